@@ -21,7 +21,6 @@ class Config(ABC):
     # Files
     DIR_HISTORIC_BNB = "DIR_HISTORIC_BNB"
     FILE_SESSION_CONFIG = "FILE_SESSION_CONFIG"
-    FILE_EXECUTABLE_MYJSON_JSON_INSTANTIATE = 'FILE_EXECUTABLE_MYJSON_JSON_INSTANTIATE'
     FILE_EXECUTABLE_MYJSON_TEST_JSON_ENCODE_DECODE = 'FILE_EXECUTABLE_MYJSON_TEST_JSON_ENCODE_DECODE'
     FILE_FAKE_API_ORDERS = 'FILE_FAKE_API_ORDERS'
     FILE_MODEL_OUTPUT = "FILE_MODEL_OUTPUT"
@@ -80,6 +79,8 @@ class Config(ABC):
     API_KEY_BINANCE_PUBLIC = 'API_KEY_BINANCE_PUBLIC'
     API_KEY_BINANCE_SECRET = 'API_KEY_BINANCE_SECRET'
     FAKE_API_START_END_TIME = "FAKE_API_START_END_TIME"
+    # Logs
+    LOG_SINK = "LOG_SINK"
 
 
     @staticmethod
@@ -10,7 +10,6 @@ class Dev:
     STAGE_MODE = None
     # Static Files
     DIR_HISTORIC_BNB = 'tests/datas/structure/strategies/MinMax/historic-BNB-2021.03.26 00.52.00.csv'
-    FILE_EXECUTABLE_MYJSON_JSON_INSTANTIATE = 'content/executable/model/tools/MyJson/json_instantiate.py'
     FILE_EXECUTABLE_MYJSON_TEST_JSON_ENCODE_DECODE = 'content/executable/model/tools/MyJson/test_json_encode_decode.py'
     # Static paths
     DIR_BROKERS = "model/API/brokers"
@@ -84,6 +83,8 @@ class Dev:
         'start':    1613227500, # 2021-02-13 14:45:00
         'end':      1613313900  # 2021-02-14 14:45:00
         }
+    # Logs
+    LOG_SINK = 'columnar'
 
     @staticmethod
     def update(old: str, new: str) -> None:
@@ -194,11 +194,10 @@ class Binance(Broker, MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Binance(Map({
             Map.public: '@json',
             Map.secret: '@json',
             Map.test_mode: None
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
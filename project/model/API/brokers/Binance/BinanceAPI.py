@@ -1,21 +1,20 @@
 from abc import ABC
-from time import sleep
-from typing import Callable, List, Union
+from typing import Callable, Dict, List, Union
 
-from requests import get as rq_get, Response
-from requests import post as rq_post
-from requests import delete as rq_delete
+from requests import Response
 from hmac import new as new_hmac
 from hashlib import sha256 as hashlib_sha256
 
 from config.Config import Config
 from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FlatMap import FlatMap
 from model.tools.Map import Map
 from model.tools.BrokerResponse import BrokerResponse
 from model.tools.Pair import Pair
 from model.tools.Price import Price
-from model.tools.RateLimit import RateLimit
-from model.tools.WaitingRoom import WaitingRoom
+from model.tools.RateScheduler import RateScheduler
+from model.tools.SessionPool import SessionPool
+from model.tools.TokenBucket import TokenBucket
 
 
 class BinanceAPI(ABC):
@@ -471,12 +470,19 @@ class BinanceAPI(ABC):
     _ORDER_RQ_REGEX = r'^RQ_ORDER.*$'
     _TEST_MODE = None
     _SOCKET = None
-    _WAITINGROOM = None
-    _WAITINGROOM_SLEEP_TIME = 1
-    _RATELIMIT_REQUEST =  None
-    _RATELIMIT_ORDER_INSTANT =  None
-    _RATELIMIT_ORDER_DAILY =  None
+    _RATE_SCHEDULER = None
     _RATELIMIT_MAX_LIMIT = 0.9
+    _PRIORITY_ORDER = 0
+    _PRIORITY_ACCOUNT = 1
+    _PRIORITY_MARKET = 2
+    _SESSION_POOL = None
+    _SESSION_POOL_SIZE = 20
+    _SESSION_TIMEOUT = (3.05, 30)
+    _SESSION_MAX_RETRY = 3
+    _SESSION_BACKOFF = 0.5
+    _SESSION_GROUP_ORDER = 'order'
+    _SESSION_GROUP_MARKET = 'market'
+    _STATUSES_BACK_OFF = [429, 418]
 
     @staticmethod
     def is_active() ->  bool:
@@ -965,11 +971,85 @@ class BinanceAPI(ABC):
         return response
 
     @staticmethod
-    def get_waitingroom() -> WaitingRoom:
-        if BinanceAPI._WAITINGROOM is None:
-            name = f"{BinanceAPI.__name__}_Send_Request"
-            BinanceAPI._WAITINGROOM = WaitingRoom(name)
-        return BinanceAPI._WAITINGROOM
+    def get_rate_scheduler() -> RateScheduler:
+        """
+        To get the scheduler that makes requests respect Binance's rate limits
+        NOTE: each limit is a bucket named like its key in exchange infos (Map.weight, Map.second, Map.day)
+
+        Returns:
+        --------
+        return: RateScheduler
+            The scheduler of requests
+        """
+        _cls = BinanceAPI
+        if _cls._RATE_SCHEDULER is None:
+            scheduler = RateScheduler(f"{_cls.__name__}_Send_Request")
+            for key in [Map.weight, Map.second, Map.day]:
+                rate_limit = _cls.get_exchange_info(Map.limit, key)
+                unit_interval = _cls.limit_interval_to_second(rate_limit[Map.interval])
+                limit = int(rate_limit[Map.limit] * _cls.get_max_limit_rate())
+                interval = unit_interval * rate_limit[Map.intervalNum]
+                scheduler.add_bucket(key, TokenBucket(limit, interval))
+            _cls._RATE_SCHEDULER = scheduler
+        return _cls._RATE_SCHEDULER
+
+    @staticmethod
+    def get_session_pool() -> SessionPool:
+        """
+        To get the pool of HTTP sessions used to send requests
+
+        Returns:
+        --------
+        return: SessionPool
+            The pool of HTTP sessions
+        """
+        _cls = BinanceAPI
+        if _cls._SESSION_POOL is None:
+            _cls._SESSION_POOL = SessionPool(
+                pool_size=_cls._SESSION_POOL_SIZE,
+                timeout=_cls._SESSION_TIMEOUT,
+                max_retry=_cls._SESSION_MAX_RETRY,
+                backoff=_cls._SESSION_BACKOFF
+                )
+        return _cls._SESSION_POOL
+
+    @staticmethod
+    def _session_group(rq: str) -> str:
+        """
+        To get the group of sessions of a request
+        NOTE: orders have their own connections to not wait behind market requests
+        """
+        _cls = BinanceAPI
+        is_order = _MF.regex_match(_cls._ORDER_RQ_REGEX, rq) or (rq == _cls.RQ_CANCEL_ORDER)
+        return _cls._SESSION_GROUP_ORDER if is_order else _cls._SESSION_GROUP_MARKET
+
+    @classmethod
+    def _retry_sleep_time(cls, rq: str, response: Response) -> Union[float, None]:
+        """
+        To get the time to wait before to retry a request according to rate limits
+        NOTE: limits are synchronized with the failed try's headers and the retry's weight is counted
+
+        Parameters:
+        -----------
+        rq: str
+            The request to retry
+        response: Response
+            The response of the failed try
+
+        Returns:
+        --------
+        return: Union[float, None]
+            Time to wait till the limits allow the request (in second)
+        """
+        if rq == cls.RQ_EXCHANGE_INFOS:
+            return None
+        headers = response.headers
+        if ('x-mbx-used-weight-1m' in headers) or ('X-SAPI-USED-IP-WEIGHT-1M' in headers):
+            cls._update_limits(rq, BrokerResponse(response))
+        sleep_time = cls.get_limits_sleep_time(rq)
+        # The retry is sent without waiting its turn in the scheduler
+        cls._add_weight(rq)
+        return sleep_time
 
     @staticmethod
     def get_max_limit_rate() -> float:
@@ -983,159 +1063,144 @@ class BinanceAPI(ABC):
         return time_second
 
     @staticmethod
-    def get_ratelimit_request() -> RateLimit:
-        if BinanceAPI._RATELIMIT_REQUEST is None:
-            rq_limit = BinanceAPI.get_exchange_info(Map.limit, Map.weight)
-            unit_interval = BinanceAPI.limit_interval_to_second(rq_limit[Map.interval])
-            limit = int(rq_limit[Map.limit] * BinanceAPI.get_max_limit_rate())
-            interval = unit_interval * rq_limit[Map.intervalNum]
-            BinanceAPI._RATELIMIT_REQUEST = RateLimit(limit, interval)
-        return BinanceAPI._RATELIMIT_REQUEST
+    def get_ratelimit_request() -> TokenBucket:
+        return BinanceAPI.get_rate_scheduler().get_bucket(Map.weight)
 
     @staticmethod
-    def get_ratelimit_order_instant() -> RateLimit:
-        if BinanceAPI._RATELIMIT_ORDER_INSTANT is None:
-            order_sec_limit = BinanceAPI.get_exchange_info(Map.limit, Map.second)
-            unit_interval = BinanceAPI.limit_interval_to_second(order_sec_limit[Map.interval])
-            limit = int(order_sec_limit[Map.limit] * BinanceAPI.get_max_limit_rate())
-            interval = unit_interval * order_sec_limit[Map.intervalNum]
-            BinanceAPI._RATELIMIT_ORDER_INSTANT = RateLimit(limit, interval)
-        return BinanceAPI._RATELIMIT_ORDER_INSTANT
+    def get_ratelimit_order_instant() -> TokenBucket:
+        return BinanceAPI.get_rate_scheduler().get_bucket(Map.second)
 
     @staticmethod
-    def get_ratelimit_order_daily() -> RateLimit:
-        if BinanceAPI._RATELIMIT_ORDER_DAILY is None:
-            rq_day_limit = BinanceAPI.get_exchange_info(Map.limit, Map.day)
-            unit_interval = BinanceAPI.limit_interval_to_second(rq_day_limit[Map.interval])
-            limit = int(rq_day_limit[Map.limit] * BinanceAPI.get_max_limit_rate())
-            interval = unit_interval * rq_day_limit[Map.intervalNum]
-            BinanceAPI._RATELIMIT_ORDER_DAILY = RateLimit(limit, interval)
-        return BinanceAPI._RATELIMIT_ORDER_DAILY
+    def get_ratelimit_order_daily() -> TokenBucket:
+        return BinanceAPI.get_rate_scheduler().get_bucket(Map.day)
 
     @staticmethod
-    def can_send_request(rq: str) -> bool:
+    def _is_order_request(rq: str) -> bool:
+        _cls = BinanceAPI
+        return _MF.regex_match(_cls._ORDER_RQ_REGEX, rq) or (rq == _cls.RQ_CANCEL_ORDER)
+
+    @staticmethod
+    def _request_weights(rq: str) -> Dict[str, int]:
+        """
+        To get the weight of a request in each rate limit
+
+        Parameters:
+        -----------
+        rq: str
+            A supported request (i.e.: BinanceAPI.RQ_{...})
+
+        Returns:
+        --------
+        return: Dict[str, int]
+            The weight of the request for each bucket of the rate scheduler
+        """
         _cls = BinanceAPI
-        can_send = True
         weight = _cls._get_request_configs()[rq][Map.weight]
-        rq_ratelimit = _cls.get_ratelimit_request()
-        order_instant_ratelimit = _cls.get_ratelimit_order_instant()
-        order_daily_ratelimit = _cls.get_ratelimit_order_daily()
-        if weight > rq_ratelimit.get_remaining_weight():
-            can_send = False
-        if can_send and (_MF.regex_match(_cls._ORDER_RQ_REGEX, rq) or (rq == _cls.RQ_CANCEL_ORDER)):
-            if weight > order_instant_ratelimit.get_remaining_weight():
-                can_send = False
-            if can_send and weight > order_daily_ratelimit.get_remaining_weight():
+        weights = {Map.weight: weight}
+        if _cls._is_order_request(rq):
+            weights[Map.second] = weight
+            weights[Map.day] = weight
+        return weights
+
+    @staticmethod
+    def _request_priority(rq: str) -> int:
+        """
+        To get the priority of a request
+        NOTE: orders pass before account requests that pass before market requests
+        """
+        _cls = BinanceAPI
+        if _cls._is_order_request(rq):
+            priority = _cls._PRIORITY_ORDER
+        elif rq in _cls._VIP_REQUESTS:
+            priority = _cls._PRIORITY_ACCOUNT
+        else:
+            priority = _cls._PRIORITY_MARKET
+        return priority
+
+    @staticmethod
+    def _check_daily_limit(rq: str) -> None:
+        _cls = BinanceAPI
+        if _cls._is_order_request(rq):
+            weight = _cls._get_request_configs()[rq][Map.weight]
+            order_daily_ratelimit = _cls.get_ratelimit_order_daily()
+            if order_daily_ratelimit.wait_time(weight) > 0:
                 limit = order_daily_ratelimit.get_limit()
                 raise Exception(f"BinanceAPI's daily limit '{limit}' for Order request is reached")
-        return can_send
 
     @staticmethod
-    def get_limits_sleep_time(rq: str) -> int:
+    def can_send_request(rq: str) -> bool:
+        _cls = BinanceAPI
+        _cls._check_daily_limit(rq)
+        return _cls.get_limits_sleep_time(rq) <= 0
+
+    @staticmethod
+    def get_limits_sleep_time(rq: str) -> float:
         _cls = BinanceAPI
-        rq_ratelimit = _cls.get_ratelimit_request()
-        order_instant_ratelimit = _cls.get_ratelimit_order_instant()
-        sleep_time = rq_ratelimit.get_remaining_time()
-        if _MF.regex_match(_cls._ORDER_RQ_REGEX, rq) or (rq == _cls.RQ_CANCEL_ORDER):
-            order_sleep_time = order_instant_ratelimit.get_remaining_time()
-            sleep_time = sleep_time if sleep_time >= order_sleep_time else order_sleep_time
-        return sleep_time
+        return _cls.get_rate_scheduler().wait_time(_cls._request_weights(rq))
 
     @staticmethod
     def _add_weight(rq: str) -> None:
         _cls = BinanceAPI
-        weight = _cls._get_request_configs()[rq][Map.weight]
-        rq_ratelimit = _cls.get_ratelimit_request()
-        order_instant_ratelimit = _cls.get_ratelimit_order_instant()
-        order_daily_ratelimit = _cls.get_ratelimit_order_daily()
-        rq_ratelimit.add_weight(weight)
-        if _MF.regex_match(_cls._ORDER_RQ_REGEX, rq) or (rq == _cls.RQ_CANCEL_ORDER):
-            order_instant_ratelimit.add_weight(weight)
-            order_daily_ratelimit.add_weight(weight)
+        _cls.get_rate_scheduler().consume(_cls._request_weights(rq))
 
     @staticmethod
     def _update_limits(rq: str, response: BrokerResponse) -> None:
         _cls = BinanceAPI
-        rq_ratelimit = _cls.get_ratelimit_request()
-        order_instant_ratelimit = _cls.get_ratelimit_order_instant()
-        order_daily_ratelimit = _cls.get_ratelimit_order_daily()
+        scheduler = _cls.get_rate_scheduler()
         header = response.get_headers()
+        # Over the limit or banned: wait the refill of the whole limit
+        if response.get_status_code() in _cls._STATUSES_BACK_OFF:
+            scheduler.sync(Map.weight, scheduler.get_bucket(Map.weight).get_limit())
         # Update request
         key_rq_header = 'x-mbx-used-weight-1m'
         rq_header_weight = int(header[key_rq_header] if key_rq_header in header else header['X-SAPI-USED-IP-WEIGHT-1M'])
-        rq_ratelimit_weight = rq_ratelimit.get_weight()
-        if (rq_ratelimit_weight is not None) and (rq_ratelimit_weight != rq_header_weight):
-            rq_ratelimit.update_weight(rq_header_weight)
+        scheduler.sync(Map.weight, rq_header_weight)
         # Update order
         if _MF.regex_match(_cls._ORDER_RQ_REGEX, rq):    # or (rq == _cls.RQ_CANCEL_ORDER):
             # Instant order
             key_instant_w = 'x-mbx-order-count-10s'
-            header_instant_weight = int(header[key_instant_w]) if key_instant_w in header else None
-            order_instant_weight = order_instant_ratelimit.get_weight()
-            if (order_instant_weight is not None) \
-                    and (header_instant_weight is not None) \
-                    and (order_instant_weight != header_instant_weight):
-                order_instant_ratelimit.update_weight(header_instant_weight)
+            scheduler.sync(Map.second, int(header[key_instant_w])) if key_instant_w in header else None
             # Daily order
             key_daily_w = 'x-mbx-order-count-1d'
-            header_daily_weight = int(header[key_daily_w]) if key_daily_w in header else None
-            order_daily_weight = order_daily_ratelimit.get_weight()
-            if (order_daily_weight is not None) \
-                    and (header_daily_weight is not None) \
-                    and (order_daily_weight != header_daily_weight):
-                order_daily_ratelimit.update_weight(header_daily_weight)
+            scheduler.sync(Map.day, int(header[key_daily_w])) if key_daily_w in header else None
 
     @staticmethod
     def _waitingroom(test_mode: bool, api_keys: Map, rq: str, params: Map) -> BrokerResponse:
+        """
+        To send a request as soon as Binance's rate limits allow it
+        NOTE: waiting requests are served by priority, so orders don't wait behind market requests
+
+        Parameters:
+        -----------
+        test_mode: bool
+            Set True to use Binance's test API else False for the real one
+        api_keys: Map
+            Public and Secret key for Binance's API
+        rq: str
+            A supported request (i.e.: BinanceAPI.RQ_{...})
+        params: Map
+            Request's params to send
+
+        Returns:
+        --------
+        return: BrokerResponse
+            Binance's API response
+        """
         _cls = BinanceAPI
-        def new_ticket() -> str:
-            return f"{rq}_{_MF.new_code()}"
-        def time_to_str(time: int) -> str:
-            return f"{int(time / 60)}min.{time % 60}sec."
-        def room_size(waitingroom: WaitingRoom) -> int:
-            return len(waitingroom.get_tickets())
-        is_vip = rq in _cls._VIP_REQUESTS
-        if is_vip:
-            response = _cls._send_request(test_mode, api_keys, rq, params)
-        else:
-            room_sleep_time = _cls._WAITINGROOM_SLEEP_TIME
-            waitingroom = _cls.get_waitingroom()
-            ticket = waitingroom.join_room(new_ticket())
-            join_unix_time = _MF.get_timestamp()
-            _MF.output(f"{_MF.prefix()}Join room"
-                f" (size='{room_size(waitingroom)}', ticket=" + '\033[34m' + f"'{ticket}'" + '\033[0m') \
-                if _cls._DEBUG else None
-            try:
-                while not waitingroom.my_turn(ticket):
-                    sleep(room_sleep_time)
-                while not _cls.can_send_request(rq):
-                    limits_sleep_time = _cls.get_limits_sleep_time(rq)
-                    if isinstance(limits_sleep_time, int):
-                        unix_time = _MF.get_timestamp()
-                        unix_date = _MF.unix_to_date(unix_time)
-                        wakeup_date = _MF.unix_to_date(unix_time + limits_sleep_time)
-                        limits_sleep_time_str = time_to_str(limits_sleep_time)
-                        _MF.output(f"{_MF.prefix()}\033[33mCan't send request, sleep for '{limits_sleep_time_str}'"
-                            f" from '{unix_date}'->'{wakeup_date}'"
-                            f" (size='{room_size(waitingroom)}', ticket=" + '\033[34m' + f"'{ticket}'" + '\033[0m') \
-                            if _cls._DEBUG else None
-                    sleep(limits_sleep_time) if isinstance(limits_sleep_time, int) else None
-                response = _cls._send_request(test_mode, api_keys, rq, params)
-            except Exception as error:
-                # Save error
-                from model.structure.Bot import Bot
-                Bot.save_error(error, _cls.__name__)
-                # Quit room
-                waitingroom.quit_room(ticket)
-                wait_time_str = time_to_str(_MF.get_timestamp() - join_unix_time)
-                _MF.output(f"{_MF.prefix()}\033[31mQuit room with error in '{wait_time_str}'"
-                    f" (size='{room_size(waitingroom)}', ticket='{ticket}')\n error: « {error} »" + '\033[0m') if _cls._DEBUG else None
-                raise error
-            waitingroom.treat_ticket(ticket)
-            wait_time_str = time_to_str(_MF.get_timestamp() - join_unix_time)
-            _MF.output(f"{_MF.prefix()}\033[32mTicket treated in '{wait_time_str}'"
-                f" (size='{room_size(waitingroom)}', ticket=" + '\033[34m' + f"'{ticket}'" + '\033[0m') \
+        # Rate limits are read from exchange infos
+        if rq == _cls.RQ_EXCHANGE_INFOS:
+            return _cls._send_request(test_mode, api_keys, rq, params)
+        scheduler = _cls.get_rate_scheduler()
+        try:
+            _cls._check_daily_limit(rq)
+            wait_time = scheduler.acquire(_cls._request_weights(rq), _cls._request_priority(rq), rq)
+            _MF.output(f"{_MF.prefix()}\033[32mRequest '{rq}' sent after '{round(wait_time, 3)}'sec.\033[0m") \
                 if _cls._DEBUG else None
+            response = _cls._send_request(test_mode, api_keys, rq, params)
+        except Exception as error:
+            from model.structure.Bot import Bot
+            Bot.save_error(error, _cls.__name__)
+            raise error
         return response
 
     @classmethod
@@ -1166,20 +1231,22 @@ class BinanceAPI(ABC):
         headers = cls._generate_headers(api_keys)
         url = cls._generate_url(rq)
         method = request_config[Map.method]
+        session_pool = cls.get_session_pool()
+        group = cls._session_group(rq)
+        wait = lambda response: cls._retry_sleep_time(rq, response)
         if method == Map.GET:
-            rsp = rq_get(url, params.get_map(), headers=headers)
+            rsp = session_pool.request(method, url, group, wait, params=params.get_map(), headers=headers)
         elif method == Map.POST:
-            rsp = rq_post(url, params.get_map(), headers=headers)
+            rsp = session_pool.request(method, url, group, wait, data=params.get_map(), headers=headers)
         elif method == Map.DELETE:
             ds = params.get_map()
             url += '?' + '&'.join([f'{k}={v}' for k, v in ds.items()])
-            rsp = rq_delete(url, headers=headers)
+            rsp = session_pool.request(method, url, group, wait, headers=headers)
         else:
             raise Exception(f"The request method {method} is not supported")
         broker_response = BrokerResponse(rsp)
         try:
             if rq != cls.RQ_EXCHANGE_INFOS:
-                cls._add_weight(rq)
                 cls._update_limits(rq, broker_response)
         except Exception as error:
             cls._save_response(rq, params, rsp)
@@ -1189,40 +1256,48 @@ class BinanceAPI(ABC):
 
     @staticmethod
     def _socket_market_history(test_mode: bool, rq: str, params: Map) -> BrokerResponse:
+        """
+        To get market history from BinanceSocket
+        NOTE: the history is handed over as a numpy array without JSON encoding
+
+        Parameters:
+        -----------
+        test_mode: bool
+            Set True to use the test API else False
+        rq: str
+            The request (must be BinanceAPI.RQ_KLINES)
+        params: Map
+            Params of the request
+
+        Returns:
+        --------
+        return: BrokerResponse
+            Response with the market history as content
+        """
         BinanceAPI._set_test_mode(test_mode)
         symbol = params.get(Map.symbol)
         period_str = params.get(Map.interval)
         stream = BinanceAPI.generate_stream(rq, symbol, period_str)
         socket = BinanceAPI._get_socket([stream])
-        market_historic = socket.get_market_history(stream)
         rsp = Response()
         rsp.request = {
             Map.method: Map.websocket,
             'headers': []
         }
-        if isinstance(market_historic, list):
-            limit = params.get(Map.limit)
-            if limit is not None:
-                new_market_historic = market_historic[-limit:]
-            else:
-                limit = BinanceAPI._CONSTANT_KLINES_DEFAULT_NB_PERIOD
-                new_market_historic = market_historic[-limit:]
-            rsp.status_code = BrokerResponse.STATUS_CODE_SUCCESS
-            rsp.reason = 'OK'
-            rsp._content = _MF.json_encode(new_market_historic).encode()
-            rsp.url = socket.url(stream)
-        else:
-            rsp.status_code = 0000
-            rsp.reason = 'BinanceSocket fail'
-            rsp_content = {'comment': "Can't get market historic from websocket.", 'data_returned': market_historic}
-            rsp._content = _MF.json_encode(rsp_content)
-        return BrokerResponse(rsp)
+        limit = params.get(Map.limit)
+        limit = BinanceAPI._CONSTANT_KLINES_DEFAULT_NB_PERIOD if limit is None else limit
+        market_historic = socket.copy_market_history(stream, limit)
+        rsp.status_code = BrokerResponse.STATUS_CODE_SUCCESS
+        rsp.reason = 'OK'
+        rsp._content = b''
+        rsp.url = socket.url(stream)
+        return BrokerResponse(rsp, content=market_historic)
 
     @staticmethod
     def _set_symbol_to_pair() -> None:
         infos = BinanceAPI._get_exchange_infos()
         symbols = infos.get(Map.symbol)
-        symbol_to_pair = Map()
+        symbol_to_pair = FlatMap()
         for pair, row in symbols.items():
             symbol = row[Map.symbol].lower()
             symbol_to_pair.put(pair, symbol)
@@ -1233,7 +1308,7 @@ class BinanceAPI(ABC):
     def _get_symbol_to_pair() -> Map:
         if BinanceAPI._SYMBOL_TO_PAIR is None:
             BinanceAPI._set_symbol_to_pair()
-        return Map(dict(BinanceAPI._SYMBOL_TO_PAIR.get_map()))
+        return BinanceAPI._SYMBOL_TO_PAIR.snapshot()
 
     @staticmethod
     def symbol_to_pair(symbol: str) -> str:
@@ -1267,7 +1342,7 @@ class BinanceAPI(ABC):
     @staticmethod
     def get_pairs(match: List[str] = None, no_match: List[str] = None) -> list:
         symbol_to_pair = BinanceAPI._get_symbol_to_pair()
-        pair_strs = [pair_str for symbol, pair_str in symbol_to_pair.get_map().items()]
+        pair_strs = [symbol_to_pair.get(symbol) for symbol in symbol_to_pair.get_keys()]
         if match is not None:
             regex_match = '|'.join(match)
             pair_strs = [pair_str for pair_str in pair_strs if _MF.regex_match(regex_match, pair_str)]
@@ -1473,7 +1548,7 @@ class BinanceAPI(ABC):
 
     @staticmethod
     def _save_response(rq: str, params: Map, rsp: Response) -> None:
-        from model.tools.FileManager import FileManager
+        from model.tools.LogSink import LogSink
         _cls = BinanceAPI
         p = Config.get(Config.DIR_SAVE_API_RSP)
         content_json = rsp.content.decode('utf-8')
@@ -1490,9 +1565,9 @@ class BinanceAPI(ABC):
         request_header = _MF.json_encode(dict(rsp.request["headers"])) \
             if isinstance(rsp.request, dict) else _MF.json_encode(dict(rsp.request.__dict__["headers"]))
         exchange_is_set = isinstance(_cls._EXCHANGE_INFOS, Map)
-        request_weight = _cls.get_ratelimit_request().get_weight() if exchange_is_set else '—'
-        order_instant_weight = _cls.get_ratelimit_order_instant().get_weight() if exchange_is_set else '—'
-        order_daily_weight = _cls.get_ratelimit_order_daily().get_weight() if exchange_is_set else '—'
+        request_weight = round(_cls.get_ratelimit_request().get_used()) if exchange_is_set else '—'
+        order_instant_weight = round(_cls.get_ratelimit_order_instant().get_used()) if exchange_is_set else '—'
+        order_daily_weight = round(_cls.get_ratelimit_order_daily().get_used()) if exchange_is_set else '—'
         row = {
             Map.time: _MF.unix_to_date(_MF.get_timestamp()),
             Map.request: rq,
@@ -1509,7 +1584,4 @@ class BinanceAPI(ABC):
             "request_content": _MF.json_encode(params.get_map()),
             "response_content": content_json
         }
-        rows = [row]
-        fields = list(rows[0].keys())
-        overwrite = False
-        FileManager.write_csv(p, fields, rows, overwrite, make_dir=True)
+        LogSink.get_sink().write(p, [row])
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Tuple
 
 import numpy as np
+import pandas as pd
 from config.Config import Config
 from model.API.brokers.Binance.BinanceAPI import BinanceAPI
 from model.API.brokers.Binance.BinanceFakeOrder import BinanceFakeOrder
@@ -22,9 +23,15 @@ class BinanceFakeAPI(BinanceAPI):
     _FILE_LOAD_ORDERS = 'FILE_LOAD_ORDERS'
     _DIR_EXCHANGE_INFOS = 'DIR_EXCHANGE_INFOS'
     _DIR_TRADE_FEES = 'DIR_TRADE_FEES'
+    # Columns of the open kline updated from the minimum period's history
+    _AGGREGATE_MAX = [2]
+    _AGGREGATE_MIN = [3]
+    _AGGREGATE_LAST = [4]
+    _AGGREGATE_SUM = [5, 7, 8, 9, 10]
     # Variables
     _HISTORY_TIMES = None
     _HISTORIES = None
+    _AGGREGATES = None
     _INITIAL_INDEXES = None
     _ORDERS = None
 
@@ -68,6 +75,7 @@ class BinanceFakeAPI(BinanceAPI):
         To reset all variables
         """
         BinanceFakeAPI._HISTORIES = None
+        BinanceFakeAPI._AGGREGATES = None
         BinanceFakeAPI._INITIAL_INDEXES = None
         BinanceFakeAPI._ORDERS = None
         BinanceFakeAPI._HISTORY_TIMES = None
@@ -186,11 +194,19 @@ class BinanceFakeAPI(BinanceAPI):
         """
         broker_name = BinanceAPI.__name__.replace('API', '')
         pair = Pair(cls.symbol_to_pair(merged_pair))
-        history = MarketPrice.load_marketprice(broker_name, pair, period, active_path=True).to_numpy()
-        # Complete missing period
-        history = cls._duplicate_missing_rows(period, history)
+        # Missing periods are completed once, when the history is converted
+        clean = lambda history: cls._duplicate_missing_rows(period, history)
+        history = MarketPrice.load_history(broker_name, pair, period, active_path=True, clean=clean)
         return history
 
+    @classmethod
+    def convert_market_histories(cls) -> None:
+        """
+        To convert all stored CSV histories into their binary format with their missing rows completed
+        """
+        broker_name = BinanceAPI.__name__.replace('API', '')
+        MarketPrice.convert_histories(broker_name, clean=cls._duplicate_missing_rows)
+
     @classmethod
     def _put_market_history(cls, history: np.ndarray, merged_pair: str, period: int)  -> None:
         """
@@ -203,6 +219,63 @@ class BinanceFakeAPI(BinanceAPI):
         histories = cls._get_market_histories()
         merged_pair = merged_pair.upper()
         histories.put(history, merged_pair, period)
+        # Aggregates are built from all periods of the pair
+        cls._get_aggregates().get_map().pop(merged_pair, None)
+
+    @staticmethod
+    def _get_aggregates() -> Map:
+        """
+        To get aggregates of market histories (see BinanceFakeAPI._get_aggregate())
+
+        Return:
+        -------
+        return: Map
+            Aggregates of market histories
+            Map[merged_pair.upper(){str}][period{int}]: Map
+        """
+        _cls = BinanceFakeAPI
+        if _cls._AGGREGATES is None:
+            _cls._AGGREGATES = Map()
+        return _cls._AGGREGATES
+
+    @classmethod
+    def _get_aggregate(cls, merged_pair: str, period: int, min_period: int) -> Map:
+        """
+        To get the state of the open kline of a period at each row of the minimum period's history
+        NOTE: it's built once from the histories with cumulative reductions by kline
+
+        Parameters:
+        -----------
+        merged_pair: str
+            Pair of the histories (in merged format)
+        period: int
+            Period of the klines to aggregate (in second)
+        min_period: int
+            Minimum period available in histories (in second)
+
+        Return:
+        -------
+        return: Map
+            The aggregate
+            Map[Map.index]:     {np.ndarray}    # Index of the open kline in the period's history at each row of the minimum period's history
+            Map[Map.history]:   {np.ndarray}    # Running values of the open kline at each row of the minimum period's history
+        """
+        merged_pair = merged_pair.upper()
+        aggregates = cls._get_aggregates()
+        aggregate = aggregates.get(merged_pair, period)
+        if aggregate is None:
+            history = cls._get_market_history(merged_pair, period)
+            min_history = cls._get_market_history(merged_pair, min_period)
+            indexes = np.searchsorted(history[:,0], min_history[:,0], side='right') - 1
+            groups = pd.DataFrame(min_history).groupby(indexes, sort=False)
+            running = np.array(min_history, dtype=np.float64)
+            maxs, mins, sums = cls._AGGREGATE_MAX, cls._AGGREGATE_MIN, cls._AGGREGATE_SUM
+            running[:,maxs] = groups[maxs].cummax().to_numpy()
+            running[:,mins] = groups[mins].cummin().to_numpy()
+            running[:,sums] = groups[sums].cumsum().to_numpy()
+            aggregate = Map({Map.index: indexes, Map.history: running})
+            aggregates.put(aggregate, merged_pair, period)
+        return aggregate
 
     @staticmethod
     def _get_market_histories() -> Map:
@@ -251,8 +324,7 @@ class BinanceFakeAPI(BinanceAPI):
                 Map.interval: period_str,
                 Map.limit: cls.CONSTRAINT_KLINES_MAX_PERIOD
             }))
-            content = response.get_content()
-            market_history = np.array(content)
+            market_history = response.get_content()
             return market_history
 
         stage = cls._get_stage()
@@ -629,10 +701,8 @@ class BinanceFakeAPI(BinanceAPI):
         merged_pair = merged_pair.upper()
         order_dict = cls._get_order_dict(merged_pair)
         market_datas, market_data_history = cls._actual_market_datas(merged_pair)
-        executions = []
-        for period, order in order_dict.copy().items():
-            executions.append(1) if order.try_execute(market_datas, market_data_history) else None
-        cls._save_orders() if sum(executions) > 0 else None
+        executions = BinanceFakeOrder.execute_orders(list(order_dict.values()), market_datas, market_data_history)
+        cls._save_orders() if any(executions) else None
 
     # ——————————————————————————————————————————— STATIC FUNCTION ORDER UP
     # ——————————————————————————————————————————— STATIC FUNCTION REQUESTS DOWN
@@ -732,32 +802,17 @@ class BinanceFakeAPI(BinanceAPI):
         def asked_rows(index: int, n_row: int, history: np.ndarray) -> np.ndarray:
             return history[:index+1][-n_row:]
 
-        def update_last_row(merged_pair: str, period: int, min_period: int, limit: int, kline: np.ndarray) -> np.ndarray:
-            min_history = _cls._get_market_history(merged_pair, min_period)
+        def update_last_row(merged_pair: str, period: int, min_period: int, index: int, kline: np.ndarray) -> list:
+            # History is a read-only memory map: only a copy of the last row is updated
+            aggregate = _cls._get_aggregate(merged_pair, period, min_period)
             min_idx = _cls._index(min_period)
-            min_limit = int(period/min_period)
-            open_time = kline[-1,0]
-            kline_min_history = asked_rows(index=min_idx, n_row=min_limit, history=min_history)
-            min_open_time = kline_min_history[-1,0]
-            if open_time != min_open_time:
-                n_elapsed = int((min_open_time - open_time)/(min_period*1000))
-                elapseds = kline_min_history[-n_elapsed-1:]
-                if elapseds[0,0] != open_time:
-                    raise ValueError(f"Opens times must be the same")
-                high = max(elapseds[:,2])
-                low = min(elapseds[:,3])
-            else:
-                high = kline_min_history[-1,2]
-                low = kline_min_history[-1,3]
-            kline[-1,2] = high
-            kline[-1,3] = low
-            kline[-1,4] = kline_min_history[-1,4]
-            kline[-1,5] = kline_min_history[-1,5]
-            kline[-1,7] = kline_min_history[-1,7]
-            kline[-1,8] = kline_min_history[-1,8]
-            kline[-1,9] = kline_min_history[-1,9]
-            kline[-1,10] = kline_min_history[-1,10]
-            return kline
+            if aggregate.get(Map.index)[min_idx] != index:
+                raise ValueError(f"Opens times must be the same")
+            running = aggregate.get(Map.history)[min_idx]
+            columns = [*_cls._AGGREGATE_MAX, *_cls._AGGREGATE_MIN, *_cls._AGGREGATE_LAST, *_cls._AGGREGATE_SUM]
+            last_row = kline[-1].copy()
+            last_row[columns] = running[columns]
+            return [*kline[:-1].tolist(), last_row.tolist()]
 
         keys = params.get_keys()
         if (Map.endTime in keys) or (Map.startTime in keys):
@@ -775,7 +830,7 @@ class BinanceFakeAPI(BinanceAPI):
             kline = asked_rows(index=idx, n_row=limit, history=history)
             min_period = min(MarketPrice.history_periods(broker_name))
             if period != min_period:
-                kline = update_last_row(merged_pair=merged_pair, period=period, min_period=min_period, limit=limit, kline=kline)
+                return update_last_row(merged_pair=merged_pair, period=period, min_period=min_period, index=idx, kline=kline)
         elif stage == Config.STAGE_2:
             kline = history[-limit:]
         else:
@@ -991,7 +1046,8 @@ class BinanceFakeAPI(BinanceAPI):
                             base_row = new_row
                         new_history = np.insert(history, 0, new_rows, axis=0)
                     else:
-                        new_history = history[history[:,0] >= older_open_time]
+                        # Slice to keep a view on memory-mapped histories
+                        new_history = history[np.searchsorted(history[:,0], older_open_time, side='left'):]
                     cls._put_market_history(new_history, merged_pair, period)
 
         def limit_newest_rows(histories: Map, max_period: int) -> None:
@@ -1001,7 +1057,7 @@ class BinanceFakeAPI(BinanceAPI):
                 newest_time = _MF.round_time(end_time*1000, max_period*1000)
                 for merged_pair, histories_dict in histories.get_map().items():
                     for period, history in histories_dict.items():
-                        sub_history = history[history[:,0] <= newest_time]
+                        sub_history = history[:np.searchsorted(history[:,0], newest_time, side='right')]
                         cls._put_market_history(sub_history, merged_pair, period)
 
         histories = cls._get_market_histories()
@@ -1,4 +1,4 @@
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
 import numpy as np
 from config.Config import Config
@@ -85,6 +85,8 @@ class BinanceFakeOrder(MyJson):
         -----------
         market_datas: Map
             A row with Market's most recent prices
+        market_history: np.ndarray
+            Market's history of the shortest period
 
         Returns:
         --------
@@ -92,76 +94,156 @@ class BinanceFakeOrder(MyJson):
             True if the order has been executed else False
         """
         from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
-        HIGH =  2
-        LOW =   3
-        def get_sub_history(history: np.ndarray, market_datas: Map) -> np.ndarray:
-            now_time = market_datas.get(Map.time)
-            submit_time = self.get_attribut(Map.time)
-            is_stage_one = Config.get(Config.STAGE_MODE) == Config.STAGE_1
-            submit_filter = (history[:, 0] >= submit_time) if is_stage_one else (history[:, 0] > submit_time)
-            sub_history = history[submit_filter & (history[:, 0] <= now_time)]
-            return sub_history
-        def get_exetremums(sub_history: np.ndarray, market_datas: Map) -> tuple[float, float]:
-            close = market_datas.get(Map.close)
-            is_history_empty = sub_history.shape[0] == 0
-            max_high =  max([sub_history[:, HIGH].max(), close]) if not is_history_empty else close
-            min_low =   min([sub_history[:, LOW].min(), close])  if not is_history_empty else close
-            return max_high, min_low
-        def limit_reached(is_buyer: bool, market_datas: Map, history: np.ndarray) -> bool:
-            limit_price = self.get_attribut(Map.price)
-            sub_history = get_sub_history(history, market_datas)
-            max_high, min_low = get_exetremums(sub_history, market_datas)
-            is_reached = (is_buyer and (min_low <= limit_price)) or ((not is_buyer) and (max_high >= limit_price))
-            return is_reached
-        def stop_reached(is_buyer: bool, market_datas: Map, history: np.ndarray) -> bool:
-            close = market_datas.get(Map.close)
-            stop_price = self.get_attribut(Map.stopPrice)
-            sub_history = get_sub_history(history, market_datas)
-            max_high, min_low = get_exetremums(sub_history, market_datas)
-            return (is_buyer and (max_high >= stop_price)) or ((not is_buyer) and (min_low <= stop_price))
-        def stop_limit_reached(market_datas: Map, history: np.ndarray) -> bool:
-            """
-            To stop price is reached
-            NOTE: stop price is reached if market's price come through the stop price
-            """
-            submit_price = self.get_attribut(Map.submit)
-            stop_price = self.get_attribut(Map.stopPrice)
-            sub_history = get_sub_history(history, market_datas)
-            max_high, min_low = get_exetremums(sub_history, market_datas)
-            return (min_low <= stop_price) if (submit_price >= stop_price) else (max_high >= stop_price)
         _api = BinanceFakeAPI
-        executed = False
         if self.get_attribut(Map.status) not in [_api.STATUS_ORDER_NEW, _api.STATUS_ORDER_PARTIALLY]:
             return None
-        # Attributs
-        order_type = self.get_attribut(Map.type)
-        is_buyer = self.is_buyer()
-        # Check
-        if order_type == _api.TYPE_MARKET:
-            self._set_attribut(Map.ready, True)
-            executed = self._execute(market_datas)
-        elif order_type == _api.TYPE_STOP_LOSS:
-            if stop_reached(is_buyer, market_datas, market_history):
-                self._set_attribut(Map.ready, True)
-                executed = self._execute(market_datas)
-        elif order_type == _api.TYPE_LIMIT:
-            if limit_reached(is_buyer, market_datas, market_history):
-                self._set_attribut(Map.ready, True)
-                executed = self._execute(market_datas)
-        elif order_type == _api.TYPE_STOP_LOSS_LIMIT:
-            if (not self.get_attribut(Map.ready)) and stop_limit_reached(market_datas, market_history):
-                self._set_attribut(Map.ready, True)
-                stop_price = self.get_attribut(Map.stopPrice)
-                market_datas.put(stop_price, Map.close)
-            if self.get_attribut(Map.ready) and limit_reached(is_buyer, market_datas, market_history):
-                executed = self._execute(market_datas)
-        else:
-            raise Exception(f"This order type '{order_type}' is not supported")
-        return executed
+        return self.execute_orders([self], market_datas, market_history)[0]
+
+    @staticmethod
+    def execute_orders(orders: List['BinanceFakeOrder'], market_datas: Map, market_history: np.ndarray) -> List[bool]:
+        """
+        To try to execute orders of the same pair
+
+        Parameters:
+        -----------
+        orders: List[BinanceFakeOrder]
+            Orders to execute (orders that are not open are ignored)
+        market_datas: Map
+            A row with Market's most recent prices
+        market_history: np.ndarray
+            Market's history of the shortest period
+
+        Returns:
+        --------
+        return: List[bool]
+            For each order, True if it has been executed else False
+        """
+        from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
+        _api = BinanceFakeAPI
+        open_statuses = [_api.STATUS_ORDER_NEW, _api.STATUS_ORDER_PARTIALLY]
+        executions = [False] * len(orders)
+        opens = [i for i, order in enumerate(orders) if order.get_attribut(Map.status) in open_statuses]
+        if len(opens) == 0:
+            return executions
+        fills = BinanceFakeOrder.find_fills([orders[i] for i in opens], market_datas, market_history)
+        for k, i in enumerate(opens):
+            order = orders[i]
+            if fills.get(Map.ready)[k]:
+                order._set_attribut(Map.ready, True)
+            if fills.get(Map.index)[k] >= 0:
+                executions[i] = order._execute(market_datas, float(fills.get(Map.price)[k]))
+        return executions
+
+    @staticmethod
+    def find_fills(orders: List['BinanceFakeOrder'], market_datas: Map, market_history: np.ndarray) -> Map:
+        """
+        To find which orders are filled by the prices reached since their submission
+        NOTE: the trigger conditions of all orders are evaluated together on the extremums of
+              the history, so the history is read once whatever the number of orders
+        NOTE: a stop-limit order that reaches its stop price is evaluated on its limit price
+              as if market's close price was its stop price
+
+        Parameters:
+        -----------
+        orders: List[BinanceFakeOrder]
+            Open orders to evaluate
+        market_datas: Map
+            A row with Market's most recent prices
+        market_history: np.ndarray
+            Market's history of the shortest period
+
+        Returns:
+        --------
+        return: Map
+            Map[Map.index]: {np.ndarray}    # Index in market_history of the row that fills each order (-1 if not filled)
+            Map[Map.price]: {np.ndarray}    # Execution price of each order (nan if not filled)
+            Map[Map.ready]: {np.ndarray}    # True for each order that is ready to be executed
+        """
+        from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
+        _api = BinanceFakeAPI
+        TIME =  0
+        HIGH =  2
+        LOW =   3
+        def to_array(attribut: str) -> np.ndarray:
+            values = [order.get_attribut(attribut) for order in orders]
+            return np.array([value if value is not None else np.nan for value in values], dtype=np.float64)
+        def first_cross(values: np.ndarray, starts: np.ndarray, prices: np.ndarray, is_above: np.ndarray) -> np.ndarray:
+            rows = np.arange(values.shape[1])
+            crosses = np.where(is_above[:, None], values[0][None, :] >= prices[:, None], values[1][None, :] <= prices[:, None])
+            crosses = crosses & (rows[None, :] >= starts[:, None])
+            return np.where(crosses.any(axis=1), crosses.argmax(axis=1), -1)
+        n_order = len(orders)
+        close = market_datas.get(Map.close)
+        now_time = market_datas.get(Map.time)
+        is_stage_one = Config.get(Config.STAGE_MODE) == Config.STAGE_1
+        # Orders
+        order_types = np.array([order.get_attribut(Map.type) for order in orders])
+        is_buyers = np.array([order.is_buyer() for order in orders], dtype=bool)
+        readies = np.array([order.get_attribut(Map.ready) for order in orders], dtype=bool)
+        submit_times = to_array(Map.time)
+        limit_prices = to_array(Map.price)
+        stop_prices = to_array(Map.stopPrice)
+        submit_prices = to_array(Map.submit)
+        is_market = order_types == _api.TYPE_MARKET
+        is_stop = order_types == _api.TYPE_STOP_LOSS
+        is_limit = order_types == _api.TYPE_LIMIT
+        is_stop_limit = order_types == _api.TYPE_STOP_LOSS_LIMIT
+        unsupported = ~(is_market | is_stop | is_limit | is_stop_limit)
+        if unsupported.any():
+            raise Exception(f"This order type '{order_types[unsupported][0]}' is not supported")
+        # Window of each order: rows from its submission to now
+        times = market_history[:, TIME]
+        end = int(np.searchsorted(times, now_time, side='right'))
+        starts = np.searchsorted(times, submit_times, side=('left' if is_stage_one else 'right'))
+        starts = np.minimum(starts, end)
+        first = int(starts.min())
+        highs = market_history[first:end, HIGH]
+        lows = market_history[first:end, LOW]
+        local_starts = starts - first
+        # Extremums of each window from the suffix extremums of the history
+        suffix_highs = np.append(np.maximum.accumulate(highs[::-1])[::-1], -np.inf)
+        suffix_lows = np.append(np.minimum.accumulate(lows[::-1])[::-1], np.inf)
+        max_highs = np.maximum(suffix_highs[local_starts], close)
+        min_lows = np.minimum(suffix_lows[local_starts], close)
+        # Triggers
+        stop_reached = np.where(is_buyers, max_highs >= stop_prices, min_lows <= stop_prices)
+        stop_limit_reached = np.where(submit_prices >= stop_prices, min_lows <= stop_prices, max_highs >= stop_prices)
+        triggered = is_stop_limit & (~readies) & stop_limit_reached
+        max_highs = np.where(triggered, np.maximum(max_highs, stop_prices), max_highs)
+        min_lows = np.where(triggered, np.minimum(min_lows, stop_prices), min_lows)
+        limit_reached = np.where(is_buyers, min_lows <= limit_prices, max_highs >= limit_prices)
+        readies = readies | triggered | is_market | (is_stop & stop_reached) | (is_limit & limit_reached)
+        filled = is_market | (is_stop & stop_reached) | ((is_limit | is_stop_limit) & readies & limit_reached)
+        # Fill price and row
+        prices = np.where(is_market | is_stop, close, limit_prices)
+        prices = np.where(filled, prices, np.nan)
+        indexes = np.full(n_order, -1, dtype=np.int64)
+        crossers = filled & (~is_market)
+        if crossers.any():
+            values = np.vstack([highs, lows])
+            fill_prices = np.where(is_stop, stop_prices, limit_prices)[crossers]
+            is_above = np.where(is_stop, is_buyers, ~is_buyers)[crossers]
+            cross_starts = local_starts[crossers]
+            stop_limits = is_stop_limit[crossers]
+            if stop_limits.any():
+                stop_above = (submit_prices < stop_prices)[crossers]
+                stop_crosses = first_cross(values, cross_starts, stop_prices[crossers], stop_above)
+                cross_starts = np.where(stop_limits & (stop_crosses >= 0), stop_crosses, cross_starts)
+            crosses = first_cross(values, cross_starts, fill_prices, is_above)
+            indexes[crossers] = np.where(crosses >= 0, crosses + first, end - 1)
+        indexes[filled & is_market] = end - 1
+        return Map({Map.index: indexes, Map.price: prices, Map.ready: readies})
 
-    def _execute(self, market_datas: Map) -> bool:
+    def _execute(self, market_datas: Map, exec_price: float = None) -> bool:
         """
         To execute the order
+
+        Parameters:
+        -----------
+        market_datas: Map
+            A row with Market's most recent prices
+        exec_price: float = None
+            Price to execute the order at (default to the price given by the order's type)
         """
         from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
         def execution_values(exec_price: float, asked_amount: float, asked_quantity: float) -> Tuple[float, float]:
@@ -197,15 +279,16 @@ class BinanceFakeOrder(MyJson):
         market_now_time = market_datas.get(Map.time)
         if order_type == _api.TYPE_MARKET:
             is_maker = False
-            exec_price = market_close_price
+            default_price = market_close_price
         elif order_type == _api.TYPE_STOP_LOSS:
             is_maker = False
-            exec_price = market_close_price
+            default_price = market_close_price
         elif order_type in [_api.TYPE_LIMIT, _api.TYPE_STOP_LOSS_LIMIT]:
             is_maker = True
-            exec_price = self.get_attribut(Map.price)
+            default_price = self.get_attribut(Map.price)
         else:
             raise Exception(f"This order type '{order_type}' is not supported")
+        exec_price = exec_price if exec_price is not None else default_price
         request_params = self.get_attribut(Map.param)
         asked_quantity = request_params.get(Map.quantity)
         asked_amount = request_params.get(Map.quoteOrderQty)
@@ -305,7 +388,6 @@ class BinanceFakeOrder(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = BinanceFakeOrder.__new__(BinanceFakeOrder)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
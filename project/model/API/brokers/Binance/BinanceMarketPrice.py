@@ -1,4 +1,7 @@
-from config.Config import Config
+from typing import Union
+
+import numpy as np
+
 from model.API.brokers.Binance.BinanceAPI import BinanceAPI
 from model.tools.Map import Map
 from model.tools.MarketPrice import MarketPrice
@@ -7,15 +10,24 @@ from model.tools.Pair import Pair
 
 
 class BinanceMarketPrice(MarketPrice, MyJson):
-    def __init__(self, mkt: list, prd_str: str, pair: Pair):
+    _COLUMNS = {
+        Map.time: 0,
+        Map.open: 1,
+        Map.high: 2,
+        Map.low: 3,
+        Map.close: 4,
+        Map.left: 5,
+        Map.right: 7
+    }
+
+    def __init__(self, mkt: Union[list, np.ndarray], prd_str: str, pair: Pair):
         """
         Constructor\n
         :param mkt: the market prices.
         NOTE:   market prices are ordered from the older (i=0)
                 to the newest (i=len()-1)
-                So to facilitate the manipulation, market prices is reversed
-                to have the newest prices in the top indexes and the older in
-                the end
+                Market prices are stored in this order as one 2D array of float,
+                getters return collections from the newest (i=0) to the older
                     [
                       [
                         1499040000000,      // 0.  Open time
@@ -40,9 +52,7 @@ class BinanceMarketPrice(MarketPrice, MyJson):
         k = self.COLLECTION_OPENS
         opens = self._get_collection(k)
         if opens is None:
-            idx = 1
-            coll = self._extract_index(idx)
-            opens = tuple(float(v) for v in coll)
+            opens = self._column_to_collection(Map.open)
             self._set_collection(k, opens)
         return opens
 
@@ -50,43 +60,32 @@ class BinanceMarketPrice(MarketPrice, MyJson):
         k = self.COLLECTION_CLOSES
         closes = self._get_collection(k)
         if closes is None:
-            idx = 4
-            coll = self._extract_index(idx)
-            closes = tuple(float(v) for v in coll)
+            closes = self._column_to_collection(Map.close)
             self._set_collection(k, closes)
         return closes
 
     def get_highs(self) -> tuple:
         k = self.COLLECTION_HIGHS
-        closes = self._get_collection(k)
-        if closes is None:
-            idx = 2
-            coll = self._extract_index(idx)
-            # coll.reverse()
-            closes = tuple(float(v) for v in coll)
-            self._set_collection(k, closes)
-        return closes
+        highs = self._get_collection(k)
+        if highs is None:
+            highs = self._column_to_collection(Map.high)
+            self._set_collection(k, highs)
+        return highs
 
     def get_lows(self) -> tuple:
         k = self.COLLECTION_LOWS
-        closes = self._get_collection(k)
-        if closes is None:
-            idx = 3
-            coll = self._extract_index(idx)
-            # coll.reverse()
-            closes = tuple(float(v) for v in coll)
-            self._set_collection(k, closes)
-        return closes
+        lows = self._get_collection(k)
+        if lows is None:
+            lows = self._column_to_collection(Map.low)
+            self._set_collection(k, lows)
+        return lows
 
     def get_times(self) -> tuple:
         k = self.COLLECTION_TIMES
         times = self._get_collection(k)
         if times is None:
-            idx = 0
-            coll = self._extract_index(idx)
-            _stage = Config.get(Config.STAGE_MODE)
-            # times = tuple(int(v) for v in coll) if _stage == Config.STAGE_1 else tuple(int(int(v)/1000) for v in coll)
-            times = tuple(int(int(v)/1000) for v in coll)
+            coll = self._get_column(Map.time)[::-1]
+            times = tuple((coll // 1000).astype(np.int64).tolist())
             self._set_collection(k, times)
         return times
 
@@ -101,8 +100,7 @@ class BinanceMarketPrice(MarketPrice, MyJson):
         key = self.COLLECTION_VOLUMES_LEFT if side == Map.left else self.COLLECTION_VOLUMES_RIGHT
         volumes = self._get_collection(key)
         if volumes is None:
-            idx = {Map.left: 5, Map.right: 7}[side]
-            volumes = self._extract_index(idx)
+            volumes = self._column_to_collection(side)
             self._set_collection(key, volumes)
         return volumes
 
@@ -113,12 +111,11 @@ class BinanceMarketPrice(MarketPrice, MyJson):
         :return: collection of values extracted from each line of market prices
         """
         mkt = self.get_market()
-        coll = [line[idx] for line in mkt]
+        coll = mkt[:, idx].tolist() if mkt.shape[0] > 0 else []
         return coll
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = BinanceMarketPrice([], '1m', Pair('@json/@json'))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -316,11 +316,10 @@ class BinanceOrder(Order):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = BinanceOrder(Order.TYPE_MARKET, Map({
             Map.pair: Pair('@json/@json'),
             Map.move: Order.MOVE_BUY,
             Map.amount: Price(0, '@json')
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -273,7 +273,6 @@ class BinanceRequest(BrokerRequest, MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = BinanceRequest(BrokerRequest.RQ_MARKET_PRICE, Map({
             Map.pair: Pair('@json/@json'),
             Map.period: 1,
@@ -281,5 +280,5 @@ class BinanceRequest(BrokerRequest, MyJson):
             Map.end_time: 2,
             Map.number: 1,
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
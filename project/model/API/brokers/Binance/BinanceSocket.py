@@ -1,16 +1,18 @@
 import threading
 import time
-from types import FunctionType, MethodType
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Hashable, List, Tuple, Union
 
 import numpy as np
 
 from config.Config import Config
 from model.API.brokers.Binance.BinanceAPI import BinanceAPI
 from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FlatMap import FlatMap
 from model.tools.Map import Map
+from model.tools.MessageQueue import MessageQueue
 from model.tools.Pair import Pair
 from model.tools.RequestResponse import RequestResponse
+from model.tools.RingBuffer import RingBuffer
 from model.tools.WaitingRoom import WaitingRoom
 from model.tools.WebSocket import WebSocket
 
@@ -36,18 +38,19 @@ class BinanceSocket(BinanceAPI):
     _THREAD_NAME_RUN_ADD_STREAM =           'run_add_stream'
     _THREAD_NAME_WEBSOCKET_MANGER =         'websocket_manager'
     _THREAD_NAME_WEBSOCKET_EVENT_HANDLER =  'websocket_event_handler'
-    _THREAD_NAME_WEBSOCKET_EVENT_WAITING =  'websocket_event_waiting'
     _THREAD_NAME_EVENT_STREAM =             'event_stream'
     _TIMEOUT_RUN_WEBSOCKET =                10
     _TIMEOUT_CLOSE_WEBSOCKET =              10
     _SLEEP_WAIT_NEW_MESSAGE =               1
-    _SLEEP_WAIT_EVENT_POST =                0.0001
     _SLEEP_WAIT_MARKET_POST =               0.1
     _SLEEP_RUN_WEBSOCKET =                  1
     _SLEEP_MANAGER_RUN_WEBSOCKET =          1
     _SLEEP_MANAGER_LOOP =                   1
     _SLEEP_POST_EVENT_STREAM =              0.0001
     MAX_N_PERIOD_OFFSET =                   5
+    _N_MESSAGE_CONSUMER =                   1
+    _MESSAGE_QUEUE_MAX_SIZE =               4096
+    _TIMEOUT_POST_MESSAGE =                 1
 
     def __init__(self, streams: list):
         if BinanceSocket._NB_INSTANCE is not None:
@@ -64,9 +67,8 @@ class BinanceSocket(BinanceAPI):
         self.__room_call_market_update =    None
         self.__market_reset_times =         None
         self.__thread_run_manager =         None
-        self.__room_post_event =            None
-        self.__thread_event_handler =       None
-        self.__websocket_messages =         None
+        self.__threads_message_consumer =   None
+        self.__message_queues =             None
         self.__event_streams =              None
         self.__thread_event_stream =        None
         self.__room_event_stream =          None
@@ -269,7 +271,7 @@ class BinanceSocket(BinanceAPI):
             Map[stream{str}]:   {int}   # in millisecond 
         """
         if self.__stream_times is None:
-            self.__stream_times = Map()
+            self.__stream_times = FlatMap()
         return self.__stream_times
 
     def get_stream_time(self, stream: str) -> int:
@@ -300,10 +302,10 @@ class BinanceSocket(BinanceAPI):
         --------
         return: Map
             List of market histories
-            Map[stream{str}]:   {Numpy.ndarray}
+            Map[stream{str}]:   {RingBuffer}
         """
         if self.__market_histories is None:
-            self.__market_histories = Map()
+            self.__market_histories = FlatMap()
         return self.__market_histories
 
     def _set_market_history(self, stream: str, raise_error: bool = True) -> bool:
@@ -349,7 +351,7 @@ class BinanceSocket(BinanceAPI):
         if is_success:
             market_history = bkr_rsp.get_content()
             martket_np = np.array(market_history, dtype=np.float64)
-            self._get_market_histories().put(martket_np, stream)
+            self._get_market_histories().put(RingBuffer(martket_np), stream)
             self._set_market_reset_time(stream)
         # End
         return is_success
@@ -363,8 +365,9 @@ class BinanceSocket(BinanceAPI):
         stream: str
             The stream of the history to treat
         """
-        history_np = self.get_market_history_np(stream)
-        history_np[:, [1,2,3,4,5,7,8,9,10]] = 0
+        self.get_market_history_np(stream)
+        market_history = self._get_market_histories().get(stream)
+        market_history[:, [1,2,3,4,5,7,8,9,10]] = 0
 
     def get_market_history_np(self, stream: str) -> np.ndarray:
         """
@@ -377,15 +380,16 @@ class BinanceSocket(BinanceAPI):
 
         Returns:
         --------
-        return: list
-            The market history for the given stream
+        return: np.ndarray
+            Read-only view of the market history for the given stream
+            NOTE: the view follows next updates of the history, copy it to keep it as it is
         """
         self.check_stream(stream)
         market_histories = self._get_market_histories()
         market_history = market_histories.get(stream)
-        if not isinstance(market_history, np.ndarray):
+        if not isinstance(market_history, RingBuffer):
             raise Exception(f"Market history don't exist for this stream '{stream}' (type='{type(market_history)}')")
-        return market_history
+        return market_history.view()
 
     def get_market_history(self, stream: str) -> list:
         """
@@ -401,8 +405,29 @@ class BinanceSocket(BinanceAPI):
         return: list
             The market history for the given stream
         """
-        market_history = self.get_market_history_np(stream)
-        return market_history.tolist()
+        self.get_market_history_np(stream)
+        market_history = self._get_market_histories().get(stream)
+        return market_history.copy().tolist()
+
+    def copy_market_history(self, stream: str, n_row: int = None) -> np.ndarray:
+        """
+        To get a copy of the newest rows of a market history
+
+        Parameters:
+        -----------
+        stream: str
+            The stream to get market history of
+        n_row: int = None
+            Number of newest rows to copy (default to all rows)
+
+        Returns:
+        --------
+        return: np.ndarray
+            The newest rows ordered from the older (index=0) to the newest (index=-1)
+        """
+        self.get_market_history_np(stream)
+        market_history = self._get_market_histories().get(stream)
+        return market_history.copy(n_row)
 
     def _reset_room_market_update(self) -> None:
         market_room = self.__room_market_update
@@ -478,7 +503,7 @@ class BinanceSocket(BinanceAPI):
             Map[stream{str}]: {int}
         """
         if self.__market_reset_times is None:
-            self.__market_reset_times = Map()
+            self.__market_reset_times = FlatMap()
         return self.__market_reset_times
 
     def _set_market_reset_time(self, stream: str) -> None:
@@ -533,60 +558,95 @@ class BinanceSocket(BinanceAPI):
             self.__thread_run_manager = new_thread
         return self.__thread_run_manager
 
-    def _reset_room_post_event(self) -> None:
-        post_room = self.__room_post_event
-        if post_room is not None:
-            tickets = post_room.get_tickets()
-            [post_room.quit_room(ticket) for ticket in tickets]
-            self.__room_post_event = None
-            del post_room
+    def _reset_threads_message_consumer(self) -> None:
+        self.__threads_message_consumer = None
 
-    def _get_room_post_event(self) -> WaitingRoom:
+    def _get_threads_message_consumer(self) -> List[threading.Thread]:
         """
-        To get queue where to wait to post event to handle
+        To get threads that treat messages received from websockets
+        NOTE: each thread treats messages of its own queue (from BinanceSocket._get_message_queues())
 
         Returns:
         --------
-        reeturn: WaitingRoom
-            Queue where to wait to post event to handle
+        return: List[threading.Thread]
+            Threads that treat messages received from websockets
         """
-        if self.__room_post_event is None:
-            self.__room_post_event = WaitingRoom('post-websocket-event')
-        return self.__room_post_event
+        if self.__threads_message_consumer is None:
+            base_name = self._THREAD_NAME_WEBSOCKET_EVENT_HANDLER
+            threads = []
+            for queue in self._get_message_queues():
+                def consume(f_queue: MessageQueue = queue) -> None:
+                    self._consume_messages(f_queue)
+                threads.append(self._generate_thread(consume, base_name, output=True))
+            self.__threads_message_consumer = threads
+        return self.__threads_message_consumer
 
-    def _reset_thread_event_handler(self) -> None:
-        self.__thread_event_handler = None
+    def _reset_message_queues(self) -> None:
+        queues = self.__message_queues
+        if queues is not None:
+            [queue.close() for queue in queues]
+        self.__message_queues = None
 
-    def _get_thread_event_handler(self, func: Union[FunctionType, MethodType]) -> threading.Thread:
+    def _get_message_queues(self) -> List[MessageQueue]:
         """
-        To get thread that mannage update of maket histories\n
+        To get queues of no treated messages received from websockets
+        NOTE: there's one queue per consumer thread
+
+        Return:
+        -------
+        return: List[MessageQueue]
+            Queues of no treated messages received from websockets
+        """
+        if self.__message_queues is None:
+            max_size = self._MESSAGE_QUEUE_MAX_SIZE
+            timeout = self._TIMEOUT_POST_MESSAGE
+            self.__message_queues = [MessageQueue(max_size, timeout) for _ in range(self._N_MESSAGE_CONSUMER)]
+        return self.__message_queues
+
+    def _start_message_consumers(self) -> None:
+        """
+        To start threads that treat messages received from websockets
+        """
+        self._reset_threads_message_consumer()
+        [thread.start() for thread in self._get_threads_message_consumer()]
+
+    def _post_message(self, route: str, key: Hashable, treat: Callable) -> bool:
+        """
+        To put a message in the queue of its consumer
+
+        Parameters:
+        -----------
+        route: str
+            Messages with the same route are treated by the same consumer in the order they are posted
+        key: Hashable
+            Key of the message, a message still in queue is replaced by a newer one with the same key
+        treat: Callable
+            Function to call to treat the message
+
         Returns:
         --------
-        return: threading.Thread
-            The thread that mannage update of maket histories
+        return: bool
+            True if the message is in queue else False
         """
-        if self.__thread_event_handler is None:
-            base_name = self._THREAD_NAME_WEBSOCKET_EVENT_HANDLER
-            new_thread = self._generate_thread(
-                func, base_name, output=True)
-            self.__thread_event_handler = new_thread
-        return self.__thread_event_handler
+        queues = self._get_message_queues()
+        queue = queues[hash(route) % len(queues)]
+        return queue.put(key, treat)
 
-    def _reset_websocket_messages(self) -> None:
-        self.__websocket_messages = None
-
-    def _get_websocket_messages(self) -> List[str]:
+    def _consume_messages(self, queue: MessageQueue) -> None:
         """
-        To get list of no treated messages received from websocke
+        To treat messages of a queue while BinanceSocket is running
 
-        Return:
-        -------
-        return: List[str]
-            List of no treated messages received from websocke
+        Parameters:
+        -----------
+        queue: MessageQueue
+            Queue of messages to treat
         """
-        if self.__websocket_messages is None:
-            self.__websocket_messages = []
-        return self.__websocket_messages
+        class_name = self.__class__.__name__
+        while self.is_running():
+            item = queue.get(timeout=self._SLEEP_WAIT_NEW_MESSAGE)
+            if item is not None:
+                _, treat = item
+                _MF.catch_exception(treat, class_name, repport=True)
 
     # ——————————————————————————————————————————— CALLBACK EVENT DOWN
 
@@ -828,7 +888,10 @@ class BinanceSocket(BinanceAPI):
         return: int
             The most recent event time else None (in millisecond)
         """
-        event_times = list(self._get_stream_times().get_map().values())
+        stream_times = self._get_stream_times()
+        # Streams are copied as WebSocket threads can add streams while iterating
+        event_times = [stream_times.get(stream) for stream in list(stream_times.get_keys())]
+        event_times = [event_time for event_time in event_times if event_time is not None]
         return max(event_times) if len(event_times) > 0 else None
 
     def _websocket_are_running(self) -> bool:
@@ -880,7 +943,7 @@ class BinanceSocket(BinanceAPI):
             def kline(pay_load: dict) -> None:
                 def update_fake_api(stream: str, merged_pair: str, str_period: str) -> None:
                     period = self.get_interval(str_period)
-                    market_history = self._get_market_histories().get(stream)
+                    market_history = self.get_market_history_np(stream)
                     BinanceFakeAPI.update_market_history(merged_pair, period, market_history)
                 def milli_to_date(milli) -> str:
                     return _MF.unix_to_date(int(milli/1000))
@@ -933,7 +996,8 @@ class BinanceSocket(BinanceAPI):
                 self._set_stream_time(stream, event_time)
                 new_row = build_new_row(pay_load)
                 market_hists = self._get_market_histories()
-                market_hist = market_hists.get(stream)
+                market_buffer = market_hists.get(stream)
+                market_hist = market_buffer.view()
                 if not is_market_history_correct(stream, new_row, market_hist):
                     self._update_market_history(stream) if (stream not in self._get_room_market_update().get_tickets()) else None
                 else:
@@ -942,22 +1006,22 @@ class BinanceSocket(BinanceAPI):
                     new_price_event = self.EVENT_NEW_PRICE
                     new_period_event = self.EVENT_NEW_PERIOD
                     occured_events = []
-                    if new_row[-1][0] == market_hist[-1][0]:
+                    last_open_time = market_hist[-1][0]
+                    last_close = market_hist[-1][4]
+                    if new_row[-1][0] == last_open_time:
                         print(_MF.prefix() + f"REPLACE LAST ROW") if BinanceSocket._VERBOSE else None
-                        market_hist[-1] = new_row
+                        market_buffer.replace_last(new_row[-1])
                         update_fake_api(stream, symbol, period_str) if stage == Config.STAGE_2 else None
                         occured_events.append(new_price_event)
-                    elif new_row[-1][0] > market_hist[-1][0]:
+                    elif new_row[-1][0] > last_open_time:
                         print(_MF.prefix() + f"PUSH NEW ROW") if BinanceSocket._VERBOSE else None
-                        new_market_hist = np.vstack((market_hist, new_row))
-                        new_market_hist = np.delete(new_market_hist, 0, axis=0)
-                        market_hists.put(new_market_hist, stream)
+                        market_buffer.append(new_row[-1])
                         update_fake_api(stream, symbol, period_str) if stage == Config.STAGE_2 else None
                         occured_events.append(new_period_event)
-                        occured_events.append(new_price_event) if (new_row[-1][4] != market_hist[-1][4]) else None
+                        occured_events.append(new_price_event) if (new_row[-1][4] != last_close) else None
                     elif BinanceSocket._VERBOSE:
                         new_date = _MF.unix_to_date(int(new_row[-1][0]/1000))
-                        market_date = _MF.unix_to_date(int(market_hist[-1][0]/1000))
+                        market_date = _MF.unix_to_date(int(last_open_time/1000))
                         error = f"Stream event '{stream}' is older than market's newest row (market='{market_date}', new_date='{new_date}')"
                         _MF.output(_MF.prefix() + _red + error + _normal)
                     end_debug() if BinanceSocket._VERBOSE else None
@@ -973,46 +1037,26 @@ class BinanceSocket(BinanceAPI):
                 else:
                     raise ValueError(f"on_message: this event '{event}' is not supported (message='{message}')")
 
-            def handle_event() -> None:
-                def extract_payload(decoded: dict) -> Tuple[str, dict]:
-                    n_row = len(decoded)
-                    if (n_row == 2) and (Map.stream in decoded) and (Map.data in decoded):
-                        pay_load = decoded[Map.data]
-                    elif 'e' in decoded:
-                        pay_load = decoded
-                    else:
-                        raise ValueError(f"on_message: can't handle event's message: '{f_message}'")
-                    event = pay_load['e']
-                    return event, pay_load
-
-                f_ws_messages = self._get_websocket_messages()
-                while self.is_running():
-                    if len(f_ws_messages) > 0:
-                        f_message = f_ws_messages.pop(0)
-                        decoded = _MF.json_decode(f_message)
-                        event, pay_load = extract_payload(decoded)
-                        root_event(event, pay_load)
-                    else:
-                        time.sleep(self._SLEEP_WAIT_NEW_MESSAGE)
-                self._reset_thread_event_handler()
-
-            def waiting_room() -> None:
-                def wait_my_trun() -> Tuple[WaitingRoom, str]:
-                    f_post_room = self._get_room_post_event()
-                    f_ticket = f_post_room.join_room()
-                    while not f_post_room.my_turn(f_ticket):
-                        time.sleep(self._SLEEP_WAIT_EVENT_POST)
-                    return f_post_room, f_ticket
-
-                post_room, ticket = wait_my_trun()
-                thread_event = self._get_thread_event_handler(handle_event)
-                ws_messages = self._get_websocket_messages()
-                ws_messages.append(message)
-                thread_event.start() if not thread_event.is_alive() else None
-                post_room.treat_ticket(ticket)
-            
-            base_name = self._THREAD_NAME_WEBSOCKET_EVENT_WAITING
-            self._generate_thread(waiting_room, base_name, output=False).start()
+            def extract_payload(decoded: dict) -> Tuple[str, dict]:
+                n_row = len(decoded)
+                if (n_row == 2) and (Map.stream in decoded) and (Map.data in decoded):
+                    pay_load = decoded[Map.data]
+                elif 'e' in decoded:
+                    pay_load = decoded
+                else:
+                    raise ValueError(f"on_message: can't handle event's message: '{message}'")
+                event = pay_load['e']
+                return event, pay_load
+
+            decoded = _MF.json_decode(message)
+            event, pay_load = extract_payload(decoded)
+            if event == 'kline':
+                # Updates of the same open kline are coalesced
+                route = f"{pay_load['s']}_{pay_load['k']['i']}"
+                key = (route, pay_load['k']['t'])
+            else:
+                route = key = _MF.new_code()
+            self._post_message(route, key, lambda: root_event(event, pay_load))
 
         # Create WebSocket
         _normal = '\033[0m'
@@ -1182,6 +1226,7 @@ class BinanceSocket(BinanceAPI):
         streams = self.get_streams()
         self.initialize_market_histories(streams, raise_error=True)
         self._turn_on()
+        self._start_message_consumers()
         wait_time = 0
         max_wait_time = self.get_run_restart_interval()
         while not self._websocket_are_running():
@@ -1203,9 +1248,8 @@ class BinanceSocket(BinanceAPI):
         self._reset_market_histories()
         self._reset_market_reset_times()
         self._reset_stream_times()
-        self._reset_websocket_messages()
-        self._reset_room_post_event()
-        self._reset_thread_event_handler()
+        self._reset_message_queues()
+        self._reset_threads_message_consumer()
         self.reset_module_event_streams()
 
     def _manage_run(self) -> None:
@@ -1230,8 +1274,9 @@ class BinanceSocket(BinanceAPI):
                 # Market Room
                 n_market_reset = len(self._get_room_market_update().get_tickets())
                 # Event room
-                n_ws_messages = len(self._get_websocket_messages())
-                n_event = len(self._get_room_post_event().get_tickets())
+                queues_stats = [queue.get_stats() for queue in self._get_message_queues()]
+                n_ws_messages = sum([stats.get(Map.size) for stats in queues_stats])
+                n_event = sum([stats.get(Map.coalesce) + stats.get(Map.drop) for stats in queues_stats])
                 # Event Callback Post + Treat
                 n_post_callback = len(self._get_room_post_event_stream().get_tickets())
                 n_treat_callback = len(self._get_queu_event_stream())
@@ -1239,9 +1284,9 @@ class BinanceSocket(BinanceAPI):
                 n_post_write = FileManager.n_wait()
                 n_write = FileManager.n_write()
                 msg = f"Running_WebSocket: ({n_running}/{n_wss}) == Post_Update_Room: ({n_call}) == Update_Room: ({n_market_reset})"
-                msg += f" == Post_Event_Room: '{n_event}' == N_Message: '{n_ws_messages}'"
+                msg += f" == Coalesced_Dropped_Message: '{n_event}' == N_Message: '{n_ws_messages}'"
                 msg += f" == Post_Callback_Room: '{n_post_callback}' == Treat_Callback: '{n_treat_callback}'"
-                msg += f" == Post_Write_Room: '{n_post_write}' == N_To_Write: '{n_write}'"
+                msg += f" == Unflushed_Write: '{n_post_write}' == N_To_Write: '{n_write}'"
                 _MF.output(f"{pfx()}" + _purple + msg + _normal) if BinanceSocket._DEBUG else None
             elif key == "B":
                 n_socket = kwargs[Map.websocket]
@@ -5,6 +5,7 @@ from config.Config import Config
 from model.structure.Broker import Broker
 from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.structure.strategies.Strategy import Strategy
+from model.tools.BackupJournal import BackupJournal
 from model.tools.FileManager import FileManager
 from model.tools.Map import Map
 from model.tools.MyJson import MyJson
@@ -21,6 +22,7 @@ class Bot(MyJson):
     _THREAD_BACKUP =        'bot_backup'
     _TIMEOUT_THREAD_STOP =  60*2
     SLEEP_DEFAULT_TRADE =   60
+    _BACKUP_INTERVAL =      60
 
     def __init__(self, capital: Price, strategy_class: Callable, broker_class: Callable, pair: Pair = None):
         self.__id =                 None
@@ -143,15 +145,15 @@ class Bot(MyJson):
     def set_broker(self, broker: Broker) -> None:
         self.get_strategy().set_broker(broker)
 
-    def _set_backup(self, backup: str) -> None:
-        if not isinstance(backup, str):
-            raise TypeError(f"The backup must be of type '{str}', instead '{type(backup)}'")
+    def _set_backup(self, backup: BackupJournal) -> None:
+        if not isinstance(backup, BackupJournal):
+            raise TypeError(f"The backup must be of type '{BackupJournal}', instead '{type(backup)}'")
         self.__backup = backup
 
     def _reset_backup(self) -> None:
         self.__backup = None
 
-    def _get_backup(self) -> str:
+    def _get_backup(self) -> BackupJournal:
         return self.__backup
 
     # ——————————————————————————————————————————— FUNCTION SETTER/GETTER UP ————————————————————————————————————————————
@@ -201,7 +203,8 @@ class Bot(MyJson):
             sleep_interval = _MF.catch_exception(strategy.trade, self.__class__.__name__)
             if sleep_interval is not None:
                 trade_index += 1
-                self.backup()
+                # Backtest moves a trade index per minute: backup each interval of index
+                self.backup() if (stage != Config.STAGE_1) or ((trade_index % self._BACKUP_INTERVAL) == 0) else None
             unix_time = _MF.get_timestamp()
             if stage in [Config.STAGE_2, Config.STAGE_3]:
                 sleep_interval = self.SLEEP_DEFAULT_TRADE if sleep_interval is None else sleep_interval
@@ -239,13 +242,19 @@ class Bot(MyJson):
         return attributes
 
     def backup(self, force: bool = False) -> None:
+        """
+        To backup attributes of Bot changed since the last backup
+
+        Parameters:
+        -----------
+        force: bool = False
+            Set True to write a full snapshot else False
+        """
         backup = self._get_backup()
-        json_str = self.json_encode()
-        if force or (backup != json_str):
-            bot_id = self.get_id()
-            bot_file_path = self.get_path_file_backup(bot_id)
-            FileManager.write(bot_file_path, json_str, overwrite=True, make_dir=True)
-            self._set_backup(json_str)
+        if backup is None:
+            backup = BackupJournal(self.get_path_file_backup(self.get_id()))
+            self._set_backup(backup)
+        backup.backup(self, snapshot=force)
 
     # ——————————————————————————————————————————— FUNCTION SELF UP —————————————————————————————————————————————————————
     # ——————————————————————————————————————————— STATIC FUNCTION DOWN —————————————————————————————————————————————————
@@ -308,11 +317,11 @@ class Bot(MyJson):
         file_path = cls.get_path_file_backup(bot_id)
         dir_path = FileManager.path_to_dir(file_path)
         backup_files = _MF.catch_exception(FileManager.get_files, cls.__name__, **{Map.path: dir_path})
+        backup_files = [backup_file for backup_file in backup_files if BackupJournal.is_snapshot(backup_file)] if backup_files is not None else None
         if (backup_files is None) or len(backup_files) == 0:
             raise Exception(f"There's not '{cls.__name__}' backup with this id '{bot_id}'")
         most_recent_file_path = dir_path + backup_files[-1]
-        json_str = FileManager.read(most_recent_file_path)
-        bot = MyJson.json_decode(json_str)
+        bot = BackupJournal.load(most_recent_file_path)
         return bot
 
     @classmethod
@@ -367,9 +376,8 @@ class Bot(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Bot.__new__(Bot)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
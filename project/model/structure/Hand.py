@@ -8,6 +8,7 @@ from config.Config import Config
 from model.structure.Broker import Broker
 from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.tools.Asset import Asset
+from model.tools.BackupJournal import BackupJournal
 from model.tools.HandTrade import HandTrade
 from model.tools.FileManager import FileManager
 from model.tools.Map import Map
@@ -33,6 +34,11 @@ class Hand(MyJson):
     _SLEEP_MARKET_ANALYSE =     60
     _N_PERIOD =                 300
     _STALK_FUNCTIONS =          None
+    _STALK_PERIODS = [
+        Broker.PERIOD_1MIN,
+        Broker.PERIOD_5MIN,
+        Broker.PERIOD_15MIN
+        ]
     _INTERVAL_BACKUP =          60*15
     STACK =                     None
     K_MARKET_TRENDS =           'K_MARKET_TRENDS'
@@ -701,13 +707,13 @@ class Hand(MyJson):
             self.__thread_market_analyse = thread
         return thread
 
-    def _set_backup(self, backup: str) -> None:
+    def _set_backup(self, backup: BackupJournal) -> None:
         self.__backup = backup
 
     def _reset_backup(self) -> None:
         self.__backup = None
 
-    def _get_backup(self) -> str:
+    def _get_backup(self) -> BackupJournal:
         return self.__backup
 
     def _set_backup_time(self, backup_time: int = None) -> None:
@@ -1167,7 +1173,9 @@ class Hand(MyJson):
 =======
         stalk_pairs = self._get_stalk_pairs()
 >>>>>>> Solomon-v5.4.4.2.2
-        marketprices = Map()
+        broker = self.get_broker()
+        n_period = self._N_PERIOD
+        marketprices = MarketPrice.prefetch(broker, [(pair, period, n_period) for pair in stalk_pairs for period in self._STALK_PERIODS])
         conditions = self._get_stalk_functions()
         selected_pairs = []
         stalk_start_date = _MF.unix_to_date(_MF.get_timestamp())
@@ -1178,7 +1186,7 @@ class Hand(MyJson):
                 row_start_date = _MF.unix_to_date(_MF.get_timestamp())
                 can_select, pair_repport = condition(stalk_pair, marketprices)
                 selected_pairs.append(stalk_pair) if can_select else None
-                marketprice_1min = self._marketprice(stalk_pair, period_1min, marketprices)
+                marketprice_1min = self._marketprice(broker, stalk_pair, period_1min, marketprices)
                 pair_repport = {
                     'stalk_start_date': stalk_start_date,
                     'row_start_date': row_start_date,
@@ -1315,8 +1323,8 @@ class Hand(MyJson):
         """
 
         vars_map = Map()
-        child_marketprice = self._marketprice(pair, period_15min, marketprices)
-        min_marketprice = self._marketprice(pair, period_1min, marketprices)
+        child_marketprice = self._marketprice(self.get_broker(), pair, period_15min, marketprices)
+        min_marketprice = self._marketprice(self.get_broker(), pair, period_1min, marketprices)
         # Child
         closes = list(child_marketprice.get_closes())
         closes.reverse()
@@ -1400,7 +1408,7 @@ class Hand(MyJson):
         period_5min = Broker.PERIOD_5MIN
         TRIGGER_KELTNER_ROI = 0.5/100
         vars_map = Map()
-        marketprice_5min = self._marketprice(pair, period_5min, marketprices)
+        marketprice_5min = self._marketprice(self.get_broker(), pair, period_5min, marketprices)
         keltner_roi = self._stalk_is_keltner_roi_above_trigger(vars_map, marketprice_5min, TRIGGER_KELTNER_ROI)
         price_switch_up = self._stalk_is_price_switch_up(vars_map, marketprice_5min)
         stalk_condition_1 = price_switch_up and keltner_roi
@@ -1722,6 +1730,7 @@ class Hand(MyJson):
         """
         To backup Hand
         NOTE: Hand is backed up every interval specified by Hand._INTERVAL_BACKUP
+        NOTE: only attributes changed since the last backup are written (see BackupJournal)
 
         Parameters:
         -----------
@@ -1737,14 +1746,13 @@ class Hand(MyJson):
             return now_time >= next_backup_time
         if force or is_backup_time():
             backup = self._get_backup()
-            json_str = self.json_encode()
-            if backup != json_str:
-                self._set_backup_time()
-                json_str = self.json_encode()
-                hand_id = self.get_id()
-                hand_file_path = self.get_path_file_backup(hand_id)
-                FileManager.write(hand_file_path, json_str, overwrite=True, make_dir=True)
-                self._set_backup(json_str)
+            if backup is None:
+                backup = BackupJournal(self.get_path_file_backup(self.get_id()))
+                self._set_backup(backup)
+            backup_time = self.get_backup_time()
+            self._set_backup_time()
+            if not backup.backup(self, ignores=[f'_{Hand.__name__}__backup_time']):
+                self.__backup_time = backup_time
 
     # ••• FUNCTION SELF OTHERS UP
     # ——————————————————————————————————————————— FUNCTION SELF UP ————————————————————————————————————————————————————
@@ -1809,11 +1817,11 @@ class Hand(MyJson):
         hand_file_path = cls.get_path_file_backup(hand_id)
         hand_dir_path = FileManager.path_to_dir(hand_file_path)
         backup_files = _MF.catch_exception(FileManager.get_files, cls.__name__, **{Map.path: hand_dir_path})
+        backup_files = [backup_file for backup_file in backup_files if BackupJournal.is_snapshot(backup_file)] if backup_files is not None else None
         if (backup_files is None) or len(backup_files) == 0:
             raise Exception(f"There's not Hand backup with this id '{hand_id}'")
         most_recent_file_path = hand_dir_path + backup_files[-1]
-        json_str = FileManager.read(most_recent_file_path)
-        hand = MyJson.json_decode(json_str)
+        hand = BackupJournal.load(most_recent_file_path)
         return hand
 
     @classmethod
@@ -1979,9 +1987,8 @@ class Hand(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Hand(Price(0, '@json'), Broker)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ——————————————————————————————————————————————————
@@ -366,9 +366,8 @@ class Genesis(Strategy):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Genesis.__new__(Genesis)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ––––––––––––––––––––––––––––––––––––––––––– STATIC UP
@@ -1886,7 +1886,6 @@ class Icarus(TraderClass):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Icarus(Map({
             Map.pair: Pair('@json/@json'),
             Map.maximum: None,
@@ -1894,7 +1893,7 @@ class Icarus(TraderClass):
             Map.rate: 1,
             Map.period: 0
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     def save_move(self, **agrs) -> None:
@@ -4379,9 +4378,10 @@ class Icarus(TraderClass):
         return backtest_df
 
     @classmethod
-    def backtest(cls, broker: Broker, starttime: int, endtime: int, periods: list[int], pairs: list[Pair] = None, buy_type: str = Map.close, sell_type: str = Map.close) -> None:
+    def backtest(cls, broker: Broker, starttime: int, endtime: int, periods: list[int], pairs: list[Pair] = None, buy_type: str = Map.close, sell_type: str = Map.close, n_process: int = None) -> None:
         """
         To backtest Strategy
+        NOTE: each (pair, period) is backtested in its own worker process (see BacktestRunner)
 
         Parameters:
         -----------
@@ -4402,31 +4402,50 @@ class Icarus(TraderClass):
         - close: to use close price
         - open: to use open price
         - mean: to use mean of open_price and close_price in period of 1min
+        n_process: int = None
+            Maximum number of worker processes (default to the number of CPU)
         """
-        import sys
-
         from model.API.brokers.Binance.BinanceAPI import BinanceAPI
         from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
-
-        def wrap_trades(pair: Pair, period: int, turn: int) -> None:
-            print(_MF.loop_progression(output_starttime, turn, n_turn,f"{pair.__str__().upper()}({BinanceAPI.convert_interval(period)})"))
-            BinanceFakeAPI.reset()
-            trades = cls.backtest_trade_history(pair, period, broker, buy_type, sell_type).to_dict(orient='records')
-            fields = list(trades[0].keys())
-            FileManager.write_csv(file_path, fields, trades, overwrite=False, make_dir=True)
+        from model.tools.BacktestRunner import BacktestRunner
 
         Config.update(Config.FAKE_API_START_END_TIME, {Map.start: starttime, Map.end: endtime})
         broker_name = broker.__class__.__name__
         active_path = True
         pairs = MarketPrice.history_pairs(broker_name, active_path=active_path) if pairs is None else pairs
         file_path = cls.file_path_backtest_test()
-        output_starttime = _MF.get_timestamp()
-        turn = 1
-        n_turn = len(pairs) * len(periods)
+        job_params = []
+        names = []
         for pair in pairs:
             for period in periods:
-                _MF.catch_exception(wrap_trades, cls.__name__, repport=True, **{Map.pair: pair, Map.period: period, 'turn': turn})
-                turn += 1
+                job_params.append({
+                    Map.pair: pair,
+                    Map.period: period,
+                    Map.broker: broker,
+                    'buy_type': buy_type,
+                    'sell_type': sell_type
+                    })
+                names.append(f"{pair.__str__().upper()}({BinanceAPI.convert_interval(period)})")
+        results = BacktestRunner.run(cls._backtest_trades, job_params, n_process=n_process, reset=BinanceFakeAPI.reset, names=names)
+        for result in results:
+            trades = result.get(Map.result)
+            if result.get(Map.error) is not None:
+                _MF.output(_MF.prefix() + f"Backtest of '{names[result.get(Map.index)]}' failed: '{result.get(Map.error)}'")
+            elif len(trades) > 0:
+                fields = list(trades[0].keys())
+                FileManager.write_csv(file_path, fields, trades, overwrite=False, make_dir=True)
+
+    @classmethod
+    def _backtest_trades(cls, pair: Pair, period: int, broker: Broker, buy_type: str, sell_type: str) -> list[dict]:
+        """
+        To get backtest's trades of a pair on a period as rows
+
+        Returns:
+        --------
+        return: list[dict]
+            Backtest's trades of the pair on the period
+        """
+        return cls.backtest_trade_history(pair, period, broker, buy_type, sell_type).to_dict(orient='records')
 
     @classmethod
     def backtest_trade_history(cls, pair: Pair, period: int, broker: Broker, buy_type: str, sell_type: str)  -> pd.DataFrame:
@@ -5013,7 +5032,6 @@ class Icarus(TraderClass):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Icarus(Map({
             Map.pair: Pair('@json/@json'),
             Map.maximum: None,
@@ -5021,7 +5039,7 @@ class Icarus(TraderClass):
             Map.rate: 1,
             Map.period: 0
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
 <<<<<<< HEAD
@@ -814,7 +814,6 @@ class IcarusStalker(StalkerClass):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = IcarusStalker(Map({
             Map.pair: Pair('@json/@json'),
             Map.maximum: None,
@@ -829,5 +828,5 @@ class IcarusStalker(StalkerClass):
                 Map.period: 0,
             }
         }))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -242,9 +242,8 @@ class Noah(Strategy):
 >>>>>>> Solomon-v5.4.4.2.2
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Noah.__new__(Noah)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ——————————————————————————————————————————————————
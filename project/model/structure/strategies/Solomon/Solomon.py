@@ -25,6 +25,7 @@ from model.structure.strategies.Strategy import Strategy
 >>>>>>> Solomon-v5.4.4.2.2
 from model.tools.FileManager import FileManager
 from model.tools.HandTrade import HandTrade
+from model.tools.LogSink import LogSink
 from model.tools.Map import Map
 from model.tools.MarketPrice import MarketPrice
 <<<<<<< HEAD
@@ -302,10 +303,11 @@ class Solomon(Strategy):
         if stack.get(stack_key) is not None:
             stack_copy = stack.get(stack_key).copy()
             del stack.get_map()[stack_key]
+            log_sink = LogSink.get_sink()
             for file, datas_dict in stack_copy.items():
                 fields =    datas_dict[Map.column]
                 rows =      datas_dict[Map.content]
-                FileManager.write_csv(file, fields, rows, overwrite=False, make_dir=True)
+                log_sink.write(file, rows, fields)
 
     def _callback_trade(self, params: dict, marketprices: Map = None) -> None:
         def explode_params(params: dict) -> tuple[str, int, Pair, int, np.ndarray]:
@@ -3899,9 +3901,8 @@ class Solomon(Strategy):
 >>>>>>> Solomon-v5.4.4.2.2
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Solomon.__new__(Solomon)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ––––––––––––––––––––––––––––––––––––––––––– STATIC UP
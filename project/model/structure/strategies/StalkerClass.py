@@ -556,7 +556,7 @@ class StalkerClass(Strategy, MyJson, ABC):
                 'base_name': self._THREAD_NAME_STALK_CHILD,
                 'call_class': self.__class__.__name__,
                 'repport': True,
-                'target_params': {Map.broker: broker, 'pairs': f_pair_group}
+                'target_params': {Map.broker: broker, 'pairs': f_pair_group, 'marketprices': marketprices}
             }
             return self._wrap_thread(**f_params)
 
@@ -584,6 +584,8 @@ class StalkerClass(Strategy, MyJson, ABC):
         pair_groups = group_pairs(pairs)
         threads = []
         starttime = _MF.get_timestamp()
+        n_period = broker.get_max_n_period()
+        marketprices = MarketPrice.prefetch(broker, [(pair, stalk_period, n_period) for pair in pairs])
         _MF.output(pfx() + _purple + f"Stalk '{len(pairs)}' pairs in '{len(pair_groups)}' groups" + _normal)
         for pair_group in pair_groups:
             thread = new_thread(pair_group)
@@ -594,7 +596,7 @@ class StalkerClass(Strategy, MyJson, ABC):
         delta_time = _MF.delta_time(starttime, endtime)
         _MF.output(pfx() + _purple + f"End stalking in '{delta_time}'" + _normal)
 
-    def _stalk_merket_thread(self, broker: Broker, pairs: List[Pair]) -> None:
+    def _stalk_merket_thread(self, broker: Broker, pairs: List[Pair], marketprices: Map = None) -> None:
         _normal = self._TO_REMOVE_STYLE_NORMAL
         _cyan = self._TO_REMOVE_STYLE_CYAN
         _green = self._TO_REMOVE_STYLE_GREEN
@@ -604,8 +606,11 @@ class StalkerClass(Strategy, MyJson, ABC):
         n_pair = len(pairs)
         repports = []
         i = 1
+        marketprices = marketprices if marketprices is not None else Map()
         for pair in pairs:
-            marketprice = MarketPrice.marketprice(broker, pair, stalk_period, n_period)
+            marketprice = marketprices.get(pair, stalk_period)
+            if marketprice is None:
+                marketprice = MarketPrice.marketprice(broker, pair, stalk_period, n_period)
             max_not_reached = not self.max_active_strategies_reached()
             eligible = False
             if max_not_reached:
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Callable, List
+from typing import Callable, List, Union
 
+import numpy as np
 import pandas as pd
 
 from config.Config import Config
@@ -9,6 +10,7 @@ from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.structure.Hand import Hand
 from model.tools.FileManager import FileManager
 from model.tools.HandTrade import HandTrade
+from model.tools.FlatMap import FlatMap
 from model.tools.Map import Map
 from model.tools.MarketPrice import MarketPrice
 from model.tools.Order import Order
@@ -142,7 +144,7 @@ class Strategy(Hand, ABC):
             The sleep time before the next call of this function
         """
         self._update_orders()
-        marketprices = Map()
+        marketprices = FlatMap()
         self._trade_inner(marketprices=marketprices)
         self._repport_positions(marketprices)
         return self.get_sleep_trade()
@@ -162,7 +164,46 @@ class Strategy(Hand, ABC):
     @classmethod
     def backtest(cls, broker: Broker, pair: Pair, starttime: int, endtime: int) -> None:
         Config.update(Config.FAKE_API_START_END_TIME, {Map.start: starttime, Map.end: endtime})
-        trades, buy_conditions, sell_conditions, stats = cls._backtest_loop(broker, pair, starttime, endtime)
+        buy_conditions, sell_conditions, trade_rows = cls._backtest_rows(broker, pair, starttime, endtime)
+        cls._backtest_write(buy_conditions, sell_conditions, trade_rows)
+
+    @classmethod
+    def backtest_pairs(cls, broker: Broker, pairs: List[Pair], starttime: int, endtime: int, n_process: int = None) -> None:
+        """
+        To backtest Strategy on many pairs
+        NOTE: each pair is backtested in its own worker process (see BacktestRunner)
+        and backtest files are written in the order of the given pairs
+
+        Parameters:
+        -----------
+        broker: Broker
+            Access to a Broker's API
+        pairs: List[Pair]
+            Pairs to backtest
+        starttime: int
+            Time of the older period to backtest
+        endtime: int
+            Time of the most recent period to backtest
+        n_process: int = None
+            Maximum number of worker processes (default to the number of CPU)
+        """
+        from model.API.brokers.Binance.BinanceFakeAPI import BinanceFakeAPI
+        from model.tools.BacktestRunner import BacktestRunner
+        Config.update(Config.FAKE_API_START_END_TIME, {Map.start: starttime, Map.end: endtime})
+        job_params = [{Map.broker: broker, Map.pair: pair, 'starttime': starttime, 'endtime': endtime} for pair in pairs]
+        names = [pair.__str__().upper() for pair in pairs]
+        results = BacktestRunner.run(cls._backtest_rows, job_params, n_process=n_process, reset=BinanceFakeAPI.reset, names=names)
+        for result in results:
+            if result.get(Map.error) is not None:
+                _MF.output(_MF.prefix() + f"Backtest of '{names[result.get(Map.index)]}' failed: '{result.get(Map.error)}'")
+            else:
+                cls._backtest_write(*result.get(Map.result))
+
+    @classmethod
+    def _backtest_write(cls, buy_conditions: list[dict], sell_conditions: list[dict], trade_rows: list[dict]) -> None:
+        """
+        To write backtest's rows in backtest files
+        """
         # Buy
         if len(buy_conditions) > 0:
             buy_file_path = cls.get_path_backtest_file(Map.condition, **{Map.side: Map.buy})
@@ -174,8 +215,23 @@ class Strategy(Hand, ABC):
             sell_field = list(sell_conditions[0].keys())
             FileManager.write_csv(sell_file_path, sell_field, sell_conditions, overwrite=False, make_dir=True)
         # Trades
-        if len(trades) > 0:
+        if len(trade_rows) > 0:
             trade_file_path = cls.get_path_backtest_file(Map.test)
+            FileManager.write_csv(trade_file_path, list(trade_rows[0].keys()), trade_rows, overwrite=False, make_dir=True)
+
+    @classmethod
+    def _backtest_rows(cls, broker: Broker, pair: Pair, starttime: int, endtime: int) -> tuple[list[dict], list[dict], list[dict]]:
+        """
+        To backtest Strategy on a pair and get rows to write in backtest files
+
+        Returns:
+        --------
+        return: tuple[list[dict], list[dict], list[dict]]
+            Rows of buy conditions, sell conditions and trades
+        """
+        trades, buy_conditions, sell_conditions, stats = cls._backtest_loop(broker, pair, starttime, endtime)
+        trade_rows = []
+        if len(trades) > 0:
             rows = []
             broker_str = broker.__class__.__name__
             for trade in trades:
@@ -245,7 +301,8 @@ class Strategy(Hand, ABC):
             pd_rows.loc[:,'win_rate'] =             n_win/pd_rows.shape[0]
             pd_rows.loc[:,'n_loss'] =               n_loss
             pd_rows.loc[:,'loss_rate'] =            n_loss/pd_rows.shape[0]
-            FileManager.write_csv(trade_file_path, pd_rows.columns, pd_rows.replace({float('nan'): None}).to_dict('records'), overwrite=False, make_dir=True)
+            trade_rows = pd_rows.replace({float('nan'): None}).to_dict('records')
+        return buy_conditions, sell_conditions, trade_rows
 
     @classmethod
     def _backtest_loop(cls, broker: Broker, pair: Pair, starttime: int, endtime: int) -> tuple[list[dict], list[dict], list[dict]]:
@@ -271,13 +328,24 @@ class Strategy(Hand, ABC):
             _MF.update_bot_trade_index(i)
             marketprice = _MF.catch_exception(cls._marketprice, cls.__name__, repport=False, **market_params)
             return (not isinstance(marketprice, MarketPrice)), marketprice
-        def update_stats(i: int, stats: dict, marketprice: MarketPrice) -> None:
+        def next_index(i: int, marketprice: MarketPrice, trade: dict) -> int:
+            # Only buy conditions are checked while there's no trade
+            if (trigger_times is None) or (trade is not None):
+                return i + 1
+            open_time = marketprice.get_time()
+            position = np.searchsorted(trigger_times, open_time + period_1min, side='left')
+            if position < trigger_times.shape[0]:
+                n_jump = int((trigger_times[position] - open_time)/period_1min)
+            else:
+                n_jump = max_jump
+            return i + min(max(n_jump, 1), max_jump)
+        def update_stats(i: int, stats: dict, marketprice: MarketPrice, n_row: int) -> None:
             close = marketprice.get_close()
             open_time = marketprice.get_time()
-            marketprice_np = marketprice.to_pd()
-            high = float(marketprice_np.loc[marketprice_np.index[-1], Map.high])
-            low = float(marketprice_np.loc[marketprice_np.index[-1], Map.low])
-            open_price = float(marketprice_np.loc[marketprice_np.index[-1], Map.open])
+            # Rows skipped since the last turn are included
+            high = float(max(marketprice.get_highs()[:n_row]))
+            low = float(min(marketprice.get_lows()[:n_row]))
+            open_price = float(marketprice.get_opens()[0])
             if i == 0:
                 stats[Map.start] = open_time
                 stats[Map.open] = open_price
@@ -295,6 +363,11 @@ class Strategy(Hand, ABC):
             Map.pair:   pair,
             Map.period: Broker.PERIOD_1MIN
         }
+        period_1min = Broker.PERIOD_1MIN
+        trigger_times = cls._backtest_trigger_times(broker, pair, starttime, endtime)
+        trigger_times = np.sort(np.asarray(trigger_times, dtype=np.int64)) if trigger_times is not None else None
+        # Skipped rows must stay in the MarketPrice of the next turn to update stats
+        max_jump = max(cls._N_PERIOD - 1, 1)
         trade = None
         trades = []
         buy_conditions = []
@@ -311,28 +384,62 @@ class Strategy(Hand, ABC):
         output_starttime = None
         output_n_turn = None
         #
-        i = -1
+        i = 0
+        last_i = -1
         _MF.output(_MF.prefix() + f"Backtest '{pair_str.upper()}' from '{_MF.unix_to_date(starttime)}' to '{_MF.unix_to_date(endtime)}'")
         while True:
             # Manage Loop
-            i += 1
-            market_params['marketprices'] = marketprices = Map()
+            market_params['marketprices'] = marketprices = FlatMap()
             can_break_loop, marketprice = break_loop(i, market_params)
+            if can_break_loop and ((i - last_i) > 1):
+                # Jumped after the end: finish period by period
+                trigger_times = None
+                i = last_i + 1
+                continue
             if can_break_loop:
                 break
             # Print time
             output_starttime, output_n_turn = output(i, marketprice, output_starttime, output_n_turn)
             # Stats
-            update_stats(i, stats, marketprice)
+            update_stats(i, stats, marketprice, n_row=i-last_i)
             # Execution 2
             trade = try_execute(broker, marketprices, trade)
             # Trade
             trade = cls._backtest_loop_inner(broker, marketprices, pair, trades, trade, buy_conditions, sell_conditions)
             # Execution 2
             trade = try_execute(broker, marketprices, trade)
+            last_i = i
+            i = next_index(i, marketprice, trade)
         print() # To clean static print output()
         return trades, buy_conditions, sell_conditions, stats
 
+    @classmethod
+    def _backtest_trigger_times(cls, broker: Broker, pair: Pair, starttime: int, endtime: int) -> Union[np.ndarray, None]:
+        """
+        To get open times of 1min periods where a trade can be opened
+        NOTE: Strategy that can compute its buy conditions on the whole history at once overrides
+        this function so Strategy._backtest_loop() jumps over periods where no trade can be opened
+        NOTE: buy conditions are only reported for periods evaluated
+
+        Parameters:
+        -----------
+        broker: Broker
+            Access to a Broker's API
+        pair: Pair
+            Pair to backtest
+        starttime: int
+            Time of the older period to backtest
+        endtime: int
+            Time of the most recent period to backtest
+
+        Returns:
+        --------
+        return: Union[np.ndarray, None]
+            Open times (in second) where buy conditions can be True
+            or None to check buy conditions at each period
+        """
+        return None
+
     @classmethod
     @abstractmethod
     def _backtest_loop_inner(cls, broker: Broker, marketprices: Map, pair: Pair, trades: list[dict], trade: dict, buy_conditions: list, sell_conditions: list) -> None:
@@ -1,10 +1,31 @@
+from typing import Dict
+
 from model.tools.MyJson import MyJson
 
 
 class Asset(MyJson):
-    def __init__(self, sbl: str):
-        self.__symbol = sbl.lower()
-        self.__name = None
+    """
+    To represent an asset (i.e.: 'btc', 'usdt')
+    NOTE: Asset are immutable and interned: Asset('BTC') is Asset('btc')
+    """
+    __slots__ = ('__symbol', '__name', '__hash')
+    _ASSETS = {}
+
+    def __new__(cls, sbl: str) -> 'Asset':
+        if cls is not Asset:
+            return super().__new__(cls)
+        asset = Asset._ASSETS.get(sbl)
+        if asset is None:
+            symbol = sbl.lower()
+            asset = Asset._ASSETS.get(symbol)
+            if asset is None:
+                asset = super().__new__(cls)
+                asset.__symbol = symbol
+                asset.__name = None
+                asset.__hash = hash(symbol)
+                asset = Asset._ASSETS.setdefault(symbol, asset)
+            Asset._ASSETS[sbl] = asset
+        return asset
 
     def get_symbol(self) -> str:
         return self.__symbol
@@ -12,22 +33,42 @@ class Asset(MyJson):
     def get_name(self) -> str:
         return self.__name
 
+    def _json_encode_to_dict(self) -> dict:
+        return {'_Asset__symbol': self.__symbol, '_Asset__name': self.__name}
+
+    @staticmethod
+    def get_assets() -> Dict[str, 'Asset']:
+        """
+        To get Asset interned
+
+        Returns:
+        --------
+        return: Dict[str, Asset]
+            Asset interned by symbol
+        """
+        return {symbol: asset for symbol, asset in Asset._ASSETS.items() if symbol == asset.get_symbol()}
+
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
-        instance = Asset('@json')
-        exec(MyJson.get_executable())
-        return instance
+        return Asset(object_dic['_Asset__symbol'])
+
+    def __reduce__(self) -> tuple:
+        return (Asset, (self.__symbol,))
 
     def __eq__(self, other):
-        return self.get_symbol() == other.get_symbol() if isinstance(other, Asset) else other\
-               and self.get_name() == other.get_name() if isinstance(other, Asset) else other
+        if self is other:
+            return True
+        if isinstance(other, Asset):
+            return self.__symbol == other.__symbol
+        if isinstance(other, str):
+            return self.__symbol == other
+        return NotImplemented
 
     def __str__(self) -> str:
-        return self.get_symbol()
+        return self.__symbol
 
     def __repr__(self) -> str:
         return self.__str__()
 
     def __hash__(self) -> int:
-        return self.__str__().__hash__()
+        return self.__hash
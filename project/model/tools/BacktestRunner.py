@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, List
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FileManager import FileManager
+from model.tools.Map import Map
+
+
+class BacktestRunner:
+    """
+    To run backtest jobs in parallel across processes
+
+    Jobs are shared between worker processes forked from the calling process, so
+    each worker starts with a copy of the loaded state (Config, market histories)
+    and owns its fake API state: it's reset before each job. Results are sent back
+    to the calling process that merges them in the order of the jobs, whatever the
+    order in which jobs end.
+    FileManager is flushed before workers are forked and each worker starts with its
+    own write queue, files a job writes are flushed before the job is reported as ended.
+    """
+    _START_METHOD = 'fork'
+    # Jobs of the running backtest (inherited by forked workers)
+    _JOB = None
+    _JOB_PARAMS = None
+    _RESET = None
+
+    @staticmethod
+    def can_fork() -> bool:
+        """
+        To check if worker processes can be forked on this platform
+
+        Returns:
+        --------
+        return: bool
+            True if worker processes can be forked else False
+        """
+        return BacktestRunner._START_METHOD in multiprocessing.get_all_start_methods()
+
+    @staticmethod
+    def get_n_process(n_process: int = None, n_job: int = None) -> int:
+        """
+        To get the number of worker processes to use
+
+        Parameters:
+        -----------
+        n_process: int = None
+            Number of processes wanted (default to the number of CPU)
+        n_job: int = None
+            Number of jobs to run
+
+        Returns:
+        --------
+        return: int
+            The number of worker processes to use
+        """
+        n_process = (os.cpu_count() or 1) if n_process is None else n_process
+        if n_process < 1:
+            raise ValueError(f"The number of process must be at least 1, instead '{n_process}'")
+        n_process = min(n_process, n_job) if (n_job is not None) and (n_job > 0) else n_process
+        return n_process if BacktestRunner.can_fork() else 1
+
+    @classmethod
+    def run(cls, job: Callable, job_params: List[dict], n_process: int = None, reset: Callable = None, names: List[str] = None, output: bool = True) -> List[Map]:
+        """
+        To run jobs in parallel
+        NOTE: jobs are run in the calling process when only 1 process is used or when processes can't be forked
+
+        Parameters:
+        -----------
+        job: Callable
+            Function to run for each job, its returned value must be picklable
+        job_params: List[dict]
+            Params of each job (job(**params))
+        n_process: int = None
+            Maximum number of worker processes (default to the number of CPU)
+        reset: Callable = None
+            Function to call before each job to reset the state shared by jobs (i.e.: BinanceFakeAPI.reset)
+        names: List[str] = None
+            Name of each job to output the progression
+        output: bool = True
+            Set True to output the progression else False
+
+        Returns:
+        --------
+        return: List[Map]
+            Results in the same order as job_params
+            result[i][Map.index]:   {int}           # Index of the job in job_params
+            result[i][Map.result]:  {Any}           # Value returned by the job (None if it failed)
+            result[i][Map.time]:    {float}         # Duration of the job (in second)
+            result[i][Map.error]:   {str|None}      # Error raised by the job
+        """
+        n_job = len(job_params)
+        names = [str(i) for i in range(n_job)] if names is None else names
+        n_process = cls.get_n_process(n_process, n_job)
+        cls._JOB = job
+        cls._JOB_PARAMS = job_params
+        cls._RESET = reset
+        results = []
+        output_starttime = _MF.get_timestamp()
+        try:
+            if n_process <= 1:
+                executions = map(cls._execute, range(n_job))
+                results = cls._collect(executions, n_job, names, output_starttime, output)
+            else:
+                FileManager.flush()
+                context = multiprocessing.get_context(cls._START_METHOD)
+                with context.Pool(processes=n_process, initializer=FileManager.reset_after_fork) as pool:
+                    executions = pool.imap_unordered(cls._execute, range(n_job), chunksize=1)
+                    results = cls._collect(executions, n_job, names, output_starttime, output)
+        finally:
+            cls._JOB = None
+            cls._JOB_PARAMS = None
+            cls._RESET = None
+        results.sort(key=lambda result: result.get(Map.index))
+        return results
+
+    @staticmethod
+    def _collect(executions: Any, n_job: int, names: List[str], output_starttime: int, output: bool) -> List[Map]:
+        results = []
+        turn = 1
+        for index, result, duration, error in executions:
+            results.append(Map({Map.index: index, Map.result: result, Map.time: duration, Map.error: error}))
+            if output:
+                status = f"{names[index]} in '{round(duration, 2)}'sec." if error is None else f"{names[index]} failed: '{error}'"
+                _MF.output(_MF.loop_progression(output_starttime, turn, n_job, status))
+            turn += 1
+        return results
+
+    @classmethod
+    def _execute(cls, index: int) -> tuple:
+        """
+        To run a job in a worker
+
+        Parameters:
+        -----------
+        index: int
+            Index of the job to run
+
+        Returns:
+        --------
+        return: tuple
+            The index of the job, the value returned, its duration (in second) and the error raised
+        """
+        start = time.perf_counter()
+        result = None
+        error = None
+        try:
+            cls._RESET() if cls._RESET is not None else None
+            result = cls._JOB(**cls._JOB_PARAMS[index])
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        FileManager.flush()
+        return index, result, time.perf_counter() - start, error
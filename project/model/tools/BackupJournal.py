@@ -0,0 +1,239 @@
+import threading
+from math import isnan
+from typing import Any, List
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FileManager import FileManager
+from model.tools.MyJson import MyJson
+
+
+class BackupJournal:
+    """
+    To back up a MyJson object in a full snapshot followed by a journal of its changes
+
+    Each backup encodes the object into its JSON values and compares them with the
+    values of the previous backup: only attributes that changed are appended to the
+    journal. A full snapshot is written on the first backup and every interval of
+    journal entries, the journal is then restarted.
+    NOTE: snapshot 'path/to/backup.json' => journal 'path/to/backup.journal'
+    NOTE: a journal entry is the JSON line [snapshot_id, sequence, [[keys, value], [keys], ...]]
+          where [keys, value] sets a value and [keys] deletes it
+    NOTE: entries are only applied to the snapshot that has their id, so entries left by
+          a previous journal are never applied to a new snapshot
+    """
+    _EXTENSION_JOURNAL = '.journal'
+    _TOKEN_SEQUENCE = '@backup_sequence'
+    _TOKEN_SNAPSHOT = '@backup_snapshot'
+    _SNAPSHOT_INTERVAL = 100
+
+    def __init__(self, path: str, snapshot_interval: int = None) -> None:
+        """
+        To create a new journal
+
+        Parameters:
+        -----------
+        path: str
+            Path to the snapshot file from the project's directory
+        snapshot_interval: int = None
+            Number of journal entries written between two snapshots
+        """
+        self.__path = path
+        self.__snapshot_interval = self._SNAPSHOT_INTERVAL if snapshot_interval is None else snapshot_interval
+        if self.__snapshot_interval < 1:
+            raise ValueError(f"The snapshot interval must be at least 1, instead '{self.__snapshot_interval}'")
+        self.__values = None
+        self.__snapshot_id = None
+        self.__sequence = 0
+        self.__n_entry = 0
+        self.__lock = threading.Lock()
+
+    def get_path(self) -> str:
+        return self.__path
+
+    def get_path_journal(self) -> str:
+        return self.journal_path(self.get_path())
+
+    def get_snapshot_interval(self) -> int:
+        return self.__snapshot_interval
+
+    def get_snapshot_id(self) -> str:
+        """
+        To get the id of the last snapshot written
+        """
+        return self.__snapshot_id
+
+    def get_sequence(self) -> int:
+        """
+        To get the sequence number of the last backup written
+        """
+        return self.__sequence
+
+    def backup(self, obj: MyJson, ignores: List[str] = None, snapshot: bool = False) -> bool:
+        """
+        To back up changes of an object since its last backup
+
+        Parameters:
+        -----------
+        obj: MyJson
+            The object to back up
+        ignores: List[str] = None
+            Attributes whose change alone don't require a backup
+        snapshot: bool = False
+            Set True to write a full snapshot else False
+
+        Returns:
+        --------
+        return: bool
+            True if a backup was written else False
+        """
+        with self.__lock:
+            values = obj._json_encode_object()
+            if (self.__values is None) or snapshot or (self.__n_entry >= self.get_snapshot_interval()):
+                self._write_snapshot(values)
+                return True
+            delta = []
+            self.diff(self.__values, values, [], delta)
+            ignores = [] if ignores is None else ignores
+            if all(change[0][0] in ignores for change in delta):
+                return False
+            self.__sequence += 1
+            self.__n_entry += 1
+            self.__values = values
+            FileManager.write(self.get_path_journal(), _MF.json_encode([self.__snapshot_id, self.__sequence, delta]), overwrite=False, make_dir=True)
+            return True
+
+    def _write_snapshot(self, values: dict) -> None:
+        """
+        To write a full snapshot and restart the journal
+        NOTE: must be called with the journal's lock acquired
+        NOTE: the snapshot is written in a temporary file that then replaces the previous one
+        """
+        self.__snapshot_id = _MF.new_code()
+        self.__sequence += 1
+        self.__n_entry = 0
+        self.__values = values
+        snapshot = {**values, self._TOKEN_SNAPSHOT: self.__snapshot_id, self._TOKEN_SEQUENCE: self.__sequence}
+        FileManager.write(self.get_path(), _MF.json_encode(snapshot), overwrite=True, make_dir=True, atomic=True)
+        FileManager.write(self.get_path_journal(), '', overwrite=True, make_dir=True, line_return=False)
+
+    @classmethod
+    def journal_path(cls, path: str) -> str:
+        """
+        To get the path of the journal of a snapshot
+
+        Parameters:
+        -----------
+        path: str
+            Path to the snapshot file from the project's directory
+
+        Returns:
+        --------
+        return: str
+            Path to the journal file from the project's directory
+        """
+        base_path = path[:path.rindex('.')] if '.' in path.split('/')[-1] else path
+        return base_path + cls._EXTENSION_JOURNAL
+
+    @classmethod
+    def is_journal(cls, path: str) -> bool:
+        return path.endswith(cls._EXTENSION_JOURNAL)
+
+    @classmethod
+    def is_snapshot(cls, path: str) -> bool:
+        """
+        To check if a backup file is a snapshot
+        NOTE: a snapshot's temporary file can remain if the process stopped while writing it
+        """
+        return not (cls.is_journal(path) or FileManager.is_temporary(path))
+
+    @staticmethod
+    def diff(old_values: dict, new_values: dict, keys: List[str], delta: List[list]) -> None:
+        """
+        To list changes between two JSON dicts
+
+        Parameters:
+        -----------
+        old_values: dict
+            JSON values of the previous backup
+        new_values: dict
+            JSON values to back up
+        keys: List[str]
+            Keys to reach the dicts from the root
+        delta: List[list]
+            List where to add changes
+        """
+        for key, value in new_values.items():
+            if key not in old_values:
+                delta.append([[*keys, key], value])
+                continue
+            old_value = old_values[key]
+            if (old_value is value) or (old_value == value):
+                continue
+            if isinstance(value, dict) and isinstance(old_value, dict):
+                BackupJournal.diff(old_value, value, [*keys, key], delta)
+            elif isinstance(value, float) and isinstance(old_value, float) and isnan(value) and isnan(old_value):
+                continue
+            else:
+                delta.append([[*keys, key], value])
+        for key in old_values.keys():
+            if key not in new_values:
+                delta.append([[*keys, key]])
+
+    @staticmethod
+    def apply(values: dict, delta: List[list]) -> None:
+        """
+        To apply changes of a journal entry to JSON values
+
+        Parameters:
+        -----------
+        values: dict
+            JSON values to update
+        delta: List[list]
+            Changes to apply
+        """
+        for change in delta:
+            keys = change[0]
+            parent = values
+            for key in keys[:-1]:
+                parent = parent[key]
+            if len(change) > 1:
+                parent[keys[-1]] = change[1]
+            else:
+                parent.pop(keys[-1], None)
+
+    @classmethod
+    def load(cls, path: str) -> Any:
+        """
+        To load an object from its snapshot and the journal that follows
+
+        Parameters:
+        -----------
+        path: str
+            Path to the snapshot file from the project's directory
+
+        Returns:
+        --------
+        return: Any
+            The object backed up
+        """
+        values = _MF.json_decode(FileManager.read(path))
+        snapshot_id = values.pop(cls._TOKEN_SNAPSHOT, None)
+        sequence = values.pop(cls._TOKEN_SEQUENCE, 0)
+        journal_path = cls.journal_path(path)
+        journal = FileManager.read(journal_path) if FileManager.exist_file(journal_path) else ''
+        for line in journal.splitlines():
+            if len(line) == 0:
+                continue
+            try:
+                entry_snapshot_id, entry_sequence, delta = _MF.json_decode(line)
+            except ValueError:
+                # Last entry interrupted while written
+                break
+            if (entry_snapshot_id != snapshot_id) or (entry_sequence <= sequence):
+                # Entry of another snapshot's journal
+                continue
+            if entry_sequence != (sequence + 1):
+                break
+            cls.apply(values, delta)
+            sequence = entry_sequence
+        return MyJson._generate_instance(values)
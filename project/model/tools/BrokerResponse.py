@@ -1,5 +1,7 @@
 from json import loads as json_loads
 from typing import Union
+
+import numpy as np
 from requests import Response
 
 from model.tools.MyJson import MyJson
@@ -7,15 +9,29 @@ from model.tools.RequestResponse import RequestResponse
 
 
 class BrokerResponse(RequestResponse, MyJson):
-    def __init__(self, rsp: Response):
+    def __init__(self, rsp: Response, content: np.ndarray = None):
+        """
+        Constructor
+
+        Parameters:
+        -----------
+        rsp: Response
+            The response received
+        content: np.ndarray = None
+            Content already decoded (i.e.: from a stream in the same process)
+            NOTE: set it to skip the JSON decoding of the response's content
+        """
         RequestResponse.__init__(self, rsp)
+        self.__decoded_content = content
 
-    def get_content(self) -> Union[list, dict]:
+    def get_content(self) -> Union[list, dict, np.ndarray]:
+        decoded_content = self.__decoded_content
+        if decoded_content is not None:
+            return decoded_content
         return json_loads(super(BrokerResponse, self).get_content())
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = BrokerResponse(Response())
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -0,0 +1,238 @@
+import atexit
+import pickle
+import threading
+import time
+import zlib
+from pickle import Unpickler
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FileManager import FileManager
+from model.tools.LogSink import LogSink
+from model.tools.Map import Map
+
+
+class ColumnarLogSink(LogSink):
+    """
+    To store logs in append-only binary files of typed columns
+
+    Rows are buffered per log and written by chunk: a chunk holds one numpy array per
+    field (numbers and booleans keep their type, other values are stored as strings)
+    pickled then compressed. A log is split in parts rotated when they exceed a size
+    or an age, each part starts with the log's schema so it can be read alone.
+    NOTE: part of a log 'path/to/log.csv' => 'path/to/log-{part_index}.bin'
+    NOTE: a part is a sequence of pickled records: the schema {dict} then chunks {bytes}
+    """
+    _EXTENSION = '.bin'
+    _VERSION = 1
+    _CHUNK_SIZE = 1000
+    _FLUSH_INTERVAL = 60
+    _MAX_PART_SIZE = 2**26
+    _MAX_PART_AGE = 60*60*24
+    _COMPRESS_LEVEL = 1
+
+    def __init__(self, chunk_size: int = None, flush_interval: float = None, max_part_size: int = None, max_part_age: float = None, compress: bool = True) -> None:
+        """
+        To create a new sink
+
+        Parameters:
+        -----------
+        chunk_size: int = None
+            Number of rows buffered before to write a chunk
+        flush_interval: float = None
+            Maximum time rows stay buffered while rows are written (in second)
+        max_part_size: int = None
+            Size from which a new part is started (in byte)
+        max_part_age: float = None
+            Time from which a new part is started (in second)
+        compress: bool = True
+            Set True to compress chunks else False
+        """
+        self.__chunk_size = self._CHUNK_SIZE if chunk_size is None else chunk_size
+        self.__flush_interval = self._FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.__max_part_size = self._MAX_PART_SIZE if max_part_size is None else max_part_size
+        self.__max_part_age = self._MAX_PART_AGE if max_part_age is None else max_part_age
+        self.__compress = compress
+        if self.__chunk_size < 1:
+            raise ValueError(f"The chunk size must be at least 1, instead '{self.__chunk_size}'")
+        self.__logs = {}
+        self.__lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def get_chunk_size(self) -> int:
+        return self.__chunk_size
+
+    def get_flush_interval(self) -> float:
+        return self.__flush_interval
+
+    def get_max_part_size(self) -> int:
+        return self.__max_part_size
+
+    def get_max_part_age(self) -> float:
+        return self.__max_part_age
+
+    def is_compress(self) -> bool:
+        return self.__compress
+
+    def write(self, path: str, rows: List[dict], fields: List[str] = None) -> None:
+        if len(rows) == 0:
+            return
+        with self.__lock:
+            log = self._get_log(path, list(rows[0].keys()) if fields is None else fields)
+            buffer = log[Map.content]
+            buffer.extend(rows)
+            now = time.monotonic()
+            log[Map.time] = now if log[Map.time] is None else log[Map.time]
+            if (len(buffer) >= self.get_chunk_size()) or ((now - log[Map.time]) >= self.get_flush_interval()):
+                self._write_chunk(path, log)
+
+    def flush(self) -> None:
+        with self.__lock:
+            [self._write_chunk(path, log) for path, log in self.__logs.items() if len(log[Map.content]) > 0]
+
+    def _get_log(self, path: str, fields: List[str]) -> dict:
+        """
+        To get the state of a log
+        NOTE: the schema of a log is fixed by its first rows
+
+        Returns:
+        --------
+        return: dict
+            dict[Map.column]:   {List[str]}     # Fields of the log
+            dict[Map.content]:  {List[dict]}    # Rows buffered
+            dict[Map.time]:     {float}         # Time of the older row buffered
+            dict[Map.index]:    {int}           # Index of the part written
+            dict[Map.size]:     {int}           # Size of the part written (in byte)
+            dict[Map.start]:    {float}         # Time the part was started
+        """
+        log = self.__logs.get(path)
+        if log is None:
+            log = self.__logs[path] = {
+                Map.column: list(fields),
+                Map.content: [],
+                Map.time: None,
+                Map.index: self._last_part_index(path),
+                Map.size: None,
+                Map.start: None
+            }
+        return log
+
+    def _write_chunk(self, path: str, log: dict) -> None:
+        """
+        To submit rows buffered of a log to FileManager
+        NOTE: must be called with the sink's lock acquired
+        """
+        fields = log[Map.column]
+        rows = log[Map.content]
+        log[Map.content] = []
+        log[Map.time] = None
+        chunk = pickle.dumps(self.encode_columns(fields, rows), protocol=pickle.HIGHEST_PROTOCOL)
+        chunk = zlib.compress(chunk, self._COMPRESS_LEVEL) if self.is_compress() else chunk
+        now = time.monotonic()
+        if (log[Map.size] is None) or (log[Map.size] >= self.get_max_part_size()) or ((now - log[Map.start]) >= self.get_max_part_age()):
+            log[Map.index] += 1
+            log[Map.size] = 0
+            log[Map.start] = now
+            schema = {Map.version: self._VERSION, Map.column: fields, Map.compress: self.is_compress()}
+            FileManager.write(self.part_path(path, log[Map.index]), schema, binary=True, overwrite=True, make_dir=True, line_return=False)
+        FileManager.write(self.part_path(path, log[Map.index]), chunk, binary=True, overwrite=False, make_dir=True, line_return=False)
+        log[Map.size] += len(chunk)
+
+    @staticmethod
+    def encode_columns(fields: List[str], rows: List[dict]) -> Dict[str, np.ndarray]:
+        """
+        To convert rows into typed columns
+
+        Parameters:
+        -----------
+        fields: List[str]
+            Fields to keep (missing values are set to NaN, other keys are ignored)
+        rows: List[dict]
+            Rows to convert
+
+        Returns:
+        --------
+        return: Dict[str, np.ndarray]
+            Values of each field
+        """
+        frame = pd.DataFrame(rows, columns=fields)
+        columns = {}
+        for field in fields:
+            values = frame[field]
+            if is_numeric_dtype(values.dtype) or is_bool_dtype(values.dtype):
+                columns[field] = values.to_numpy()
+            else:
+                columns[field] = values.where(values.notna(), '').astype(str).to_numpy(dtype=object)
+        return columns
+
+    @classmethod
+    def part_path(cls, path: str, part_index: int) -> str:
+        """
+        To get the path of a part of a log
+
+        Parameters:
+        -----------
+        path: str
+            Path to the log's csv file from the project's directory
+        part_index: int
+            Index of the part
+
+        Returns:
+        --------
+        return: str
+            Path of the part from the project's directory
+        """
+        base_path = path[:path.rindex('.')] if '.' in path.split('/')[-1] else path
+        return f'{base_path}-{part_index}{cls._EXTENSION}'
+
+    def get_paths(self, path: str) -> List[str]:
+        dir_path = FileManager.path_to_dir(path)
+        base_name = self.part_path(path, 0).split('/')[-1][:-len(f'0{self._EXTENSION}')]
+        files = _MF.catch_exception(FileManager.get_files, self.__class__.__name__, repport=False, **{Map.path: dir_path})
+        parts = []
+        for file in (files if files is not None else []):
+            part_index = file[len(base_name):-len(self._EXTENSION)]
+            if file.startswith(base_name) and file.endswith(self._EXTENSION) and part_index.isdigit():
+                parts.append((int(part_index), dir_path + file))
+        return [file_path for _, file_path in sorted(parts)]
+
+    def _last_part_index(self, path: str) -> int:
+        part_paths = self.get_paths(path)
+        return int(part_paths[-1][:-len(self._EXTENSION)].split('-')[-1]) if len(part_paths) > 0 else -1
+
+    def read(self, path: str) -> pd.DataFrame:
+        frames = [self.read_part(part_path) for part_path in self.get_paths(path)]
+        return pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame()
+
+    @staticmethod
+    def read_part(part_path: str) -> pd.DataFrame:
+        """
+        To read a part of a log
+
+        Parameters:
+        -----------
+        part_path: str
+            Path of the part from the project's directory
+
+        Returns:
+        --------
+        return: pd.DataFrame
+            Rows of the part
+        """
+        frames = []
+        with open(FileManager.get_project_directory() + part_path, 'rb') as file:
+            unpickler = Unpickler(file)
+            schema = unpickler.load()
+            fields = schema[Map.column]
+            while True:
+                try:
+                    chunk = unpickler.load()
+                except EOFError:
+                    break
+                chunk = zlib.decompress(chunk) if schema[Map.compress] else chunk
+                frames.append(pd.DataFrame(pickle.loads(chunk), columns=fields))
+        return pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame(columns=fields)
@@ -328,9 +328,8 @@ class DeepLearning(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = DeepLearning([[1]], [[-1]], train=False)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         # load model
         project_dir = FileManager.get_project_directory()
         model = load_model(project_dir + instance.get_model_file_path())
@@ -1,25 +1,38 @@
+import atexit
+from collections import OrderedDict, deque
 from pickle import Pickler, Unpickler
 from csv import DictReader
 from csv import DictWriter
 from abc import ABC
-from os import path as os_path, remove as os_remove, walk
+from os import fsync as os_fsync, path as os_path, remove as os_remove, replace as os_replace, walk
 from pathlib import Path
 import re as rgx
 import threading
 import time
 from types import FunctionType
-from typing import Any, List
+from typing import Any, Deque, List
 
 from model.structure.database.ModelFeature import ModelFeature as _MF
-from model.tools.WaitingRoom import WaitingRoom
 
 
 class FileManager(ABC):
     _PROJECT_DIR = None
     _THREAD_WRITE = None
-    _ROOM_WRITE = None
+    _CONDITION_WRITE = threading.Condition()
     _QUEU_WRITE = None
+    _FILES_WRITE = None
     _THREAD_NAME_WRITE = "files_writer"
+    _WRITE_BUFFER_SIZE = 2**16
+    _WRITE_MAX_FILE = 32
+    _WRITE_FLUSH_INTERVAL = 1
+    _WRITE_IDLE_TIMEOUT = 10
+    _WRITE_N_UNFLUSHED = 0
+    _WRITE_FLUSH = False
+    _WRITE_FSYNC = False
+    _WRITE_STOP = False
+    _WRITE_STATS = None
+    _FILES_FORKED = None
+    _EXTENSION_TEMPORARY = '.tmp'
 
     @staticmethod
     def get_project_directory() -> str:
@@ -31,6 +44,13 @@ class FileManager(ABC):
             FileManager._PROJECT_DIR = os_path.abspath(__file__).replace('model/tools/FileManager.py', '')
         return FileManager._PROJECT_DIR
 
+    @classmethod
+    def is_temporary(cls, path: str) -> bool:
+        """
+        To check if a file is the temporary file of an atomic write
+        """
+        return path.endswith(cls._EXTENSION_TEMPORARY)
+
     @classmethod
     def is_writting(cls) -> bool:
         """
@@ -39,42 +59,51 @@ class FileManager(ABC):
         Returns:
         --------
         return: bool
-            True if FileManager is writting else False
+            True if writes are waiting or not flushed yet else False
         """
-        return cls._get_write_thread().is_alive()
+        with cls._CONDITION_WRITE:
+            return (len(cls._get_write_queu()) + cls._WRITE_N_UNFLUSHED) > 0
 
     @classmethod
-    def _get_write_thread(cls) -> threading.Thread:
+    def _start_write_thread(cls) -> None:
+        """
+        To start the writer thread if it's not running
+        NOTE: must be called with the write condition acquired
+        """
         thread = cls._THREAD_WRITE
         if (thread is None) or (not thread.is_alive()):
             thread_name = cls._THREAD_NAME_WRITE
             class_name = cls.__name__
             thread, output = _MF.wrap_thread(cls._thread_write, class_name, thread_name, repport=True)
+            # Pending writes are flushed by close() at exit
+            thread.daemon = True
+            cls._WRITE_STOP = False
             cls._THREAD_WRITE = thread
-        return thread
-
-    @classmethod
-    def _get_writing_room(cls) -> WaitingRoom:
-        if cls._ROOM_WRITE is None:
-            cls._ROOM_WRITE = WaitingRoom('WriteRoom')
-        return cls._ROOM_WRITE
+            thread.start()
 
     @classmethod
-    def _get_write_queu(cls)  -> List[dict]:
+    def _get_write_queu(cls)  -> Deque[dict]:
         """
-        To get list of write to execute
+        To get queue of write to execute
 
         Returns:
         --------
-        return: List[dict]
-            List of write to execute
-            list[index{int}][Map.callback]: {FunctionType}
-            list[index{int}][Map.data]:     {**kwargs}
+        return: Deque[dict]
+            Queue of write to execute
+            deque[index{int}][Map.callback]: {FunctionType}
+            deque[index{int}][Map.data]:     {**kwargs}
         """
         if cls._QUEU_WRITE is None:
-            cls._QUEU_WRITE = []
+            cls._QUEU_WRITE = deque()
         return cls._QUEU_WRITE
 
+    @classmethod
+    def _get_write_stats(cls) -> dict:
+        if cls._WRITE_STATS is None:
+            from model.tools.Map import Map
+            cls._WRITE_STATS = {Map.received: 0, Map.coalesce: 0, Map.flush: 0, Map.maximum: 0}
+        return cls._WRITE_STATS
+
     @classmethod
     def _join_write_queu(cls, callback: FunctionType, **kwargs) -> None:
         """
@@ -88,32 +117,321 @@ class FileManager(ABC):
             Params to pass to the callback
         """
         from model.tools.Map import Map
-        room = cls._get_writing_room()
-        ticket = room.join_room()
-        while not room.my_turn(ticket):
-            time.sleep(0.0001)
-        cls._get_write_queu().append({Map.callback: callback, Map.data: kwargs})
-        cls._get_write_thread().start() if not cls._get_write_thread().is_alive() else None
-        room.quit_room(ticket)
+        with cls._CONDITION_WRITE:
+            write_queu = cls._get_write_queu()
+            write_queu.append({Map.callback: callback, Map.data: kwargs})
+            stats = cls._get_write_stats()
+            stats[Map.received] += 1
+            stats[Map.maximum] = max(stats[Map.maximum], len(write_queu))
+            cls._start_write_thread()
+            cls._CONDITION_WRITE.notify_all()
 
     @classmethod
     def _thread_write(cls) -> None:
+        """
+        To execute writes in their order of submission
+        NOTE: writes are taken by batch, appends to the same csv file are merged
+        NOTE: appended files stay open and are flushed at most each _WRITE_FLUSH_INTERVAL
+        NOTE: the thread stops after _WRITE_IDLE_TIMEOUT without write
+        NOTE: if the thread dies, waiters of flush() and close() are released
+        """
+        condition = cls._CONDITION_WRITE
+        try:
+            cls._thread_write_loop()
+        finally:
+            with condition:
+                if cls._THREAD_WRITE is threading.current_thread():
+                    _MF.catch_exception(cls._close_write_files, cls.__name__, repport=True)
+                    cls._WRITE_N_UNFLUSHED = 0
+                    cls._WRITE_FLUSH = False
+                    cls._THREAD_WRITE = None
+                    condition.notify_all()
+
+    @classmethod
+    def _thread_write_loop(cls) -> None:
         from model.tools.Map import Map
+        condition = cls._CONDITION_WRITE
         write_queu = cls._get_write_queu()
         class_name = cls.__name__
-        while len(write_queu) > 0:
-            callback = write_queu[0][Map.callback]
-            datas = write_queu[0][Map.data]
-            _MF.catch_exception(callback, class_name, repport=True, **datas)
-            del write_queu[0]
+        flush_time = 0
+        n_unflushed = 0
+        while True:
+            with condition:
+                idle_time = time.monotonic() + cls._WRITE_IDLE_TIMEOUT
+                while (len(write_queu) == 0) and (not cls._WRITE_FLUSH):
+                    now = time.monotonic()
+                    if n_unflushed > 0:
+                        if now >= flush_time:
+                            break
+                        timeout = flush_time - now
+                    elif cls._WRITE_STOP or (now >= idle_time):
+                        cls._close_write_files()
+                        cls._THREAD_WRITE = None
+                        condition.notify_all()
+                        return
+                    else:
+                        timeout = idle_time - now
+                    condition.wait(timeout)
+                writes = list(write_queu)
+                write_queu.clear()
+                cls._WRITE_N_UNFLUSHED += len(writes)
+                n_unflushed += len(writes)
+                fsync = cls._WRITE_FSYNC
+                stats = cls._get_write_stats()
+            merged_writes = cls._coalesce_writes(writes)
+            with condition:
+                stats[Map.coalesce] += len(writes) - len(merged_writes)
+            for write in merged_writes:
+                _MF.catch_exception(write[Map.callback], class_name, repport=True, **write[Map.data])
+            if cls._WRITE_FLUSH or (time.monotonic() >= flush_time):
+                cls._flush_write_files(fsync)
+                flush_time = time.monotonic() + cls._WRITE_FLUSH_INTERVAL
+                with condition:
+                    cls._WRITE_N_UNFLUSHED -= n_unflushed
+                    n_unflushed = 0
+                    stats[Map.flush] += 1
+                    if len(write_queu) == 0:
+                        cls._WRITE_FLUSH = False
+                        cls._WRITE_FSYNC = cls._WRITE_FSYNC and (not fsync)
+                    condition.notify_all()
+
+    @classmethod
+    def _coalesce_writes(cls, writes: List[dict]) -> List[dict]:
+        """
+        To merge appends of rows to the same csv file with the same fields
+        NOTE: writes to the same file keep their order
+
+        Parameters:
+        -----------
+        writes: List[dict]
+            Writes to execute in their order of submission
+
+        Returns:
+        --------
+        return: List[dict]
+            Writes to execute
+        """
+        from model.tools.Map import Map
+        def can_merge(write: dict) -> bool:
+            return (write[Map.callback] == cls._write_csv) and (not write[Map.data].get('overwrite', True))
+
+        merged_writes = []
+        last_writes = {}
+        for write in writes:
+            datas = write[Map.data]
+            path = datas.get(Map.path)
+            last_write = last_writes.get(path)
+            if (last_write is not None) and can_merge(last_write) and can_merge(write) \
+                and (list(last_write[Map.data]['fields']) == list(datas['fields'])) \
+                    and (last_write[Map.data].get('ignore_extra', False) == datas.get('ignore_extra', False)):
+                last_write[Map.data]['rows'].extend(datas['rows'])
+                continue
+            if can_merge(write):
+                write = {Map.callback: write[Map.callback], Map.data: {**datas, 'rows': list(datas['rows'])}}
+            merged_writes.append(write)
+            last_writes[path] = write
+        return merged_writes
+
+    @classmethod
+    def _get_write_files(cls) -> OrderedDict:
+        """
+        To get files kept open to append content
+
+        Returns:
+        --------
+        return: OrderedDict
+            Files kept open from the least to the most recently used
+            dict[path{str}]: {list}     # [file{TextIO}, newline{str}, writers{dict}, empty{bool}]
+        """
+        if cls._FILES_WRITE is None:
+            cls._FILES_WRITE = OrderedDict()
+        return cls._FILES_WRITE
+
+    @classmethod
+    def _get_write_file(cls, path: str, newline: str = None, make_dir: bool = False) -> list:
+        """
+        To get a file open to append content
+        NOTE: must only be called by the writer thread
+
+        Parameters:
+        -----------
+        path: str
+            Path to the file from the project's directory
+        newline: str = None
+            Newline mode to open the file with
+        make_dir: bool = False
+            Set True create missing directory else False to raise error if miss directory
+
+        Returns:
+        --------
+        return: list
+            The file, its newline mode, its csv writers and if nothing is written in it yet
+            list[0]: {TextIO}
+            list[1]: {str}
+            list[2]: {dict}     # dict[(fields{tuple}, extrasaction{str})]: {DictWriter}
+            list[3]: {bool}
+        """
+        files = cls._get_write_files()
+        write_file = files.get(path)
+        if (write_file is not None) and (write_file[1] != newline):
+            cls._close_write_file(path)
+            write_file = None
+        if write_file is None:
+            if make_dir:
+                FileManager.make_directory(FileManager.path_to_dir(path))
+            full_path = FileManager.get_project_directory() + path
+            file = open(full_path, mode='a', newline=newline, buffering=cls._WRITE_BUFFER_SIZE)
+            write_file = [file, newline, {}, file.tell() <= 0]
+            files[path] = write_file
+            while len(files) > cls._WRITE_MAX_FILE:
+                cls._close_write_file(next(iter(files)))
+        else:
+            files.move_to_end(path)
+        return write_file
+
+    @classmethod
+    def _close_write_file(cls, path: str) -> None:
+        """
+        To flush and close a file kept open
+        NOTE: must only be called by the writer thread
+
+        Parameters:
+        -----------
+        path: str
+            Path to the file from the project's directory
+        """
+        write_file = cls._get_write_files().pop(path, None)
+        _MF.catch_exception(write_file[0].close, cls.__name__, repport=True) if write_file is not None else None
+
+    @classmethod
+    def _close_write_files(cls) -> None:
+        [cls._close_write_file(path) for path in list(cls._get_write_files().keys())]
+
+    @classmethod
+    def _flush_write_files(cls, fsync: bool = False) -> None:
+        def flush_file(file: 'TextIO', fsync: bool) -> bool:
+            file.flush()
+            os_fsync(file.fileno()) if fsync else None
+            return True
+
+        class_name = cls.__name__
+        files = cls._get_write_files()
+        for path, (file, _, _, _) in list(files.items()):
+            # An error (ie: disk full) must not kill the writer thread: the file is
+            # closed so it's reported once and is open again by the next append
+            if not _MF.catch_exception(flush_file, class_name, repport=True, file=file, fsync=fsync):
+                files.pop(path)
+                _MF.catch_exception(file.close, class_name, repport=False)
+
+    @classmethod
+    def flush(cls, fsync: bool = False, timeout: float = None) -> bool:
+        """
+        To wait till all writes submitted are executed and flushed
+
+        Parameters:
+        -----------
+        fsync: bool = False
+            Set True to also force the system to write files on the disk else False
+        timeout: float = None
+            Maximum time to wait (in second)
+
+        Returns:
+        --------
+        return: bool
+            True if all writes are flushed else False (time is out)
+        """
+        condition = cls._CONDITION_WRITE
+        with condition:
+            thread = cls._THREAD_WRITE
+            if (thread is None) or (not thread.is_alive()):
+                return len(cls._get_write_queu()) == 0
+            cls._WRITE_FLUSH = True
+            cls._WRITE_FSYNC = cls._WRITE_FSYNC or fsync
+            condition.notify_all()
+            def is_flushed() -> bool:
+                return (not cls._WRITE_FLUSH) and (not cls.is_writting())
+            # Stop waiting if the writer thread dies
+            condition.wait_for(lambda: is_flushed() or (cls._THREAD_WRITE is not thread), timeout)
+            return is_flushed()
+
+    @classmethod
+    def close(cls, timeout: float = None) -> None:
+        """
+        To flush all writes submitted and close files kept open
+
+        Parameters:
+        -----------
+        timeout: float = None
+            Maximum time to wait (in second)
+        """
+        condition = cls._CONDITION_WRITE
+        cls.flush(timeout=timeout)
+        with condition:
+            cls._WRITE_STOP = True
+            condition.notify_all()
+            condition.wait_for(lambda: cls._THREAD_WRITE is None, timeout)
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        """
+        To give a forked child process its own write queue, lock and writer thread
+        NOTE: must be the first call of FileManager in the child: the lock copied from the
+              parent can be held by the parent's writer thread, and queued writes belong
+              to the parent
+        NOTE: files kept open by the parent are held but never used, so their buffers
+              are not written a second time when the child ends
+        """
+        cls._FILES_FORKED = cls._FILES_WRITE
+        cls._CONDITION_WRITE = threading.Condition()
+        cls._THREAD_WRITE = None
+        cls._QUEU_WRITE = None
+        cls._FILES_WRITE = None
+        cls._WRITE_N_UNFLUSHED = 0
+        cls._WRITE_FLUSH = False
+        cls._WRITE_FSYNC = False
+        cls._WRITE_STOP = False
+        cls._WRITE_STATS = None
 
     @classmethod
     def n_wait(cls) -> int:
-        return len(cls._get_writing_room().get_tickets())
+        """
+        To get the number of writes executed but not flushed yet
+
+        Returns:
+        --------
+        return: int
+            The number of writes executed but not flushed yet
+        """
+        with cls._CONDITION_WRITE:
+            return cls._WRITE_N_UNFLUSHED
 
     @classmethod
     def n_write(cls) -> int:
-        return len(cls._get_write_queu())
+        with cls._CONDITION_WRITE:
+            return len(cls._get_write_queu())
+
+    @classmethod
+    def get_write_stats(cls) -> 'Map':
+        """
+        To get statistics of writes
+
+        Returns:
+        --------
+        return: Map
+            Map[Map.size]:      {int}   # Number of writes waiting in the queue
+            Map[Map.maximum]:   {int}   # Maximum number of writes that waited in the queue
+            Map[Map.received]:  {int}   # Number of writes submitted
+            Map[Map.coalesce]:  {int}   # Number of writes merged into a previous one
+            Map[Map.flush]:     {int}   # Number of flush of open files
+            Map[Map.file]:      {int}   # Number of files kept open
+        """
+        from model.tools.Map import Map
+        with cls._CONDITION_WRITE:
+            return Map({
+                Map.size: len(cls._get_write_queu()),
+                **cls._get_write_stats(),
+                Map.file: len(cls._get_write_files())
+            })
 
     @staticmethod
     def read(path: str, binary: bool = False) -> Any:
@@ -134,7 +452,7 @@ class FileManager(ABC):
         return content
 
     @staticmethod
-    def write(path: str, content: Any, binary: bool = False, overwrite: bool = True, make_dir: bool = False, line_return=True) -> None:
+    def write(path: str, content: Any, binary: bool = False, overwrite: bool = True, make_dir: bool = False, line_return=True, atomic: bool = False) -> None:
         """
         To write in a file\n
         :param path: The path to the file
@@ -143,6 +461,7 @@ class FileManager(ABC):
         :param overwrite: Set True to overwrite the file's content else False to add new line at file's end
         :param make_dir: Set True create missing directory else False to raise error if miss directory
         :param line_return: Set True to end with new line else False
+        :param atomic: Set True to write in a temporary file that then replaces the file (when overwrite) else False
         """
         kwargs = {
             'path': path,
@@ -150,26 +469,36 @@ class FileManager(ABC):
             'binary': binary,
             'overwrite': overwrite,
             'make_dir': make_dir,
-            'line_return': line_return
+            'line_return': line_return,
+            'atomic': atomic
         }
         FileManager._join_write_queu(FileManager._write, **kwargs)
 
     @staticmethod
-    def _write(path: str, content: Any, binary: bool = False, overwrite: bool = True, make_dir: bool = False, line_return=True) -> None:
+    def _write(path: str, content: Any, binary: bool = False, overwrite: bool = True, make_dir: bool = False, line_return=True, atomic: bool = False) -> None:
+        if line_return:
+            content = f'{content}\r\n'
+        if (not binary) and (not overwrite):
+            write_file = FileManager._get_write_file(path, make_dir=make_dir)
+            write_file[0].write(content)
+            write_file[3] = write_file[3] and (len(content) == 0)
+            return
+        FileManager._close_write_file(path)
         full_path = FileManager.get_project_directory() + path
         bin_mode = 'b' if binary else ''
         write_mode = 'w' if overwrite else 'a'
-        if line_return:
-            content = f'{content}\r\n'
         if make_dir:
             file_dir = FileManager.path_to_dir(path)
             FileManager.make_directory(file_dir)
-        with open(full_path, write_mode + bin_mode) as file:
+        atomic = atomic and overwrite
+        write_path = full_path + FileManager._EXTENSION_TEMPORARY if atomic else full_path
+        with open(write_path, write_mode + bin_mode) as file:
             if binary:
                 record = Pickler(file)
                 record.dump(content)
             else:
                 file.write(content)
+        os_replace(write_path, full_path) if atomic else None
 
     @staticmethod
     def get_csv(p: str, fields: list = None) -> list:
@@ -222,19 +551,28 @@ class FileManager(ABC):
                 ks = list(rows[i].keys())
                 if fields != ks:
                     raise ValueError(f"This row's fields '{i}:{ks}' don't match the given fields '{fields}")
+        extrasaction = 'ignore' if ignore_extra else 'raise'
+        if not overwrite:
+            write_file = cls._get_write_file(path, newline='', make_dir=make_dir)
+            file, _, writers, empty = write_file
+            writer_key = (tuple(fields), extrasaction)
+            writer = writers.get(writer_key)
+            if writer is None:
+                writer = writers[writer_key] = DictWriter(file, fieldnames=fields, extrasaction=extrasaction)
+            writer.writeheader() if empty else None
+            writer.writerows(rows)
+            write_file[3] = False
+            return
+        cls._close_write_file(path)
         project_dir = FileManager.get_project_directory()
         full_path = project_dir + path
-        extrasaction = 'ignore' if ignore_extra else 'raise'
-        mode = 'w' if overwrite else 'a'
         if make_dir:
             file_dir = FileManager.path_to_dir(path)
             FileManager.make_directory(file_dir)
-        with open(full_path, mode=mode, newline='') as f:
+        with open(full_path, mode='w', newline='') as f:
             writer = DictWriter(f, fieldnames=fields, extrasaction=extrasaction)
-            f_size = os_path.getsize(full_path)
-            writer.writeheader() if (f_size <= 0) or overwrite else None
-            for row in rows:
-                writer.writerow(row)
+            writer.writeheader()
+            writer.writerows(rows)
 
     @staticmethod
     def get_files(path: str, extension: bool = True, special: bool = False, make_dir: bool = False) -> List[str]:
@@ -305,6 +643,8 @@ class FileManager(ABC):
         To remove file\n
         :param path: The path the file to remove from the project's directory, i.e.: content/my/file.txt
         """
+        FileManager._join_write_queu(FileManager._close_write_file, **{'path': path})
+        FileManager.flush()
         path = FileManager.get_project_directory() + path
         os_remove(path)
 
@@ -418,3 +758,6 @@ class FileManager(ABC):
         files = _MF.catch_exception(cls.get_files, FileManager.__name__, repport=False, **{Map.path: dir_path})
         file_exist = (files is not None) and (file_name in files)
         return file_exist
+
+
+atexit.register(FileManager.close)
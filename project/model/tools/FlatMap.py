@@ -0,0 +1,221 @@
+from typing import Any, KeysView
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.Map import Map
+from model.tools.MyJson import MyJson
+
+
+class FlatMap(Map):
+    """
+    To store values in a flat dict indexed by the tuple of their keys
+
+    A FlatMap has the same API than Map but a value is reached in one lookup of its
+    keys instead of a walk through nested dicts, the keys of the first level are
+    counted so they're returned as a view. A snapshot shares the dict of the FlatMap
+    it's taken from until one of them is modified, the modified one then copies it.
+    NOTE: Map.put(value, 'a', 'b') => FlatMap.__map[('a', 'b')] = value
+    NOTE: dict values are stored as they are, only dicts given to the constructor are
+          flattened
+    NOTE: FlatMap.get_map() builds a new nested dict, changes made to it are not applied
+          to the FlatMap
+    """
+    PREFIX_ID = 'flatmap_'
+
+    def __init__(self, my_map: dict = None):
+        self.__id = None
+        self.__map = None
+        self.__prefixes = None
+        self.__firsts = None
+        self.__shared = False
+        self._set_map({} if my_map is None else my_map)
+
+    def get_id(self) -> str:
+        if self.__id is None:
+            self.__id = self.PREFIX_ID + _MF.new_code()
+        return self.__id
+
+    def _set_map(self, my_map: dict) -> None:
+        """
+        To replace values of the FlatMap with the values of a nested dict
+
+        Parameters:
+        -----------
+        my_map: dict
+            Nested dict to flatten (same format than Map.get_map())
+        """
+        self.__map = {}
+        self.__prefixes = {}
+        self.__firsts = {}
+        self.__shared = False
+        stack = [((), iter(my_map.items()))]
+        while len(stack) > 0:
+            keys, items = stack[-1]
+            row = next(items, None)
+            if row is None:
+                stack.pop()
+                continue
+            key, value = row
+            if isinstance(value, dict) and (len(value) > 0):
+                stack.append(((*keys, key), iter(value.items())))
+            else:
+                self.put(value, *keys, key)
+
+    def get_map(self) -> dict:
+        """
+        To get values of the FlatMap in nested dicts
+
+        Returns:
+        --------
+        return: dict
+            A new nested dict of values (same format than Map.get_map())
+        """
+        my_map = {}
+        for keys, value in self.__map.items():
+            mp = my_map
+            for key in keys[:-1]:
+                child = mp.get(key)
+                if type(child) != dict:
+                    child = mp[key] = {}
+                mp = child
+            mp[keys[-1]] = value
+        return my_map
+
+    def _unshare(self) -> None:
+        """
+        To copy dicts shared with a snapshot before to modify them
+        """
+        if self.__shared:
+            self.__map = dict(self.__map)
+            self.__prefixes = dict(self.__prefixes)
+            self.__firsts = dict(self.__firsts)
+            self.__shared = False
+
+    def put(self, val, *keys) -> None:
+        if len(keys) == 0:
+            raise ValueError("Keys can't be empty")
+        self._unshare()
+        flat = self.__map
+        if keys not in flat:
+            # Counted first so the first key keeps its position if values are replaced
+            firsts = self.__firsts
+            first = keys[0]
+            firsts[first] = firsts.get(first, 0) + 1
+            # Replace values stored at a prefix or under the keys
+            self.remove(*keys) if keys in self.__prefixes else None
+            for i in range(1, len(keys)):
+                prefix = keys[:i]
+                self.remove(*prefix) if prefix in flat else None
+            prefixes = self.__prefixes
+            for i in range(1, len(keys)):
+                prefix = keys[:i]
+                prefixes[prefix] = prefixes.get(prefix, 0) + 1
+        flat[keys] = val
+
+    def get(self, *keys) -> Any:
+        """
+        To get the value stored at the given keys
+        NOTE: a dict of values is built when keys are a prefix of stored keys
+
+        Parameters:
+        -----------
+        *keys: Any
+            Keys of the value
+
+        Returns:
+        --------
+        return: Any
+            The value stored at the given keys, None if there's no value
+        """
+        if len(keys) == 0:
+            raise ValueError("Keys can't be empty")
+        value = self.__map.get(keys)
+        if (value is None) and (keys in self.__prefixes):
+            n_key = len(keys)
+            sub_map = FlatMap()
+            for sub_keys, sub_value in self.__map.items():
+                if sub_keys[:n_key] == keys:
+                    sub_map.put(sub_value, *sub_keys[n_key:])
+            value = sub_map.get_map()
+        return value
+
+    def remove(self, *keys) -> None:
+        """
+        To remove the value stored at the given keys and values stored under them
+
+        Parameters:
+        -----------
+        *keys: Any
+            Keys of the value
+        """
+        if len(keys) == 0:
+            raise ValueError("Keys can't be empty")
+        self._unshare()
+        flat = self.__map
+        if keys in flat:
+            removed = [keys]
+        elif keys in self.__prefixes:
+            n_key = len(keys)
+            removed = [stored_keys for stored_keys in flat.keys() if stored_keys[:n_key] == keys]
+        else:
+            return
+        prefixes = self.__prefixes
+        firsts = self.__firsts
+        for stored_keys in removed:
+            del flat[stored_keys]
+            for i in range(1, len(stored_keys)):
+                prefix = stored_keys[:i]
+                prefixes[prefix] -= 1
+                if prefixes[prefix] == 0:
+                    del prefixes[prefix]
+            first = stored_keys[0]
+            firsts[first] -= 1
+            if firsts[first] == 0:
+                del firsts[first]
+
+    def get_keys(self) -> KeysView:
+        """
+        To get keys of the first level
+        NOTE: a view taken while this FlatMap shares its dicts with a snapshot doesn't
+              follow changes made after, and iterating a view while other threads
+              update this FlatMap can raise RuntimeError: copy it first (list(keys))
+
+        Returns:
+        --------
+        return: KeysView
+            View on keys of the first level (from the older to the newest)
+        """
+        return self.__firsts.keys()
+
+    def sort(self, reverse: bool = False) -> None:
+        self._unshare()
+        firsts = self.__firsts
+        sorted_firsts = sorted(firsts.keys(), reverse=reverse)
+        ranks = {first: rank for rank, first in enumerate(sorted_firsts)}
+        self.__map = dict(sorted(self.__map.items(), key=lambda row: ranks[row[0][0]]))
+        self.__firsts = {first: firsts[first] for first in sorted_firsts}
+
+    def snapshot(self) -> 'FlatMap':
+        """
+        To get a copy of the FlatMap that shares its values until one of them is modified
+        NOTE: values stored are not copied
+
+        Returns:
+        --------
+        return: FlatMap
+            The snapshot of the FlatMap
+        """
+        snapshot = FlatMap()
+        snapshot.__map = self.__map
+        snapshot.__prefixes = self.__prefixes
+        snapshot.__firsts = self.__firsts
+        snapshot.__shared = self.__shared = True
+        return snapshot
+
+    def _json_encode_to_dict(self) -> dict:
+        return {'_FlatMap__id': self.get_id(), '_FlatMap__map': self.get_map()}
+
+    @staticmethod
+    def json_instantiate(object_dic: dict) -> object:
+        instance = FlatMap(MyJson._root_decoding(object_dic['_FlatMap__map']))
+        instance.__id = object_dic['_FlatMap__id']
+        return instance
@@ -69,7 +69,6 @@ class HandTrade(Trade):
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
         from model.API.brokers.Binance.Binance import Binance
-        _class_token = MyJson.get_class_name_token()
         pair = Pair('JSON/@JSON')
         buy_order_params = Map({
             Map.pair: pair,
@@ -80,7 +79,7 @@ class HandTrade(Trade):
         })
         buy_order = Order.generate_broker_order(Binance.__name__, Order.TYPE_MARKET, buy_order_params)
         instance = HandTrade(buy_order)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
@@ -0,0 +1,189 @@
+import json
+import os
+from hashlib import sha256 as hashlib_sha256
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+from model.tools.FileManager import FileManager
+from model.tools.Map import Map
+
+
+class HistoryStore:
+    """
+    To store market histories in a binary format that is memory-mapped on load
+
+    Each CSV history is converted once into a '.npy' file (float64 rows ordered from
+    the older to the newest) saved next to it, with a '.json' header that holds the
+    checksum of the source CSV and of the binary data. Loading a converted history
+    maps the file in memory instead of parsing the CSV, so its pages are read on
+    demand and shared through the page cache by all processes that load it.
+    """
+    _EXTENSION_SOURCE = '.csv'
+    _EXTENSION_DATA = '.npy'
+    _EXTENSION_HEADER = '.json'
+    _VERSION = 1
+    _CHUNK_SIZE = 2**20
+
+    @classmethod
+    def data_path(cls, source_path: str) -> str:
+        """
+        To get the path to the binary history of a CSV history
+
+        Parameters:
+        -----------
+        source_path: str
+            Path to the CSV history (from the project's root)
+
+        Returns:
+        --------
+        return: str
+            Path to the binary history (from the project's root)
+        """
+        return cls._replace_extension(source_path, cls._EXTENSION_DATA)
+
+    @classmethod
+    def header_path(cls, source_path: str) -> str:
+        """
+        To get the path to the header of the binary history of a CSV history
+
+        Parameters:
+        -----------
+        source_path: str
+            Path to the CSV history (from the project's root)
+
+        Returns:
+        --------
+        return: str
+            Path to the header (from the project's root)
+        """
+        return cls._replace_extension(source_path, cls._EXTENSION_HEADER)
+
+    @classmethod
+    def _replace_extension(cls, source_path: str, extension: str) -> str:
+        if not source_path.endswith(cls._EXTENSION_SOURCE):
+            raise ValueError(f"The source history must be a '{cls._EXTENSION_SOURCE}' file, instead '{source_path}'")
+        return source_path[:-len(cls._EXTENSION_SOURCE)] + extension
+
+    @classmethod
+    def convert(cls, source_path: str, clean: Callable[[np.ndarray], np.ndarray] = None) -> np.ndarray:
+        """
+        To convert a CSV history into a binary history
+
+        Parameters:
+        -----------
+        source_path: str
+            Path to the CSV history (from the project's root)
+        clean: Callable[[np.ndarray], np.ndarray] = None
+            Function that returns the history cleaned (i.e.: with its missing rows completed)
+
+        Raises:
+        -------
+        raise: ValueError
+            If the binary history written is not the same as the converted history
+
+        Returns:
+        --------
+        return: np.ndarray
+            The binary history memory-mapped in read-only
+        """
+        project_dir = FileManager.get_project_directory()
+        abs_source_path = project_dir + source_path
+        abs_data_path = project_dir + cls.data_path(source_path)
+        abs_header_path = project_dir + cls.header_path(source_path)
+        source_stat = os.stat(abs_source_path)
+        history = pd.read_csv(abs_source_path).to_numpy(dtype=np.float64)
+        history = clean(history) if clean is not None else history
+        history = np.ascontiguousarray(history, dtype=np.float64)
+        checksum = cls._checksum_data(history)
+        header = {
+            Map.version: cls._VERSION,
+            Map.source: cls._checksum_file(abs_source_path),
+            Map.size: source_stat.st_size,
+            Map.time: source_stat.st_mtime_ns,
+            Map.checksum: checksum,
+            Map.shape: list(history.shape)
+        }
+        # Write in temporary files so readers never see a partial history
+        tmp_data_path = abs_data_path + '.tmp'
+        with open(tmp_data_path, 'wb') as file:
+            np.save(file, history, allow_pickle=False)
+        os.replace(tmp_data_path, abs_data_path)
+        tmp_header_path = abs_header_path + '.tmp'
+        with open(tmp_header_path, 'w') as file:
+            json.dump(header, file)
+        os.replace(tmp_header_path, abs_header_path)
+        stored = np.load(abs_data_path, mmap_mode='r', allow_pickle=False)
+        if cls._checksum_data(stored) != checksum:
+            raise ValueError(f"The binary history written don't match its source '{source_path}'")
+        return stored
+
+    @classmethod
+    def load(cls, source_path: str, clean: Callable[[np.ndarray], np.ndarray] = None, validate: bool = False) -> np.ndarray:
+        """
+        To load a history from its binary format
+        NOTE: the history is converted first if it's not converted yet or if its CSV changed
+
+        Parameters:
+        -----------
+        source_path: str
+            Path to the CSV history (from the project's root)
+        clean: Callable[[np.ndarray], np.ndarray] = None
+            Function that returns the history cleaned (used only to convert the history)
+        validate: bool = False
+            Set True to check checksums of the CSV and binary history (reads both files)
+            else False to only compare the CSV's size and modification time
+
+        Returns:
+        --------
+        return: np.ndarray
+            The history memory-mapped in read-only, rows ordered from the older to the newest
+        """
+        abs_data_path = FileManager.get_project_directory() + cls.data_path(source_path)
+        header = cls._read_header(source_path)
+        if not cls._is_up_to_date(source_path, header, validate):
+            return cls.convert(source_path, clean)
+        history = np.load(abs_data_path, mmap_mode='r', allow_pickle=False)
+        if validate and (cls._checksum_data(history) != header[Map.checksum]):
+            return cls.convert(source_path, clean)
+        return history
+
+    @classmethod
+    def _read_header(cls, source_path: str) -> Union[dict, None]:
+        project_dir = FileManager.get_project_directory()
+        abs_header_path = project_dir + cls.header_path(source_path)
+        abs_data_path = project_dir + cls.data_path(source_path)
+        if not (os.path.isfile(abs_header_path) and os.path.isfile(abs_data_path)):
+            return None
+        try:
+            with open(abs_header_path, 'r') as file:
+                header = json.load(file)
+        except ValueError:
+            return None
+        return header if header.get(Map.version) == cls._VERSION else None
+
+    @classmethod
+    def _is_up_to_date(cls, source_path: str, header: Union[dict, None], validate: bool) -> bool:
+        if header is None:
+            return False
+        abs_source_path = FileManager.get_project_directory() + source_path
+        source_stat = os.stat(abs_source_path)
+        if validate:
+            return header[Map.source] == cls._checksum_file(abs_source_path)
+        return (header[Map.size] == source_stat.st_size) and (header[Map.time] == source_stat.st_mtime_ns)
+
+    @classmethod
+    def _checksum_file(cls, abs_path: str) -> str:
+        hasher = hashlib_sha256()
+        with open(abs_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(cls._CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _checksum_data(history: np.ndarray) -> str:
+        hasher = hashlib_sha256()
+        hasher.update(str(history.shape).encode())
+        hasher.update(memoryview(np.ascontiguousarray(history)).cast('B'))
+        return hasher.hexdigest()
@@ -0,0 +1,194 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Union
+
+from model.tools.Map import Map
+
+
+class IndicatorCache:
+    """
+    To share indicators between all MarketPrice of the process
+
+    Indicators are stored by (broker, Pair, period, last open time, indicator, params)
+    so MarketPrice built from the same history reuse indicators already computed
+    by an other one instead of recomputing them. The cache is bounded and drops
+    the least recently used indicators first.
+    """
+    _CACHE = OrderedDict()
+    _LOCK = threading.Lock()
+    _MAX_SIZE = 1024
+    _N_HIT = 0
+    _N_MISS = 0
+    _N_EVICTION = 0
+
+    @classmethod
+    def get_max_size(cls) -> int:
+        return cls._MAX_SIZE
+
+    @classmethod
+    def set_max_size(cls, max_size: int) -> None:
+        """
+        To set the maximum number of indicators kept in cache
+
+        Parameters:
+        -----------
+        max_size: int
+            The maximum number of indicators kept in cache
+        """
+        if max_size < 1:
+            raise ValueError(f"The max size must be at least 1, instead '{max_size}'")
+        with cls._LOCK:
+            cls._MAX_SIZE = max_size
+            cls._evict()
+
+    @classmethod
+    def get_stats(cls) -> Map:
+        """
+        To get counters of the cache
+
+        Returns:
+        --------
+        return: Map
+            Counters of the cache
+            stats[Map.hit]:         {int}   # Number of indicators found in cache
+            stats[Map.miss]:        {int}   # Number of indicators computed
+            stats[Map.eviction]:    {int}   # Number of indicators dropped to respect the max size
+            stats[Map.size]:        {int}   # Number of indicators in cache
+        """
+        with cls._LOCK:
+            return Map({
+                Map.hit: cls._N_HIT,
+                Map.miss: cls._N_MISS,
+                Map.eviction: cls._N_EVICTION,
+                Map.size: len(cls._CACHE)
+            })
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        To delete all indicators in cache and reset counters
+        """
+        with cls._LOCK:
+            cls._CACHE = OrderedDict()
+            cls._N_HIT = 0
+            cls._N_MISS = 0
+            cls._N_EVICTION = 0
+
+    @staticmethod
+    def generate_key(broker: str, pair: 'Pair', period: int, last_time: int, indicator: str, params: dict, fingerprint: tuple = ()) -> tuple:
+        """
+        To generate the key of an indicator
+
+        Parameters:
+        -----------
+        broker: str
+            Name of the broker that provided the history
+        pair: Pair
+            Pair of the history
+        period: int
+            Period of the history (in second)
+        last_time: int
+            Open time of the newest kline in the history
+        indicator: str
+            Name of the indicator
+        params: dict
+            Params of the indicator
+        fingerprint: tuple
+            Values that distinguish histories with the same last open time
+            (i.e.: its size and the open kline's prices)
+
+        Returns:
+        --------
+        return: tuple
+            The key of the indicator
+        """
+        return (broker, str(pair), period, last_time, indicator, tuple(sorted(params.items())), fingerprint)
+
+    @classmethod
+    def get(cls, key: tuple) -> Union[list, Map, None]:
+        """
+        To get an indicator from cache
+
+        Parameters:
+        -----------
+        key: tuple
+            Key of the indicator (from IndicatorCache.generate_key())
+
+        Returns:
+        --------
+        return: Union[list, Map, None]
+            A copy of the indicator or None if it's not in cache
+        """
+        with cls._LOCK:
+            value = cls._CACHE.get(key)
+            if value is None:
+                cls._N_MISS += 1
+                return None
+            cls._CACHE.move_to_end(key)
+            cls._N_HIT += 1
+        return cls._thaw(value)
+
+    @classmethod
+    def put(cls, key: tuple, value: Union[list, Map]) -> None:
+        """
+        To put an indicator in cache
+
+        Parameters:
+        -----------
+        key: tuple
+            Key of the indicator (from IndicatorCache.generate_key())
+        value: Union[list, Map]
+            The indicator (Map of list for indicators with many outputs)
+        """
+        frozen = cls._freeze(value)
+        with cls._LOCK:
+            cls._CACHE[key] = frozen
+            cls._CACHE.move_to_end(key)
+            cls._evict()
+
+    @classmethod
+    def get_or_compute(cls, key: tuple, compute: Callable) -> Union[list, Map]:
+        """
+        To get an indicator from cache or compute and cache it if it's missing
+        NOTE: the computation is done outside the lock so threads don't wait on each other
+
+        Parameters:
+        -----------
+        key: tuple
+            Key of the indicator (from IndicatorCache.generate_key())
+        compute: Callable
+            Function that returns the indicator
+
+        Returns:
+        --------
+        return: Union[list, Map]
+            A copy of the indicator
+        """
+        value = cls.get(key)
+        if value is None:
+            value = compute()
+            cls.put(key, value)
+        return value
+
+    @classmethod
+    def _evict(cls) -> None:
+        """
+        To drop the least recently used indicators until the max size is respected
+        NOTE: must be called with the lock acquired
+        """
+        cache = cls._CACHE
+        while len(cache) > cls._MAX_SIZE:
+            cache.popitem(last=False)
+            cls._N_EVICTION += 1
+
+    @staticmethod
+    def _freeze(value: Union[list, Map]) -> Any:
+        if isinstance(value, Map):
+            return {key: tuple(output) for key, output in value.get_map().items()}
+        return tuple(value)
+
+    @staticmethod
+    def _thaw(value: Any) -> Union[list, Map]:
+        if isinstance(value, dict):
+            return Map({key: list(output) for key, output in value.items()})
+        return list(value)
@@ -0,0 +1,579 @@
+import math
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import List, Tuple, Union
+
+from model.tools.Map import Map
+
+
+class IndicatorEngine:
+    """
+    To compute indicators incrementally, one kline at a time
+
+    Each engine holds the state of one indicator for one (Pair, period, params) and
+    updates it in constant time when a new kline arrives or when the open kline is
+    revised. Formulas replicate the 'ta' and 'pandas_ta' implementations used by
+    MarketPrice: on the first history streamed, outputs are those the library gives.
+    A history that slides forward keeps streaming from the state of the previous one, the
+    outputs of its oldest rows are kept till they drop off the longest history streamed.
+    NOTE: the library restarts its warm-up at the first kline of each history, the engine
+          doesn't: rows in the library's warm-up differ, recent rows converge to the
+          library's values (indicators on a rolling window are identical)
+    """
+    _ENGINES = OrderedDict()
+    _ENGINES_LOCK = threading.Lock()
+    _MAX_ENGINES = 2048
+    _NAN = float('nan')
+    _KELTNERC_WINDOW_ATR = 10
+    INDICATORS = [Map.rsi, Map.ema, Map.macd, Map.keltner, Map.bollinger, Map.psar, Map.tsi, Map.roc, Map.supertrend]
+    # Name of each output of indicators that produce more than one value per kline
+    OUTPUTS = {
+        Map.macd:       [Map.macd, Map.signal, Map.histogram],
+        Map.keltner:    [Map.high, Map.middle, Map.low],
+        Map.bollinger:  [Map.high, Map.middle, Map.low, Map.width, Map.rate]
+    }
+
+    def __init__(self, indicator: str, params: dict):
+        """
+        Constructor
+
+        Parameters:
+        -----------
+        indicator: str
+            Name of the indicator to compute (one of IndicatorEngine.INDICATORS)
+        params: dict
+            Params of the indicator, same names as in MarketPrice's static indicator functions
+        """
+        if indicator not in self.INDICATORS:
+            raise ValueError(f"This indicator '{indicator}' is not supported")
+        self.__indicator = indicator
+        self.__params = dict(params)
+        self.__step = getattr(self, f'_step_{indicator}')
+        self.__n_output = len(self.OUTPUTS.get(indicator, [indicator]))
+        self.__lock = threading.Lock()
+        self.__committed = None
+        self.__state = None
+        self.__first_time = None
+        self.__last_time = None
+        self.__times = None
+        self.__columns = None
+        self.__n_keep = None
+        self.reset()
+
+    def get_indicator(self) -> str:
+        return self.__indicator
+
+    def get_params(self) -> dict:
+        return dict(self.__params)
+
+    def get_lock(self) -> threading.Lock:
+        return self.__lock
+
+    def get_first_time(self) -> int:
+        return self.__first_time
+
+    def get_last_time(self) -> int:
+        return self.__last_time
+
+    def get_times(self) -> List[int]:
+        return list(self.__times)
+
+    def get_outputs(self) -> list:
+        """
+        To get outputs of streamed klines
+
+        Returns:
+        --------
+        return: list
+            Outputs from the older (index=0) to the newest (index=-1)
+            NOTE: output is a float or a tuple (ordered like IndicatorEngine.OUTPUTS) for indicators with many outputs
+        """
+        columns = self.__columns
+        return list(columns[0]) if self.__n_output == 1 else list(zip(*columns))
+
+    def get_columns(self) -> List[list]:
+        """
+        To get a copy of outputs of streamed klines, one list per output
+
+        Returns:
+        --------
+        return: List[list]
+            Outputs from the older (index=0) to the newest (index=-1) of each output
+            (ordered like IndicatorEngine.OUTPUTS)
+        """
+        return [column[:] for column in self.__columns]
+
+    def reset(self) -> None:
+        """
+        To forget all streamed klines
+        """
+        self.__committed = None
+        self.__state = None
+        self.__first_time = None
+        self.__last_time = None
+        self.__times = []
+        self.__columns = [[] for _ in range(self.__n_output)]
+        self.__n_keep = 0
+
+    def update(self, open_time: int, high: float, low: float, close: float) -> Union[float, tuple]:
+        """
+        To stream a kline
+
+        Parameters:
+        -----------
+        open_time: int
+            Open time of the kline
+            NOTE: a kline with the same open time than the last streamed kline revises it
+        high: float
+            High price of the kline
+        low: float
+            Low price of the kline
+        close: float
+            Close price of the kline
+
+        Raises:
+        -------
+        raise: ValueError
+            If the kline is older than the last streamed kline
+
+        Returns:
+        --------
+        return: Union[float, tuple]
+            The indicator's output for the given kline
+        """
+        last_time = self.__last_time
+        if (last_time is not None) and (open_time < last_time):
+            raise ValueError(f"Can't stream a kline older than the last one, instead '{open_time}' < '{last_time}'")
+        columns = self.__columns
+        if open_time == last_time:
+            self.__state, output = self.__step(self.__committed, high, low, close)
+            if self.__n_output == 1:
+                columns[0][-1] = output
+            else:
+                for column, value in zip(columns, output):
+                    column[-1] = value
+        else:
+            self.__committed = self.__state
+            self.__state, output = self.__step(self.__committed, high, low, close)
+            self.__first_time = open_time if last_time is None else self.__first_time
+            self.__last_time = open_time
+            self.__times.append(open_time)
+            if self.__n_output == 1:
+                columns[0].append(output)
+            else:
+                for column, value in zip(columns, output):
+                    column.append(value)
+        return output
+
+    def sync(self, times: List[int], highs: List[float], lows: List[float], closes: List[float]) -> Union[List[list], None]:
+        """
+        To bring the engine up to date with a market history and get its outputs
+
+        When the history starts at a streamed kline and contains the last one, only klines
+        from the last streamed one are streamed, else the engine is reset and streams the
+        whole history. Rows older than the longest history streamed are dropped.
+        NOTE: klines before the last streamed one are assumed unchanged (they're closed)
+
+        Parameters:
+        -----------
+        times: List[int]
+            Open times from the older (index=0) to the newest (index=-1)
+        highs: List[float]
+            High prices in the same order than times
+        lows: List[float]
+            Low prices in the same order than times
+        closes: List[float]
+            Close prices in the same order than times
+
+        Returns:
+        --------
+        return: Union[List[list], None]
+            Outputs aligned on the given times (one list per output) or None if the history
+            ends before the last streamed kline
+        """
+        n_row = len(times)
+        if n_row == 0:
+            return [[] for _ in range(self.__n_output)]
+        stored_times = self.__times
+        n_stored = len(stored_times)
+        first = bisect_left(stored_times, times[0])
+        start = n_stored - 1 - first
+        if (first < n_stored) and (stored_times[first] == times[0]) and (start >= n_row):
+            return None
+        resync = (first >= n_stored) or (stored_times[first] != times[0]) or (times[start] != self.__last_time)
+        if resync:
+            self.reset()
+            start = 0
+        for i in range(start, n_row):
+            self.update(times[i], highs[i], lows[i], closes[i])
+        self.__n_keep = max(self.__n_keep, n_row)
+        stored_times = self.__times
+        n_drop = len(stored_times) - self.__n_keep
+        if n_drop > 0:
+            del stored_times[:n_drop]
+            for column in self.__columns:
+                del column[:n_drop]
+            self.__first_time = stored_times[0]
+        return [column[-n_row:] for column in self.__columns]
+
+    @classmethod
+    def get_engine(cls, pair: 'Pair', period: int, indicator: str, params: dict) -> 'IndicatorEngine':
+        """
+        To get the process-wide engine of the given indicator
+        NOTE: the least recently used engines are deleted beyond IndicatorEngine._MAX_ENGINES
+
+        Parameters:
+        -----------
+        pair: Pair
+            Pair of the market
+        period: int
+            Period of the market (in second)
+        indicator: str
+            Name of the indicator
+        params: dict
+            Params of the indicator
+
+        Returns:
+        --------
+        return: IndicatorEngine
+            The engine of the given indicator
+        """
+        key = cls.generate_key(pair, period, indicator, params)
+        with cls._ENGINES_LOCK:
+            engines = cls._ENGINES
+            engine = engines.get(key)
+            if engine is None:
+                engine = engines[key] = IndicatorEngine(indicator, params)
+                engines.popitem(last=False) if len(engines) > cls._MAX_ENGINES else None
+            else:
+                engines.move_to_end(key)
+        return engine
+
+    @classmethod
+    def reset_engines(cls) -> None:
+        """
+        To delete all process-wide engines
+        """
+        with cls._ENGINES_LOCK:
+            cls._ENGINES = OrderedDict()
+
+    @staticmethod
+    def generate_key(pair: 'Pair', period: int, indicator: str, params: dict) -> tuple:
+        return (str(pair), period, indicator, tuple(sorted(params.items())))
+
+    @classmethod
+    def stream(cls, pair: 'Pair', period: int, indicator: str, params: dict, times: List[int], highs: List[float], lows: List[float], closes: List[float]) -> Union[list, Map, None]:
+        """
+        To get an indicator from the process-wide engine of the given market
+
+        Parameters:
+        -----------
+        pair: Pair
+            Pair of the market
+        period: int
+            Period of the market (in second)
+        indicator: str
+            Name of the indicator
+        params: dict
+            Params of the indicator
+        times: List[int]
+            Open times from the older (index=0) to the newest (index=-1)
+        highs: List[float]
+            High prices in the same order than times
+        lows: List[float]
+            Low prices in the same order than times
+        closes: List[float]
+            Close prices in the same order than times
+
+        Returns:
+        --------
+        return: Union[list, Map, None]
+            The indicator from the older (index=0) to the newest (index=-1), in the same format
+            than MarketPrice's static indicator functions (Map of list for indicators with many outputs)
+            or None if the engine can't produce it
+        """
+        engine = cls.get_engine(pair, period, indicator, params)
+        with engine.get_lock():
+            columns = engine.sync(times, highs, lows, closes)
+        if columns is None:
+            return None
+        if indicator not in cls.OUTPUTS:
+            return columns[0]
+        names = cls.OUTPUTS[indicator]
+        return Map({names[i]: columns[i] for i in range(len(names))})
+
+    # ——————————————————————————————————————————— STEPS ———————————————————————————————————————————
+
+    @staticmethod
+    def _is_nan(value: float) -> bool:
+        return value != value
+
+    @classmethod
+    def _ewm(cls, ewm: tuple, value: float, alpha: float, adjust: bool) -> tuple:
+        """
+        To add a value to an exponential weighted mean like pandas.Series.ewm().mean()
+
+        Parameters:
+        -----------
+        ewm: tuple
+            State of the mean: (weighted{float}, old_weight{float}, n_observation{int})
+            NOTE: None for an empty mean
+        value: float
+            The value to add (NaN values are skipped)
+        alpha: float
+            Smoothing factor
+        adjust: bool
+            Same as pandas' adjust param
+
+        Returns:
+        --------
+        return: tuple
+            The new state of the mean
+        """
+        if ewm is None:
+            return (cls._NAN, 1., 0) if cls._is_nan(value) else (value, 1., 1)
+        weighted, old_weight, n_observation = ewm
+        if cls._is_nan(value):
+            return ewm
+        if n_observation == 0:
+            return (value, 1., 1)
+        new_weight = 1. if adjust else alpha
+        old_weight *= (1. - alpha)
+        if weighted != value:
+            weighted = ((old_weight * weighted) + (new_weight * value)) / (old_weight + new_weight)
+        old_weight = (old_weight + new_weight) if adjust else 1.
+        return (weighted, old_weight, n_observation + 1)
+
+    @classmethod
+    def _ewm_value(cls, ewm: tuple, min_periods: int) -> float:
+        return ewm[0] if (ewm is not None) and (ewm[2] > 0) and (ewm[2] >= min_periods) else cls._NAN
+
+    @staticmethod
+    def _divide(numerator: float, denominator: float) -> float:
+        if denominator == 0:
+            return float('nan') if (numerator == 0) or (numerator != numerator) else math.copysign(float('inf'), numerator)
+        return numerator / denominator
+
+    def _step_rsi(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        nb_prd = self.__params['nb_prd']
+        alpha = 1 / nb_prd
+        state = {} if state is None else state
+        prev_close = state.get(Map.close)
+        diff = (close - prev_close) if prev_close is not None else self._NAN
+        up = diff if diff > 0 else 0.0
+        down = -diff if diff < 0 else -0.0
+        ewm_up = self._ewm(state.get(Map.high), up, alpha, adjust=False)
+        ewm_down = self._ewm(state.get(Map.low), down, alpha, adjust=False)
+        ema_up = self._ewm_value(ewm_up, nb_prd)
+        ema_down = self._ewm_value(ewm_down, nb_prd)
+        if ema_down == 0:
+            rsi = 100.0
+        elif self._is_nan(ema_up) or self._is_nan(ema_down):
+            rsi = self._NAN
+        else:
+            rsi = 100 - (100 / (1 + ema_up / ema_down))
+        return {Map.close: close, Map.high: ewm_up, Map.low: ewm_down}, rsi
+
+    def _step_ema(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        n_period = self.__params['n_period']
+        ewm = self._ewm(state, close, 2 / (n_period + 1), adjust=False)
+        return ewm, self._ewm_value(ewm, n_period)
+
+    def _step_macd(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, tuple]:
+        params = self.__params
+        slow, fast, signal = params['slow'], params['fast'], params['signal']
+        state = {} if state is None else state
+        ewm_fast = self._ewm(state.get(Map.fast), close, 2 / (fast + 1), adjust=False)
+        ewm_slow = self._ewm(state.get(Map.slow), close, 2 / (slow + 1), adjust=False)
+        macd = self._ewm_value(ewm_fast, fast) - self._ewm_value(ewm_slow, slow)
+        ewm_signal = self._ewm(state.get(Map.signal), macd, 2 / (signal + 1), adjust=False)
+        macd_signal = self._ewm_value(ewm_signal, signal)
+        new_state = {Map.fast: ewm_fast, Map.slow: ewm_slow, Map.signal: ewm_signal}
+        return new_state, (macd, macd_signal, macd - macd_signal)
+
+    def _step_keltner(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, tuple]:
+        params = self.__params
+        window, multiple, original_version = params['window'], params['multiple'], params['original_version']
+        state = {} if state is None else state
+        if original_version:
+            typicals = (*state.get(Map.middle, ()), (high + low + close) / 3.0)[-window:]
+            highs = (*state.get(Map.high, ()), ((4 * high) - (2 * low) + close) / 3.0)[-window:]
+            lows = (*state.get(Map.low, ()), ((-2 * high) + (4 * low) + close) / 3.0)[-window:]
+            middle = (sum(typicals) / window) if len(typicals) >= window else self._NAN
+            output = (sum(highs) / len(highs), middle, sum(lows) / len(lows))
+            return {Map.middle: typicals, Map.high: highs, Map.low: lows}, output
+        window_atr = self._KELTNERC_WINDOW_ATR
+        ewm = self._ewm(state.get(Map.middle), close, 2 / (window + 1), adjust=False)
+        middle = self._ewm_value(ewm, window)
+        prev_close = state.get(Map.close)
+        if prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        index = state.get(Map.index, -1) + 1
+        true_ranges = state.get(Map.true_range, ())
+        atr = state.get(Map.atr, 0.0)
+        if index < window_atr:
+            true_ranges = (*true_ranges, true_range)
+            atr = (sum(true_ranges) / window_atr) if index == (window_atr - 1) else 0.0
+        else:
+            atr = (atr * (window_atr - 1) + true_range) / float(window_atr)
+        new_state = {Map.middle: ewm, Map.close: close, Map.index: index, Map.true_range: true_ranges, Map.atr: atr}
+        return new_state, (middle + (multiple * atr), middle, middle - (multiple * atr))
+
+    def _step_bollinger(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, tuple]:
+        params = self.__params
+        window, window_dev = params['window'], params['window_dev']
+        closes = (*(state if state is not None else ()), close)[-window:]
+        if len(closes) < window:
+            nan = self._NAN
+            return closes, (nan, nan, nan, nan, nan)
+        mean = sum(closes) / window
+        std = math.sqrt(sum((value - mean) ** 2 for value in closes) / window)
+        high_band = mean + window_dev * std
+        low_band = mean - window_dev * std
+        width = self._divide(high_band - low_band, mean) * 100
+        rate = ((close - low_band) / (high_band - low_band)) if high_band != low_band else self._NAN
+        return closes, (high_band, mean, low_band, width, rate)
+
+    def _step_roc(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        window = self.__params['window']
+        closes = (*(state if state is not None else ()), close)[-(window + 1):]
+        if len(closes) <= window:
+            return closes, self._NAN
+        old_close = closes[0]
+        return closes, self._divide(close - old_close, old_close) * 100
+
+    def _step_tsi(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        params = self.__params
+        nb_prd_slow, nb_prd_fast, use_nan = params['nb_prd_slow'], params['nb_prd_fast'], params['use_nan']
+        fillna = not use_nan
+        min_periods_slow = 0 if fillna else nb_prd_slow
+        min_periods_fast = 0 if fillna else nb_prd_fast
+        alpha_slow = 2 / (nb_prd_slow + 1)
+        alpha_fast = 2 / (nb_prd_fast + 1)
+        state = {} if state is None else state
+        prev_close = state.get(Map.close)
+        diff = (close - prev_close) if prev_close is not None else self._NAN
+        ewms = []
+        for key, value in [(Map.value, diff), (Map.absolute, abs(diff))]:
+            ewm_slow = self._ewm(state.get(f'{key}_{Map.slow}'), value, alpha_slow, adjust=False)
+            smoothed = self._ewm_value(ewm_slow, min_periods_slow)
+            ewm_fast = self._ewm(state.get(f'{key}_{Map.fast}'), smoothed, alpha_fast, adjust=False)
+            ewms.append((ewm_slow, ewm_fast, self._ewm_value(ewm_fast, min_periods_fast)))
+        tsi = self._divide(ewms[0][2], ewms[1][2]) * 100
+        last_tsi = state.get(Map.tsi)
+        if fillna and (self._is_nan(tsi) or math.isinf(tsi)):
+            tsi = last_tsi if last_tsi is not None else 0
+        elif fillna:
+            last_tsi = tsi
+        new_state = {
+            Map.close: close,
+            Map.tsi: last_tsi,
+            f'{Map.value}_{Map.slow}': ewms[0][0],
+            f'{Map.value}_{Map.fast}': ewms[0][1],
+            f'{Map.absolute}_{Map.slow}': ewms[1][0],
+            f'{Map.absolute}_{Map.fast}': ewms[1][1]
+        }
+        return new_state, tsi
+
+    def _step_psar(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        params = self.__params
+        step, max_step = params['step'], params['max_step']
+        if state is None:
+            new_state = {
+                Map.index: 0,
+                Map.rise: True,
+                Map.rate: step,
+                Map.high: high,
+                Map.low: low,
+                Map.psar: close,
+                Map.last: [(high, low)]
+            }
+            return new_state, close
+        index = state[Map.index] + 1
+        last_klines = [*state[Map.last], (high, low)][-3:]
+        if index < 2:
+            return {**state, Map.index: index, Map.psar: close, Map.last: last_klines}, close
+        up_trend = state[Map.rise]
+        acceleration_factor = state[Map.rate]
+        up_trend_high = state[Map.high]
+        down_trend_low = state[Map.low]
+        last_psar = state[Map.psar]
+        (high2, low2), (high1, low1) = last_klines[0], last_klines[1]
+        reversal = False
+        if up_trend:
+            psar = last_psar + (acceleration_factor * (up_trend_high - last_psar))
+            if low < psar:
+                reversal = True
+                psar = up_trend_high
+                down_trend_low = low
+                acceleration_factor = step
+            else:
+                if high > up_trend_high:
+                    up_trend_high = high
+                    acceleration_factor = min(acceleration_factor + step, max_step)
+                if low2 < psar:
+                    psar = low2
+                elif low1 < psar:
+                    psar = low1
+        else:
+            psar = last_psar - (acceleration_factor * (last_psar - down_trend_low))
+            if high > psar:
+                reversal = True
+                psar = down_trend_low
+                up_trend_high = high
+                acceleration_factor = step
+            else:
+                if low < down_trend_low:
+                    down_trend_low = low
+                    acceleration_factor = min(acceleration_factor + step, max_step)
+                if high2 > psar:
+                    psar = high2
+                elif high1 > psar:
+                    psar = high1
+        new_state = {
+            Map.index: index,
+            Map.rise: up_trend != reversal,
+            Map.rate: acceleration_factor,
+            Map.high: up_trend_high,
+            Map.low: down_trend_low,
+            Map.psar: psar,
+            Map.last: last_klines
+        }
+        return new_state, psar
+
+    def _step_supertrend(self, state: dict, high: float, low: float, close: float) -> Tuple[dict, float]:
+        params = self.__params
+        nb_prd, coef = params['nb_prd'], params['coef']
+        state = {} if state is None else state
+        prev_close = state.get(Map.close)
+        if prev_close is None:
+            true_range = abs(high - low)
+        else:
+            true_range = max(abs(high - low), abs(high - prev_close), abs(prev_close - low))
+        ewm = self._ewm(state.get(Map.atr), true_range, 1 / nb_prd, adjust=True)
+        matr = coef * self._ewm_value(ewm, nb_prd)
+        hl2 = 0.5 * (high + low)
+        upper_band = hl2 + matr
+        lower_band = hl2 - matr
+        if prev_close is None:
+            direction = 1
+            supertrend = self._NAN
+        else:
+            last_upper_band = state[Map.high]
+            last_lower_band = state[Map.low]
+            if close > last_upper_band:
+                direction = 1
+            elif close < last_lower_band:
+                direction = -1
+            else:
+                direction = state[Map.rise]
+                if (direction > 0) and (lower_band < last_lower_band):
+                    lower_band = last_lower_band
+                if (direction < 0) and (upper_band > last_upper_band):
+                    upper_band = last_upper_band
+            supertrend = lower_band if direction > 0 else upper_band
+        new_state = {Map.close: close, Map.atr: ewm, Map.rise: direction, Map.high: upper_band, Map.low: lower_band}
+        return new_state, supertrend
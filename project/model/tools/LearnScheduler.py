@@ -0,0 +1,237 @@
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, List
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.FileManager import FileManager
+from model.tools.Map import Map
+
+
+class LearnScheduler:
+    """
+    To train models in parallel across processes
+
+    Unlike BacktestRunner, workers are spawned: TensorFlow's runtime can't be used in a
+    forked process, so each worker starts a fresh interpreter and limits the threads of
+    TensorFlow's intra/inter-op pools before its first fit. Threads are shared between
+    workers so that n_process * n_thread don't exceed the number of CPU.
+    Each task that ends is recorded in a checkpoint file, when resumed tasks already
+    recorded are skipped so an interrupted run resumes where it stopped. A run that
+    don't resume starts from an empty checkpoint. The checkpoint is removed once all
+    tasks succeeded.
+    """
+    _START_METHOD = 'spawn'
+    CHECKPOINT_FIELDS = [Map.name, Map.time, Map.date]
+
+    @staticmethod
+    def get_n_process(n_process: int = None, n_task: int = None) -> int:
+        """
+        To get the number of worker processes to use
+
+        Parameters:
+        -----------
+        n_process: int = None
+            Number of processes wanted (default to the number of CPU)
+        n_task: int = None
+            Number of tasks to run
+
+        Returns:
+        --------
+        return: int
+            The number of worker processes to use
+        """
+        n_process = (os.cpu_count() or 1) if n_process is None else n_process
+        if n_process < 1:
+            raise ValueError(f"The number of process must be at least 1, instead '{n_process}'")
+        return min(n_process, n_task) if (n_task is not None) and (n_task > 0) else n_process
+
+    @staticmethod
+    def get_n_thread(n_process: int, n_thread: int = None) -> int:
+        """
+        To get the number of threads of TensorFlow's intra-op pool in each worker
+
+        Parameters:
+        -----------
+        n_process: int
+            Number of worker processes
+        n_thread: int = None
+            Number of threads wanted (default to share CPU between workers)
+
+        Returns:
+        --------
+        return: int
+            The number of intra-op threads per worker
+        """
+        n_thread = max(1, (os.cpu_count() or 1) // n_process) if n_thread is None else n_thread
+        if n_thread < 1:
+            raise ValueError(f"The number of thread must be at least 1, instead '{n_thread}'")
+        return n_thread
+
+    @classmethod
+    def get_checkpoint(cls, checkpoint_path: str) -> Map:
+        """
+        To get tasks recorded in a checkpoint file
+
+        Parameters:
+        -----------
+        checkpoint_path: str
+            Path to the checkpoint file (from the project's directory)
+
+        Returns:
+        --------
+        return: Map
+            Duration (in second) of each task recorded
+            Map[name{str}]: {float}
+        """
+        checkpoint = Map()
+        if (checkpoint_path is not None) and FileManager.exist_file(checkpoint_path):
+            for row in FileManager.get_csv(checkpoint_path):
+                checkpoint.put(float(row[Map.time]), row[Map.name])
+        return checkpoint
+
+    @classmethod
+    def run(cls, task: Callable, task_params: List[dict], names: List[str], n_process: int = None, n_thread: int = None, n_inter_thread: int = 1, checkpoint_path: str = None, resume: bool = True, output: bool = True) -> List[Map]:
+        """
+        To run tasks in parallel
+        NOTE: tasks are run in the calling process when only 1 process is used, threads
+              of TensorFlow are then not limited
+        NOTE: FileManager is flushed after each task, so files a task writes are on disk
+              before it's recorded in the checkpoint
+        NOTE: workers import the main module, so the code that calls this function must be
+              guarded by "if __name__ == '__main__':"
+
+        Parameters:
+        -----------
+        task: Callable
+            Function to run for each task, it must be picklable (defined at a module's
+            level or static method of a class) and so must be its returned value
+        task_params: List[dict]
+            Params of each task (task(**params))
+        names: List[str]
+            Unique name of each task, used to record them in the checkpoint
+        n_process: int = None
+            Maximum number of worker processes (default to the number of CPU)
+        n_thread: int = None
+            Number of threads of TensorFlow's intra-op pool in each worker
+            (default to the number of CPU shared between workers)
+        n_inter_thread: int = 1
+            Number of threads of TensorFlow's inter-op pool in each worker
+        checkpoint_path: str = None
+            Path to the checkpoint file, None to not checkpoint
+        resume: bool = True
+            Set True to skip tasks recorded in the checkpoint else False to remove the
+            checkpoint of a previous run before to start
+        output: bool = True
+            Set True to output the progression else False
+
+        Returns:
+        --------
+        return: List[Map]
+            Results of tasks run (tasks in the checkpoint are skipped) in the order of
+            task_params
+            result[i][Map.index]:   {int}           # Index of the task in task_params
+            result[i][Map.name]:    {str}           # Name of the task
+            result[i][Map.result]:  {Any}           # Value returned by the task (None if it failed)
+            result[i][Map.time]:    {float}         # Duration of the task (in second)
+            result[i][Map.error]:   {str|None}      # Error raised by the task
+        """
+        if len(names) != len(task_params):
+            raise ValueError(f"Each task must have a name, instead '{len(names)}' names for '{len(task_params)}' tasks")
+        if (not resume) and (checkpoint_path is not None) and FileManager.exist_file(checkpoint_path):
+            FileManager.remove_file(checkpoint_path)
+        checkpoint = cls.get_checkpoint(checkpoint_path)
+        indexes = [i for i in range(len(task_params)) if checkpoint.get(names[i]) is None]
+        n_task = len(indexes)
+        if output and (n_task < len(task_params)):
+            _MF.output(_MF.prefix() + f"Skip '{len(task_params) - n_task}' tasks already in the checkpoint")
+        n_process = cls.get_n_process(n_process, n_task)
+        n_thread = cls.get_n_thread(n_process, n_thread)
+        executions_params = [(task, i, task_params[i]) for i in indexes]
+        output_starttime = _MF.get_timestamp()
+        if n_process <= 1:
+            executions = (cls._execute(*params) for params in executions_params)
+            results = cls._collect(executions, n_task, names, checkpoint_path, output_starttime, output)
+        else:
+            context = multiprocessing.get_context(cls._START_METHOD)
+            initargs = (n_thread, n_inter_thread)
+            with context.Pool(processes=n_process, initializer=cls._init_worker, initargs=initargs) as pool:
+                executions = pool.imap_unordered(cls._execute_params, executions_params, chunksize=1)
+                results = cls._collect(executions, n_task, names, checkpoint_path, output_starttime, output)
+        results.sort(key=lambda result: result.get(Map.index))
+        succeed = all([result.get(Map.error) is None for result in results])
+        if succeed and (checkpoint_path is not None) and FileManager.exist_file(checkpoint_path):
+            FileManager.remove_file(checkpoint_path)
+        return results
+
+    @classmethod
+    def _collect(cls, executions: Any, n_task: int, names: List[str], checkpoint_path: str, output_starttime: int, output: bool) -> List[Map]:
+        results = []
+        turn = 1
+        for index, result, duration, error in executions:
+            name = names[index]
+            results.append(Map({Map.index: index, Map.name: name, Map.result: result, Map.time: duration, Map.error: error}))
+            if (error is None) and (checkpoint_path is not None):
+                row = {Map.name: name, Map.time: duration, Map.date: _MF.unix_to_date(_MF.get_timestamp())}
+                FileManager.write_csv(checkpoint_path, cls.CHECKPOINT_FIELDS, [row], overwrite=False, make_dir=True)
+                FileManager.flush()
+            if output:
+                status = f"{name} in '{round(duration, 2)}'sec." if error is None else f"{name} failed: '{error}'"
+                _MF.output(_MF.loop_progression(output_starttime, turn, n_task, status))
+            turn += 1
+        return results
+
+    @staticmethod
+    def _init_worker(n_thread: int, n_inter_thread: int) -> None:
+        """
+        To limit threads of a worker before TensorFlow's runtime starts
+
+        Parameters:
+        -----------
+        n_thread: int
+            Number of threads of TensorFlow's intra-op pool (and of OpenMP)
+        n_inter_thread: int
+            Number of threads of TensorFlow's inter-op pool
+        """
+        os.environ['OMP_NUM_THREADS'] = str(n_thread)
+        os.environ['TF_NUM_INTRAOP_THREADS'] = str(n_thread)
+        os.environ['TF_NUM_INTEROP_THREADS'] = str(n_inter_thread)
+        try:
+            import tensorflow as tf
+        except ImportError:
+            return
+        tf.config.threading.set_intra_op_parallelism_threads(n_thread)
+        tf.config.threading.set_inter_op_parallelism_threads(n_inter_thread)
+
+    @classmethod
+    def _execute_params(cls, params: tuple) -> tuple:
+        return cls._execute(*params)
+
+    @staticmethod
+    def _execute(task: Callable, index: int, params: dict) -> tuple:
+        """
+        To run a task in a worker
+
+        Parameters:
+        -----------
+        task: Callable
+            Function to run
+        index: int
+            Index of the task to run
+        params: dict
+            Params of the task
+
+        Returns:
+        --------
+        return: tuple
+            The index of the task, the value returned, its duration (in second) and the error raised
+        """
+        start = time.perf_counter()
+        result = None
+        error = None
+        try:
+            result = task(**params)
+            FileManager.flush()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return index, result, time.perf_counter() - start, error
@@ -0,0 +1,112 @@
+import threading
+from typing import List
+
+import pandas as pd
+
+from config.Config import Config
+from model.tools.FileManager import FileManager
+
+
+class LogSink:
+    """
+    To write high-volume logs (i.e.: broker responses, condition reports)
+
+    The base sink appends rows to csv files. Subclasses store rows in other formats
+    and are selected with Config.LOG_SINK, one sink of each type is shared by all
+    writers so rows of the same file are buffered together.
+    """
+    SINK_CSV = 'csv'
+    SINK_COLUMNAR = 'columnar'
+    _SINKS = {}
+    _LOCK_SINKS = threading.Lock()
+
+    @classmethod
+    def get_sink(cls, sink_type: str = None) -> 'LogSink':
+        """
+        To get the sink of a type
+
+        Parameters:
+        -----------
+        sink_type: str = None
+            Type of sink (i.e.: LogSink.SINK_CSV), None to use the type set in Config.LOG_SINK
+
+        Returns:
+        --------
+        return: LogSink
+            The sink of the type
+        """
+        sink_type = Config.get(Config.LOG_SINK) if sink_type is None else sink_type
+        sink = LogSink._SINKS.get(sink_type)
+        if sink is None:
+            with LogSink._LOCK_SINKS:
+                sink = LogSink._SINKS.get(sink_type)
+                if sink is None:
+                    sink = LogSink._SINKS[sink_type] = LogSink._new_sink(sink_type)
+        return sink
+
+    @staticmethod
+    def _new_sink(sink_type: str) -> 'LogSink':
+        if sink_type == LogSink.SINK_CSV:
+            return LogSink()
+        if sink_type == LogSink.SINK_COLUMNAR:
+            from model.tools.ColumnarLogSink import ColumnarLogSink
+            return ColumnarLogSink()
+        raise ValueError(f"This type of sink '{sink_type}' is not supported")
+
+    def write(self, path: str, rows: List[dict], fields: List[str] = None) -> None:
+        """
+        To append rows to a log
+
+        Parameters:
+        -----------
+        path: str
+            Path to the log's csv file from the project's directory
+        rows: List[dict]
+            Rows to append
+        fields: List[str] = None
+            Name of fields to write, None to use keys of the first row
+        """
+        if len(rows) == 0:
+            return
+        fields = list(rows[0].keys()) if fields is None else fields
+        FileManager.write_csv(path, fields, rows, overwrite=False, make_dir=True)
+
+    def flush(self) -> None:
+        """
+        To submit rows buffered to FileManager
+        """
+        pass
+
+    def get_paths(self, path: str) -> List[str]:
+        """
+        To get files where a log is stored
+
+        Parameters:
+        -----------
+        path: str
+            Path to the log's csv file from the project's directory
+
+        Returns:
+        --------
+        return: List[str]
+            Path to files of the log from the older to the newest
+        """
+        return [path] if FileManager.exist_file(path) else []
+
+    def read(self, path: str) -> pd.DataFrame:
+        """
+        To read a log
+
+        Parameters:
+        -----------
+        path: str
+            Path to the log's csv file from the project's directory
+
+        Returns:
+        --------
+        return: pd.DataFrame
+            Rows of the log
+        """
+        project_dir = FileManager.get_project_directory()
+        frames = [pd.read_csv(project_dir + file_path) for file_path in self.get_paths(path)]
+        return pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame()
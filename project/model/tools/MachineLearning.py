@@ -323,7 +323,6 @@ class MachineLearning(MyJson):
     
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = MachineLearning([[1]],[[1]], degree=1, train=False)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -211,6 +211,41 @@ class Map(MyJson):
     signal = "signal"
     histogram = "histogram"
     ema = "ema"
+    roc = "roc"
+    bollinger = "bollinger"
+    atr = "atr"
+    true_range = "true_range"
+    absolute = "absolute"
+    fast = "fast"
+    slow = "slow"
+    last = "last"
+    before = "before"
+    after = "after"
+    # IndicatorCache
+    hit = "hit"
+    miss = "miss"
+    eviction = "eviction"
+    # MessageQueue
+    coalesce = "coalesce"
+    received = "received"
+    delivered = "delivered"
+    # HistoryStore
+    version = "version"
+    source = "source"
+    checksum = "checksum"
+    # BacktestRunner
+    result = "result"
+    error = "error"
+    # LearnScheduler
+    name = "name"
+    # FileManager
+    flush = "flush"
+    # ColumnarLogSink
+    compress = "compress"
+    # SessionPool
+    session = "session"
+    retry = "retry"
+    connection = "connection"
     # MinMax
     stop = "stop"
     # Order
@@ -239,11 +274,17 @@ class Map(MyJson):
     stream = "stream"
 
     def __init__(self, my_map: dict = None):
-        self.__id = self.PREFIX_ID + _MF.new_code()
+        self.__id = None
         my_map = {} if my_map is None else dict(my_map)
         self.__map = my_map
 
     def get_id(self) -> str:
+        """
+        To get the Map's id
+        NOTE: the id is generated the first time it's asked
+        """
+        if self.__id is None:
+            self.__id = self.PREFIX_ID + _MF.new_code()
         return self.__id
 
     def _set_map(self, my_map: dict) -> None:
@@ -256,52 +297,24 @@ class Map(MyJson):
         nb = len(keys)
         if nb == 0:
             raise ValueError("Keys can't be empty")
-        key = keys[0]
         mp = self.get_map()
-        if nb == 1:
-            mp[key] = val
-        else:
-            if key in mp:
-                mp[key] = self._put_rec(mp[key], val, keys, 1)
-            else:
-                mp[key] = self._put_rec({}, val, keys, 1)
-
-    def _put_rec(self, mp: dict, val, keys: tuple, i: int):
-        if i < len(keys):
-            key = keys[i]
-            if key in mp:
-                i += 1
-                mp[key] = self._put_rec(mp[key], val, keys, i)
-            else:
-                i += 1
-                mp = {} if type(mp) != dict else mp
-                mp[key] = self._put_rec({}, val, keys, i)
-            return mp
-        else:
-            return val
+        for key in keys[:-1]:
+            child = mp.get(key)
+            if not isinstance(child, dict):
+                child = mp[key] = {}
+            mp = child
+        mp[keys[-1]] = val
 
     def get(self, *keys):
-        nb = len(keys)
-        if nb == 0:
+        if len(keys) == 0:
             raise ValueError("Keys can't be empty")
-        mp = self.get_map()
-        if nb == 1:
-            key = keys[0]
-            val = mp[key] if ((type(mp) == dict) and key in mp) else None
-        else:
-            key = keys[0]
-            val = self._get_rec(mp[key], keys, 1) if ((type(mp) == dict) and key in mp) else None
+        val = self.get_map()
+        for key in keys:
+            if (type(val) != dict) or (key not in val):
+                return None
+            val = val[key]
         return val
 
-    def _get_rec(self, mp: dict, keys: tuple, i: int):
-        if i == (len(keys) - 1):
-            key = keys[i]
-            return mp[key] if ((type(mp) == dict) and key in mp) else None
-        else:
-            key = keys[i]
-            i += 1
-            return self._get_rec(mp[key], keys, i) if ((type(mp) == dict) and key in mp) else None
-
     def get_keys(self) -> list:
         return list(self.__map.keys())
 
@@ -338,11 +351,14 @@ class Map(MyJson):
         #     clean_keys.append(key)
         return cls.MERGE_KEY_TOKEN.join(keys)
 
+    def _json_encode_to_dict(self) -> dict:
+        self.get_id()
+        return self.__dict__
+
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Map({'@json': '@json'})
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     def __str__(self) -> str:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Tuple, Union, List
 
 import numpy as np
@@ -15,6 +16,10 @@ from config.Config import Config
 from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.tools.Asset import Asset
 from model.tools.FileManager import FileManager
+from model.tools.HistoryStore import HistoryStore
+from model.tools.IndicatorCache import IndicatorCache
+from model.tools.IndicatorEngine import IndicatorEngine
+from model.tools.FlatMap import FlatMap
 from model.tools.Map import Map
 from model.tools.Order import Order
 from model.tools.Pair import Pair
@@ -26,6 +31,8 @@ class MarketPrice(ABC):
     _HISTORY_PERIODS = None
     _REGEX_HISTORY_FILE = r"\d+.csv"
     _PERIOD_MARKET_ANALYSE = 60 * 60
+    _N_DOWNLOAD_THREAD = 8
+    _N_DOWNLOAD_JOB = 8
     # Indicators
     INDIC_MS = "_set_ms"
     INDIC_DR = "_set_dr"
@@ -100,27 +107,29 @@ class MarketPrice(ABC):
     _KELTNERC_WINDOW = 20
     _KELTNERC_MULTIPLE = 2
     _KELTNERC_MULTIPLE_LIBRARY = 2
+    _KELTNERC_WINDOW_ATR = 10
     _EMA_N_PERIOD = 10
     _BOLLINGER_WINDOW = 20
     _BOLLINGER_WINDOW_DEV = 2
     _ROC_WINDOW = 12
+    _STREAM_INDICATOR_STAGES = [Config.STAGE_2, Config.STAGE_3]
+    # History
+    _COLUMNS = None
+    # Batch
+    COMPUTE_MANY_INDICATORS = [Map.rsi, Map.ema, Map.macd, Map.keltner, Map.bollinger, Map.roc, Map.supertrend]
 
     @abstractmethod
-    def __init__(self, mkt: list, prd_time: int, pair: Pair):
+    def __init__(self, mkt: Union[list, np.ndarray], prd_time: int, pair: Pair):
         """
         Constructor\n
         :param mkt: market prices.
-        NOTE: market prices must be ordered from the newest to the older
+        NOTE: market prices must be ordered from the older (index=0) to the newest (index=-1)
         """
-        if not isinstance(mkt, list):
-            raise ValueError(f"Market param must be type 'list', instead '{type(mkt)}'")
+        if not isinstance(mkt, (list, np.ndarray)):
+            raise ValueError(f"Market param must be type 'list' or 'np.ndarray', instead '{type(mkt)}'")
         self.__id = self.PREFIX_ID + _MF.new_code()
         self.__settime = _MF.get_timestamp(unit=_MF.TIME_MILLISEC)
-        mkt = [row.copy() for row in mkt]
-        self.__id = self.PREFIX_ID + _MF.new_code()
-        self.__settime = _MF.get_timestamp(unit=_MF.TIME_MILLISEC)
-        mkt.reverse()
-        self.__market = tuple(mkt)
+        self.__history = self._new_history(mkt)
         self.__period_time = prd_time
         self.__pair = pair
         self.__indicators = Map()
@@ -183,8 +192,88 @@ class MarketPrice(ABC):
         """
         return self.__settime
 
-    def get_market(self) -> tuple:
-        return self.__market
+    def get_history(self) -> np.ndarray:
+        """
+        To get market prices as a read-only 2D array of float
+
+        Returns:
+        --------
+        return: np.ndarray
+            Market prices ordered from the older (index=0) to the newest (index=-1)
+        """
+        return self.__history
+
+    def get_market(self) -> np.ndarray:
+        """
+        To get market prices as a read-only view of the history
+
+        Returns:
+        --------
+        return: np.ndarray
+            Market prices ordered from the newest (index=0) to the older (index=-1)
+        """
+        return self.__history[::-1]
+
+    def _get_column(self, key: str) -> np.ndarray:
+        """
+        To get a column of the history without copying it
+
+        Parameters:
+        -----------
+        key: str
+            Key of the column in MarketPrice._COLUMNS (i.e.: Map.close, Map.high, etc...)
+
+        Returns:
+        --------
+        return: np.ndarray
+            Read-only view of the column ordered from the older (index=0) to the newest (index=-1)
+        """
+        history = self.get_history()
+        return history[:, self._COLUMNS[key]] if history.shape[0] > 0 else np.empty(0, dtype=np.float64)
+
+    def _column_to_collection(self, key: str) -> tuple:
+        """
+        To convert a column of the history into a collection
+
+        Parameters:
+        -----------
+        key: str
+            Key of the column in MarketPrice._COLUMNS (i.e.: Map.close, Map.high, etc...)
+
+        Returns:
+        --------
+        return: tuple
+            The column ordered from the newest (index=0) to the older (index=-1)
+        """
+        return tuple(self._get_column(key)[::-1].tolist())
+
+    @staticmethod
+    def _new_history(mkt: Union[list, np.ndarray]) -> np.ndarray:
+        """
+        To convert market prices into a read-only 2D array of float
+        NOTE: values that can't be converted to float are replaced by NaN
+
+        Parameters:
+        -----------
+        mkt: Union[list, np.ndarray]
+            Market prices ordered from the older (index=0) to the newest (index=-1)
+
+        Returns:
+        --------
+        return: np.ndarray
+            Market prices in the same order
+        """
+        if len(mkt) == 0:
+            history = np.empty((0, 0), dtype=np.float64)
+        else:
+            try:
+                history = np.asarray(mkt, dtype=np.float64).view()
+            except (ValueError, TypeError):
+                history = pd.DataFrame(list(mkt)).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        if history.ndim != 2:
+            raise ValueError(f"Market prices must have 2 dimensions, instead '{history.ndim}'")
+        history.flags.writeable = False
+        return history
 
     def get_period_time(self) -> int:
         return self.__period_time
@@ -227,6 +316,64 @@ class MarketPrice(ABC):
             raise IndexError(f"This collection key '{k}' is not supported")
         return colls.get(k)
 
+    def _stream_indicator(self, indicator: str, **params) -> Union[list, Map, None]:
+        """
+        To get an indicator from the process-wide IndicatorEngine instead of recomputing it on the whole history
+        NOTE: only used in stages where MarketPrice are requested on each new kline
+
+        Parameters:
+        -----------
+        indicator: str
+            Name of the indicator (one of IndicatorEngine.INDICATORS)
+        **params: dict
+            Params of the indicator
+
+        Returns:
+        --------
+        return: Union[list, Map, None]
+            The indicator ordered from the older (index=0) to the newest (index=-1)
+            or None if it must be computed on the whole history
+        """
+        if Config.get(Config.STAGE_MODE) not in self._STREAM_INDICATOR_STAGES:
+            return None
+        times = self._get_column(Map.time)
+        highs = self._get_column(Map.high)
+        lows = self._get_column(Map.low)
+        closes = self._get_column(Map.close)
+        return IndicatorEngine.stream(self.get_pair(), self.get_period_time(), indicator, params, times, highs, lows, closes)
+
+    def _cache_indicator(self, indicator: str, compute: Callable, **params) -> Union[list, Map]:
+        """
+        To get an indicator from the process-wide IndicatorCache or produce it if it's missing
+        NOTE: a missing indicator is streamed by the IndicatorEngine when possible else computed
+
+        Parameters:
+        -----------
+        indicator: str
+            Name of the indicator
+        compute: Callable
+            Function that computes the indicator on the whole history
+        **params: dict
+            Params of the indicator
+
+        Returns:
+        --------
+        return: Union[list, Map]
+            The indicator ordered from the older (index=0) to the newest (index=-1)
+        """
+        def produce() -> Union[list, Map]:
+            values = self._stream_indicator(indicator, **params)
+            return compute() if values is None else values
+
+        history = self.get_history()
+        if history.shape[0] == 0:
+            return produce()
+        last_row = history[-1]
+        last_time = last_row[self._COLUMNS[Map.time]]
+        fingerprint = (history.shape[0], history[0, self._COLUMNS[Map.time]], tuple(last_row.tolist()))
+        key = IndicatorCache.generate_key(self.__class__.__name__, self.get_pair(), self.get_period_time(), last_time, indicator, params, fingerprint)
+        return IndicatorCache.get_or_compute(key, produce)
+
     def __set_indicator(self, k, v) -> None:
         self._get_indicators().put(float(v), k)
 
@@ -339,22 +486,12 @@ class MarketPrice(ABC):
         """
         prices_pd = self.__pd
         if prices_pd is None:
-            open_times = list(self.get_times())
-            open_times.reverse()
-            opens = list(self.get_opens())
-            opens.reverse()
-            closes = list(self.get_closes())
-            closes.reverse()
-            highs = list(self.get_highs())
-            highs.reverse()
-            lows = list(self.get_lows())
-            lows.reverse()
             prices = {
-                Map.time:   open_times,
-                Map.open:   opens,
-                Map.close:  closes,
-                Map.high:   highs,
-                Map.low:    lows
+                Map.time:   self.get_times()[::-1],
+                Map.open:   self._get_column(Map.open),
+                Map.close:  self._get_column(Map.close),
+                Map.high:   self._get_column(Map.high),
+                Map.low:    self._get_column(Map.low)
                 }
             prices_pd = pd.DataFrame(prices)
             prices_pd.set_index(Map.time, drop=False, inplace=True)
@@ -424,16 +561,14 @@ class MarketPrice(ABC):
         """
         rsis = self._get_collection(self.COLLECTION_RSIS)
         if rsis is None:
-            closes = list(self.get_closes())
-            closes.reverse()
+            closes = self._get_column(Map.close)
             """
             pd_ser = pd.Series(np.array(closes))
             rsis_obj = RSIIndicator(pd_ser, nb_prd)
             rsis_series = rsis_obj.rsi()
             rsis = rsis_series.to_list()
             """
-            rsis = self.rsis(nb_prd, closes)
-            rsis = [float(str(v)) for v in rsis]
+            rsis = self._cache_indicator(Map.rsi, lambda: self.rsis(nb_prd, closes), nb_prd=nb_prd)
             rsis.reverse()
             rsis = tuple(rsis)
             self._set_collection(self.COLLECTION_RSIS, rsis)
@@ -454,12 +589,10 @@ class MarketPrice(ABC):
             rsis.reverse()
             rsis = rsis[nb_period-1:]
             # High
-            highs = list(self.get_highs())
-            highs.reverse()
+            highs = self._get_column(Map.high)
             rsi_highs = MarketPrice.rsis(nb_period, highs)[nb_period-1:]
             # Low
-            lows = list(self.get_lows())
-            lows.reverse()
+            lows = self._get_column(Map.low)
             rsi_lows = MarketPrice.rsis(nb_period, lows)[nb_period-1:]
             # Psar
             psar_rsis = MarketPrice.psar(rsi_highs, rsi_lows, rsis, step=step, max_step=max_step)
@@ -480,12 +613,10 @@ class MarketPrice(ABC):
             rsis = list(self.get_rsis(nb_prd))
             rsis.reverse()
             # RSI High
-            highs = list(self.get_highs())
-            highs.reverse()
+            highs = self._get_column(Map.high)
             rsis_highs = self.rsis(nb_prd, highs)
             # RSI Low
-            lows = list(self.get_lows())
-            lows.reverse()
+            lows = self._get_column(Map.low)
             rsis_lows = self.rsis(nb_prd, lows)
             super_rsis = self.super_trend(nb_prd, coef, rsis, rsis_highs, rsis_lows)
             super_rsis.reverse()
@@ -499,10 +630,8 @@ class MarketPrice(ABC):
         k = self.COLLECTION_TSIS
         tsis = self._get_collection(k)
         if tsis is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            tsis = self.tsis(nb_prd_slow, nb_prd_fast, use_nan, closes)
-            tsis = [float(str(v)) for v in tsis]
+            closes = self._get_column(Map.close)
+            tsis = self._cache_indicator(Map.tsi, lambda: self.tsis(nb_prd_slow, nb_prd_fast, use_nan, closes), nb_prd_slow=nb_prd_slow, nb_prd_fast=nb_prd_fast, use_nan=use_nan)
             tsis.reverse()
             tsis = tuple(tsis)
             self._set_collection(k, tsis)
@@ -525,7 +654,6 @@ class MarketPrice(ABC):
             pd_series = pd.Series(np.array(tsis))
             tsis_emas = _ema(pd_series, nb_prd_fast, not use_nan)
             tsis_emas = tsis_emas.to_list()
-            tsis_emas = [float(str(v)) for v in tsis_emas]
             tsis_emas.reverse()
             tsis_emas = tuple(tsis_emas)
             self._set_collection(k, tsis_emas)
@@ -659,13 +787,10 @@ class MarketPrice(ABC):
         k = self.COLLECTION_SUPER_TREND
         supers = self._get_collection(k)
         if supers is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            highs = list(self.get_highs())
-            highs.reverse()
-            lows = list(self.get_lows())
-            lows.reverse()
-            supers = self.super_trend(nb_prd, coef, closes, highs, lows)
+            closes = self._get_column(Map.close)
+            highs = self._get_column(Map.high)
+            lows = self._get_column(Map.low)
+            supers = self._cache_indicator(Map.supertrend, lambda: self.super_trend(nb_prd, coef, closes, highs, lows), nb_prd=nb_prd, coef=coef)
             supers.reverse()
             supers = tuple(supers)
             self._set_collection(k, supers)
@@ -675,13 +800,10 @@ class MarketPrice(ABC):
         k = self.COLLECTION_PSAR
         psars = self._get_collection(k)
         if psars is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            highs = list(self.get_highs())
-            highs.reverse()
-            lows = list(self.get_lows())
-            lows.reverse()
-            psars = MarketPrice.psar(highs, lows, closes, step=step, max_step=max_step)
+            closes = self._get_column(Map.close)
+            highs = self._get_column(Map.high)
+            lows = self._get_column(Map.low)
+            psars = self._cache_indicator(Map.psar, lambda: MarketPrice.psar(highs, lows, closes, step=step, max_step=max_step), step=step, max_step=max_step)
             psars.reverse()
             psars = tuple(psars)
             self._set_collection(k, psars)
@@ -691,9 +813,8 @@ class MarketPrice(ABC):
         k = self.COLLECTION_MACD
         macds = self._get_collection(k)
         if macds is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            macd_map = MarketPrice.macd(closes, slow, fast, signal)
+            closes = self._get_column(Map.close)
+            macd_map = self._cache_indicator(Map.macd, lambda: MarketPrice.macd(closes, slow, fast, signal), slow=slow, fast=fast, signal=signal)
             # Treat MACDs
             macds = macd_map.get(Map.macd)
             macds.reverse()
@@ -721,13 +842,10 @@ class MarketPrice(ABC):
         k = self.COLLECTION_KELTNERC_MIDDLE
         kelc_middles = self._get_collection(k)
         if kelc_middles is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            highs = list(self.get_highs())
-            highs.reverse()
-            lows = list(self.get_lows())
-            lows.reverse()
-            kelc = MarketPrice.keltnerchannel(highs, lows, closes, window, multiple, original_version)
+            closes = self._get_column(Map.close)
+            highs = self._get_column(Map.high)
+            lows = self._get_column(Map.low)
+            kelc = self._cache_indicator(Map.keltner, lambda: MarketPrice.keltnerchannel(highs, lows, closes, window, multiple, original_version), window=window, multiple=multiple, original_version=original_version)
             # Middle
             kelc_middles = kelc.get(Map.middle)
             kelc_middles.reverse()
@@ -765,10 +883,9 @@ class MarketPrice(ABC):
         k = self.COLLECTION_EMA
         ema = self._get_collection(k)
         if ema is None:
-            closes = list(self.get_closes())
-            closes.reverse()
+            closes = self._get_column(Map.close)
             fillna = False
-            ema = self.ema(closes, n_period, fillna)
+            ema = self._cache_indicator(Map.ema, lambda: self.ema(closes, n_period, fillna), n_period=n_period)
             ema.reverse()
             ema = tuple(ema)
             self._set_collection(k, ema)
@@ -800,9 +917,8 @@ class MarketPrice(ABC):
         k = self.COLLECTION_BOLLINGER_MIDDLE
         bollinger_middle = self._get_collection(k)
         if bollinger_middle is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            bollinger = self.bollingerbands(closes, window, window_dev)
+            closes = self._get_column(Map.close)
+            bollinger = self._cache_indicator(Map.bollinger, lambda: self.bollingerbands(closes, window, window_dev), window=window, window_dev=window_dev)
             bollinger_high = bollinger.get(Map.high)
             bollinger_high.reverse()
             bollinger_middle = bollinger.get(Map.middle)
@@ -834,9 +950,8 @@ class MarketPrice(ABC):
         key = self.COLLECTION_ROC
         roc = self._get_collection(key)
         if roc is None:
-            closes = list(self.get_closes())
-            closes.reverse()
-            roc = self.roc(closes, window)
+            closes = self._get_column(Map.close)
+            roc = self._cache_indicator(Map.roc, lambda: self.roc(closes, window), window=window)
             roc.reverse()
             self._set_collection(key, roc)
         return roc
@@ -1429,6 +1544,161 @@ class MarketPrice(ABC):
         roc = roc_obj.roc().to_list()
         return roc
 
+    @classmethod
+    def compute_many(cls, indicator: str, closes: np.ndarray, highs: np.ndarray = None, lows: np.ndarray = None, **params) -> Union[np.ndarray, Map]:
+        """
+        To compute an indicator for many Pair at once
+        NOTE: give the same values than MarketPrice's static indicator functions applied Pair by Pair
+
+        Parameters:
+        -----------
+        indicator: str
+            Name of the indicator (one of MarketPrice.COMPUTE_MANY_INDICATORS)
+        closes: np.ndarray
+            Close prices of shape (n_pair, n_period), each row ordered from the older (index=0) to the newest (index=-1)
+        highs: np.ndarray
+            High prices in the same shape and order than closes (required by Map.keltner and Map.supertrend)
+        lows: np.ndarray
+            Low prices in the same shape and order than closes (required by Map.keltner and Map.supertrend)
+        **params: dict
+            Params of the indicator (same names as in MarketPrice's indicator getters, default to the same values)
+
+        Returns:
+        --------
+        return: Union[np.ndarray, Map]
+            The indicator in the same shape and order than closes
+            or Map of indicators for indicators with many outputs (same keys as MarketPrice's static indicator functions)
+        """
+        if indicator not in cls.COMPUTE_MANY_INDICATORS:
+            raise ValueError(f"This indicator '{indicator}' is not supported")
+        closes = np.asarray(closes, dtype=np.float64)
+        if closes.ndim != 2:
+            raise ValueError(f"Closes must have 2 dimensions (n_pair, n_period), instead '{closes.ndim}'")
+        if indicator in [Map.keltner, Map.supertrend]:
+            if (highs is None) or (lows is None):
+                raise ValueError(f"Highs and lows are required to compute '{indicator}'")
+            highs = np.asarray(highs, dtype=np.float64)
+            lows = np.asarray(lows, dtype=np.float64)
+            if (highs.shape != closes.shape) or (lows.shape != closes.shape):
+                raise ValueError(f"Highs '{highs.shape}' and lows '{lows.shape}' must have the same shape than closes '{closes.shape}'")
+        # Each column is a Pair to let pandas run each window on contiguous periods
+        frame = pd.DataFrame(closes.T)
+        if indicator == Map.rsi:
+            nb_prd = params.get('nb_prd', cls._NB_PRD_RSIS)
+            diff = frame.diff(1)
+            up_direction = diff.where(diff > 0, 0.0)
+            down_direction = -diff.where(diff < 0, 0.0)
+            emaup = up_direction.ewm(alpha=1/nb_prd, min_periods=nb_prd, adjust=False).mean()
+            emadn = down_direction.ewm(alpha=1/nb_prd, min_periods=nb_prd, adjust=False).mean()
+            relative_strength = emaup / emadn
+            result = np.where(emadn == 0, 100, 100 - (100 / (1 + relative_strength))).T
+        elif indicator == Map.ema:
+            n_period = params.get('n_period', cls._EMA_N_PERIOD)
+            result = _ema(frame, n_period, False).to_numpy().T
+        elif indicator == Map.macd:
+            slow = params.get('slow', cls._MACD_SLOW)
+            fast = params.get('fast', cls._MACD_FAST)
+            signal = params.get('signal', cls._MACD_SIGNAL)
+            macds = _ema(frame, fast, False) - _ema(frame, slow, False)
+            signals = _ema(macds, signal, False)
+            result = Map({
+                Map.macd: macds.to_numpy().T,
+                Map.signal: signals.to_numpy().T,
+                Map.histogram: (macds - signals).to_numpy().T
+            })
+        elif indicator == Map.keltner:
+            window = params.get('window', cls._KELTNERC_WINDOW)
+            multiple = params.get('multiple', cls._KELTNERC_MULTIPLE)
+            original_version = params.get('original_version', False)
+            high_frame = pd.DataFrame(highs.T)
+            low_frame = pd.DataFrame(lows.T)
+            if original_version:
+                middles = ((high_frame + low_frame + frame) / 3.0).rolling(window, min_periods=window).mean()
+                tp_highs = (((4 * high_frame) - (2 * low_frame) + frame) / 3.0).rolling(window, min_periods=0).mean()
+                tp_lows = (((-2 * high_frame) + (4 * low_frame) + frame) / 3.0).rolling(window, min_periods=0).mean()
+            else:
+                middles = frame.ewm(span=window, min_periods=window, adjust=False).mean()
+                atrs = pd.DataFrame(cls._average_true_range_many(highs, lows, closes, cls._KELTNERC_WINDOW_ATR).T)
+                tp_highs = middles + (multiple * atrs)
+                tp_lows = middles - (multiple * atrs)
+            result = Map({
+                Map.high: tp_highs.to_numpy().T,
+                Map.low: tp_lows.to_numpy().T,
+                Map.middle: middles.to_numpy().T
+            })
+        elif indicator == Map.bollinger:
+            window = params.get('window', cls._BOLLINGER_WINDOW)
+            window_dev = params.get('window_dev', cls._BOLLINGER_WINDOW_DEV)
+            rolling = frame.rolling(window, min_periods=window)
+            middles = rolling.mean()
+            stds = rolling.std(ddof=0)
+            bands_high = middles + window_dev * stds
+            bands_low = middles - window_dev * stds
+            result = Map({
+                Map.high: bands_high.to_numpy().T,
+                Map.middle: middles.to_numpy().T,
+                Map.low: bands_low.to_numpy().T,
+                Map.width: (((bands_high - bands_low) / middles) * 100).to_numpy().T,
+                Map.rate: ((frame - bands_low) / (bands_high - bands_low).where(bands_high != bands_low, np.nan)).to_numpy().T
+            })
+        elif indicator == Map.roc:
+            window = params.get('window', cls._ROC_WINDOW)
+            shifts = frame.shift(window)
+            result = (((frame - shifts) / shifts) * 100).to_numpy().T
+        else:
+            nb_prd = params.get('nb_prd', cls._SUPERTREND_NB_PERIOD)
+            coef = params.get('coef', cls._SUPERTREND_COEF)
+            result = cls._super_trend_many(nb_prd, coef, closes, highs, lows)
+        return result
+
+    @staticmethod
+    def _true_range_many(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+        """
+        To get the true range of many Pair (the first period has no previous close so it's high - low)
+        """
+        prev_closes = np.full(closes.shape, np.nan)
+        prev_closes[:, 1:] = closes[:, :-1]
+        return np.fmax(np.abs(highs - lows), np.fmax(np.abs(highs - prev_closes), np.abs(prev_closes - lows)))
+
+    @classmethod
+    def _average_true_range_many(cls, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, window: int) -> np.ndarray:
+        """
+        To get the Average True Range of many Pair, seeded like 'ta' with the mean of the first window
+        """
+        true_ranges = cls._true_range_many(highs, lows, closes)
+        atrs = np.zeros(closes.shape)
+        n_period = closes.shape[1]
+        if n_period >= window:
+            atrs[:, window-1] = true_ranges[:, :window].mean(axis=1)
+            for i in range(window, n_period):
+                atrs[:, i] = (atrs[:, i-1] * (window - 1) + true_ranges[:, i]) / window
+        return atrs
+
+    @classmethod
+    def _super_trend_many(cls, nb_prd: int, coef: float, closes: np.ndarray, highs: np.ndarray, lows: np.ndarray) -> np.ndarray:
+        """
+        To get the Super Trend of many Pair
+        NOTE: bands depend on the previous period so periods are walked one by one, all Pair at once
+        """
+        true_ranges = cls._true_range_many(highs, lows, closes)
+        atrs = pd.DataFrame(true_ranges.T).ewm(alpha=1/nb_prd, min_periods=nb_prd).mean().to_numpy().T
+        hl2s = 0.5 * (highs + lows)
+        upper_bands = hl2s + coef * atrs
+        lower_bands = hl2s - coef * atrs
+        super_trends = np.full(closes.shape, np.nan)
+        directions = np.ones(closes.shape[0])
+        for i in range(1, closes.shape[1]):
+            rising = closes[:, i] > upper_bands[:, i-1]
+            dropping = closes[:, i] < lower_bands[:, i-1]
+            keeping = ~(rising | dropping)
+            directions = np.where(rising, 1, np.where(dropping, -1, directions))
+            lower_keeps = keeping & (directions > 0) & (lower_bands[:, i] < lower_bands[:, i-1])
+            lower_bands[:, i] = np.where(lower_keeps, lower_bands[:, i-1], lower_bands[:, i])
+            upper_keeps = keeping & (directions < 0) & (upper_bands[:, i] > upper_bands[:, i-1])
+            upper_bands[:, i] = np.where(upper_keeps, upper_bands[:, i-1], upper_bands[:, i])
+            super_trends[:, i] = np.where(directions > 0, lower_bands[:, i], upper_bands[:, i])
+        return super_trends
+
     @staticmethod
     def get_spot_pairs(broker_class: str, fiat_asset: Asset) -> List[Pair]:
         """
@@ -1507,11 +1777,57 @@ class MarketPrice(ABC):
         broker.request(bkr_rq)
         return bkr_rq.get_market_price()
 
+    @staticmethod
+    def prefetch(broker: 'Broker', requests: List[Tuple[Pair, int, int]], marketprices: Map = None) -> Map:
+        """
+        To request the most recent MarketPrice of several pairs and periods concurrently
+        NOTE: MarketPrice are requested by several threads that wait their turn in the Broker's rate limits
+        NOTE: MarketPrice are served by the Broker's streams when they're open
+        NOTE: MarketPrice are requested one after the other in backtest (Config.STAGE_1)
+
+        Parameters
+        ----------
+        broker: Broker
+            Access to a Broker's API
+        requests: List[Tuple[Pair, int, int]]
+            Pair, period and number of period of each MarketPrice to request
+        marketprices: Map = None
+            MarketPrice already requested, they are not requested again
+            marketprices[Pair.hash()][period{int}] -> {MarketPrice}
+
+        Returns
+        -------
+        return: Map
+            MarketPrice requested (the ones that failed are missing)
+            marketprices[Pair.hash()][period{int}] -> {MarketPrice}
+        """
+        marketprices = marketprices if marketprices is not None else FlatMap()
+        to_request = {}
+        for pair, period, n_period in requests:
+            key = (pair.__str__(), period)
+            if (key in to_request) or (marketprices.get(pair, period) is not None):
+                continue
+            to_request[key] = (pair, period, n_period)
+        to_request = list(to_request.values())
+        def request(item: Tuple[Pair, int, int]) -> 'MarketPrice':
+            pair, period, n_period = item
+            kwargs = {'broker': broker, 'pair': pair, 'period': period, 'n_period': n_period}
+            return _MF.catch_exception(MarketPrice.marketprice, MarketPrice.__name__, **kwargs)
+        n_thread = 1 if Config.get_stage() == Config.STAGE_1 else min(MarketPrice._N_DOWNLOAD_THREAD, len(to_request))
+        if n_thread <= 1:
+            results = [request(item) for item in to_request]
+        else:
+            with ThreadPoolExecutor(max_workers=n_thread, thread_name_prefix='prefetch_marketprices') as executor:
+                results = list(executor.map(request, to_request))
+        for (pair, period, _), marketprice in zip(to_request, results):
+            marketprices.put(marketprice, pair, period) if marketprice is not None else None
+        return marketprices
+
     @staticmethod
     def marketprices(broker: 'Broker', pair: Pair, period: int, endtime: int, starttime: int = None, n_period: int = None) -> pd.DataFrame:
         """
-        To request recurisively market history from starttime (older) to endtime (recent)
-        NOTE: if there's not enough period between starttime and endtime, market history already downloaded is returned
+        To request market history from starttime (older) to endtime (recent)
+        NOTE: the history is split in pages that are requested concurrently
 
         Parameters
         ----------
@@ -1545,6 +1861,34 @@ class MarketPrice(ABC):
         -------
             The market history from starttime (older) to endtime (recent)
         """
+        starttime, endtime = MarketPrice._download_range(period, endtime, starttime, n_period)
+        max_n_period = broker.get_max_n_period()
+        page_endtimes = MarketPrice._page_endtimes(period, starttime, endtime, max_n_period)
+        pages = MarketPrice._request_pages(broker, [(pair, period, page_endtime) for page_endtime in page_endtimes])
+        marketprices = MarketPrice._assemble_pages(pages, max_n_period)
+        return MarketPrice._clean_pages(marketprices, period, starttime, endtime)
+
+    @staticmethod
+    def _download_range(period: int, endtime: int, starttime: int = None, n_period: int = None) -> Tuple[int, int]:
+        """
+        To check and round the interval of market history to download
+
+        Parameters
+        ----------
+        period: int
+            The period interval to request
+        endtime: int
+            The most recent open time (in second)
+        starttime: int
+            The older open time (in second)
+        n_period: int
+            The number of period to retrieve
+
+        Returns
+        -------
+        return: Tuple[int, int]
+            The start time (one period before the older open time) and the end time rounded to the period
+        """
         unix_time = _MF.get_timestamp()
         if starttime == n_period == None:
             raise ValueError(f"starttime and n_period can't both be None")
@@ -1561,34 +1905,143 @@ class MarketPrice(ABC):
         if starttime is None:
             starttime = endtime - (n_period * period)
         starttime = _MF.round_time(starttime, period) - period
-        max_n_period = broker.get_max_n_period()
         endtime = _MF.round_time(endtime, period)
-        endtime_copy = endtime
-        marketprices = None
-        end = False
-        while not end:
-            marketprice = MarketPrice.marketprice(broker, pair, period, n_period=max_n_period, endtime=endtime_copy)
-            market = list(marketprice.get_market())
-            market.reverse()
-            martket_np = np.array(market, dtype=np.float64)
-            marketprices = martket_np if marketprices is None else np.vstack((martket_np, marketprices))
-            endtime_copy -= period * max_n_period
-            end = (martket_np.shape[0] < max_n_period) \
-                or (endtime_copy <= starttime)
-        # Convert to DataFrame
-        marketprices_pd = pd.DataFrame(marketprices, columns=[str(i) for i in range(marketprices.shape[1])])
-        # Drop duplicates
-        marketprices_pd = marketprices_pd.drop_duplicates(subset='0', keep='last', ignore_index=True)
-        # Sort following the open time
-        marketprices_pd = marketprices_pd.sort_values(by='0', axis=0, ascending=True)
+        return starttime, endtime
+
+    @staticmethod
+    def _page_endtimes(period: int, starttime: int, endtime: int, max_n_period: int) -> List[int]:
+        """
+        To get the end time of each page of market history to request
+
+        Parameters
+        ----------
+        period: int
+            The period interval to request
+        starttime: int
+            The start time of the history (in second)
+        endtime: int
+            The end time of the history (in second)
+        max_n_period: int
+            The maximum number of period per page
+
+        Returns
+        -------
+        return: List[int]
+            End time of each page (in second) from the newest to the older
+        """
+        page_time = period * max_n_period
+        n_page = max(int(np.ceil((endtime - starttime) / page_time)), 1)
+        return [endtime - i * page_time for i in range(n_page)]
+
+    @staticmethod
+    def _request_pages(broker: 'Broker', pages: List[Tuple[Pair, int, int]]) -> List[Union[np.ndarray, Exception]]:
+        """
+        To request pages of market history concurrently
+        NOTE: pages are requested by several threads that wait their turn in the Broker's rate limits
+        NOTE: pages are requested one after the other in backtest (Config.STAGE_1)
+
+        Parameters
+        ----------
+        broker: Broker
+            Access to a Broker's API
+        pages: List[Tuple[Pair, int, int]]
+            Pair, period and end time (in second) of each page
+
+        Returns
+        -------
+        return: List[Union[np.ndarray, Exception]]
+            The history of each page or the exception raised while requesting it
+        """
+        max_n_period = broker.get_max_n_period()
+        def request_page(page: Tuple[Pair, int, int]) -> Union[np.ndarray, Exception]:
+            pair, period, endtime = page
+            try:
+                return MarketPrice.marketprice(broker, pair, period, n_period=max_n_period, endtime=endtime).get_history()
+            except Exception as error:
+                return error
+        n_thread = 1 if Config.get_stage() == Config.STAGE_1 else min(MarketPrice._N_DOWNLOAD_THREAD, len(pages))
+        if n_thread <= 1:
+            return [request_page(page) for page in pages]
+        with ThreadPoolExecutor(max_workers=n_thread, thread_name_prefix='download_marketprices') as executor:
+            return list(executor.map(request_page, pages))
+
+    @staticmethod
+    def _assemble_pages(pages: List[Union[np.ndarray, Exception]], max_n_period: int) -> np.ndarray:
+        """
+        To assemble pages of market history into one history
+        NOTE: pages older than the first incomplete page are ignored, they are before market's start
+
+        Parameters
+        ----------
+        pages: List[Union[np.ndarray, Exception]]
+            History of each page from the newest to the older
+        max_n_period: int
+            The maximum number of period per page
+
+        Raise
+        ------
+        raise: Exception
+            The exception raised while requesting a page needed
+
+        Returns
+        -------
+        return: np.ndarray
+            The history of pages from the older to the newest (rows shared by pages are repeated)
+        """
+        used_pages = []
+        for page in pages:
+            if isinstance(page, Exception):
+                raise page
+            used_pages.append(page)
+            if page.shape[0] < max_n_period:
+                break
+        n_row = sum([page.shape[0] for page in used_pages])
+        if n_row == 0:
+            raise ValueError("The market history requested is empty")
+        n_col = max([page.shape[1] for page in used_pages if page.shape[0] > 0])
+        history = np.empty((n_row, n_col), dtype=np.float64)
+        end = n_row
+        for page in used_pages:
+            history[end - page.shape[0]:end] = page
+            end -= page.shape[0]
+        return history
+
+    @staticmethod
+    def _clean_pages(history: np.ndarray, period: int, starttime: int, endtime: int) -> pd.DataFrame:
+        """
+        To remove duplicated and exceeding rows from assembled pages
+
+        Parameters
+        ----------
+        history: np.ndarray
+            History of pages from the older to the newest
+        period: int
+            The period interval of the history
+        starttime: int
+            The start time of the history (in second)
+        endtime: int
+            The end time of the history (in second)
+
+        Returns
+        -------
+        return: pd.DataFrame
+            The market history from starttime (older) to endtime (recent)
+        """
+        # Drop duplicates keeping the row of the newest page, sorted following the open time
+        reversed_history = history[::-1]
+        _, indexes = np.unique(reversed_history[:, 0], return_index=True)
+        history = reversed_history[indexes]
         # Remove exceeding periods
-        marketprices_pd = marketprices_pd[(marketprices_pd.iloc[:,0] >= ((starttime+period)*1000)) & (marketprices_pd.iloc[:,0] <= (endtime*1000))]
-        return marketprices_pd
+        open_times = history[:, 0]
+        history = history[(open_times >= ((starttime+period)*1000)) & (open_times <= (endtime*1000))]
+        return pd.DataFrame(history, columns=[str(i) for i in range(history.shape[1])])
 
     @classmethod
     def download_marketprices(cls, broker: 'Broker', pairs: List[Pair], periods: List[int], endtime: int, starttime: int) -> None:
         """
         To download and save markt prices
+        NOTE: pairs and periods are downloaded by batch of MarketPrice._N_DOWNLOAD_JOB, each
+              history is saved before the pages of the next batch are requested
 
         Parameters:
         -----------
@@ -1603,21 +2056,25 @@ class MarketPrice(ABC):
         starttime: int
             The older time to download (in second)
         """
-        def get_marketprices(broker: 'Broker', pair: Pair, period: int, endtime: int, starttime: int) -> pd.DataFrame:
-            marketprice_pd = _MF.catch_exception(cls.marketprices, cls.__name__, repport=True, **{
-                'broker': broker, 
-                'pair': pair, 
-                'period': period, 
-                'endtime': endtime, 
-                'starttime': starttime
-                })
+        def get_marketprices(pages: List[Union[np.ndarray, Exception]], period: int, endtime: int, starttime: int) -> pd.DataFrame:
+            try:
+                history = cls._assemble_pages(pages, max_n_period)
+                marketprice_pd = cls._clean_pages(history, period, starttime, endtime)
+            except Exception as error:
+                from model.structure.Bot import Bot
+                Bot.save_error(error, cls.__name__)
+                marketprice_pd = None
             return marketprice_pd
 
         def print_history(path: str, marketprice: pd.DataFrame) -> None:
             csv = marketprice.to_csv(index=False)
             FileManager.write(path, csv, overwrite=True, make_dir=True)
+
+        def append_history(path: str, marketprice: pd.DataFrame) -> None:
+            csv = marketprice.to_csv(index=False, header=False)
+            FileManager.write(path, csv, overwrite=False, line_return=False)
         
-        def print_config(path: str, marketprice: pd.DataFrame) -> None:
+        def print_config(path: str, pair: Pair, period: int, marketprice: pd.DataFrame) -> None:
             first_time = int(marketprice.iloc[0,0]/1000)
             last_time = int(marketprice.iloc[-1,0]/1000)
             max_high = marketprice.iloc[:,2].max()
@@ -1640,38 +2097,98 @@ class MarketPrice(ABC):
             file_path = path + 'config.csv'
             FileManager.write_csv(file_path, fields, rows, overwrite=False, make_dir=True)
 
+        def plan_job(pair: Pair, period: int) -> dict:
+            job = {Map.pair: pair, Map.period: period, Map.history: None, Map.before: None, Map.after: None}
+            if cls.exist_history(broker_name, pair, period):
+                marketprice_pd = cls.load_marketprice(broker_name, pair, period, active_path=False)
+                old_starttime = int(marketprice_pd.iloc[0,0]/1000)
+                old_endtime = int(marketprice_pd.iloc[-1,0]/1000)
+                job[Map.history] = marketprice_pd
+                # Download before existing history
+                job[Map.before] = (old_starttime, starttime) if (old_starttime - starttime) > 0 else None
+                # Download after existing history
+                job[Map.after] = (endtime, old_endtime) if (endtime - old_endtime) > 0 else None
+            else:
+                job[Map.after] = (endtime, starttime)
+            return job
+
+        def plan_pages(jobs: List[dict]) -> List[Tuple[Pair, int, int]]:
+            pages = []
+            for job in jobs:
+                for key in [Map.before, Map.after]:
+                    if job[key] is None:
+                        continue
+                    try:
+                        page_starttime, page_endtime = cls._download_range(job[Map.period], *job[key])
+                    except Exception as error:
+                        from model.structure.Bot import Bot
+                        Bot.save_error(error, cls.__name__)
+                        job[key] = None
+                        continue
+                    page_endtimes = cls._page_endtimes(job[Map.period], page_starttime, page_endtime, max_n_period)
+                    job[key] = (page_endtime, page_starttime, len(pages), len(pages) + len(page_endtimes))
+                    pages += [(job[Map.pair], job[Map.period], page_endtime) for page_endtime in page_endtimes]
+            return pages
+
+        def save_job(job: dict, pages: List[Union[np.ndarray, Exception]]) -> None:
+            pair = job[Map.pair]
+            period = job[Map.period]
+            intervals = {}
+            for key in [Map.before, Map.after]:
+                if job[key] is not None:
+                    page_endtime, page_starttime, first_page, last_page = job[key]
+                    intervals[key] = get_marketprices(pages[first_page:last_page], period, page_endtime, page_starttime)
+            file_path = cls.file_path_market_history(broker_name, pair, period, active_path=False)
+            dir_path = cls.dir_path_market_history(broker_name, pair, active_path=False)
+            marketprice_pd = job[Map.history]
+            before_marketprice_pd = intervals.get(Map.before)
+            after_marketprice_pd = intervals.get(Map.after)
+            if marketprice_pd is None:
+                if after_marketprice_pd is None:
+                    return
+                marketprice_pd = after_marketprice_pd
+                print_history(file_path, marketprice_pd)
+            else:
+                old_starttime = marketprice_pd.iloc[0,0]
+                old_endtime = marketprice_pd.iloc[-1,0]
+                before_marketprice_pd = before_marketprice_pd[before_marketprice_pd.iloc[:,0] < old_starttime] if before_marketprice_pd is not None else None
+                after_marketprice_pd = after_marketprice_pd[after_marketprice_pd.iloc[:,0] > old_endtime] if after_marketprice_pd is not None else None
+                has_before = (before_marketprice_pd is not None) and (before_marketprice_pd.shape[0] > 0)
+                has_after = (after_marketprice_pd is not None) and (after_marketprice_pd.shape[0] > 0)
+                if not (has_before or has_after):
+                    return
+                marketprice_pd = pd.concat([
+                    before_marketprice_pd if has_before else None,
+                    marketprice_pd,
+                    after_marketprice_pd if has_after else None
+                    ], ignore_index=True)
+                if has_before:
+                    print_history(file_path, marketprice_pd)
+                else:
+                    # Only append rows newer than the last stored
+                    append_history(file_path, after_marketprice_pd)
+            print_config(dir_path, pair, period, marketprice_pd)
+
         _back_cyan = '\033[46m' + '\033[30m'
         _normal = '\033[0m'
         broker_name = broker.__class__.__name__
-        # Ouput
-        n_turn = len(pairs) * len(periods)
+        max_n_period = broker.get_max_n_period()
+        _MF.output(f"{_MF.prefix() + _back_cyan}Start extracting prices of '{len(pairs)}' pairs from '{_MF.unix_to_date(starttime)}' to '{_MF.unix_to_date(endtime)}'{_normal}")
+        # Jobs are downloaded and saved by batch to hold only one batch's pages in memory
+        intervals = [(pair, period) for pair in pairs for period in periods]
+        n_turn = len(intervals)
         turn = 1
         out_starttime = _MF.get_timestamp()
-        _MF.output(f"{_MF.prefix() + _back_cyan}Start extracting prices of '{len(pairs)}' pairs from '{_MF.unix_to_date(starttime)}' to '{_MF.unix_to_date(endtime)}'{_normal}")
-        for pair in pairs:
-            for period in periods:
-                _MF.output(_MF.loop_progression(out_starttime, turn, n_turn, message=f"{pair.__str__().upper()} {int(period/60)}min."))
+        for i in range(0, n_turn, cls._N_DOWNLOAD_JOB):
+            jobs = [plan_job(pair, period) for pair, period in intervals[i:i + cls._N_DOWNLOAD_JOB]]
+            pages = plan_pages(jobs)
+            _MF.output(f"{_MF.prefix()}Request '{len(pages)}' pages of market history")
+            pages = cls._request_pages(broker, pages)
+            for job in jobs:
+                _MF.output(_MF.loop_progression(out_starttime, turn, n_turn, message=f"{job[Map.pair].__str__().upper()} {int(job[Map.period]/60)}min."))
                 turn += 1
-                if cls.exist_history(broker_name, pair, period):
-                    marketprice_pd = cls.load_marketprice(broker_name, pair, period, active_path=False)
-                    old_starttime = int(marketprice_pd.iloc[0,0]/1000)
-                    old_endtime = int(marketprice_pd.iloc[-1,0]/1000)
-                    if (old_starttime - starttime) > 0:
-                        # Download before existing history
-                        before_marketprice_pd = get_marketprices(broker, pair, period, old_starttime, starttime)
-                        marketprice_pd = pd.concat([before_marketprice_pd[:-1], marketprice_pd], ignore_index=True)
-                    if (endtime - old_endtime) > 0:
-                        # Download after existing history
-                        after_marketprice_pd = get_marketprices(broker, pair, period, endtime, old_endtime)
-                        marketprice_pd = pd.concat([marketprice_pd, after_marketprice_pd.iloc[1:]], ignore_index=True)
-                else:
-                    marketprice_pd = get_marketprices(broker, pair, period, endtime, starttime)
-                    if marketprice_pd is None:
-                        continue
-                file_path = cls.file_path_market_history(broker_name, pair, period, active_path=False)
-                dir_path = cls.dir_path_market_history(broker_name, pair, active_path=False)
-                print_history(file_path, marketprice_pd)
-                print_config(dir_path, marketprice_pd)
+                save_job(job, pages)
+            FileManager.flush()
 
     @staticmethod
     def load_marketprice(broker_name: str, pair: Pair, period: int, active_path: bool) -> pd.DataFrame:
@@ -1695,6 +2212,66 @@ class MarketPrice(ABC):
         return: pd.DataFrame
             Loaded market history
         """
+        MarketPrice._check_history_pair(broker_name, pair, active_path)
+        stock_file_path = MarketPrice.file_path_market_history(broker_name, pair, period, active_path=False)
+        project_dir = FileManager.get_project_directory()
+        history = pd.read_csv(project_dir + stock_file_path)
+        return history
+
+    @staticmethod
+    def load_history(broker_name: str, pair: Pair, period: int, active_path: bool, clean: Callable[[np.ndarray], np.ndarray] = None) -> np.ndarray:
+        """
+        To load market history from its binary format (see HistoryStore)
+        NOTE: the CSV history is converted on the first load or when it changed
+
+        Parameters:
+        -----------
+        broker_name: str
+            Class name of a supported Broker
+        pair: Pair
+            Pair to get file path of
+        period: int
+            Period to get file path of (in second)
+        active_path: bool
+            Set True to access histories for the running session 
+            else False to access stored histories
+        clean: Callable[[np.ndarray], np.ndarray] = None
+            Function that returns the history cleaned before to store it
+
+        Return:
+        -------
+        return: np.ndarray
+            Read-only memory-mapped market history
+        """
+        MarketPrice._check_history_pair(broker_name, pair, active_path)
+        stock_file_path = MarketPrice.file_path_market_history(broker_name, pair, period, active_path=False)
+        return HistoryStore.load(stock_file_path, clean)
+
+    @staticmethod
+    def convert_histories(broker_name: str, clean: Callable[[int, np.ndarray], np.ndarray] = None) -> None:
+        """
+        To convert all stored CSV histories into their binary format (see HistoryStore)
+
+        Parameters:
+        -----------
+        broker_name: str
+            Class name of a supported Broker
+        clean: Callable[[int, np.ndarray], np.ndarray] = None
+            Function that returns a history cleaned from its period and the history
+        """
+        _cls = MarketPrice
+        regex = _cls.regex_history_file()
+        for pair in _cls.history_pairs(broker_name, active_path=False):
+            dir_path = _cls.dir_path_market_history(broker_name, pair, active_path=False)
+            history_files = FileManager.get_files(dir_path)
+            periods = [int(file.split('.')[0]) for file in history_files if _MF.regex_match(regex, file)]
+            for period in periods:
+                file_path = _cls.file_path_market_history(broker_name, pair, period, active_path=False)
+                f_clean = (lambda history, f_period=period: clean(f_period, history)) if clean is not None else None
+                HistoryStore.convert(file_path, f_clean)
+
+    @staticmethod
+    def _check_history_pair(broker_name: str, pair: Pair, active_path: bool) -> None:
         if active_path:
             pair_dir_path = MarketPrice.dir_path_pair(broker_name, active_path=True)
             str_pairs = FileManager.get_dirs(pair_dir_path, make_dir=True)
@@ -1705,10 +2282,6 @@ class MarketPrice(ABC):
             str_pairs = FileManager.get_dirs(pair_dir_path, make_dir=True)
             if pair.format(Pair.FORMAT_UNDERSCORE).upper() not in str_pairs:
                 raise ValueError(f"This Pair '{pair}' don't has its Stock history")
-        stock_file_path = MarketPrice.file_path_market_history(broker_name, pair, period, active_path=False)
-        project_dir = FileManager.get_project_directory()
-        history = pd.read_csv(project_dir + stock_file_path)
-        return history
 
     @classmethod
     def exist_history(cls, broker_name: str, pair: Pair, period: int) -> bool:
@@ -2076,9 +2649,8 @@ class MarketPrice(ABC):
     @staticmethod
     def _save_market(market_price: 'MarketPrice') -> None:
         p = Config.get(Config.DIR_SAVE_MARKET)
-        mkt = market_price.get_market()
+        mkt = market_price.get_history().tolist()
         mkt = [[str(v) for v in row] for row in mkt]
-        mkt.reverse()
         rows = [{
             Map.time: _MF.unix_to_date(_MF.get_timestamp()),
             Map.pair: market_price.get_pair(),
@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple, Union
+
+from model.tools.Map import Map
+
+
+class MessageQueue:
+    """
+    To pass messages from producers to consumers through a bounded queue
+
+    Messages are stored by key: a message put while an other one with the same key
+    is still waiting replaces it at its place in the queue (coalesce), so a consumer
+    late on a key only treats the newest message of this key. When the queue is full
+    producers wait for a free place (backpressure) and the older message is dropped
+    if no place is freed in time.
+    """
+
+    def __init__(self, max_size: int, timeout: float = None):
+        """
+        Constructor
+
+        Parameters:
+        -----------
+        max_size: int
+            Maximum number of messages waiting in the queue
+        timeout: float = None
+            Maximum time (in second) a producer waits for a free place before dropping
+            the older message (0 to drop without waiting, None to wait until a place is freed)
+        """
+        if max_size < 1:
+            raise ValueError(f"The max size must be at least 1, instead '{max_size}'")
+        if (timeout is not None) and (timeout < 0):
+            raise ValueError(f"The timeout must be positive, instead '{timeout}'")
+        self.__max_size = max_size
+        self.__timeout = timeout
+        self.__messages = OrderedDict()
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__n_received = 0
+        self.__n_delivered = 0
+        self.__n_coalesce = 0
+        self.__n_drop = 0
+
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    def get_timeout(self) -> Union[float, None]:
+        return self.__timeout
+
+    def is_closed(self) -> bool:
+        return self.__closed
+
+    def __len__(self) -> int:
+        with self.__condition:
+            return len(self.__messages)
+
+    def get_stats(self) -> Map:
+        """
+        To get counters of the queue
+
+        Returns:
+        --------
+        return: Map
+            Counters of the queue
+            stats[Map.received]:    {int}   # Number of messages put
+            stats[Map.delivered]:   {int}   # Number of messages got by consumers
+            stats[Map.coalesce]:    {int}   # Number of messages replaced by a newer one with the same key
+            stats[Map.drop]:        {int}   # Number of messages dropped because the queue was full
+            stats[Map.size]:        {int}   # Number of messages waiting in the queue
+        """
+        with self.__condition:
+            return Map({
+                Map.received: self.__n_received,
+                Map.delivered: self.__n_delivered,
+                Map.coalesce: self.__n_coalesce,
+                Map.drop: self.__n_drop,
+                Map.size: len(self.__messages)
+            })
+
+    def put(self, key: Hashable, message: Any) -> bool:
+        """
+        To put a message in the queue
+
+        Parameters:
+        -----------
+        key: Hashable
+            Key of the message, messages with the same key are coalesced
+        message: Any
+            The message
+
+        Returns:
+        --------
+        return: bool
+            True if the message is in the queue else False (the queue is closed)
+        """
+        messages = self.__messages
+        with self.__condition:
+            if self.__closed:
+                return False
+            self.__n_received += 1
+            if key in messages:
+                messages[key] = message
+                self.__n_coalesce += 1
+                return True
+            if len(messages) >= self.__max_size:
+                self.__condition.wait_for(lambda: (len(messages) < self.__max_size) or self.__closed, timeout=self.__timeout)
+                if self.__closed:
+                    return False
+                if key in messages:
+                    messages[key] = message
+                    self.__n_coalesce += 1
+                    return True
+                while len(messages) >= self.__max_size:
+                    messages.popitem(last=False)
+                    self.__n_drop += 1
+            messages[key] = message
+            self.__condition.notify_all()
+            return True
+
+    def get(self, timeout: float = None) -> Union[Tuple[Hashable, Any], None]:
+        """
+        To get the older message of the queue
+
+        Parameters:
+        -----------
+        timeout: float = None
+            Maximum time (in second) to wait for a message (None to wait until a message is put)
+
+        Returns:
+        --------
+        return: Union[Tuple[Hashable, Any], None]
+            The key and the message or None if no message came in time or the queue is closed
+        """
+        messages = self.__messages
+        with self.__condition:
+            self.__condition.wait_for(lambda: (len(messages) > 0) or self.__closed, timeout=timeout)
+            if len(messages) == 0:
+                return None
+            item = messages.popitem(last=False)
+            self.__n_delivered += 1
+            self.__condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        """
+        To refuse new messages and wake up all waiting producers and consumers
+        NOTE: messages still in the queue can be got
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
@@ -1,6 +1,7 @@
+import importlib
 from abc import ABC, abstractmethod
 from collections import Iterable
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -10,14 +11,23 @@ from model.tools.FileManager import FileManager
 
 
 class MyJson(ABC):
+    __slots__ = ()
     _TOKEN_CLASS_NAME =                     '@class_name'
     _TOKEN_ITERABLE =                       '@'
     _KEY_DICT_TYPE =                        '@dict_type'
     _KEY_DICT_VALUE =                       '@dict_value'
     _REGEX_REPLACE_ATTRIBUTE =              f'^.+{_TOKEN_CLASS_NAME}'
-    _EXECUTABLE_json_instantiate =          None
     _EXECUTABLE_test_json_encode_decode =   None
     _DONT_SERIALIZES =                      ['Thread']
+    _SERIALIZABLES =                        None
+    _CLASSES =                              {}
+    _ENCODERS =                             {}
+    _KEY_TYPES = {
+        str.__name__:   str,
+        int.__name__:   int,
+        float.__name__: float,
+        bool.__name__:  lambda str_key: str_key == str(True)
+        }
 
     def json_encode(self) -> str:
         """
@@ -27,17 +37,24 @@ class MyJson(ABC):
         serialized: str
             Custom class object's JSON string
         """
+        return _MF.json_encode(self._json_encode_object())
+
+    def _json_encode_object(self) -> dict:
+        """
+        To convert a custom class object to a dict of JSON values
+
+        Returns:
+        --------
+        return: dict
+            Class name and JSON value of each attribute
+        """
         self._json_encode_prepare()
-        _class_token = MyJson.get_class_name_token()
-        class_name = self.__class__.__name__
         attrs = self._json_encode_to_dict().copy()
-        json_dict = {_class_token: class_name}
+        json_dict = {MyJson._TOKEN_CLASS_NAME: self.__class__.__name__}
         for attr, value in attrs.items():
-            value_serialized = MyJson.__root_encoding(value)
-            json_dict[attr] = value_serialized
-        json_str = _MF.json_encode(json_dict)
-        return json_str
-    
+            json_dict[attr] = MyJson._root_encoding(value)
+        return json_dict
+
     def _json_encode_prepare(self) -> None:
         """
         To prepare Object to be encoded
@@ -52,51 +69,92 @@ class MyJson(ABC):
         return self.__dict__
 
     def copy(self) -> object:
-        obj_copy = MyJson.json_decode(self.json_encode())
-        return obj_copy        
-
-    @staticmethod
-    def __root_encoding(value: Any) -> Any:
-        serializables = list(_MF._get_imports().keys())
-        class_name = value.__class__.__name__
-        if class_name in MyJson._DONT_SERIALIZES:
-            value_serialized = None
-        elif class_name in serializables:
-            value_serialized = _MF.json_decode(value.json_encode())
-        elif isinstance(value, Iterable) and not isinstance(value, (str, bytes, bytearray)):
-            value_serialized = MyJson.__encode_iterable(value)
-        else:
-            value_serialized = value
-        return value_serialized
+        """
+        To copy Object through its JSON values (without to write them in a JSON string)
+
+        Returns:
+        --------
+        return: object
+            The copy
+        """
+        return MyJson._generate_instance(self._json_encode_object())
+
+    @staticmethod
+    def _root_encoding(value: Any) -> Any:
+        encoder = MyJson._ENCODERS.get(value.__class__)
+        if encoder is None:
+            encoder = MyJson._get_encoder(value.__class__)
+        return encoder(value)
 
     @staticmethod
-    def __encode_iterable(iterable_value: Iterable) -> Iterable:
+    def _get_encoder(value_class: type) -> Callable[[Any], Any]:
+        """
+        To get the function that converts values of a class to JSON values
+        NOTE: the function is resolved once per class
+
+        Parameters:
+        -----------
+        value_class: type
+            Class of values to encode
+
+        Returns:
+        --------
+        return: Callable[[Any], Any]
+            Function that converts a value to its JSON value
+        """
+        encoder = MyJson._ENCODERS.get(value_class)
+        if encoder is None:
+            class_name = value_class.__name__
+            if class_name in MyJson._DONT_SERIALIZES:
+                encoder = MyJson._encode_none
+            elif class_name in MyJson._get_serializables():
+                encoder = MyJson._encode_object
+            elif issubclass(value_class, Iterable) and (not issubclass(value_class, (str, bytes, bytearray))):
+                encoder = MyJson._encode_iterable
+            else:
+                encoder = MyJson._encode_value
+            MyJson._ENCODERS[value_class] = encoder
+        return encoder
+
+    @staticmethod
+    def _get_serializables() -> set:
+        if MyJson._SERIALIZABLES is None:
+            MyJson._SERIALIZABLES = set(_MF._get_imports().keys())
+        return MyJson._SERIALIZABLES
+
+    @staticmethod
+    def _encode_none(value: Any) -> None:
+        return None
+
+    @staticmethod
+    def _encode_value(value: Any) -> Any:
+        return value
+
+    @staticmethod
+    def _encode_object(value: 'MyJson') -> dict:
+        return value._json_encode_object()
+
+    @staticmethod
+    def _encode_iterable(iterable_value: Iterable) -> Iterable:
         iter_type = type(iterable_value)
         iterable_value = iterable_value.copy() if not isinstance(iterable_value, tuple) else iterable_value
-        key_dict_type = MyJson._KEY_DICT_TYPE
-        key_dict_value = MyJson._KEY_DICT_VALUE
+        root_encoding = MyJson._root_encoding
         if iter_type == dict:
-            value_encoded = {}
-            value_encoded[key_dict_type] = dict.__name__
+            iter_token = MyJson._TOKEN_ITERABLE
+            value_encoded = {MyJson._KEY_DICT_TYPE: dict.__name__}
             for key, value in iterable_value.items():
-                iter_token = MyJson._TOKEN_ITERABLE
-                json_key = f"{key.__class__.__name__}{iter_token}{key}"
-                value_encoded[json_key] = MyJson.__root_encoding(value)
+                value_encoded[f"{key.__class__.__name__}{iter_token}{key}"] = root_encoding(value)
         elif iter_type == pd.DataFrame:
             value_encoded = {}
-            value_encoded[key_dict_type] = pd.DataFrame.__name__
+            value_encoded[MyJson._KEY_DICT_TYPE] = pd.DataFrame.__name__
             iterable_value_dict = iterable_value.to_dict('records')
-            value_encoded[key_dict_value] = MyJson.__encode_iterable(iterable_value_dict)
+            value_encoded[MyJson._KEY_DICT_VALUE] = MyJson._encode_iterable(iterable_value_dict)
         elif (iter_type == list) or (iter_type == tuple):
-            iter_name = iter_type.__name__
-            value_encoded = [iter_name]
-            for value in iterable_value:
-                value_encoded.append(MyJson.__root_encoding(value))
+            value_encoded = [iter_type.__name__]
+            value_encoded.extend([root_encoding(value) for value in iterable_value])
         elif iter_type == np.ndarray:
-            iter_name = iter_type.__name__
             np_list = iterable_value.tolist()
-            np_list_json = MyJson.__root_encoding(np_list)
-            value_encoded = [iter_name, np_list_json]
+            value_encoded = [iter_type.__name__, root_encoding(np_list)]
         else:
             raise ValueError(f"This iterable type '{iter_type}' is not supported")
         return value_encoded
@@ -105,14 +163,6 @@ class MyJson(ABC):
     def get_class_name_token() -> str:
         return MyJson._TOKEN_CLASS_NAME
 
-    @staticmethod
-    def get_executable() -> str:
-        if MyJson._EXECUTABLE_json_instantiate is None:
-            from config.Config import Config
-            path = Config.get(Config.FILE_EXECUTABLE_MYJSON_JSON_INSTANTIATE)
-            MyJson._EXECUTABLE_json_instantiate = FileManager.read(path)
-        return MyJson._EXECUTABLE_json_instantiate
-
     @staticmethod
     def get_executable_test_json_encode_decode() -> str:
         if MyJson._EXECUTABLE_test_json_encode_decode is None:
@@ -135,7 +185,6 @@ class MyJson(ABC):
         custom_object: object
             Custom class object
         """
-        _class_token = MyJson.get_class_name_token()
         object_dic = _MF.json_decode(json_str)
         if not isinstance(object_dic, dict):
             raise ValueError(f"Type of JSON object must be dict, instead '{type(object_dic)}'")
@@ -144,53 +193,78 @@ class MyJson(ABC):
 
     @staticmethod
     def _root_decoding(value: Any) -> Any:
-        _class_token = MyJson.get_class_name_token()
-        if isinstance(value, dict) and (_class_token in value):
-            decoded_value = MyJson._generate_instance(value)
-        elif isinstance(value, Iterable) and not isinstance(value, (str, bytes, bytearray)):
-            decoded_value = MyJson.__decode_iterable(value)
-        else:
-            decoded_value = value
-        return decoded_value
+        value_type = type(value)
+        if value_type == dict:
+            if MyJson._TOKEN_CLASS_NAME in value:
+                return MyJson._generate_instance(value)
+            return MyJson._decode_dict(value)
+        if value_type == list:
+            return MyJson._decode_list(value)
+        return value
 
     @staticmethod
-    def __decode_iterable(iterable_value: Iterable) -> Iterable:
-        iterable_value_copy = iterable_value.copy()
-        iter_type = type(iterable_value_copy)
-        key_dict_type = MyJson._KEY_DICT_TYPE
-        key_dict_value = MyJson._KEY_DICT_VALUE
-        if iter_type == dict:
+    def _decode_dict(dict_value: dict) -> Any:
+        dict_type = dict_value[MyJson._KEY_DICT_TYPE]
+        if dict_type == dict.__name__:
+            key_dict_type = MyJson._KEY_DICT_TYPE
+            iter_token = MyJson._TOKEN_ITERABLE
+            root_decoding = MyJson._root_decoding
             value_decoded = {}
-            dict_type = iterable_value_copy[key_dict_type]
-            if dict_type == dict.__name__:
-                del iterable_value_copy[key_dict_type]
-                for json_key, value in iterable_value_copy.items():
-                    iter_token = MyJson._TOKEN_ITERABLE
-                    key_type, str_key = json_key.split(iter_token)
-                    key = eval(f"{key_type}(str_key)")
-                    value_decoded[key] = MyJson._root_decoding(value)
-            elif dict_type == pd.DataFrame.__name__:
-                dict_value = MyJson.__decode_iterable(iterable_value_copy[key_dict_value])
-                value_decoded = pd.DataFrame(dict_value)
-            else:
-                raise ValueError(f"This dict type '{dict_type}' is not supported")
-        elif iter_type == list:
-            list_type = iterable_value_copy[0]
-            del iterable_value_copy[0]
-            if (list_type == list.__name__) or (list_type == tuple.__name__):
-                value_decoded = []
-                for value in iterable_value_copy:
-                    value_decoded.append(MyJson._root_decoding(value))
-                value_decoded = eval(f"{list_type}(value_decoded)")
-            elif list_type == np.ndarray.__name__:
-                np_list = MyJson._root_decoding(iterable_value_copy[0])
-                value_decoded = np.array(np_list)
-            else:
-                raise ValueError(f"This list type '{list_type}' is not supported")
+            for json_key, value in dict_value.items():
+                if json_key == key_dict_type:
+                    continue
+                key_type, str_key = json_key.split(iter_token, 1)
+                value_decoded[MyJson._decode_key(key_type, str_key)] = root_decoding(value)
+        elif dict_type == pd.DataFrame.__name__:
+            value_decoded = pd.DataFrame(MyJson._root_decoding(dict_value[MyJson._KEY_DICT_VALUE]))
         else:
-            raise ValueError(f"This iterable type '{iter_type}' is not supported")
+            raise ValueError(f"This dict type '{dict_type}' is not supported")
         return value_decoded
 
+    @staticmethod
+    def _decode_key(key_type: str, str_key: str) -> Any:
+        key_class = MyJson._KEY_TYPES.get(key_type)
+        if key_class is None:
+            key_class = MyJson._get_class(key_type)
+        return key_class(str_key)
+
+    @staticmethod
+    def _decode_list(list_value: list) -> Any:
+        list_type = list_value[0]
+        if (list_type == list.__name__) or (list_type == tuple.__name__):
+            root_decoding = MyJson._root_decoding
+            value_decoded = [root_decoding(value) for value in list_value[1:]]
+            value_decoded = tuple(value_decoded) if list_type == tuple.__name__ else value_decoded
+        elif list_type == np.ndarray.__name__:
+            value_decoded = np.array(MyJson._root_decoding(list_value[1]))
+        else:
+            raise ValueError(f"This list type '{list_type}' is not supported")
+        return value_decoded
+
+    @staticmethod
+    def _get_class(class_name: str) -> type:
+        """
+        To get a class of the project from its name
+        NOTE: classes are imported once
+
+        Parameters:
+        -----------
+        class_name: str
+            Name of the class
+
+        Returns:
+        --------
+        return: type
+            The class
+        """
+        class_ref = MyJson._CLASSES.get(class_name)
+        if class_ref is None:
+            # i.e.: 'from model.tools.Price import Price'
+            module_name = _MF.get_import(class_name).split(' ')[1]
+            class_ref = getattr(importlib.import_module(module_name), class_name)
+            MyJson._CLASSES[class_name] = class_ref
+        return class_ref
+
     @staticmethod
     def _generate_instance(object_dic: dict) -> object:
         """
@@ -207,13 +281,28 @@ class MyJson(ABC):
         _class_token = MyJson.get_class_name_token()
         if _class_token not in object_dic:
             raise KeyError(f"Miss key '{_class_token}' in JSON object")
-        class_name = object_dic[_class_token]
-        import_exec = _MF.get_import(class_name)
-        exec(import_exec)
-        class_ref = eval(class_name)
+        class_ref = MyJson._get_class(object_dic[_class_token])
         instnace = class_ref.json_instantiate(object_dic)
         return instnace
 
+    @staticmethod
+    def _json_set_attributes(instance: object, object_dic: dict) -> None:
+        """
+        To set attributes of a new instance from their JSON value
+
+        Parameters
+        ----------
+        instance: object
+            The new instance
+        object_dic: dict
+            Class name and JSON value of each attribute
+        """
+        _class_token = MyJson._TOKEN_CLASS_NAME
+        root_decoding = MyJson._root_decoding
+        for attr, value in object_dic.items():
+            if attr != _class_token:
+                setattr(instance, attr, root_decoding(value))
+
     @staticmethod
     @abstractmethod
     def json_instantiate(object_dic: dict) -> object:
@@ -238,4 +327,14 @@ class MyJson(ABC):
         for d in [self_dict, other_dict]:
             if id_key in d:
                 del d[id_key]
-        return (type(self) == type(other)) and (self_dict == other_dict)
+        if (type(self) != type(other)) or (self_dict.keys() != other_dict.keys()):
+            return False
+        for attr, value in self_dict.items():
+            other_value = other_dict[attr]
+            if isinstance(value, np.ndarray) or isinstance(other_value, np.ndarray):
+                equal = np.array_equal(value, other_value, equal_nan=True)
+            else:
+                equal = value == other_value
+            if not equal:
+                return False
+        return True
@@ -21,16 +21,18 @@ class Orders(Order, MyJson):
         self.__orders = Map()
         self.__ids_to_indexes = Map()
         self.__sum = None
+        self.__pending_indexes = None
         self.__has_position = None
+        self.__last_completed = None
 
     def add_order(self, odr: Order) -> None:
-        self._reset()
         odrs = self._get_orders()
         ids_to_indexes = self._get_ids_to_indexes()
         idx = len(odrs.get_map())
         odr_id = odr.get_id()
         odrs.put(odr, idx)
         ids_to_indexes.put(idx, odr_id)
+        self.__pending_indexes.append(idx) if self.__pending_indexes is not None else None
 
     def _get_orders(self) -> Map:
         """
@@ -91,10 +93,29 @@ class Orders(Order, MyJson):
         return last
 
     def _set_sum(self) -> None:
-        self.__sum = self._sum_orders(self._get_orders())
+        odrs = self._get_orders()
+        self.__sum = self._sum_orders(odrs)
+        self.__pending_indexes = [idx for idx, odr in odrs.get_map().items() if odr.get_status() != Order.STATUS_COMPLETED]
+
+    def _update_sum(self) -> None:
+        """
+        To add to the sum Order completed since the last sum
+        NOTE: Order still pending are kept to be checked at the next update
+        """
+        odrs = self._get_orders()
+        odrs_sum = self.__sum
+        pending = []
+        for idx in self.__pending_indexes:
+            odr = odrs.get(idx)
+            if odr.get_status() == Order.STATUS_COMPLETED:
+                odrs_sum = self._sum_order(odrs_sum, odr)
+            else:
+                pending.append(idx)
+        self.__sum = odrs_sum
+        self.__pending_indexes = pending
 
     def get_sum(self) -> Map:
-        self._set_sum() if self.__sum is None else None
+        self._set_sum() if (self.__sum is None) or (self.__pending_indexes is None) else self._update_sum()
         return self.__sum
 
     def get_size(self) -> int:
@@ -105,26 +126,36 @@ class Orders(Order, MyJson):
 
     def has_position(self) -> bool:
         """
-        Check if holding a left position\n
-        :return: True if holding else False
+        Check if holding a left position
+        NOTE: only Order more recent than the last Order completed are checked
+
+        Returns:
+        --------
+        return: bool
+            True if holding else False
         """
-        has_pos = self.__has_position
-        if has_pos is None:
-            has_pos = False
-            odrs = self._get_orders()
-            ks = odrs.get_keys()
-            ks.reverse()
-            for k in ks:
-                odr = odrs.get(k)
-                if odr.get_status() == Order.STATUS_COMPLETED:
-                    has_pos = odr.get_move() == Order.MOVE_BUY
-                    break
-            self._set_has_position(has_pos)
-        return has_pos
+        odrs = self._get_orders()
+        last_completed = self.__last_completed
+        if (self.__has_position is None) or (last_completed is None):
+            last_completed = -1
+            self._set_has_position(False)
+        for idx in range(self.get_size() - 1, last_completed, -1):
+            odr = odrs.get(idx)
+            if odr.get_status() == Order.STATUS_COMPLETED:
+                self._set_has_position(odr.get_move() == Order.MOVE_BUY)
+                last_completed = idx
+                break
+        self.__last_completed = last_completed if last_completed >= 0 else None
+        return self.__has_position
 
     def _reset(self) -> None:
+        """
+        To invalidate the sum and position so they are computed again from all Order
+        """
         self.__sum = None
+        self.__pending_indexes = None
         self.__has_position = None
+        self.__last_completed = None
 
     def update(self, bkr: Broker, wallet: Wallet = None) -> list:
         """
@@ -142,7 +173,6 @@ class Orders(Order, MyJson):
         return: list
             The id of all Order updated from SUBMITTED|PROCESSING to EXECUTED
         """
-        self._reset()
         odrs = self._get_orders()
         # Get pending
         pending = [odr.get_id() for idx, odr in odrs.get_map().items()
@@ -333,37 +363,62 @@ class Orders(Order, MyJson):
             raise ValueError("The collection of Order can't be empty")
         ks = odrs.get_keys()
         pr = odrs.get(ks[0]).get_pair()
-        r_asset = pr.get_right()
-        l_asset = pr.get_left()
-        r_symbol = r_asset.get_symbol()
-        l_symbol = l_asset.get_symbol()
-        lspot = Price(0, l_symbol)
-        rspot = Price(0, r_symbol)
-        fees = Price(0, r_symbol)
+        r_symbol = pr.get_right().get_symbol()
+        l_symbol = pr.get_left().get_symbol()
+        odrs_sum = Map({
+            Map.left: Price(0, l_symbol),
+            Map.right: Price(0, r_symbol),
+            Map.fee: Price(0, r_symbol)
+        })
         for _, odr in odrs.get_map().items():
             if pr != odr.get_pair():
                 raise Exception(f"All Order must have the same pair of asset: {pr}!={odr.get_pair()}")
             if odr.get_status() == Order.STATUS_COMPLETED:
-                move = odr.get_move()
-                exec_qty = odr.get_executed_quantity()
-                exec_amount = odr.get_executed_amount()
-                l_fee = odr.get_fee(l_asset)
-                r_fee = odr.get_fee(r_asset)
-                fees += r_fee
-                if move == Order.MOVE_BUY:
-                    lspot += exec_qty - l_fee
-                    rspot -= exec_amount
-                elif move == Order.MOVE_SELL:
-                    lspot -= exec_qty
-                    rspot += exec_amount - r_fee
-                else:
-                    raise Exception("Unknown Order move")
-        odrs_sum = Map({
+                odrs_sum = Orders._sum_order(odrs_sum, odr)
+        return odrs_sum
+
+    @staticmethod
+    def _sum_order(odrs_sum: Map, odr: Order) -> Map:
+        """
+        To add an Order executed to a sum of Order
+
+        Parameters:
+        -----------
+        odrs_sum: Map
+            Sum of Order (same format than Orders._sum_orders())
+        odr: Order
+            The Order executed to add
+
+        Returns:
+        --------
+        return: Map
+            A new sum of Order including the given Order
+        """
+        lspot = odrs_sum.get(Map.left)
+        rspot = odrs_sum.get(Map.right)
+        l_asset = lspot.get_asset()
+        r_asset = rspot.get_asset()
+        if Pair(l_asset, r_asset) != odr.get_pair():
+            raise Exception(f"All Order must have the same pair of asset: {Pair(l_asset, r_asset)}!={odr.get_pair()}")
+        move = odr.get_move()
+        exec_qty = odr.get_executed_quantity()
+        exec_amount = odr.get_executed_amount()
+        l_fee = odr.get_fee(l_asset)
+        r_fee = odr.get_fee(r_asset)
+        fees = odrs_sum.get(Map.fee) + r_fee
+        if move == Order.MOVE_BUY:
+            lspot += exec_qty - l_fee
+            rspot -= exec_amount
+        elif move == Order.MOVE_SELL:
+            lspot -= exec_qty
+            rspot += exec_amount - r_fee
+        else:
+            raise Exception("Unknown Order move")
+        return Map({
             Map.left: lspot,
             Map.right: rspot,
             Map.fee: fees
         })
-        return odrs_sum
 
     @staticmethod
     def insert_order(action: str, odr: Order) -> None:
@@ -384,9 +439,8 @@ class Orders(Order, MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Orders()
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # Don't use classes bellow
@@ -4,6 +4,11 @@ from model.tools.MyJson import MyJson
 
 
 class Pair(MyJson):
+    """
+    To represent a couple of Asset (i.e.: 'btc/usdt')
+    NOTE: Pair are immutable and interned: Pair('BTC/USDT') is Pair('btc', 'usdt')
+    """
+    __slots__ = ('__left', '__right', '__str', '__hash')
     SEPARATOR = "/"
     UNDERSCORE = '_'
     LEFT = '$left'
@@ -11,33 +16,50 @@ class Pair(MyJson):
     FORMAT_MERGED = LEFT + RIGHT
     FORMAT_UNDERSCORE = LEFT + UNDERSCORE + RIGHT
     FORMAT_SLASH = LEFT + SEPARATOR + RIGHT
+    _PAIRS = {}
 
-    def __init__(self, *agrs):
+    def __new__(cls, *agrs) -> 'Pair':
+        if cls is not Pair:
+            return super().__new__(cls)
         nb = len(agrs)
         if nb == 1:
-            self.__constructor1(agrs[0])
+            pair = Pair._PAIRS.get(agrs[0])
+            if pair is None:
+                pair = Pair._PAIRS[agrs[0]] = Pair.__constructor1(agrs[0])
         elif nb == 2:
-            self.__constructor2(agrs[0], agrs[1])
+            pair = Pair.__constructor2(agrs[0], agrs[1])
         else:
             raise ValueError(f"This number of param '{nb}' is not supported")
+        return pair
 
-    def __constructor1(self, prsbl: str):
+    @staticmethod
+    def __constructor1(prsbl: str) -> 'Pair':
         """
         Constructor\n
         :param prsbl: couple of Asset symbol, i.e.: "BTC/USDT"
         """
-        prs = prsbl.split(self.SEPARATOR)
-        self.__left = Asset(prs[0])
-        self.__right = Asset(prs[1])
+        prs = prsbl.split(Pair.SEPARATOR)
+        return Pair.__constructor2(prs[0], prs[1])
 
-    def __constructor2(self, left: Union[str, Asset], right: Union[str, Asset]):
+    @staticmethod
+    def __constructor2(left: Union[str, Asset], right: Union[str, Asset]) -> 'Pair':
         """
         Constructor
         :param lsbl: symbol of the left Asset
         :param rsbl: symbol of the right Asset
         """
-        self.__left = left if isinstance(left, Asset) else Asset(left)
-        self.__right = right if isinstance(right, Asset) else Asset(right)
+        left = left if isinstance(left, Asset) else Asset(left)
+        right = right if isinstance(right, Asset) else Asset(right)
+        pair_str = f'{left.get_symbol()}{Pair.SEPARATOR}{right.get_symbol()}'
+        pair = Pair._PAIRS.get(pair_str)
+        if pair is None:
+            pair = MyJson.__new__(Pair)
+            pair.__left = left
+            pair.__right = right
+            pair.__str = pair_str
+            pair.__hash = hash(pair_str)
+            pair = Pair._PAIRS.setdefault(pair_str, pair)
+        return pair
 
     def get_left(self) -> Asset:
         return self.__left
@@ -46,7 +68,7 @@ class Pair(MyJson):
         return self.__right
 
     def get_merged_symbols(self) -> str:
-        return self.get_left().get_symbol() + self.get_right().get_symbol()
+        return self.__left.get_symbol() + self.__right.get_symbol()
     
     def format(self, format: str = FORMAT_MERGED) -> str:
         """
@@ -73,22 +95,32 @@ class Pair(MyJson):
     def _get_separator() -> str:
         return Pair.SEPARATOR
 
+    def _json_encode_to_dict(self) -> dict:
+        return {'_Pair__left': self.__left, '_Pair__right': self.__right}
+
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
-        instance = Pair('@json/@json')
-        exec(MyJson.get_executable())
-        return instance
+        left = MyJson._root_decoding(object_dic['_Pair__left'])
+        right = MyJson._root_decoding(object_dic['_Pair__right'])
+        return Pair(left, right)
+
+    def __reduce__(self) -> tuple:
+        return (Pair, (self.__left, self.__right))
 
     def __eq__(self, other):
-        return self.get_left() == other.get_left() if isinstance(other, Pair) else other\
-            and self.get_right() == other.get_right() if isinstance(other, Pair) else other
+        if self is other:
+            return True
+        if isinstance(other, Pair):
+            return self.__str == other.__str
+        if isinstance(other, str):
+            return self.__str == other
+        return NotImplemented
 
     def __str__(self) -> str:
-        return self.format(self.FORMAT_SLASH)
+        return self.__str
 
     def __repr__(self) -> str:
-        return self.__str__()
+        return self.__str
 
     def __hash__(self) -> int:
-        return self.__str__().__hash__()
+        return self.__hash
@@ -1,7 +1,8 @@
-from typing import List, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from config.Config import Config
 from model.structure.Broker import Broker
 from model.structure.database.ModelFeature import ModelFeature as _MF
@@ -24,6 +25,8 @@ class Predictor(MyJson):
     _FILE_LEARN_JSON = f'{DeepLearning.__name__}.json'
     _FILE_LEARN_MODEL = 'keras_model.xyz'
     _FILE_LEARN_CONFIG = 'config.csv'
+    _FILE_LEARN_CHECKPOINT = 'checkpoint.csv'
+    _FILE_ADD_CHECKPOINT = 'checkpoint_add.csv'
     _PATH_FILE_OCCUPATION_RATE = '$class/learns/print/occupation_rate/$date_occupation_rate.csv'
     _LEARN_PERIODS = [
         60 * 60
@@ -36,6 +39,8 @@ class Predictor(MyJson):
     CLOSE = Map.close
     HIGH = Map.high
     LOW = Map.low
+    # Column of each price type in market histories
+    _HISTORY_COLUMNS = {HIGH: '2', LOW: '3', CLOSE: '4'}
     _HIGH_OCCUP_N_MEAN = 1000
     _HIGH_OCCUP_N_SCORE = 3
 
@@ -280,7 +285,7 @@ class Predictor(MyJson):
         bkr.close()
         # Learn
         print(_MF.prefix() + _back_cyan + f"Start learning '{len(can_add)}' pairs..." + _normal) if Predictor._DEBUG else None
-        [Predictor._learn(pair) for pair in can_add]
+        Predictor.update_learns(pairs=can_add, checkpoint_file=Predictor._FILE_ADD_CHECKPOINT) if len(can_add) > 0 else None
         print(_MF.prefix() + _back_cyan + f"End to learn pairs histories" + _normal) if Predictor._DEBUG else None
 
     @staticmethod
@@ -317,9 +322,13 @@ class Predictor(MyJson):
             i += 1
     
     @staticmethod
-    def update_learns(pairs: List[Pair] = None, periods: List[int] = None) -> None:
+    def update_learns(pairs: List[Pair] = None, periods: List[int] = None, n_process: int = None, n_thread: int = None, n_inter_thread: int = 1, resume: bool = False, checkpoint_file: str = None) -> List[Map]:
         """
         To generate learn model on market hisories for given period
+        NOTE: models of a pair and period are trained in the same worker process (see
+              LearnScheduler) so its history is loaded once
+        NOTE: a restarted update must set resume=True to skip models already trained, else
+              the checkpoint is removed and all models are trained again
 
         Parameters:
         ----------
@@ -327,19 +336,36 @@ class Predictor(MyJson):
             List of period interval in second
         pairs: List[Pair] = None
             List of Pair
+        n_process: int = None
+            Maximum number of worker processes (default to the number of CPU)
+        n_thread: int = None
+            Number of threads of TensorFlow's intra-op pool in each worker
+            (default to the number of CPU shared between workers)
+        n_inter_thread: int = 1
+            Number of threads of TensorFlow's inter-op pool in each worker
+        resume: bool = False
+            Set True to resume an interrupted update else False to train all models
+        checkpoint_file: str = None
+            Name of the checkpoint file in the learn directory (default to Predictor._FILE_LEARN_CHECKPOINT)
+
+        Returns:
+        --------
+        return: List[Map]
+            Result of each pair and period trained (see LearnScheduler.run() and Predictor._learn())
         """
+        from model.tools.LearnScheduler import LearnScheduler
         periods = periods if periods is not None else Predictor.get_learn_periods()
         pairs = pairs if pairs is not None else Predictor.market_history_pairs()
-        starttime = _MF.get_timestamp()
-        n_turn = len(pairs)
-        i = 0
+        task_params = []
+        names = []
         for pair in pairs:
-            turn = i + 1
-            print(_MF.loop_progression(starttime, turn, n_turn, pair.__str__().upper())) if Predictor._DEBUG else None
             for period in periods:
                 if Predictor.exist_market_history(pair, period):
-                    Predictor._learn(pair, [period])
-            i += 1
+                    task_params.append({Map.pair: pair, Map.period: period})
+                    names.append(f"{pair.__str__()}_{period}")
+        checkpoint_file = checkpoint_file if checkpoint_file is not None else Predictor._FILE_LEARN_CHECKPOINT
+        checkpoint_path = Predictor.learn_dir(stock_path=True) + checkpoint_file
+        return LearnScheduler.run(Predictor._learn, task_params, names, n_process=n_process, n_thread=n_thread, n_inter_thread=n_inter_thread, checkpoint_path=checkpoint_path, resume=resume, output=Predictor._DEBUG)
 
     @staticmethod
     def _maintain_market_history(bkr: Broker, pair: Pair, periods: List[int] = None) -> None:
@@ -378,37 +404,35 @@ class Predictor(MyJson):
                     pair, period, marketprices, overwrite)
 
     @staticmethod
-    def _learn(pair: Pair, periods: List[int] = None) -> None:
+    def _learn(pair: Pair, period: int) -> Dict[str, float]:
         """
-        To create and store learn model for existing market history
+        To create and store the learn model of each price type for an existing market history
+        NOTE: the history is loaded once for all price types
 
         Parameters
         ----------
         pair: Pair
             Pair to learn of
-        periods: List[int] = None
-            List of period interval in second
+        period: int
+            Period interval in second
+
+        Returns:
+        --------
+        return: Dict[str, float]
+            The coefficient of determination of each price type's model
+            dict[Predictor.{HIGH|LOW|CLOSE}]: {float}
         """
-        _cyan = '\033[36m' + '\033[30m'
-        _normal = '\033[0m'
         n_feature = Predictor.get_n_feature()
-        periods = periods if periods is not None else Predictor.get_learn_periods()
-        print(_MF.prefix() + _cyan + f"Learn pair '{pair.__str__().upper()}'" + _normal) if Predictor._DEBUG else None
-        for period in periods:
-            print(_MF.prefix() + _cyan + f"Learn for period '{int(period/60)}min'" + _normal) if Predictor._DEBUG else None
-            marketprices = Predictor.load_market_history(pair, period)
-            # Get datas
-            high = marketprices.filter(['2']).values
-            low = marketprices.filter(['3']).values
-            close = marketprices.filter(['4']).values
-            # Create model
-            models = {
-                Predictor.HIGH: Predictor.model(high, n_feature),
-                Predictor.LOW: Predictor.model(low, n_feature),
-                Predictor.CLOSE: Predictor.model(close, n_feature)
-            }
-            # Save
-            [Predictor._print_model(pair, period, price_type, model) for price_type, model in models.items()]
+        price_types = [Predictor.HIGH, Predictor.LOW, Predictor.CLOSE]
+        columns = [Predictor._HISTORY_COLUMNS[price_type] for price_type in price_types]
+        marketprices = Predictor.load_market_history(pair, period)
+        xs, ys = Predictor.generate_datasets(marketprices.filter(columns).values, n_feature)
+        scores = {}
+        for i, price_type in enumerate(price_types):
+            model = DeepLearning(ys[:, i:i+1], xs[:, :, i], train=True)
+            Predictor._print_model(pair, period, price_type, model)
+            scores[price_type] = model.get_coef_determination()
+        return scores
 
     @staticmethod
     def model(prices: np.ndarray, n_feature: int) -> DeepLearning:
@@ -421,6 +445,7 @@ class Predictor(MyJson):
     def generate_dataset(prices: Union[list[float], np.ndarray], n_feature: int) -> Tuple[np.ndarray, np.ndarray]:
         """
         To generate Xs and Ys with prices
+        NOTE: Xs is a read-only view on prices (see Predictor.generate_datasets())
 
         Pamaters:
         ---------
@@ -432,20 +457,86 @@ class Predictor(MyJson):
         Returns:
         --------
         xs: np.ndarray
-            [0] Xs of shape=(n_samples-1, n_feature)
+            [0] Xs of shape=(n_samples-n_feature, n_feature)
         ys: np.ndarray
-            [1] Ys of shape=(n_samples-1, 1)
+            [1] Ys of shape=(n_samples-n_feature, 1)
         """
         if isinstance(prices, list):
             prices = np.array(prices).reshape((len(prices), 1))
         Predictor._check_shape(prices, (prices.shape[0],1))
-        n_row = prices.shape[0]
-        xs = []
-        ys = []
-        for i in range(n_feature, n_row):
-            xs.append(prices[i-n_feature:i, 0])
-            ys.append(prices[i, 0])
-        return np.array(xs), np.array(ys).reshape((len(ys), 1))
+        xs, ys = Predictor.generate_datasets(prices, n_feature)
+        return xs[:, :, 0], ys
+
+    @staticmethod
+    def generate_datasets(values: np.ndarray, n_feature: int, features: List[int] = None, targets: List[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        To generate Xs and Ys of several columns at once
+        NOTE: Xs are sliding windows over values, they are a read-only view (no copy)
+              except when columns are selected with features
+        NOTE: Xs[i] = values[i:i+n_feature, features] => Ys[i] = values[i+n_feature, targets]
+
+        Pamaters:
+        ---------
+        values: np.ndarray
+            Values of shape=(n_samples, n_column) ordered from the older to the newest
+        n_feature: int
+            The number of period to place in each window of Xs
+        features: List[int] = None
+            Index of columns to place in Xs, None to use all columns
+        targets: List[int] = None
+            Index of columns to place in Ys, None to use the same columns than Xs
+
+        Returns:
+        --------
+        xs: np.ndarray
+            [0] Xs of shape=(n_samples-n_feature, n_feature, n_features)
+        ys: np.ndarray
+            [1] Ys of shape=(n_samples-n_feature, n_targets)
+        """
+        if n_feature < 1:
+            raise ValueError(f"The number of feature must be at least 1, instead '{n_feature}'")
+        if values.ndim != 2:
+            raise ValueError(f"Values must have 2 dimensions (n_samples, n_column), instead shape '{values.shape}'")
+        x_values = values if features is None else values[:, features]
+        y_values = x_values if targets is None else values[:, targets]
+        n_sample = values.shape[0] - n_feature
+        if n_sample <= 0:
+            xs = np.empty((0, n_feature, x_values.shape[1]), dtype=x_values.dtype)
+        else:
+            xs = sliding_window_view(x_values, n_feature, axis=0)[:n_sample].swapaxes(1, 2)
+        ys = y_values[n_feature:]
+        return xs, ys
+
+    @staticmethod
+    def iter_datasets(chunks: Iterable[np.ndarray], n_feature: int, features: List[int] = None, targets: List[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        To generate Xs and Ys chunk by chunk for values that don't fit in memory
+        NOTE: the last n_feature rows of a chunk are kept to build windows that overlap
+              the next chunk so Xs and Ys are the same as if values were in one array
+
+        Pamaters:
+        ---------
+        chunks: Iterable[np.ndarray]
+            Values splitted in chunks of shape=(n_chunk_samples, n_column)
+        n_feature: int
+            The number of period to place in each window of Xs
+        features: List[int] = None
+            Index of columns to place in Xs, None to use all columns
+        targets: List[int] = None
+            Index of columns to place in Ys, None to use the same columns than Xs
+
+        Returns:
+        --------
+        return: Iterator[Tuple[np.ndarray, np.ndarray]]
+            Xs and Ys of each chunk (see Predictor.generate_datasets())
+        """
+        tail = None
+        for chunk in chunks:
+            values = chunk if tail is None else np.concatenate((tail, chunk))
+            xs, ys = Predictor.generate_datasets(values, n_feature, features=features, targets=targets)
+            if xs.shape[0] > 0:
+                yield xs, ys
+            tail = values[-n_feature:]
 
     @staticmethod
     def _check_shape(values: np.ndarray, shape: tuple) -> None:
@@ -726,9 +817,7 @@ class Predictor(MyJson):
         while not end:
             marketprice = Predictor._market_price(
                 bkr, pair, period, n_period=max_n_period, endtime=endtime_copy)
-            market = list(marketprice.get_market())
-            market.reverse()
-            martket_np = np.array(market, dtype=np.float64)
+            martket_np = marketprice.get_history()
             marketprices = martket_np if marketprices is None else np.vstack(
                 (martket_np, marketprices))
             endtime_copy -= period * max_n_period
@@ -747,11 +836,30 @@ class Predictor(MyJson):
         return marketprices_pd
 
     @staticmethod
-    def load_market_history(pair: Pair, period: int) -> pd.DataFrame:
+    def load_market_history(pair: Pair, period: int, chunk_size: int = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        To load a market history
+
+        Parameters:
+        -----------
+        pair: Pair
+            Pair of the market history
+        period: int
+            Period interval in second
+        chunk_size: int = None
+            Number of rows to load at once, None to load the whole history
+
+        Returns:
+        --------
+        return: Union[pd.DataFrame, Iterator[pd.DataFrame]]
+            The market history or an iterator over chunks of the market history if chunk_size is set
+        """
         def sec_to_milli(time: int) -> int:
             return int(time * 1000)
         file_path = Predictor.history_file_path(pair, period)
         project_dir = FileManager.get_project_directory()
+        if chunk_size is not None:
+            return (_MF.df_apply(chunk, ['0'], sec_to_milli) for chunk in pd.read_csv(project_dir + file_path, chunksize=chunk_size))
         market_hist = pd.read_csv(project_dir + file_path)
         market_hist = _MF.df_apply(market_hist, ['0'], sec_to_milli)
         return market_hist
@@ -915,9 +1023,8 @@ class Predictor(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Predictor(Pair('@json/@json'), -1)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
@@ -5,14 +5,39 @@ from model.tools.MyJson import MyJson
 
 
 class Price(MyJson):
+    """
+    To represent an amount of an Asset
+    NOTE: Price are immutable, their value is rounded to Price._N_DECIMAL decimals
+    """
+    __slots__ = ('__value', '__asset')
     _N_DECIMAL = 8
 
     def __init__(self, value: Union[int, float], asset: Union[str, Asset], n_decimal: int = None, cut_exceed: bool = False) -> None:
-        self.__value = None
-        self.__asset = None
         self._set_asset(asset)
         self._set_value(value, cut_exceed=cut_exceed) if n_decimal is None else self._set_value(value, n_decimal=n_decimal, cut_exceed=cut_exceed)
 
+    @staticmethod
+    def _new(value: float, asset: Asset) -> 'Price':
+        """
+        To create a Price without to check and convert its params
+
+        Parameters:
+        -----------
+        value: float
+            Value of the Price
+        asset: Asset
+            Asset of the Price
+
+        Returns:
+        --------
+        return: Price
+            The new Price
+        """
+        price = MyJson.__new__(Price)
+        price.__value = round(value, Price._N_DECIMAL)
+        price.__asset = asset
+        return price
+
     def _set_value(self, value: float, n_decimal: int = _N_DECIMAL, cut_exceed: bool = True) -> None:
         rounded_value = round(float(value), n_decimal) if not cut_exceed else int(float(value) * 10**(n_decimal))/10**(n_decimal)
         self.__value = rounded_value
@@ -21,74 +46,83 @@ class Price(MyJson):
         return self.__value
     
     def _set_asset(self, asset: Union[str, Asset]) -> None:
-        if isinstance(asset, str):
-            self.__asset = Asset(asset)
-        elif isinstance(asset, Asset):
+        if isinstance(asset, Asset):
             self.__asset = asset
+        elif isinstance(asset, str):
+            self.__asset = Asset(asset)
         else:
             raise ValueError(f"The asset '{asset}' must type 'str' or 'Asset', instead '{type(asset)}'")
 
     def get_asset(self) -> Asset:
         return self.__asset
 
+    def _json_encode_to_dict(self) -> dict:
+        return {'_Price__value': self.__value, '_Price__asset': self.__asset}
+
     @staticmethod
     def sum(prices: List['Price']) -> 'Price':
         """
         To sum list of prices\n
+        NOTE: values are added without intermediate rounding then the sum is rounded
         :param prices: List of Price
         :return: Price sum or None if list of Price is empty
         """
-        price_sum = None
-        if len(prices) > 0:
-            price_sum = prices[0]
-            for i in range(1, len(prices)):
-                price = prices[i]
-                price_sum += price
-        return price_sum
+        if len(prices) == 0:
+            return None
+        asset = prices[0].__asset
+        value_sum = 0
+        for price in prices:
+            if not isinstance(price, Price):
+                raise ValueError(f"Price can only be add with an other Price, instead: '{type(price)}'.")
+            if (price.__asset is not asset) and (price.__asset != asset):
+                raise ValueError(f"Price must have the same symbol to be add, "
+                                 f"instead: '{asset}' != '{price.__asset}'")
+            value_sum += price.__value
+        return Price._new(value_sum, asset)
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
-        instance = Price(0, '@json')
-        exec(MyJson.get_executable())
-        return instance
+        value = object_dic['_Price__value']
+        asset = MyJson._root_decoding(object_dic['_Price__asset'])
+        return Price._new(value, asset)
 
     def __add__(self, other) -> 'Price':
         if not isinstance(other, Price):
             raise ValueError(f"Price can only be add with an other Price, instead: '{type(other)}'.")
-        if self.get_asset() != other.get_asset():
+        if (self.__asset is not other.__asset) and (self.__asset != other.__asset):
             raise ValueError(f"Price must have the same symbol to be add, "
                              f"instead: '{self.get_asset()}' != '{other.get_asset()}'")
-        new_val = self.get_value() + other.get_value()
-        return Price(new_val, self.get_asset().get_symbol())
+        return Price._new(self.__value + other.__value, self.__asset)
 
     def __sub__(self, other) -> 'Price':
         if not isinstance(other, Price):
             raise ValueError(f"Price can only be subtract with an other Price, instead: '{type(other)}'.")
-        if self.get_asset() != other.get_asset():
+        if (self.__asset is not other.__asset) and (self.__asset != other.__asset):
             raise ValueError(f"Price must have the same symbol to be subtract, "
                              f"instead: '{self.get_asset()}' != '{other.get_asset()}'")
-        new_val = self.get_value() - other.get_value()
-        return Price(new_val, self.get_asset().get_symbol())
+        return Price._new(self.__value - other.__value, self.__asset)
 
     def __mul__(self, other: Union['Price', int, float]) -> Union[int, float]:
-        return self.get_value() * other.get_value() if isinstance(other, Price) else self.get_value() * other
+        return self.__value * other.__value if isinstance(other, Price) else self.__value * other
 
     def __rmul__(self, other: Union[int, float]) -> Union[int, float]:
         return self * other
 
     def __truediv__(self, other: Union['Price', int, float]) -> Union[int, float]:
-        return self.get_value() / other.get_value() if isinstance(other, Price) else self.get_value() / other
+        return self.__value / other.__value if isinstance(other, Price) else self.__value / other
 
     def __rtruediv__(self, other: Union['Price', int, float]) -> Union[int, float]:
-        return other.get_value() / self.get_value() if isinstance(other, Price) else other / self.get_value()
+        return other.__value / self.__value if isinstance(other, Price) else other / self.__value
 
     def __neg__(self) -> 'Price':
-        return Price(-self.get_value(), self.get_asset().get_symbol())
+        return Price._new(-self.__value, self.__asset)
 
     def __eq__(self, other) -> bool:
-        return self.get_value() == other.get_value() and \
-               self.get_asset() == other.get_asset()
+        return self.__value == other.get_value() and \
+               ((self.__asset is other.get_asset()) or (self.__asset == other.get_asset()))
+
+    def __hash__(self) -> int:
+        return hash((self.__value, self.__asset))
 
     def __str__(self) -> str:
         return f'{self.get_asset()} {self.get_value()}'.upper()
@@ -0,0 +1,191 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List
+
+from model.tools.Map import Map
+from model.tools.TokenBucket import TokenBucket
+
+
+class RateScheduler:
+    """
+    To schedule requests that share rate limits
+
+    Each limit is a TokenBucket and each request asks for a weight in some of them.
+    Waiting requests are served by priority (the lowest value first) then in their
+    order of arrival, so a request with a higher priority passes before requests
+    already waiting. Only the next request to serve waits for tokens, others wait
+    on a condition till it's their turn.
+    """
+
+    def __init__(self, name: str = None) -> None:
+        self.__name = name
+        self.__buckets = {}
+        self.__condition = threading.Condition()
+        self.__waiters = []
+        self.__counter = itertools.count()
+        self.__stats = {}
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def add_bucket(self, name: str, bucket: TokenBucket) -> None:
+        """
+        To add a limit to respect
+
+        Parameters:
+        -----------
+        name: str
+            Name of the limit
+        bucket: TokenBucket
+            The limit
+        """
+        with self.__condition:
+            if name in self.__buckets:
+                raise ValueError(f"This bucket '{name}' already exist")
+            self.__buckets[name] = bucket
+
+    def get_bucket(self, name: str) -> TokenBucket:
+        bucket = self.__buckets.get(name)
+        if bucket is None:
+            raise ValueError(f"This bucket '{name}' don't exist")
+        return bucket
+
+    def get_bucket_names(self) -> List[str]:
+        return list(self.__buckets.keys())
+
+    def _wait_time(self, weights: Dict[str, float]) -> float:
+        return max([self.get_bucket(name).wait_time(weight) for name, weight in weights.items()], default=0)
+
+    def wait_time(self, weights: Dict[str, float]) -> float:
+        """
+        To get the time to wait till weights can be consumed (ignoring waiting requests)
+
+        Parameters:
+        -----------
+        weights: Dict[str, float]
+            Weight to consume in each bucket
+
+        Returns:
+        --------
+        return: float
+            Time to wait (in second)
+        """
+        with self.__condition:
+            return self._wait_time(weights)
+
+    def acquire(self, weights: Dict[str, float], priority: int = 0, request_class: str = None, timeout: float = None) -> float:
+        """
+        To wait till weights can be consumed then consume them
+
+        Parameters:
+        -----------
+        weights: Dict[str, float]
+            Weight to consume in each bucket
+        priority: int = 0
+            Priority of the request, the lowest value is served first
+        request_class: str = None
+            Class of the request to group its statistics
+        timeout: float = None
+            Maximum time to wait (in second)
+
+        Raises:
+        -------
+        raise: TimeoutError
+            If weights can't be consumed before the timeout
+
+        Returns:
+        --------
+        return: float
+            Time waited (in second)
+        """
+        [self.get_bucket(name) for name in weights]
+        start = time.monotonic()
+        deadline = (start + timeout) if timeout is not None else None
+        with self.__condition:
+            entry = (priority, next(self.__counter))
+            heapq.heappush(self.__waiters, entry)
+            stats = self._get_class_stats(request_class)
+            stats[Map.size] += 1
+            try:
+                while True:
+                    remaining = (deadline - time.monotonic()) if deadline is not None else None
+                    if self.__waiters[0] == entry:
+                        wait_time = self._wait_time(weights)
+                        if wait_time <= 0:
+                            [self.get_bucket(name).consume(weight) for name, weight in weights.items()]
+                            break
+                        if (remaining is not None) and (remaining < wait_time):
+                            raise TimeoutError(f"Can't consume weights '{weights}' before '{timeout}'sec.")
+                        self.__condition.wait(wait_time)
+                    else:
+                        if (remaining is not None) and (remaining <= 0):
+                            raise TimeoutError(f"Can't consume weights '{weights}' before '{timeout}'sec.")
+                        self.__condition.wait(remaining)
+            finally:
+                self.__waiters.remove(entry)
+                heapq.heapify(self.__waiters)
+                stats[Map.size] -= 1
+                self.__condition.notify_all()
+            waited = time.monotonic() - start
+            stats[Map.number] += 1
+            stats[Map.time] += waited
+            stats[Map.maximum] = max(stats[Map.maximum], waited)
+        return waited
+
+    def consume(self, weights: Dict[str, float]) -> None:
+        """
+        To consume weights without waiting (i.e.: for a request sent again)
+
+        Parameters:
+        -----------
+        weights: Dict[str, float]
+            Weight to consume in each bucket
+        """
+        with self.__condition:
+            [self.get_bucket(name).consume(weight) for name, weight in weights.items()]
+
+    def sync(self, name: str, used: float) -> None:
+        """
+        To synchronize a bucket with the weight used on the remote side
+
+        Parameters:
+        -----------
+        name: str
+            Name of the bucket
+        used: float
+            Weight used in the remote's current interval
+        """
+        with self.__condition:
+            self.get_bucket(name).sync(used)
+            self.__condition.notify_all()
+
+    def _get_class_stats(self, request_class: str) -> dict:
+        stats = self.__stats.get(request_class)
+        if stats is None:
+            stats = self.__stats[request_class] = {Map.size: 0, Map.number: 0, Map.time: 0, Map.maximum: 0}
+        return stats
+
+    def get_stats(self) -> Map:
+        """
+        To get statistics of each class of request
+
+        Returns:
+        --------
+        return: Map
+            Map[request_class][Map.size]:       {int}   # Number of requests waiting
+            Map[request_class][Map.number]:     {int}   # Number of requests served
+            Map[request_class][Map.mean]:       {float} # Mean time waited by requests served (in second)
+            Map[request_class][Map.maximum]:    {float} # Maximum time waited by a request (in second)
+        """
+        with self.__condition:
+            return Map({
+                request_class: {
+                    Map.size: stats[Map.size],
+                    Map.number: stats[Map.number],
+                    Map.mean: (stats[Map.time] / stats[Map.number]) if stats[Map.number] > 0 else 0,
+                    Map.maximum: stats[Map.maximum]
+                }
+                for request_class, stats in self.__stats.items()
+            })
@@ -0,0 +1,145 @@
+import threading
+from typing import Any, Tuple
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    To keep the newest rows of a 2D array in a fixed capacity
+
+    Each row is written twice in a storage of twice the capacity, so rows ordered
+    from the older to the newest are always contiguous and can be read as a view
+    without copy. Appending a row and replacing the newest row are done in place.
+    """
+
+    def __init__(self, rows: np.ndarray, capacity: int = None):
+        """
+        Constructor
+
+        Parameters:
+        -----------
+        rows: np.ndarray
+            Initial rows ordered from the older (index=0) to the newest (index=-1)
+        capacity: int = None
+            Maximum number of rows kept (default to the number of initial rows)
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        if rows.ndim != 2:
+            raise ValueError(f"Rows must have 2 dimensions, instead '{rows.ndim}'")
+        capacity = rows.shape[0] if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least 1, instead '{capacity}'")
+        rows = rows[-capacity:]
+        n_row = rows.shape[0]
+        self.__capacity = capacity
+        self.__storage = np.zeros((2 * capacity, rows.shape[1]), dtype=np.float64)
+        self.__storage[:n_row] = rows
+        self.__storage[capacity:capacity+n_row] = rows
+        self.__start = 0
+        self.__size = n_row
+        self.__lock = threading.Lock()
+
+    def get_capacity(self) -> int:
+        return self.__capacity
+
+    def get_lock(self) -> threading.Lock:
+        return self.__lock
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.__size, self.__storage.shape[1])
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def view(self) -> np.ndarray:
+        """
+        To get rows without copying them
+        NOTE: the view follows the next updates, use RingBuffer.copy() to keep rows as they are
+
+        Returns:
+        --------
+        return: np.ndarray
+            Read-only view of rows ordered from the older (index=0) to the newest (index=-1)
+        """
+        start = self.__start
+        view = self.__storage[start:start+self.__size]
+        view.flags.writeable = False
+        return view
+
+    def copy(self, n_row: int = None) -> np.ndarray:
+        """
+        To get a copy of the newest rows
+
+        Parameters:
+        -----------
+        n_row: int = None
+            Number of newest rows to copy (default to all rows)
+
+        Returns:
+        --------
+        return: np.ndarray
+            Rows ordered from the older (index=0) to the newest (index=-1)
+        """
+        with self.__lock:
+            view = self.view()
+            return (view if n_row is None else view[max(view.shape[0] - n_row, 0):]).copy()
+
+    def append(self, row: np.ndarray) -> None:
+        """
+        To add a row after the newest one, the older row is dropped if the capacity is reached
+
+        Parameters:
+        -----------
+        row: np.ndarray
+            The new row
+        """
+        capacity = self.__capacity
+        with self.__lock:
+            if self.__size < capacity:
+                index = self.__start + self.__size
+                self.__size += 1
+            else:
+                index = self.__start
+                self.__start = (self.__start + 1) % capacity
+            self.__write(index % capacity, row)
+
+    def replace_last(self, row: np.ndarray) -> None:
+        """
+        To replace the newest row
+
+        Parameters:
+        -----------
+        row: np.ndarray
+            The new version of the newest row
+        """
+        if self.__size == 0:
+            raise IndexError("Can't replace the newest row of an empty buffer")
+        with self.__lock:
+            index = (self.__start + self.__size - 1) % self.__capacity
+            self.__write(index, row)
+
+    def __write(self, index: int, row: np.ndarray) -> None:
+        storage = self.__storage
+        storage[index] = row
+        storage[index + self.__capacity] = row
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.view()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        To edit rows like a numpy array
+        NOTE: the copy of each row is synchronized so it costs a copy of all rows
+        """
+        with self.__lock:
+            start = self.__start
+            end = start + self.__size
+            capacity = self.__capacity
+            storage = self.__storage
+            storage[start:end][key] = value
+            first_end = min(end, capacity)
+            storage[start+capacity:first_end+capacity] = storage[start:first_end]
+            if end > capacity:
+                storage[:end-capacity] = storage[capacity:end]
@@ -0,0 +1,213 @@
+import threading
+from time import sleep
+from typing import Callable, Tuple, Union
+from urllib.parse import urlparse
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from model.tools.Map import Map
+
+
+class SessionPool:
+    """
+    To share HTTP sessions that keep their connections alive between requests
+
+    A session is kept for each host and group of threads, so requests to the same
+    host reuse the connections of its pool instead of opening a new TCP/TLS
+    connection each time. Groups allow to keep requests that must not wait behind
+    others (i.e.: orders) in their own pool of connections.
+    Requests answered with a status to retry are sent again after a backoff that
+    can be extended by the caller (i.e.: to respect a rate limit).
+    A ban (418) or a retry asked after more than the maximum sleep are returned
+    instead, so the caller's rate limiter backs off without blocking a thread.
+    """
+    _RETRY_STATUSES = [429, 500, 502, 503, 504]
+    _RETRY_STATUSES_ANY_METHOD = [429]
+    _IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'DELETE']
+    _HEADER_RETRY_AFTER = 'Retry-After'
+    _MAX_BACKOFF = 60
+
+    def __init__(self, pool_size: int = 10, timeout: Union[float, Tuple[float, float]] = (3.05, 30), max_retry: int = 3, backoff: float = 0.5, max_sleep: float = 10) -> None:
+        """
+        To create a new pool of sessions
+
+        Parameters:
+        -----------
+        pool_size: int = 10
+            Maximum number of connections kept alive for each session
+        timeout: Union[float, Tuple[float, float]] = (3.05, 30)
+            Timeout of requests (in second), a tuple for connect and read timeout
+        max_retry: int = 3
+            Maximum number of times a request is sent again after an error
+        backoff: float = 0.5
+            Initial time to wait before to retry a request (in second), doubled at each retry
+        max_sleep: float = 10
+            Maximum time to wait before to retry a request (in second), longer waits return the response
+        """
+        if pool_size < 1:
+            raise ValueError(f"The pool size must be at least 1, instead '{pool_size}'")
+        if max_retry < 0:
+            raise ValueError(f"The number of retry can't be negative, instead '{max_retry}'")
+        self.__pool_size = pool_size
+        self.__timeout = timeout
+        self.__max_retry = max_retry
+        self.__backoff = backoff
+        self.__max_sleep = max_sleep
+        self.__sessions = {}
+        self.__lock = threading.Lock()
+        self.__n_request = 0
+        self.__n_retry = 0
+
+    def get_pool_size(self) -> int:
+        return self.__pool_size
+
+    def get_timeout(self) -> Union[float, Tuple[float, float]]:
+        return self.__timeout
+
+    def get_max_retry(self) -> int:
+        return self.__max_retry
+
+    def get_backoff(self) -> float:
+        return self.__backoff
+
+    def get_max_sleep(self) -> float:
+        return self.__max_sleep
+
+    def get_session(self, url: str, group: str = None) -> Session:
+        """
+        To get the session of a host
+
+        Parameters:
+        -----------
+        url: str
+            Url of the host (the path is ignored)
+        group: str = None
+            Group of threads that share the session
+
+        Returns:
+        --------
+        return: Session
+            The session of the host for the group
+        """
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc, group)
+        session = self.__sessions.get(key)
+        if session is None:
+            with self.__lock:
+                session = self.__sessions.get(key)
+                if session is None:
+                    session = self._new_session()
+                    self.__sessions[key] = session
+        return session
+
+    def _new_session(self) -> Session:
+        # Only connection errors are retried here: the request didn't reach the host
+        # NOTE: statuses are left to request() even with a header Retry-After
+        retry = Retry(total=self.get_max_retry(), connect=self.get_max_retry(), read=0, redirect=0, status=0, backoff_factor=self.get_backoff(), respect_retry_after_header=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.get_pool_size(), max_retries=retry)
+        session = Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method: str, url: str, group: str = None, wait: Callable[[Response], float] = None, **kwargs) -> Response:
+        """
+        To send a request through the session of its host
+
+        Parameters:
+        -----------
+        method: str
+            Method of the request (i.e.: 'GET')
+        url: str
+            Url where to send the request
+        group: str = None
+            Group of threads that share the session
+        wait: Callable[[Response], float] = None
+            Function that returns the minimum time to wait before to retry a request (in second)
+        kwargs: dict
+            Params of requests.Session.request (i.e.: params, headers)
+
+        Returns:
+        --------
+        return: Response
+            The response of the last try, or of the try that asked to wait more than the maximum sleep
+        """
+        method = method.upper()
+        session = self.get_session(url, group)
+        kwargs.setdefault('timeout', self.get_timeout())
+        n_try = 0
+        while True:
+            response = session.request(method, url, **kwargs)
+            with self.__lock:
+                self.__n_request += 1
+            if (n_try >= self.get_max_retry()) or (not self._is_retryable(method, response)):
+                return response
+            sleep_time = self.get_retry_sleep_time(response, n_try, wait)
+            if sleep_time > self.get_max_sleep():
+                return response
+            sleep(sleep_time)
+            n_try += 1
+            with self.__lock:
+                self.__n_retry += 1
+
+    def _is_retryable(self, method: str, response: Response) -> bool:
+        status = response.status_code
+        if status in self._RETRY_STATUSES_ANY_METHOD:
+            return True
+        return (status in self._RETRY_STATUSES) and (method in self._IDEMPOTENT_METHODS)
+
+    def get_retry_sleep_time(self, response: Response, n_try: int, wait: Callable[[Response], float] = None) -> float:
+        """
+        To get the time to wait before to retry a request
+
+        Parameters:
+        -----------
+        response: Response
+            The response of the failed try
+        n_try: int
+            Number of retry already done
+        wait: Callable[[Response], float] = None
+            Function that returns the minimum time to wait (in second)
+
+        Returns:
+        --------
+        return: float
+            Time to wait (in second)
+        """
+        sleep_time = min(self.get_backoff() * (2 ** n_try), self._MAX_BACKOFF)
+        retry_after = response.headers.get(self._HEADER_RETRY_AFTER)
+        if (retry_after is not None) and str(retry_after).isdigit():
+            sleep_time = max(sleep_time, float(retry_after))
+        if wait is not None:
+            wait_time = wait(response)
+            sleep_time = max(sleep_time, wait_time) if wait_time is not None else sleep_time
+        return sleep_time
+
+    def close(self) -> None:
+        """
+        To close all sessions and their connections
+        """
+        with self.__lock:
+            sessions = list(self.__sessions.values())
+            self.__sessions = {}
+        [session.close() for session in sessions]
+
+    def get_stats(self) -> Map:
+        """
+        To get statistics of the pool
+
+        Returns:
+        --------
+        return: Map
+            Map[Map.session]:   {int}   # Number of sessions opened
+            Map[Map.request]:   {int}   # Number of requests sent (retries included)
+            Map[Map.retry]:     {int}   # Number of retries
+        """
+        with self.__lock:
+            return Map({
+                Map.session: len(self.__sessions),
+                Map.request: self.__n_request,
+                Map.retry: self.__n_retry
+            })
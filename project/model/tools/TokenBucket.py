@@ -0,0 +1,147 @@
+import time
+
+
+class TokenBucket:
+    """
+    To model a rate limit as a bucket of tokens refilled continuously
+
+    A limit of N weight per interval is split into a burst and a refill rate so that
+    the weight consumed in any window of one interval never exceeds N:
+    burst + rate * interval = N
+    Consuming more tokens than held is allowed when the bucket is full so requests
+    heavier than the burst can still pass, the debt is paid back by the refill.
+    NOTE: TokenBucket is not thread safe, use it through a RateScheduler
+    """
+    _BURST_RATE = 0.5
+
+    def __init__(self, limit: float, interval: float, burst_rate: float = None) -> None:
+        """
+        To create a new bucket
+
+        Parameters:
+        -----------
+        limit: float
+            Maximum weight per interval
+        interval: float
+            Interval of the limit (in second)
+        burst_rate: float = None
+            Part of the limit that can be consumed at once (between 0 and 1)
+        """
+        burst_rate = self._BURST_RATE if burst_rate is None else burst_rate
+        if limit <= 0:
+            raise ValueError(f"The limit must be positive, instead '{limit}'")
+        if interval <= 0:
+            raise ValueError(f"The interval must be positive, instead '{interval}'")
+        if not (0 < burst_rate < 1):
+            raise ValueError(f"The burst rate must be between 0 and 1 (excluded), instead '{burst_rate}'")
+        self.__limit = limit
+        self.__interval = interval
+        self.__capacity = limit * burst_rate
+        self.__rate = limit * (1 - burst_rate) / interval
+        self.__tokens = self.__capacity
+        self.__refill_time = time.monotonic()
+
+    def get_limit(self) -> float:
+        return self.__limit
+
+    def get_interval(self) -> float:
+        return self.__interval
+
+    def get_capacity(self) -> float:
+        """
+        To get the maximum number of tokens held
+
+        Returns:
+        --------
+        return: float
+            The maximum number of tokens held
+        """
+        return self.__capacity
+
+    def get_rate(self) -> float:
+        """
+        To get the number of tokens added per second
+
+        Returns:
+        --------
+        return: float
+            The number of tokens added per second
+        """
+        return self.__rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        tokens = self.__tokens + (now - self.__refill_time) * self.get_rate()
+        self.__tokens = min(tokens, self.get_capacity())
+        self.__refill_time = now
+
+    def get_tokens(self) -> float:
+        """
+        To get the number of tokens available
+
+        Returns:
+        --------
+        return: float
+            The number of tokens available (negative while a debt is paid back)
+        """
+        self._refill()
+        return self.__tokens
+
+    def get_used(self) -> float:
+        """
+        To get the weight consumed that is not refilled yet
+
+        Returns:
+        --------
+        return: float
+            The weight consumed that is not refilled yet
+        """
+        return self.get_capacity() - self.get_tokens()
+
+    def wait_time(self, weight: float) -> float:
+        """
+        To get the time to wait till a weight can be consumed
+
+        Parameters:
+        -----------
+        weight: float
+            The weight to consume
+
+        Returns:
+        --------
+        return: float
+            Time to wait (in second), 0 if the weight can be consumed now
+        """
+        needed = min(weight, self.get_capacity()) - self.get_tokens()
+        return max(needed / self.get_rate(), 0)
+
+    def consume(self, weight: float) -> float:
+        """
+        To consume tokens without waiting
+
+        Parameters:
+        -----------
+        weight: float
+            The weight to consume
+
+        Returns:
+        --------
+        return: float
+            The number of tokens left
+        """
+        self._refill()
+        self.__tokens -= weight
+        return self.__tokens
+
+    def sync(self, used: float) -> None:
+        """
+        To synchronize the bucket with the weight used on the remote side
+        NOTE: tokens are only decreased so the bucket never exceeds what's left remotely
+
+        Parameters:
+        -----------
+        used: float
+            Weight used in the remote's current interval
+        """
+        self._refill()
+        self.__tokens = min(self.__tokens, self.get_limit() - used)
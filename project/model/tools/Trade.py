@@ -287,7 +287,6 @@ class Trade(MyJson):
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
         from model.API.brokers.Binance.Binance import Binance
-        _class_token = MyJson.get_class_name_token()
         pair = Pair('JSON/@JSON')
         buy_order_params = Map({
             Map.pair: pair,
@@ -298,7 +297,7 @@ class Trade(MyJson):
         })
         buy_order = Order.generate_broker_order(Binance.__name__, Order.TYPE_MARKET, buy_order_params)
         instance = Trade(buy_order)
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
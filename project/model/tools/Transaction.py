@@ -190,8 +190,7 @@ class Transaction(MyJson):
     # ——————————————————————————————————————————— STATIC FUNCTION DOWN —————————————————————————————————————————————————
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Transaction(type=Transaction.TYPE_DEPOSIT, pair=Pair('@left/@right'), right=Price(10, '@right'), left=Price(100, '@left'), fee=Price(1, '@right'))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
@@ -69,21 +69,64 @@ class Transactions(MyJson):
         return self._get_transactions().get_keys()
     
     def add(self, transaction: Transaction) -> None:
-        self._reset_sum()
         transaction.get_pair().are_same(self.get_pair())
         transacs = self._get_transactions()
-        transacs.put(transaction, transaction.get_id())
-        self._sort()
+        transac_id = transaction.get_id()
+        if transac_id in transacs.get_map():
+            self._reset_sum()
+        else:
+            self._update_sum(transaction, add=True)
+        transacs.put(transaction, transac_id)
+        self._sort(transaction)
     
     def remove(self, transac_id: str) -> None:
-        self._reset_sum()
         transacs = self._get_transactions()
-        transacs.get_map().pop(transac_id, None)
+        transaction = transacs.get_map().pop(transac_id, None)
+        self._update_sum(transaction, add=False) if transaction is not None else None
     
-    def _sort(self) -> None:
+    def _sort(self, transaction: Transaction = None) -> None:
+        """
+        To sort Transaction by execution time
+
+        Parameters:
+        -----------
+        transaction: Transaction = None
+            The Transaction just added, Transactions are only sorted if it's executed
+            before the previous Transaction
+        """
         transacs = self._get_transactions()
-        self.__transactions = Map(sorted(transacs.get_map().items(), key=lambda row: row[1].get_execution_time()))    
-    
+        transacs_dict = transacs.get_map()
+        if (transaction is not None) and (len(transacs_dict) > 1):
+            values = reversed(transacs_dict.values())
+            last = next(values)
+            previous = next(values)
+            if (last is transaction) and (previous.get_execution_time() <= transaction.get_execution_time()):
+                return
+        self.__transactions = Map(sorted(transacs_dict.items(), key=lambda row: row[1].get_execution_time()))
+
+    def _update_sum(self, transaction: Transaction, add: bool) -> None:
+        """
+        To update the sum with a Transaction added or removed
+        NOTE: the sum is computed at the next call of Transactions.sum() if it's not computed yet
+
+        Parameters:
+        -----------
+        transaction: Transaction
+            The Transaction added or removed
+        add: bool
+            True if the Transaction is added else False
+        """
+        transac_sum = self._get_sum()
+        if transac_sum is None:
+            return
+        amounts = {
+            Map.left: transaction.get_left(),
+            Map.right: transaction.get_right(),
+            Map.fee: transaction.get_transaction_fee()
+        }
+        new_sum = {key: (transac_sum.get(key) + amount) if add else (transac_sum.get(key) - amount) for key, amount in amounts.items()}
+        self._set_sum(Map(new_sum))
+
     def sum(self) -> Map:
         """
         To sum right, left and fee amount of Transaction
@@ -116,7 +159,6 @@ class Transactions(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Transactions(Pair('@left/@right'))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
@@ -1,6 +1,9 @@
+import numpy as np
+
 from model.structure.Broker import Broker
 from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.tools.Asset import Asset
+from model.tools.FlatMap import FlatMap
 from model.tools.Map import Map
 from model.tools.MarketPrice import MarketPrice
 from model.tools.MyJson import MyJson
@@ -39,6 +42,7 @@ class Wallet(MyJson):
         self.__removed_positions = None
         self.__historic = None
         self.__marketprices = None
+        self.__position_values = None
         self.__total = None
         self.__roi = None
         self._set_initial(initial)
@@ -279,14 +283,29 @@ class Wallet(MyJson):
         pos_value = Price(0, r_asset)
         position = self.get_position(asset, attribute)
         if position.get_value() > 0:
-            marketprice = self.get_marketprice(bkr, asset)
-            close = marketprice.get_close()
+            close = self._get_closes(bkr, [asset])[0]
             pos_value = Price(position * close, r_asset)
         return pos_value
 
+    def _get_position_values(self) -> Map:
+        """
+        To get value of all positions already computed
+
+        Returns:
+        --------
+        return: Map
+            Value of all positions in Wallet.initial's Asset
+            position_values[attribute{str}]: {Price}
+        """
+        if self.__position_values is None:
+            self.__position_values = Map()
+        return self.__position_values
+
     def get_all_position_value(self, bkr: Broker, attribute: str = ATTR_POSITONS) -> Price:
         """
         To get value of all positions in Wallet.initial's Asset
+        NOTE: value = positions · closes, with closes requested together
+        NOTE: value is kept until a position or MarketPrice change
 
         Parameters:
         -----------
@@ -298,9 +317,17 @@ class Wallet(MyJson):
         return: Price
             The value of all positions in Wallet.initial's Asset
         """
-        assets = self.assets(attribute)
-        value = Price.sum([self.get_position_value(bkr, asset, attribute) for asset in assets]) \
-            if len(assets) > 0 else Price(0, self.get_initial().get_asset())
+        position_values = self._get_position_values()
+        value = position_values.get(attribute)
+        if value is None:
+            r_asset = self.get_initial().get_asset()
+            positions = {asset: self.get_position(asset, attribute).get_value() for asset in self.assets(attribute)}
+            positions = {asset: position for asset, position in positions.items() if position > 0}
+            value = Price(0, r_asset)
+            if len(positions) > 0:
+                closes = self._get_closes(bkr, list(positions.keys()))
+                value = Price(float(np.dot(np.fromiter(positions.values(), dtype=float), closes)), r_asset)
+            position_values.put(value, attribute)
         return value
 
     def get_historic(self) -> dict:
@@ -318,8 +345,7 @@ class Wallet(MyJson):
         self.__marketprices = marketprices
 
     def reset_marketprices(self) -> None:
-        self._reset_total()
-        self._reset_roi()
+        self._reset_valuation()
         self.__marketprices = None
 
     def _get_marketprices(self) -> Map:
@@ -335,7 +361,7 @@ class Wallet(MyJson):
         | Map[Pair{Pair}][period{int}] | {MarketPrice} | Market price of the given Pair for the given period |
         """
         if self.__marketprices is None:
-            self.__marketprices = Map()
+            self.__marketprices = FlatMap()
         return self.__marketprices
 
     def get_marketprice(self, bkr: Broker, asset: Asset) -> MarketPrice:
@@ -349,6 +375,39 @@ class Wallet(MyJson):
             marketprices.put(marketprice, pair, period)
         return marketprice
 
+    def _get_closes(self, bkr: Broker, assets: list[Asset]) -> np.ndarray:
+        """
+        To get the last close price of Asset in Wallet.initial's Asset
+        NOTE: MarketPrice not stored yet are requested together
+
+        Parameters:
+        -----------
+        bkr: Broker
+            Access to Broker's API
+        assets: list[Asset]
+            The left Asset to get close price of
+
+        Returns:
+        --------
+        return: np.ndarray
+            The last close price of each Asset
+        """
+        period = self.get_period()
+        n_period = self.get_n_period()
+        marketprices = self._get_marketprices()
+        requests = [(self._new_pair(asset), period, n_period) for asset in assets]
+        MarketPrice.prefetch(bkr, requests, marketprices) if len(requests) > 1 else None
+        return np.array([self.get_marketprice(bkr, asset).get_close() for asset in assets], dtype=float)
+
+    def _reset_valuation(self) -> None:
+        """
+        To invalidate values computed from positions and MarketPrice
+        NOTE: must be called each time a Transaction or a MarketPrice change
+        """
+        self.__position_values = None
+        self._reset_total()
+        self._reset_roi()
+
     def _reset_total(self) -> None:
         self.__total = None
 
@@ -469,7 +528,7 @@ class Wallet(MyJson):
         # Link
         depot.link(spot)
         # Reset
-        self._reset_total()
+        self._reset_valuation()
 
     def withdraw(self, amount: Price, fee: Price = None) -> None:
         """
@@ -507,7 +566,7 @@ class Wallet(MyJson):
         # Link
         withdraw.link(spot)
         # Reset
-        self._reset_total()
+        self._reset_valuation()
 
     def buy(self, transaction: Transaction) -> None:
         """
@@ -563,8 +622,7 @@ class Wallet(MyJson):
         spot.link(buy)
         spot.link(position)
         # Reset
-        self._reset_total()
-        self._reset_roi()
+        self._reset_valuation()
 
     def sell(self, transaction: Transaction) -> None:
         """
@@ -613,8 +671,7 @@ class Wallet(MyJson):
         spot.link(sell)
         spot.link(position)
         # Reset
-        self._reset_total()
-        self._reset_roi()
+        self._reset_valuation()
 
     def add_position(self, quantity: Price, fee: Price = None) -> None:
         """
@@ -652,7 +709,7 @@ class Wallet(MyJson):
         # Link
         add_pos.link(position)
         # Reset
-        self._reset_total()
+        self._reset_valuation()
 
     def remove_position(self, quantity: Price, fee: Price = None) -> None:
         """
@@ -692,7 +749,7 @@ class Wallet(MyJson):
         # Link
         remove_pos.link(position)
         # Reset
-        self._reset_total()
+        self._reset_valuation()
 
     def buy_capital(self) -> Price:
         """
@@ -810,9 +867,8 @@ class Wallet(MyJson):
 
     @staticmethod
     def json_instantiate(object_dic: dict) -> object:
-        _class_token = MyJson.get_class_name_token()
         instance = Wallet(Price(0, Asset('@json')))
-        exec(MyJson.get_executable())
+        MyJson._json_set_attributes(instance, object_dic)
         return instance
 
     # ——————————————————————————————————————————— STATIC FUNCTION UP ———————————————————————————————————————————————————
@@ -571,6 +571,35 @@ class TestBinanceFakeAPI(unittest.TestCase, BinanceFakeAPI):
             self.assertTrue((unix_time - klines[-1][0]) < period_milli)
         self.broker_switch(False)
 
+    def test_get_aggregate(self) -> None:
+        _cls = BinanceFakeAPI
+        merged_pair = 'BTCUSDT'
+        min_period = 60
+        period = 60*5
+        n_row = 100
+        random = np.random.default_rng(7)
+        min_history = np.zeros((n_row, 12))
+        min_history[:,0] = 1600000000000 + np.arange(n_row) * min_period * 1000
+        min_history[:,[2,3,4,5,7,8,9,10]] = random.random((n_row, 8))
+        history = np.zeros((int(n_row/5), 12))
+        history[:,0] = min_history[::5,0]
+        histories = _cls._get_market_histories()
+        histories.put(min_history, merged_pair, min_period)
+        histories.put(history, merged_pair, period)
+        aggregate = _cls._get_aggregate(merged_pair, period, min_period)
+        indexes = aggregate.get(Map.index)
+        running = aggregate.get(Map.history)
+        for min_idx in range(n_row):
+            index = int(min_idx/5)
+            elapseds = min_history[index*5:min_idx+1]
+            self.assertEqual(index, indexes[min_idx])
+            self.assertEqual(max(elapseds[:,2]), running[min_idx,2])
+            self.assertEqual(min(elapseds[:,3]), running[min_idx,3])
+            self.assertEqual(elapseds[-1,4], running[min_idx,4])
+            np.testing.assert_allclose(elapseds[:,[5,7,8,9,10]].sum(axis=0), running[min_idx,[5,7,8,9,10]])
+        # Built once
+        self.assertEqual(id(aggregate), id(_cls._get_aggregate(merged_pair, period, min_period)))
+
     def test_request_submit_order(self) -> None:
         _cls = BinanceFakeAPI
         params = self.order_params
@@ -1,4 +1,6 @@
 import unittest
+
+import numpy as np
 from config.Config import Config
 
 from model.API.brokers.Binance.BinanceAPI import BinanceAPI
@@ -685,6 +687,44 @@ class TestBinanceFakeOrder(unittest.TestCase, BinanceFakeOrder):
         })
         self.compare_order_execution(exp=exp6, result=order6, attribut_types=attribut_types)
 
+    def test_find_fills(self) -> None:
+        Config.update(Config.STAGE_MODE, Config.STAGE_1)
+        def new_order(order_type: str, side: str, submit_index: int, limit: float = None, stop: float = None) -> BinanceFakeOrder:
+            params = Map({
+                Map.symbol:     'BTCUSDT',
+                Map.type:       order_type,
+                Map.side:       side,
+                Map.price:      limit,
+                Map.stopPrice:  stop,
+                Map.quantity:   1
+            })
+            return BinanceFakeOrder(params, Map({Map.close: closes[submit_index], Map.start: int(history[submit_index, 0])}))
+        _api = BinanceAPI
+        closes = [100, 102, 104, 101, 97, 95, 98, 100]
+        history = np.array([[i*60000, close, close + 1, close - 1, close, 1, i*60000 + 59999] for i, close in enumerate(closes)], dtype=np.float64)
+        market_datas = Map({Map.time: int(history[-1, 0]), Map.close: closes[-1]})
+        orders = [
+            new_order(_api.TYPE_MARKET, _api.SIDE_BUY, 7),
+            new_order(_api.TYPE_LIMIT, _api.SIDE_BUY, 0, limit=96),
+            new_order(_api.TYPE_LIMIT, _api.SIDE_BUY, 6, limit=96),
+            new_order(_api.TYPE_STOP_LOSS, _api.SIDE_SELL, 2, stop=99),
+            new_order(_api.TYPE_STOP_LOSS_LIMIT, _api.SIDE_SELL, 1, stop=103, limit=104),
+            new_order(_api.TYPE_STOP_LOSS_LIMIT, _api.SIDE_BUY, 3, stop=100, limit=110),
+            new_order(_api.TYPE_STOP_LOSS_LIMIT, _api.SIDE_SELL, 4, stop=90, limit=89)
+        ]
+        fills = BinanceFakeOrder.find_fills(orders, market_datas, history)
+        np.testing.assert_array_equal([7, 4, -1, 4, 2, 3, -1], fills.get(Map.index))
+        np.testing.assert_array_equal([100, 96, np.nan, 100, 104, 110, np.nan], fills.get(Map.price))
+        np.testing.assert_array_equal([True, True, False, True, True, True, False], fills.get(Map.ready))
+        # Same as orders evaluated one by one
+        for i, order in enumerate(orders):
+            fill = BinanceFakeOrder.find_fills([order], market_datas, history)
+            self.assertEqual(fills.get(Map.index)[i], fill.get(Map.index)[0])
+        # Not open orders are ignored
+        orders[0]._set_attribut(Map.status, _api.STATUS_ORDER_CANCELED)
+        executions = BinanceFakeOrder.execute_orders(orders[:1], market_datas, history)
+        self.assertListEqual([False], executions)
+
     def test_cancel(self) -> None:
         pair = Pair('BTC/USDT')
         merged_pair = pair.format(Pair.FORMAT_MERGED).upper()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from model.API.brokers.Binance.BinanceMarketPrice import BinanceMarketPrice
 from model.tools.Pair import Pair
 
@@ -35,6 +37,29 @@ class TestBinanceMarketPrice(unittest.TestCase, BinanceMarketPrice):
         result_2 = self.mkt.get_time(2)
         self.assertEqual(exp_2, result_2)
 
+    def test_get_history(self) -> None:
+        # History keeps the broker's order
+        history = self.mkt.get_history()
+        self.assertEqual((len(self.mkt_list), 5), history.shape)
+        self.assertEqual(np.float64, history.dtype)
+        self.assertListEqual([float(v) for v in self.closes[:6]], history[:, 4].tolist())
+        # Market is a view from the newest to the older
+        market = self.mkt.get_market()
+        self.assertTrue(np.shares_memory(history, market))
+        self.assertListEqual(history[-1].tolist(), market[0].tolist())
+        self.assertTupleEqual(tuple(market[:, 4].tolist()), self.mkt.get_closes())
+        # History is read-only
+        with self.assertRaises(ValueError):
+            history[0, 4] = 1
+        # Values that can't be converted
+        mkt = BinanceMarketPrice([['open_time', '1', '2', '3', '4'], ['open_time', '5', '6', '7']], '1m', Pair('BTC/USDT'))
+        self.assertTrue(np.isnan(mkt.get_history()[0, 0]))
+        self.assertTrue(np.isnan(mkt.get_history()[1, 4]))
+        self.assertTupleEqual((7.0, 3.0), mkt.get_lows())
+        # Empty market
+        mkt = BinanceMarketPrice([], '1m', Pair('BTC/USDT'))
+        self.assertTupleEqual((), mkt.get_closes())
+
     def test_json_encode_decode(self) -> None:
         original_obj = self.mkt
         original_obj.get_closes()
@@ -16,6 +16,7 @@ from model.tools.Asset import Asset
 from model.tools.Map import Map
 from model.tools.MarketPrice import MarketPrice
 from model.tools.Pair import Pair
+from model.tools.RingBuffer import RingBuffer
 from model.tools.WebSocket import WebSocket
 
 
@@ -411,6 +412,21 @@ class TestBinanceSocket(unittest.TestCase, BinanceSocket):
             for j in range(exp1.shape[1]):
                 self.assertEqual(0, result1[i,j])
 
+    def test_copy_market_history(self) -> None:
+        bws = self.bws_single
+        stream = self.streams[0]
+        market_history = np.arange(60, dtype=np.float64).reshape((5, 12))
+        bws._get_market_histories().put(RingBuffer(market_history), stream)
+        result1 = bws.copy_market_history(stream)
+        np.testing.assert_array_equal(market_history, result1)
+        result2 = bws.copy_market_history(stream, 2)
+        np.testing.assert_array_equal(market_history[-2:], result2)
+        # Copy don't follow updates
+        bws._get_market_histories().get(stream).append(np.full(12, -1))
+        np.testing.assert_array_equal(market_history[-2:], result2)
+        with self.assertRaises(Exception):
+            bws.copy_market_history(self.streams[1])
+
     def test_websocket_are_running(self) -> None:
         bws = self.bws_multi
         streams = self.streams
@@ -496,9 +512,9 @@ class TestBinanceSocket(unittest.TestCase, BinanceSocket):
                         Map.open: market_history[-1,0],
                         Map.shape: market_history.shape[0]
                     }
-                if (screen[Map.id] != id(market_history)) and (screen[Map.shape] == market_history.shape[0]):
+                if screen[Map.id] != id(market_history):
                     screen = None
-                elif (screen[Map.id] != id(market_history)) and (screen[Map.shape] < market_history.shape[0])\
+                elif (screen[Map.shape] == market_history.shape[0])\
                     and (screen[Map.open] == market_history[-2,0]) and ((screen[Map.open] + period_milli) == market_history[-1,0]):
                     push_succed = True
                     break
@@ -775,15 +775,15 @@ class TestHand(unittest.TestCase, Hand):
         # First Backup
         hand.backup()
         backup_time2 = hand.get_backup_time()
-        exp2 = hand.json_encode()
-        result2 = hand._get_backup()
+        exp2 = 1
+        result2 = hand._get_backup().get_sequence()
         self.assertEqual(exp2, result2)
         self.assertIsInstance(backup_time2, int)
         # Backup Before Interval
         hand.set_max_position(hand.get_max_position() + 1)
         hand.backup()
         exp3 = result2
-        result3 = hand._get_backup()
+        result3 = hand._get_backup().get_sequence()
         self.assertEqual(exp3, result3)
         exp3_2 = backup_time2
         result3_2 = hand.get_backup_time()
@@ -792,26 +792,27 @@ class TestHand(unittest.TestCase, Hand):
         hand.set_max_position(hand.get_max_position() + 1)
         hand.backup(force=True)
         exp4 = result2
-        result4 = hand._get_backup()
+        result4 = hand._get_backup().get_sequence()
         self.assertNotEqual(exp4, result4)
         exp4_2 = backup_time2
         result4_2 = hand.get_backup_time()
         self.assertNotEqual(exp4_2, result4_2)
         # Backup After Interval
         hand._set_backup_time(_MF.get_timestamp(_MF.TIME_MILLISEC) - backup_interval_milli)
+        previous_backup_time5 = hand.get_backup_time()
         hand.set_max_position(hand.get_max_position() + 1)
         hand.backup()
         exp5 = result4
-        result5 = hand._get_backup()
+        result5 = hand._get_backup().get_sequence()
         self.assertNotEqual(exp5, result5)
-        exp5_2 = result4_2
+        exp5_2 = previous_backup_time5
         result5_2 = hand.get_backup_time()
         self.assertNotEqual(exp5_2, result5_2)
         # Hand Didn't Change
         sleep(result5_2, backup_interval)
         hand.backup()
         exp6 = result5
-        result6 = hand._get_backup()
+        result6 = hand._get_backup().get_sequence()
         self.assertEqual(exp6, result6)
         exp6_2 = result5_2
         result6_2 = hand.get_backup_time()
@@ -820,7 +821,7 @@ class TestHand(unittest.TestCase, Hand):
         wait_writing()
         hand_id = hand.get_id()
         loaded = hand.load(hand_id)
-        self.assertEqual(hand._get_backup(), loaded.json_encode())
+        self.assertEqual(hand.json_encode(), loaded.json_encode())
         # Backup don't exist
         with self.assertRaises(Exception):
             self.load('fake_id')
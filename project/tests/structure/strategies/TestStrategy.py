@@ -1,6 +1,11 @@
 import unittest
+
+import numpy as np
+
 from config.Config import Config
 from model.API.brokers.Binance.Binance import Binance
+from model.API.brokers.Binance.BinanceMarketPrice import BinanceMarketPrice
+from model.structure.Bot import Bot
 from model.structure.Broker import Broker
 
 from model.structure.strategies.Strategy import Strategy
@@ -26,6 +31,61 @@ class StrategyChild(Strategy):
     def _trade_inner(self, marketprices: Map) -> dict:
         pass
 
+class HistoryStrategyChild(StrategyChild):
+    _REQUIRED_PERIODS = [Broker.PERIOD_1MIN]
+    _N_PERIOD = 20
+    HISTORY = None
+    EVENT_DRIVEN = False
+    N_TURN = 0
+
+    class FakeBroker:
+        def generate_streams(self, pairs: list, periods: list) -> list:
+            return []
+
+        def add_streams(self, streams: list) -> None:
+            pass
+
+    @classmethod
+    def _marketprice(cls, broker: Broker, pair: Pair, period: int, marketprices: Map) -> MarketPrice:
+        marketprice = marketprices.get(pair, period)
+        if marketprice is None:
+            index = Bot.get_trade_index()
+            if index >= cls.HISTORY.shape[0]:
+                raise IndexError("End of history")
+            rows = cls.HISTORY[max(index-cls._N_PERIOD+1, 0):index+1]
+            marketprice = BinanceMarketPrice(rows, '1m', pair)
+            marketprices.put(marketprice, pair, period)
+        return marketprice
+
+    @classmethod
+    def _backtest_loop_inner(cls, broker: Broker, marketprices: Map, pair: Pair, trades: list[dict], trade: dict, buy_conditions: list, sell_conditions: list) -> dict:
+        cls.N_TURN += 1
+        marketprice = cls._marketprice(broker, pair, Broker.PERIOD_1MIN, marketprices)
+        open_time = marketprice.get_time()
+        closes = marketprice.get_closes()
+        if (trade is None) and (len(closes) > 3) and (closes[0] > max(closes[1:4])) and (closes[0] > marketprice.get_opens()[0]):
+            trade = {Map.id: open_time, Map.buy: {Map.status: Order.STATUS_COMPLETED}, Map.sell: None}
+        elif (trade is not None) and ((open_time - trade[Map.id]) >= 60*3):
+            trade[Map.sell] = {Map.status: Order.STATUS_COMPLETED, Map.time: open_time}
+        return trade
+
+    @classmethod
+    def _backtest_trigger_times(cls, broker: Broker, pair: Pair, starttime: int, endtime: int) -> np.ndarray:
+        if not cls.EVENT_DRIVEN:
+            return None
+        history = cls.HISTORY
+        opens = history[:,1]
+        closes = history[:,4]
+        last_max = np.full(closes.shape[0], np.inf)
+        last_max[3:] = np.max([closes[2:-1], closes[1:-2], closes[:-3]], axis=0)
+        can_buy = (closes > last_max) & (closes > opens)
+        return (history[can_buy, 0] / 1000).astype(int)
+
+    @classmethod
+    def _backtest_execute_trade(cls, broker: Broker, marketprices: Map, trade: dict) -> None:
+        pass
+
+
 class TestStrategy(unittest.TestCase, StrategyChild, Order):
     def setUp(self) -> None:
         Config.update(Config.STAGE_MODE, Config.STAGE_1)
@@ -208,6 +268,46 @@ class TestStrategy(unittest.TestCase, StrategyChild, Order):
             strategy._add_last_position_id(position_2.get_id())
             
 
+    def test_backtest_loop(self) -> None:
+        _cls = HistoryStrategyChild
+        n_row = 500
+        random = np.random.default_rng(7)
+        closes = 100 + np.cumsum(random.normal(0, 1, n_row))
+        opens = closes + random.normal(0, 0.5, n_row)
+        history = np.zeros((n_row, 12))
+        history[:,0] = (1600000000 + np.arange(n_row) * 60) * 1000
+        history[:,1] = opens
+        history[:,2] = np.maximum(opens, closes) + random.random(n_row)
+        history[:,3] = np.minimum(opens, closes) - random.random(n_row)
+        history[:,4] = closes
+        _cls.HISTORY = history
+        broker = _cls.FakeBroker()
+        starttime = int(history[0,0] / 1000)
+        endtime = int(history[-1,0] / 1000)
+        # Step by step
+        _cls.EVENT_DRIVEN = False
+        _cls.N_TURN = 0
+        step_trades, _, _, step_stats = _cls._backtest_loop(broker, self.pair1, starttime, endtime)
+        self.assertGreater(len(step_trades), 0)
+        self.assertEqual(n_row, _cls.N_TURN)
+        # Stats include each row of the history
+        self.assertEqual(int(history[0,0] / 1000), step_stats[Map.start])
+        self.assertEqual(int(history[-1,0] / 1000), step_stats[Map.end])
+        self.assertEqual(float(history[0,1]), step_stats[Map.open])
+        self.assertEqual(float(history[-1,4]), step_stats[Map.close])
+        self.assertEqual(float(max(history[:,2])), step_stats[Map.high])
+        self.assertEqual(float(min(history[:,3])), step_stats[Map.low])
+        # Jump to trigger times
+        _cls.EVENT_DRIVEN = True
+        _cls.N_TURN = 0
+        try:
+            event_trades, _, _, event_stats = _cls._backtest_loop(broker, self.pair1, starttime, endtime)
+        finally:
+            _cls.EVENT_DRIVEN = False
+        self.assertLess(_cls.N_TURN, n_row)
+        self.assertListEqual(step_trades, event_trades)
+        self.assertDictEqual(step_stats, event_stats)
+
     def test_get_path_backtest_file(self) -> None:
         session_id = Config.get(Config.SESSION_ID)
         child_class_name = StrategyChild.__name__
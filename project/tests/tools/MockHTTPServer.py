@@ -0,0 +1,156 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import List
+
+from model.tools.Map import Map
+
+
+class MockHTTPServer:
+    """
+    To serve HTTP requests locally with a fixed latency
+
+    It answers every request with the same JSON content and counts the connections
+    and requests received, so HTTP clients can be benchmarked without network.
+    Statuses can be queued to answer the next requests with errors (i.e.: 429).
+    """
+    _HOST = '127.0.0.1'
+
+    def __init__(self, latency: float = 0, content: object = None, headers: dict = None) -> None:
+        """
+        To create a new server
+
+        Parameters:
+        -----------
+        latency: float = 0
+            Time to wait before to answer each request (in second)
+        content: object = None
+            Content of responses (encoded in JSON)
+        headers: dict = None
+            Headers added to responses
+        """
+        self.__latency = latency
+        self.__content = json.dumps(content if content is not None else {}).encode()
+        self.__headers = dict(headers) if headers is not None else {}
+        self.__statuses = []
+        self.__n_connection = 0
+        self.__n_request = 0
+        self.__lock = threading.Lock()
+        self.__server = None
+        self.__thread = None
+
+    def get_latency(self) -> float:
+        return self.__latency
+
+    def get_content(self) -> bytes:
+        return self.__content
+
+    def get_headers(self) -> dict:
+        return self.__headers
+
+    def queue_statuses(self, statuses: List[int]) -> None:
+        """
+        To answer the next requests with the given statuses
+
+        Parameters:
+        -----------
+        statuses: List[int]
+            Status of each next request, the following ones are answered with 200
+        """
+        with self.__lock:
+            self.__statuses.extend(statuses)
+
+    def _next_status(self) -> int:
+        with self.__lock:
+            self.__n_request += 1
+            return self.__statuses.pop(0) if len(self.__statuses) > 0 else 200
+
+    def _new_connection(self) -> None:
+        with self.__lock:
+            self.__n_connection += 1
+
+    def url(self) -> str:
+        """
+        To get the url of the server
+
+        Returns:
+        --------
+        return: str
+            Url of the server (i.e.: 'http://127.0.0.1:8000')
+        """
+        if self.__server is None:
+            raise Exception("The server must be started to get its url")
+        return f"http://{self._HOST}:{self.__server.server_address[1]}"
+
+    def start(self) -> None:
+        """
+        To start serving requests in a background thread
+        """
+        if self.__server is not None:
+            raise Exception("The server is already started")
+        self.__server = ThreadingHTTPServer((self._HOST, 0), self._new_handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        To stop serving requests
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+        self.__server = None
+        self.__thread = None
+
+    def get_stats(self) -> Map:
+        """
+        To get statistics of the server
+
+        Returns:
+        --------
+        return: Map
+            Map[Map.connection]:    {int}   # Number of connections accepted
+            Map[Map.request]:       {int}   # Number of requests received
+        """
+        with self.__lock:
+            return Map({Map.connection: self.__n_connection, Map.request: self.__n_request})
+
+    def _new_handler(self) -> type:
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive between requests
+            protocol_version = 'HTTP/1.1'
+            # Send headers and content without waiting for the client's ACK
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                server._new_connection()
+
+            def answer(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length) if length > 0 else None
+                sleep(server.get_latency()) if server.get_latency() > 0 else None
+                content = server.get_content()
+                self.send_response(server._next_status())
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                [self.send_header(key, value) for key, value in server.get_headers().items()]
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self) -> None:
+                self.answer()
+
+            def do_POST(self) -> None:
+                self.answer()
+
+            def do_DELETE(self) -> None:
+                self.answer()
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+        return Handler
@@ -18,15 +18,21 @@ class TestAsset(unittest.TestCase, Asset):
 
     def test_json_encode_decode(self) -> None:
         original_obj = self.a1
-        test_exec = self.get_executable_test_json_encode_decode()
-        exec(test_exec)
+        json_str = original_obj.json_encode()
+        decoded_obj = self.json_decode(json_str)
+        self.assertEqual(original_obj, decoded_obj)
+        # Asset are interned
+        self.assertIs(original_obj, decoded_obj)
+        self.assertEqual(json_str, decoded_obj.json_encode())
 
     def test__eq__(self):
         # Equal
         a2 = Asset(self.sbl1)
         self.assertEqual(a2, self.a1)
         self.assertTrue(a2 == self.a1)
-        self.assertNotEqual(id(a2), id(self.a1))
+        # Asset are interned
+        self.assertIs(a2, self.a1)
+        self.assertIs(Asset(self.sbl1.lower()), self.a1)
         # Different
         a3 = Asset(self.sbl2)
         self.assertNotEqual(id(a3), id(self.a1))
@@ -0,0 +1,75 @@
+import os
+import time
+import unittest
+
+from model.tools.BacktestRunner import BacktestRunner
+from model.tools.FileManager import FileManager
+from model.tools.Map import Map
+
+
+class TestBacktestRunner(unittest.TestCase):
+    STATE = None
+
+    @classmethod
+    def reset_state(cls) -> None:
+        cls.STATE = []
+
+    @classmethod
+    def job(cls, value: int) -> dict:
+        if value < 0:
+            raise ValueError(f"Negative value '{value}'")
+        # Later jobs end first
+        time.sleep(0.01 * (10 - value) / 10)
+        cls.STATE.append(value)
+        return {Map.value: value * 2, 'state': list(cls.STATE), Map.id: os.getpid()}
+
+    def test_run(self) -> None:
+        job_params = [{Map.value: i} for i in range(10)]
+        sequential = BacktestRunner.run(self.job, job_params, n_process=1, reset=self.reset_state, output=False)
+        parallel = BacktestRunner.run(self.job, job_params, n_process=4, reset=self.reset_state, output=False)
+        for results in [sequential, parallel]:
+            # Same order as jobs
+            self.assertListEqual(list(range(10)), [result.get(Map.index) for result in results])
+            self.assertListEqual([i * 2 for i in range(10)], [result.get(Map.result)[Map.value] for result in results])
+            # State is reset before each job
+            self.assertListEqual([[i] for i in range(10)], [result.get(Map.result)['state'] for result in results])
+            [self.assertIsNone(result.get(Map.error)) for result in results]
+            [self.assertGreater(result.get(Map.time), 0) for result in results]
+        self.assertSetEqual({os.getpid()}, {result.get(Map.result)[Map.id] for result in sequential})
+        if BacktestRunner.can_fork():
+            self.assertNotIn(os.getpid(), {result.get(Map.result)[Map.id] for result in parallel})
+        # Failed jobs don't stop others
+        results = BacktestRunner.run(self.job, [{Map.value: 1}, {Map.value: -1}], n_process=2, reset=self.reset_state, output=False)
+        self.assertIsNone(results[0].get(Map.error))
+        self.assertIsNone(results[1].get(Map.result))
+        self.assertIn('ValueError', results[1].get(Map.error))
+
+    @staticmethod
+    def write_job(value: int, path: str) -> int:
+        FileManager.write_csv(path, [Map.value], [{Map.value: value}], overwrite=False, make_dir=True)
+        return value
+
+    def test_run_write(self) -> None:
+        path = 'tests/datas/tools/TestBacktestRunner/test_run_write.csv'
+        FileManager.remove_file(path) if FileManager.exist_file(path) else None
+        # Parent's writer thread is running when workers are forked
+        FileManager.write_csv(path, [Map.value], [{Map.value: -1}], overwrite=False, make_dir=True)
+        job_params = [{Map.value: i, 'path': path} for i in range(6)]
+        results = BacktestRunner.run(self.write_job, job_params, n_process=3, output=False)
+        [self.assertIsNone(result.get(Map.error)) for result in results]
+        FileManager.flush()
+        # Rows written by workers are not lost and the parent's rows are not duplicated
+        rows = [row for row in FileManager.get_csv(path) if row[Map.value] != Map.value]
+        self.assertListEqual(list(range(-1, 6)), sorted([int(row[Map.value]) for row in rows]))
+        FileManager.remove_file(path)
+
+    def test_get_n_process(self) -> None:
+        if BacktestRunner.can_fork():
+            self.assertEqual(3, BacktestRunner.get_n_process(8, 3))
+            self.assertEqual(2, BacktestRunner.get_n_process(2, 3))
+        with self.assertRaises(ValueError):
+            BacktestRunner.get_n_process(0)
+
+
+if __name__ == '__main__':
+    unittest.main
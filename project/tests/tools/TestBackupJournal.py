@@ -0,0 +1,105 @@
+import shutil
+import unittest
+
+from model.structure.database.ModelFeature import ModelFeature as _MF
+from model.tools.BackupJournal import BackupJournal
+from model.tools.FileManager import FileManager
+from model.tools.Map import Map
+from model.tools.Price import Price
+
+
+class TestBackupJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir_path = f'{self.__class__.__name__}/'
+        self.path = f'{self.dir_path}backup.json'
+        self.map = Map({'k1': Price(1, 'USDT'), 'k2': {'a': [1, 2], 'b': float('nan')}, 'k3': 'v3'})
+
+    def tearDown(self) -> None:
+        FileManager.flush()
+        shutil.rmtree(FileManager.get_project_directory() + self.dir_path, ignore_errors=True)
+
+    def test_journal_path(self) -> None:
+        self.assertEqual(f'{self.dir_path}backup.journal', BackupJournal.journal_path(self.path))
+        self.assertTrue(BackupJournal.is_journal(BackupJournal.journal_path(self.path)))
+        self.assertFalse(BackupJournal.is_journal(self.path))
+        # Only snapshots can be loaded
+        self.assertTrue(BackupJournal.is_snapshot(self.path))
+        self.assertFalse(BackupJournal.is_snapshot(BackupJournal.journal_path(self.path)))
+        self.assertFalse(BackupJournal.is_snapshot(self.path + FileManager._EXTENSION_TEMPORARY))
+
+    def test_diff_apply(self) -> None:
+        old_values = self.map._json_encode_object()
+        self.map.put(Price(2, 'USDT'), 'k1')
+        self.map.put(3, 'k2', 'c')
+        self.map.get_map().pop('k3')
+        new_values = self.map._json_encode_object()
+        delta = []
+        BackupJournal.diff(old_values, new_values, [], delta)
+        # Unchanged NaN and lists aren't listed
+        self.assertEqual(3, len(delta))
+        BackupJournal.apply(old_values, _MF.json_decode(_MF.json_encode(delta)))
+        self.assertEqual(_MF.json_encode(new_values), _MF.json_encode(old_values))
+
+    def test_backup_load(self) -> None:
+        journal = BackupJournal(self.path, snapshot_interval=2)
+        # First backup is a snapshot
+        self.assertTrue(journal.backup(self.map))
+        FileManager.flush()
+        self.assertEqual('', FileManager.read(journal.get_path_journal()))
+        # Unchanged object isn't backed up
+        self.assertFalse(journal.backup(self.map))
+        self.assertEqual(1, journal.get_sequence())
+        # Changes are journaled
+        self.map.put('v3_2', 'k3')
+        self.assertFalse(journal.backup(self.map, ignores=[f'_{Map.__name__}__map']))
+        self.assertTrue(journal.backup(self.map))
+        self.map.put(Price(5, 'BNB'), 'k4')
+        self.assertTrue(journal.backup(self.map))
+        FileManager.flush()
+        self.assertEqual(2, len(FileManager.read(journal.get_path_journal()).splitlines()))
+        self.assertEqual(self.map.json_encode(), BackupJournal.load(self.path).json_encode())
+        # Snapshot after interval restarts the journal
+        self.map.put('v5', 'k5')
+        self.assertTrue(journal.backup(self.map))
+        FileManager.flush()
+        self.assertEqual('', FileManager.read(journal.get_path_journal()))
+        self.assertEqual(self.map.json_encode(), BackupJournal.load(self.path).json_encode())
+        # Entries older than the snapshot are ignored
+        self.map.put('v6', 'k6')
+        FileManager.write(journal.get_path_journal(), _MF.json_encode([journal.get_snapshot_id(), 1, [[[f'_{Map.__name__}__map', 'str@k7'], 'v7']]]), overwrite=False)
+        self.assertTrue(journal.backup(self.map))
+        FileManager.flush()
+        self.assertEqual(self.map.json_encode(), BackupJournal.load(self.path).json_encode())
+        # Snapshot is replaced without leaving its temporary file
+        self.assertFalse(FileManager.exist_file(self.path + '.tmp'))
+
+    def test_load_stale_journal(self) -> None:
+        old_journal = BackupJournal(self.path)
+        old_map = Map({'a': 1})
+        old_journal.backup(old_map)
+        for value in [2, 3]:
+            old_map.put(value, 'a')
+            old_journal.backup(old_map)
+        FileManager.flush()
+        stale_entries = FileManager.read(old_journal.get_path_journal())
+        self.assertEqual(2, len(stale_entries.splitlines()))
+        # Restart from a fresh journal while the stale journal is still on disk
+        new_map = BackupJournal.load(self.path)
+        self.assertEqual(old_map.json_encode(), new_map.json_encode())
+        new_map = Map({'b': 'new'})
+        new_journal = BackupJournal(self.path)
+        self.assertTrue(new_journal.backup(new_map))
+        self.assertEqual(old_journal.get_sequence() - 2, new_journal.get_sequence())
+        self.assertNotEqual(old_journal.get_snapshot_id(), new_journal.get_snapshot_id())
+        FileManager.write(new_journal.get_path_journal(), stale_entries, overwrite=False, line_return=False)
+        FileManager.flush()
+        # Entries of the previous snapshot are not applied to the new one
+        self.assertEqual(new_map.json_encode(), BackupJournal.load(self.path).json_encode())
+        new_map.put('newer', 'b')
+        self.assertTrue(new_journal.backup(new_map))
+        FileManager.flush()
+        self.assertEqual(new_map.json_encode(), BackupJournal.load(self.path).json_encode())
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -0,0 +1,73 @@
+import shutil
+import unittest
+
+import numpy as np
+
+from model.tools.ColumnarLogSink import ColumnarLogSink
+from model.tools.FileManager import FileManager
+from model.tools.LogSink import LogSink
+from model.tools.Map import Map
+from model.tools.Pair import Pair
+
+
+class TestColumnarLogSink(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dir_path = f'{self.__class__.__name__}/'
+        self.path = f'{self.dir_path}log.csv'
+        self.fields = [Map.id, Map.price, Map.condition, Map.pair]
+        self.rows = [{Map.id: i, Map.price: i/2, Map.condition: (i % 2) == 0, Map.pair: Pair('BTC/USDT')} for i in range(10)]
+
+    def tearDown(self) -> None:
+        FileManager.flush()
+        shutil.rmtree(FileManager.get_project_directory() + self.dir_path, ignore_errors=True)
+
+    def test_get_sink(self) -> None:
+        self.assertIs(LogSink.get_sink(LogSink.SINK_COLUMNAR), LogSink.get_sink(LogSink.SINK_COLUMNAR))
+        self.assertIsInstance(LogSink.get_sink(LogSink.SINK_COLUMNAR), ColumnarLogSink)
+        self.assertNotIsInstance(LogSink.get_sink(LogSink.SINK_CSV), ColumnarLogSink)
+        with self.assertRaises(ValueError):
+            LogSink.get_sink('unknown_sink')
+
+    def test_encode_columns(self) -> None:
+        rows = [*self.rows, {Map.id: 10, Map.price: None, 'extra': 1}]
+        columns = ColumnarLogSink.encode_columns(self.fields, rows)
+        self.assertListEqual(self.fields, list(columns.keys()))
+        self.assertEqual(np.int64, columns[Map.id].dtype)
+        self.assertEqual(np.float64, columns[Map.price].dtype)
+        self.assertTrue(np.isnan(columns[Map.price][-1]))
+        self.assertEqual('btc/usdt', columns[Map.pair][0])
+        self.assertEqual('', columns[Map.pair][-1])
+
+    def test_write_and_read(self) -> None:
+        sink = ColumnarLogSink(chunk_size=4)
+        [sink.write(self.path, [row], self.fields) for row in self.rows]
+        # Rows of an incomplete chunk stay buffered
+        FileManager.flush()
+        self.assertEqual(8, sink.read(self.path).shape[0])
+        sink.flush()
+        FileManager.flush()
+        result = sink.read(self.path)
+        self.assertListEqual(self.fields, list(result.columns))
+        self.assertListEqual(list(range(10)), result[Map.id].tolist())
+        self.assertListEqual([row[Map.condition] for row in self.rows], result[Map.condition].tolist())
+        self.assertEqual(bool, result[Map.condition].dtype)
+        self.assertListEqual([self.path.replace('.csv', '-0.bin')], sink.get_paths(self.path))
+        # A new sink continues in a new part
+        sink = ColumnarLogSink(chunk_size=4)
+        sink.write(self.path, self.rows, self.fields)
+        FileManager.flush()
+        self.assertEqual(2, len(sink.get_paths(self.path)))
+        self.assertEqual(20, sink.read(self.path).shape[0])
+
+    def test_rotation(self) -> None:
+        sink = ColumnarLogSink(chunk_size=1, max_part_size=1, compress=False)
+        [sink.write(self.path, [row]) for row in self.rows[:3]]
+        FileManager.flush()
+        part_paths = sink.get_paths(self.path)
+        self.assertEqual(3, len(part_paths))
+        self.assertListEqual([1, 1, 1], [ColumnarLogSink.read_part(part_path).shape[0] for part_path in part_paths])
+        self.assertListEqual([0, 1, 2], sink.read(self.path)[Map.id].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main
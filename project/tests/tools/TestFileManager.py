@@ -140,6 +140,89 @@ class TestFileManager(unittest.TestCase, FileManager):
         # End
         shutil.rmtree(start_dir_path)
 
+    def test_write_csv_queu(self) -> None:
+        class_name = self.__class__.__name__
+        dir_path = f'{class_name}/'
+        file_path = f'{dir_path}{class_name}_test_write_csv_queu.csv'
+        text_path = f'{dir_path}{class_name}_test_write_csv_queu.txt'
+        fields = [Map.id, Map.value]
+        n_row = 1000
+        rows = [{Map.id: i, Map.value: i*2} for i in range(n_row)]
+        stats = FileManager.get_write_stats()
+        # Rows appended are written in order with one header
+        [FileManager.write_csv(file_path, fields, [row], overwrite=False, make_dir=True) for row in rows]
+        self.assertTrue(FileManager.flush(timeout=10))
+        self.assertFalse(FileManager.is_writting())
+        result1 = FileManager.get_csv(file_path)
+        self.assertListEqual([{Map.id: str(row[Map.id]), Map.value: str(row[Map.value])} for row in rows], result1)
+        new_stats = FileManager.get_write_stats()
+        self.assertEqual(n_row, new_stats.get(Map.received) - stats.get(Map.received))
+        self.assertGreater(new_stats.get(Map.flush), stats.get(Map.flush))
+        self.assertEqual(0, new_stats.get(Map.size))
+        # Overwrite after appends
+        FileManager.write_csv(file_path, fields, rows[-2:], overwrite=False)
+        FileManager.write_csv(file_path, fields, rows[:2], overwrite=True)
+        FileManager.write_csv(file_path, fields, rows[2:3], overwrite=False)
+        self.assertTrue(FileManager.flush(fsync=True, timeout=10))
+        result2 = FileManager.get_csv(file_path)
+        self.assertListEqual([str(i) for i in range(3)], [row[Map.id] for row in result2])
+        # Append text
+        [FileManager.write(text_path, f'line_{i}', overwrite=False, make_dir=True) for i in range(3)]
+        FileManager.flush(timeout=10)
+        self.assertEqual('line_0\nline_1\nline_2\n', FileManager.read(text_path))
+        # A removed file is created again
+        FileManager.remove_file(file_path)
+        FileManager.write_csv(file_path, fields, rows[:1], overwrite=False)
+        FileManager.flush(timeout=10)
+        self.assertEqual(1, len(FileManager.get_csv(file_path)))
+        # End
+        FileManager.close(timeout=10)
+        self.assertEqual(0, FileManager.get_write_stats().get(Map.file))
+        FileManager.remove_file(file_path)
+        FileManager.remove_file(text_path)
+        FileManager.remove_directory(dir_path)
+
+    def test_write_errors(self) -> None:
+        class FailingFile:
+            def __init__(self, file) -> None:
+                self.file = file
+
+            def __getattr__(self, name: str):
+                return getattr(self.file, name)
+
+            def flush(self) -> None:
+                raise OSError(28, 'No space left on device')
+
+        class_name = self.__class__.__name__
+        dir_path = f'{class_name}/'
+        text_path = f'{dir_path}{class_name}_test_write_errors.txt'
+        FileManager.write(text_path, 'line_0', overwrite=False, make_dir=True)
+        self.assertTrue(FileManager.flush(timeout=10))
+        # A file that can't be flushed don't stop the writer thread
+        with FileManager._CONDITION_WRITE:
+            write_file = FileManager._get_write_files()[text_path]
+            write_file[0] = FailingFile(write_file[0])
+        FileManager.write(text_path, 'line_1', overwrite=False)
+        self.assertTrue(FileManager.flush(timeout=10))
+        self.assertIsNotNone(FileManager._THREAD_WRITE)
+        # Waiters are released when the writer thread dies
+        coalesce_writes = FileManager._coalesce_writes
+        try:
+            FileManager._coalesce_writes = classmethod(lambda cls, writes: 1/0)
+            FileManager.write(text_path, 'line_2', overwrite=False)
+            starttime = time.time()
+            self.assertFalse(FileManager.flush())
+            self.assertLess(time.time() - starttime, 10)
+        finally:
+            FileManager._coalesce_writes = coalesce_writes
+        # Next writes start a new writer thread
+        FileManager.write(text_path, 'line_3', overwrite=False)
+        self.assertTrue(FileManager.flush(timeout=10))
+        self.assertTrue(FileManager.read(text_path).endswith('line_3\n'))
+        FileManager.close(timeout=10)
+        FileManager.remove_file(text_path)
+        FileManager.remove_directory(dir_path)
+
     def test_exist_file(self) -> None:
         class_name = self.__class__.__name__
         dir_path = f'{class_name}/'
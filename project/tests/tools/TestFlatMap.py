@@ -0,0 +1,87 @@
+import unittest
+
+from model.tools.FlatMap import FlatMap
+from model.tools.Map import Map
+from model.tools.MyJson import MyJson
+from model.tools.Pair import Pair
+
+
+class TestFlatMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.nested = {
+            'key1': 'val1',
+            'key2': {'key1': 'val2', 'key3': {'key4': 'val3'}},
+            'key3': {}
+        }
+        self.mp1 = FlatMap(self.nested)
+
+    def test_same_as_map(self) -> None:
+        mp1 = self.mp1
+        mp2 = Map(self.nested)
+        self.assertIsInstance(mp1, Map)
+        self.assertDictEqual(mp2.get_map(), mp1.get_map())
+        self.assertListEqual(mp2.get_keys(), list(mp1.get_keys()))
+        for keys in [('key1',), ('key2', 'key1'), ('key2', 'key3', 'key4'), ('key2', 'key3'), ('key2',), ('key3',), ('key4',), ('key1', 'key2')]:
+            self.assertEqual(mp2.get(*keys), mp1.get(*keys))
+        with self.assertRaises(ValueError):
+            mp1.get()
+        with self.assertRaises(ValueError):
+            mp1.put('val')
+
+    def test_put(self) -> None:
+        mp1 = self.mp1
+        mp2 = Map(self.nested)
+        # Update, replace a value by deeper values and deeper values by a value
+        for val, keys in [('val4', ('key2', 'key1')), ('val5', ('key1', 'key2')), ('val6', ('key2',)), ('val7', ('key5', 'key6'))]:
+            mp1.put(val, *keys)
+            mp2.put(val, *keys)
+            self.assertDictEqual(mp2.get_map(), mp1.get_map())
+            self.assertListEqual(mp2.get_keys(), list(mp1.get_keys()))
+        self.assertIsNone(mp1.get('key2', 'key3', 'key4'))
+
+    def test_remove(self) -> None:
+        mp1 = self.mp1
+        mp1.remove('key2', 'key3')
+        self.assertDictEqual({'key1': 'val2'}, mp1.get('key2'))
+        mp1.remove('key2', 'key1')
+        self.assertIsNone(mp1.get('key2'))
+        self.assertListEqual(['key1', 'key3'], list(mp1.get_keys()))
+        mp1.remove('unknown')
+        self.assertListEqual(['key1', 'key3'], list(mp1.get_keys()))
+
+    def test_get_keys(self) -> None:
+        mp1 = self.mp1
+        keys = mp1.get_keys()
+        mp1.put('val4', 'key0')
+        # Keys are a view
+        self.assertListEqual(['key1', 'key2', 'key3', 'key0'], list(keys))
+        mp1.sort()
+        self.assertListEqual(['key0', 'key1', 'key2', 'key3'], list(mp1.get_keys()))
+        self.assertListEqual(['key0', 'key1', 'key2', 'key3'], list(mp1.get_map().keys()))
+
+    def test_snapshot(self) -> None:
+        mp1 = self.mp1
+        snapshot = mp1.snapshot()
+        self.assertDictEqual(mp1.get_map(), snapshot.get_map())
+        # Copied on write
+        snapshot.put('val4', 'key2', 'key1')
+        snapshot.remove('key1')
+        self.assertEqual('val2', mp1.get('key2', 'key1'))
+        self.assertEqual('val1', mp1.get('key1'))
+        self.assertEqual('val4', snapshot.get('key2', 'key1'))
+        mp1.put('val5', 'key5')
+        self.assertIsNone(snapshot.get('key5'))
+        self.assertListEqual(['key2', 'key3'], list(snapshot.get_keys()))
+
+    def test_json_encode_decode(self) -> None:
+        mp1 = self.mp1
+        mp1.put('val4', Pair('BTC/USDT'), 60)
+        mp1_decoded = MyJson.json_decode(mp1.json_encode())
+        self.assertIsInstance(mp1_decoded, FlatMap)
+        self.assertEqual(mp1.get_id(), mp1_decoded.get_id())
+        self.assertDictEqual(mp1.get_map(), mp1_decoded.get_map())
+        self.assertEqual('val4', mp1_decoded.get(Pair('BTC/USDT'), 60))
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from model.tools.FileManager import FileManager
+from model.tools.HistoryStore import HistoryStore
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self) -> None:
+        project_dir = FileManager.get_project_directory()
+        self.tmp_dir = tempfile.TemporaryDirectory(dir=project_dir)
+        dir_path = self.tmp_dir.name.replace(project_dir, '') + '/'
+        self.source_path = dir_path + '60.csv'
+        self.abs_source_path = project_dir + self.source_path
+        self.history = np.array([[i * 60000, 1, 2, 0.5, 1 + i, 10, i * 60000 + 59999] for i in range(5)], dtype=np.float64)
+        self.write_csv(self.history)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def write_csv(self, history: np.ndarray) -> None:
+        history_pd = pd.DataFrame(history, columns=[str(i) for i in range(history.shape[1])])
+        history_pd.to_csv(self.abs_source_path, index=False)
+
+    def test_data_path(self) -> None:
+        self.assertEqual('a/b/60.npy', HistoryStore.data_path('a/b/60.csv'))
+        self.assertEqual('a/b/60.json', HistoryStore.header_path('a/b/60.csv'))
+        with self.assertRaises(ValueError):
+            HistoryStore.data_path('a/b/60.txt')
+
+    def test_convert(self) -> None:
+        clean = lambda history: history[1:]
+        history = HistoryStore.convert(self.source_path, clean)
+        np.testing.assert_array_equal(self.history[1:], history)
+        self.assertIsInstance(history, np.memmap)
+        self.assertFalse(history.flags.writeable)
+        project_dir = FileManager.get_project_directory()
+        self.assertTrue(os.path.isfile(project_dir + HistoryStore.data_path(self.source_path)))
+        self.assertTrue(os.path.isfile(project_dir + HistoryStore.header_path(self.source_path)))
+
+    def test_load(self) -> None:
+        n_clean = []
+        def clean(history: np.ndarray) -> np.ndarray:
+            n_clean.append(1)
+            return history
+        # Converted on first load
+        history = HistoryStore.load(self.source_path, clean)
+        np.testing.assert_array_equal(self.history, history)
+        self.assertEqual(1, len(n_clean))
+        # Loaded without conversion
+        history = HistoryStore.load(self.source_path, clean, validate=True)
+        np.testing.assert_array_equal(self.history, history)
+        self.assertEqual(1, len(n_clean))
+        # Converted again when the source changed
+        time.sleep(0.01)
+        new_history = self.history.copy()
+        new_history[-1, 4] = 100
+        self.write_csv(new_history)
+        history = HistoryStore.load(self.source_path, clean)
+        np.testing.assert_array_equal(new_history, history)
+        self.assertEqual(2, len(n_clean))
+        # Converted again when the binary history is corrupted
+        abs_data_path = FileManager.get_project_directory() + HistoryStore.data_path(self.source_path)
+        corrupted = np.load(abs_data_path)
+        corrupted[0, 4] = -1
+        np.save(abs_data_path, corrupted)
+        history = HistoryStore.load(self.source_path, clean, validate=True)
+        np.testing.assert_array_equal(new_history, history)
+        self.assertEqual(3, len(n_clean))
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+
+from config.Config import Config
+from model.API.brokers.Binance.BinanceMarketPrice import BinanceMarketPrice
+from model.tools.IndicatorCache import IndicatorCache
+from model.tools.Map import Map
+from model.tools.MarketPrice import MarketPrice
+from model.tools.Pair import Pair
+
+
+class TestIndicatorCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.init_stage = Config.get(Config.STAGE_MODE)
+        Config.update(Config.STAGE_MODE, Config.STAGE_1)
+        self.init_max_size = IndicatorCache.get_max_size()
+        IndicatorCache.reset()
+        self.pair = Pair('BTC/USDT')
+        random = np.random.default_rng(7)
+        n_row = 100
+        closes = list(100 + np.cumsum(random.normal(0, 1, n_row)))
+        self.mkt = [[(1600000000 + i * 60) * 1000, '0', closes[i] + 1, closes[i] - 1, closes[i]] for i in range(n_row)]
+
+    def tearDown(self) -> None:
+        Config.update(Config.STAGE_MODE, self.init_stage) if self.init_stage is not None else None
+        IndicatorCache.set_max_size(self.init_max_size)
+        IndicatorCache.reset()
+
+    def test_get_or_compute(self) -> None:
+        key = IndicatorCache.generate_key('Binance', self.pair, 60, 1, Map.rsi, {'nb_prd': 14})
+        result = IndicatorCache.get_or_compute(key, lambda: [1.0, 2.0])
+        self.assertListEqual([1.0, 2.0], result)
+        # Cached values can't be modified from outside
+        result.reverse()
+        result = IndicatorCache.get_or_compute(key, lambda: [3.0, 4.0])
+        self.assertListEqual([1.0, 2.0], result)
+        # Multi-output indicators
+        key = IndicatorCache.generate_key('Binance', self.pair, 60, 1, Map.macd, {})
+        IndicatorCache.get_or_compute(key, lambda: Map({Map.macd: [1.0], Map.signal: [2.0]}))
+        result = IndicatorCache.get(key)
+        self.assertIsInstance(result, Map)
+        self.assertListEqual([2.0], result.get(Map.signal))
+        stats = IndicatorCache.get_stats()
+        self.assertEqual(2, stats.get(Map.hit))
+        self.assertEqual(2, stats.get(Map.miss))
+        self.assertEqual(2, stats.get(Map.size))
+
+    def test_evict(self) -> None:
+        IndicatorCache.set_max_size(2)
+        keys = [IndicatorCache.generate_key('Binance', self.pair, 60, i, Map.ema, {}) for i in range(3)]
+        IndicatorCache.put(keys[0], [0.0])
+        IndicatorCache.put(keys[1], [1.0])
+        IndicatorCache.get(keys[0])
+        IndicatorCache.put(keys[2], [2.0])
+        # The least recently used is dropped
+        self.assertIsNone(IndicatorCache.get(keys[1]))
+        self.assertListEqual([0.0], IndicatorCache.get(keys[0]))
+        stats = IndicatorCache.get_stats()
+        self.assertEqual(1, stats.get(Map.eviction))
+        self.assertEqual(2, stats.get(Map.size))
+        with self.assertRaises(ValueError):
+            IndicatorCache.set_max_size(0)
+
+    def test_marketprice_cache_indicator(self) -> None:
+        exp = BinanceMarketPrice(self.mkt, '1m', self.pair).get_rsis()
+        self.assertEqual(1, IndicatorCache.get_stats().get(Map.miss))
+        # An other MarketPrice of the same history
+        result = BinanceMarketPrice(self.mkt, '1m', self.pair).get_rsis()
+        np.testing.assert_allclose(exp, result)
+        self.assertEqual(1, IndicatorCache.get_stats().get(Map.hit))
+        # Same last open time but the open kline is revised
+        mkt = [row.copy() for row in self.mkt]
+        mkt[-1][4] = mkt[-1][4] + 1
+        result = BinanceMarketPrice(mkt, '1m', self.pair).get_rsis()
+        self.assertEqual(2, IndicatorCache.get_stats().get(Map.miss))
+        closes = [row[4] for row in mkt]
+        exp = MarketPrice.rsis(14, closes)
+        exp.reverse()
+        np.testing.assert_allclose(exp, result)
+        # Other params
+        BinanceMarketPrice(self.mkt, '1m', self.pair).get_ema(5)
+        self.assertEqual(3, IndicatorCache.get_stats().get(Map.miss))
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -0,0 +1,169 @@
+import unittest
+
+import numpy as np
+
+from config.Config import Config
+from model.API.brokers.Binance.BinanceMarketPrice import BinanceMarketPrice
+from model.tools.IndicatorCache import IndicatorCache
+from model.tools.IndicatorEngine import IndicatorEngine
+from model.tools.Map import Map
+from model.tools.MarketPrice import MarketPrice
+from model.tools.Pair import Pair
+
+
+class TestIndicatorEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.init_stage = Config.get(Config.STAGE_MODE)
+        Config.update(Config.STAGE_MODE, Config.STAGE_1)
+        IndicatorEngine.reset_engines()
+        IndicatorCache.reset()
+        self.pair = Pair('BTC/USDT')
+        self.period = 60
+        random = np.random.default_rng(7)
+        n_row = 700
+        self.closes = list(100 + np.cumsum(random.normal(0, 1, n_row)))
+        self.highs = [close + abs(v) for close, v in zip(self.closes, random.normal(0, 0.5, n_row))]
+        self.lows = [close - abs(v) for close, v in zip(self.closes, random.normal(0, 0.5, n_row))]
+        self.times = [1600000000 + i * self.period for i in range(n_row)]
+        self.params = {
+            Map.rsi: {'nb_prd': 14},
+            Map.ema: {'n_period': 10},
+            Map.macd: {'slow': 26, 'fast': 12, 'signal': 9},
+            Map.keltner: {'window': 20, 'multiple': 2, 'original_version': False},
+            Map.bollinger: {'window': 20, 'window_dev': 2},
+            Map.psar: {'step': 0.02, 'max_step': 0.2},
+            Map.tsi: {'nb_prd_slow': 25, 'nb_prd_fast': 13, 'use_nan': False},
+            Map.roc: {'window': 12},
+            Map.supertrend: {'nb_prd': 10, 'coef': 3}
+        }
+
+    def tearDown(self) -> None:
+        Config.update(Config.STAGE_MODE, self.init_stage) if self.init_stage is not None else None
+        IndicatorEngine.reset_engines()
+        IndicatorCache.reset()
+
+    def _library(self, indicator: str, highs: list, lows: list, closes: list):
+        params = self.params[indicator]
+        if indicator == Map.rsi:
+            return MarketPrice.rsis(params['nb_prd'], closes)
+        if indicator == Map.ema:
+            return MarketPrice.ema(closes, params['n_period'], False)
+        if indicator == Map.macd:
+            return MarketPrice.macd(closes, params['slow'], params['fast'], params['signal'])
+        if indicator == Map.keltner:
+            return MarketPrice.keltnerchannel(highs, lows, closes, params['window'], params['multiple'], params['original_version'])
+        if indicator == Map.bollinger:
+            return MarketPrice.bollingerbands(closes, params['window'], params['window_dev'])
+        if indicator == Map.psar:
+            return MarketPrice.psar(highs, lows, closes, params['step'], params['max_step'])
+        if indicator == Map.tsi:
+            return MarketPrice.tsis(params['nb_prd_slow'], params['nb_prd_fast'], params['use_nan'], closes)
+        if indicator == Map.roc:
+            return MarketPrice.roc(closes, params['window'])
+        if indicator == Map.supertrend:
+            return MarketPrice.super_trend(params['nb_prd'], params['coef'], closes, highs, lows)
+
+    def assertIndicatorEqual(self, exp, result, begin: int = 0, rtol: float = 1e-7, atol: float = 1e-9) -> None:
+        if isinstance(exp, Map):
+            for key in exp.get_keys():
+                self.assertIndicatorEqual(exp.get(key), result.get(key), begin, rtol, atol)
+            return
+        self.assertEqual(len(exp), len(result))
+        np.testing.assert_allclose(np.array(result[begin:], dtype=float), np.array(exp[begin:], dtype=float), rtol=rtol, atol=atol, equal_nan=True)
+
+    def test_update(self) -> None:
+        # Stream the whole history kline by kline
+        for indicator in IndicatorEngine.INDICATORS:
+            engine = IndicatorEngine(indicator, self.params[indicator])
+            for i in range(len(self.times)):
+                engine.update(self.times[i], self.highs[i], self.lows[i], self.closes[i])
+            result = IndicatorEngine.stream(self.pair, self.period, indicator, self.params[indicator], self.times, self.highs, self.lows, self.closes)
+            exp = self._library(indicator, self.highs, self.lows, self.closes)
+            self.assertIndicatorEqual(exp, result)
+            outputs = engine.get_outputs()
+            self.assertEqual(len(self.times), len(outputs))
+        # Revise the open kline
+        engine = IndicatorEngine(Map.rsi, self.params[Map.rsi])
+        [engine.update(self.times[i], self.highs[i], self.lows[i], self.closes[i]) for i in range(100)]
+        engine.update(self.times[100], self.highs[100], self.lows[100], 1)
+        engine.update(self.times[100], self.highs[100], self.lows[100], 500)
+        result = engine.update(self.times[100], self.highs[100], self.lows[100], self.closes[100])
+        exp = MarketPrice.rsis(14, self.closes[:101])[-1]
+        self.assertAlmostEqual(exp, result)
+        self.assertEqual(101, len(engine.get_outputs()))
+        # Kline older than the last one
+        with self.assertRaises(ValueError):
+            engine.update(self.times[50], self.highs[50], self.lows[50], self.closes[50])
+
+    def test_stream(self) -> None:
+        # Sliding window of histories with the open kline revised on each call
+        n_window = 500
+        n_warm_up = 350
+        for indicator in IndicatorEngine.INDICATORS:
+            params = self.params[indicator]
+            for end in range(n_window, len(self.times), 7):
+                begin = end - n_window
+                # Rows in the library's warm-up differ once the window slided
+                begin_equal = 0 if begin == 0 else n_warm_up
+                times = self.times[begin:end]
+                highs = self.highs[begin:end]
+                lows = self.lows[begin:end]
+                closes = [*self.closes[begin:end-1], (self.closes[end-1] + self.closes[end-2]) / 2]
+                result = IndicatorEngine.stream(self.pair, self.period, indicator, params, times, highs, lows, closes)
+                self.assertIndicatorEqual(self._library(indicator, highs, lows, closes), result, begin_equal)
+                closes = self.closes[begin:end]
+                result = IndicatorEngine.stream(self.pair, self.period, indicator, params, times, highs, lows, closes)
+                self.assertIndicatorEqual(self._library(indicator, highs, lows, closes), result, begin_equal)
+            # Rows are kept till they drop off the longest history
+            engine = IndicatorEngine.get_engine(self.pair, self.period, indicator, params)
+            self.assertListEqual(times, engine.get_times())
+            self.assertEqual(times[0], engine.get_first_time())
+            # Shorter history ending on the last kline gets the last rows streamed
+            exp = Map({key: values[-100:] for key, values in result.get_map().items()}) if isinstance(result, Map) else result[-100:]
+            result = IndicatorEngine.stream(self.pair, self.period, indicator, params, times[-100:], highs[-100:], lows[-100:], closes[-100:])
+            self.assertIndicatorEqual(exp, result, rtol=0, atol=0)
+            self.assertEqual(n_window, len(engine.get_times()))
+        # Growing history from the same first kline
+        IndicatorEngine.reset_engines()
+        for indicator in IndicatorEngine.INDICATORS:
+            params = self.params[indicator]
+            for end in range(50, len(self.times), 13):
+                times, highs, lows, closes = self.times[:end], self.highs[:end], self.lows[:end], self.closes[:end]
+                result = IndicatorEngine.stream(self.pair, self.period, indicator, params, times, highs, lows, closes)
+                self.assertIndicatorEqual(self._library(indicator, highs, lows, closes), result)
+            engine = IndicatorEngine.get_engine(self.pair, self.period, indicator, params)
+            self.assertEqual(self.times[end-1], engine.get_last_time())
+        # History starting before the first kline streamed is streamed from its start
+        IndicatorEngine.reset_engines()
+        params = self.params[Map.ema]
+        IndicatorEngine.stream(self.pair, self.period, Map.ema, params, self.times[100:], self.highs[100:], self.lows[100:], self.closes[100:])
+        result = IndicatorEngine.stream(self.pair, self.period, Map.ema, params, self.times, self.highs, self.lows, self.closes)
+        self.assertIndicatorEqual(self._library(Map.ema, self.highs, self.lows, self.closes), result)
+        # History older than the last kline streamed
+        result = IndicatorEngine.stream(self.pair, self.period, Map.ema, params, self.times[:50], self.highs[:50], self.lows[:50], self.closes[:50])
+        self.assertIsNone(result)
+        # Least recently used engines are deleted
+        IndicatorEngine.reset_engines()
+        _MAX_ENGINES = IndicatorEngine._MAX_ENGINES
+        IndicatorEngine._MAX_ENGINES = 3
+        try:
+            engines = [IndicatorEngine.get_engine(self.pair, period, Map.ema, params) for period in range(4)]
+            self.assertIsNot(engines[0], IndicatorEngine.get_engine(self.pair, 0, Map.ema, params))
+            self.assertIs(engines[3], IndicatorEngine.get_engine(self.pair, 3, Map.ema, params))
+        finally:
+            IndicatorEngine._MAX_ENGINES = _MAX_ENGINES
+
+    def test_marketprice_stream_indicator(self) -> None:
+        mkt = [[self.times[i]*1000, '0', self.highs[i], self.lows[i], self.closes[i]] for i in range(len(self.times))]
+        exp = BinanceMarketPrice(mkt, '1m', self.pair).get_macd()
+        Config.update(Config.STAGE_MODE, Config.STAGE_2)
+        IndicatorCache.reset()
+        marketprice = BinanceMarketPrice(mkt, '1m', self.pair)
+        result = marketprice.get_macd()
+        self.assertIndicatorEqual(exp, result)
+        engine = IndicatorEngine.get_engine(self.pair, self.period, Map.macd, {'slow': 26, 'fast': 12, 'signal': 9})
+        self.assertEqual(self.times[-1] * 1000, engine.get_last_time())
+
+
+if __name__ == '__main__':
+    unittest.main
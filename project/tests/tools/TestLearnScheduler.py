@@ -0,0 +1,85 @@
+import os
+import unittest
+
+from model.tools.FileManager import FileManager
+from model.tools.LearnScheduler import LearnScheduler
+from model.tools.Map import Map
+
+
+class TestLearnScheduler(unittest.TestCase):
+    CHECKPOINT_PATH = 'tests/datas/tools/TestLearnScheduler/checkpoint.csv'
+
+    def setUp(self) -> None:
+        self.tearDown()
+
+    def tearDown(self) -> None:
+        FileManager.remove_file(self.CHECKPOINT_PATH) if FileManager.exist_file(self.CHECKPOINT_PATH) else None
+
+    @staticmethod
+    def task(value: int) -> dict:
+        if value < 0:
+            raise ValueError(f"Negative value '{value}'")
+        return {Map.value: value * 2, Map.id: os.getpid(), Map.thread: os.environ.get('TF_NUM_INTRAOP_THREADS')}
+
+    def test_run(self) -> None:
+        task_params = [{Map.value: i} for i in range(6)]
+        names = [f"task_{i}" for i in range(6)]
+        sequential = LearnScheduler.run(self.task, task_params, names, n_process=1, output=False)
+        parallel = LearnScheduler.run(self.task, task_params, names, n_process=3, n_thread=2, output=False)
+        for results in [sequential, parallel]:
+            # Same order as tasks
+            self.assertListEqual(list(range(6)), [result.get(Map.index) for result in results])
+            self.assertListEqual(names, [result.get(Map.name) for result in results])
+            self.assertListEqual([i * 2 for i in range(6)], [result.get(Map.result)[Map.value] for result in results])
+            [self.assertIsNone(result.get(Map.error)) for result in results]
+            [self.assertGreater(result.get(Map.time), 0) for result in results]
+        self.assertSetEqual({os.getpid()}, {result.get(Map.result)[Map.id] for result in sequential})
+        self.assertNotIn(os.getpid(), {result.get(Map.result)[Map.id] for result in parallel})
+        # Threads are limited in workers
+        self.assertSetEqual({'2'}, {result.get(Map.result)[Map.thread] for result in parallel})
+        with self.assertRaises(ValueError):
+            LearnScheduler.run(self.task, task_params, names[:1], output=False)
+
+    def test_run_checkpoint(self) -> None:
+        checkpoint_path = self.CHECKPOINT_PATH
+        names = [f"task_{i}" for i in range(4)]
+        task_params = [{Map.value: i if i != 2 else -1} for i in range(4)]
+        results = LearnScheduler.run(self.task, task_params, names, n_process=2, checkpoint_path=checkpoint_path, output=False)
+        self.assertIn('ValueError', results[2].get(Map.error))
+        # Only tasks that succeed are recorded
+        checkpoint = LearnScheduler.get_checkpoint(checkpoint_path)
+        self.assertListEqual(['task_0', 'task_1', 'task_3'], sorted(checkpoint.get_keys()))
+        self.assertEqual(results[0].get(Map.time), checkpoint.get('task_0'))
+        # Resume from the checkpoint
+        task_params[2] = {Map.value: 2}
+        results = LearnScheduler.run(self.task, task_params, names, n_process=2, checkpoint_path=checkpoint_path, output=False)
+        self.assertListEqual([2], [result.get(Map.index) for result in results])
+        self.assertEqual(4, results[0].get(Map.result)[Map.value])
+        # Checkpoint is removed once all tasks succeeded
+        self.assertFalse(FileManager.exist_file(checkpoint_path))
+        # A run that don't resume ignores the checkpoint of a previous run
+        task_params[2] = {Map.value: -1}
+        LearnScheduler.run(self.task, task_params, names, n_process=1, checkpoint_path=checkpoint_path, output=False)
+        self.assertTrue(FileManager.exist_file(checkpoint_path))
+        task_params[2] = {Map.value: 2}
+        results = LearnScheduler.run(self.task, task_params, names, n_process=1, checkpoint_path=checkpoint_path, resume=False, output=False)
+        self.assertListEqual(list(range(4)), [result.get(Map.index) for result in results])
+        self.assertFalse(FileManager.exist_file(checkpoint_path))
+
+    def test_get_n_process(self) -> None:
+        self.assertEqual(3, LearnScheduler.get_n_process(8, 3))
+        self.assertEqual(2, LearnScheduler.get_n_process(2, 3))
+        with self.assertRaises(ValueError):
+            LearnScheduler.get_n_process(0)
+
+    def test_get_n_thread(self) -> None:
+        n_cpu = os.cpu_count() or 1
+        self.assertEqual(max(1, n_cpu // 2), LearnScheduler.get_n_thread(2))
+        self.assertEqual(1, LearnScheduler.get_n_thread(n_cpu * 2))
+        self.assertEqual(3, LearnScheduler.get_n_thread(2, 3))
+        with self.assertRaises(ValueError):
+            LearnScheduler.get_n_thread(2, 0)
+
+
+if __name__ == '__main__':
+    unittest.main
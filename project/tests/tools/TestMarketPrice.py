@@ -1,5 +1,7 @@
+import time
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from config.Config import Config
@@ -857,6 +859,77 @@ class TestMarketPrice(unittest.TestCase, MarketPrice):
         self.assertEqual(exp3, result3)
         self.broker_switch(on=False)
 
+    def test_assemble_pages(self) -> None:
+        period = 60
+        max_n_period = 4
+        starttime, endtime = MarketPrice._download_range(period, endtime=1000*period, starttime=990*period)
+        page_endtimes = MarketPrice._page_endtimes(period, starttime, endtime, max_n_period)
+        self.assertListEqual([1000*period, 996*period, 992*period], page_endtimes)
+        def page(page_endtime: int, n_row: int) -> np.ndarray:
+            open_times = np.arange(page_endtime - (n_row - 1) * period, page_endtime + period, period) * 1000
+            return np.array([[open_time, 1, 2, 0, 1, page_endtime] for open_time in open_times], dtype=np.float64)
+        pages = [page(page_endtime, max_n_period) for page_endtime in page_endtimes]
+        history = MarketPrice._assemble_pages(pages, max_n_period)
+        self.assertTupleEqual((12, 6), history.shape)
+        self.assertListEqual(sorted(history[:,0].tolist()), history[:,0].tolist())
+        marketprices = MarketPrice._clean_pages(history, period, starttime, endtime)
+        self.assertListEqual(list(range(990*60000, 1000*60000 + 1, 60000)), marketprices.iloc[:,0].astype(int).tolist())
+        # Duplicated rows are taken from the newest page
+        pages = [page(1000*period, 4), page(997*period, 4)]
+        marketprices = MarketPrice._clean_pages(MarketPrice._assemble_pages(pages, max_n_period), period, 993*period, 1000*period)
+        self.assertEqual(1000*period, marketprices[marketprices.iloc[:,0] == 997*60000].iloc[0,5])
+        # Pages older than the first incomplete page are ignored
+        pages = [page(1000*period, 4), page(996*period, 2), ValueError("Before market's start")]
+        history = MarketPrice._assemble_pages(pages, max_n_period)
+        self.assertEqual(6, history.shape[0])
+        with self.assertRaises(ValueError):
+            MarketPrice._assemble_pages([page(1000*period, 4), ValueError("Network error")], max_n_period)
+
+    def test_prefetch(self) -> None:
+        latency = 0.05
+        class FakeRequest:
+            def __init__(self, params: Map) -> None:
+                self.params = params
+                self.marketprice = None
+
+            def get_market_price(self) -> MarketPrice:
+                return self.marketprice
+
+        class FakeBroker:
+            def __init__(self) -> None:
+                self.requests = []
+
+            def generate_broker_request(self, broker_class: str, rq: str, params: Map) -> FakeRequest:
+                return FakeRequest(params)
+
+            def request(self, bkr_rq: FakeRequest) -> None:
+                time.sleep(latency)
+                pair = bkr_rq.params.get(Map.pair)
+                period = bkr_rq.params.get(Map.period)
+                self.requests.append((pair.__str__(), period))
+                if pair.__str__() == 'doge/usdt':
+                    raise ValueError("Unknown pair")
+                bkr_rq.marketprice = (pair.__str__(), period, bkr_rq.params.get(Map.number))
+
+        Config.update(Config.STAGE_MODE, Config.STAGE_2)
+        broker = FakeBroker()
+        pairs = [Pair('BTC/USDT'), Pair('ETH/USDT'), Pair('DOGE/USDT')]
+        periods = [60, 60*5]
+        requests = [(pair, period, 100) for pair in pairs for period in periods]
+        marketprices = Map()
+        marketprices.put('cached', pairs[0], 60)
+        starttime = time.time()
+        marketprices = MarketPrice.prefetch(broker, [*requests, *requests], marketprices)
+        delta_time = time.time() - starttime
+        # Each MarketPrice is requested once and the ones already requested are not requested again
+        self.assertEqual(len(requests) - 1, len(broker.requests))
+        self.assertEqual('cached', marketprices.get(pairs[0], 60))
+        self.assertTupleEqual(('eth/usdt', 60*5, 100), marketprices.get(pairs[1], 60*5))
+        # MarketPrice that failed are missing
+        self.assertIsNone(marketprices.get(pairs[2], 60))
+        # MarketPrice are requested concurrently
+        self.assertLess(delta_time, latency * len(broker.requests))
+
     def test_save_marketprices(self) -> None:
         broker = self.broker_switch(on=True, stage=Config.STAGE_3)
         pairs = [Pair('BTC/USDT'), Pair('DOGE/USDT')]
@@ -1045,6 +1118,55 @@ class TestMarketPrice(unittest.TestCase, MarketPrice):
         self.assertEqual(pair, marketprice.get_pair())
         self.broker_switch(on=False)
 
+    def test_compute_many(self) -> None:
+        random = np.random.default_rng(3)
+        n_pair = 4
+        n_period = 150
+        closes = 100 + np.cumsum(random.normal(0, 1, (n_pair, n_period)), axis=1)
+        highs = closes + np.abs(random.normal(0, 0.5, (n_pair, n_period)))
+        lows = closes - np.abs(random.normal(0, 0.5, (n_pair, n_period)))
+        params = {
+            Map.rsi: {'nb_prd': 14},
+            Map.ema: {'n_period': 10},
+            Map.macd: {'slow': 26, 'fast': 12, 'signal': 9},
+            Map.keltner: {'window': 20, 'multiple': 2, 'original_version': False},
+            Map.bollinger: {'window': 20, 'window_dev': 2},
+            Map.roc: {'window': 12},
+            Map.supertrend: {'nb_prd': 10, 'coef': 3}
+        }
+        for indicator in MarketPrice.COMPUTE_MANY_INDICATORS:
+            result = MarketPrice.compute_many(indicator, closes, highs, lows, **params[indicator])
+            for i in range(n_pair):
+                closes_i, highs_i, lows_i = list(closes[i]), list(highs[i]), list(lows[i])
+                if indicator == Map.rsi:
+                    exp = MarketPrice.rsis(14, closes_i)
+                elif indicator == Map.ema:
+                    exp = MarketPrice.ema(closes_i, 10, False)
+                elif indicator == Map.macd:
+                    exp = MarketPrice.macd(closes_i, 26, 12, 9)
+                elif indicator == Map.keltner:
+                    exp = MarketPrice.keltnerchannel(highs_i, lows_i, closes_i, 20, 2, False)
+                elif indicator == Map.bollinger:
+                    exp = MarketPrice.bollingerbands(closes_i, 20, 2)
+                elif indicator == Map.roc:
+                    exp = MarketPrice.roc(closes_i, 12)
+                else:
+                    exp = MarketPrice.super_trend(10, 3, closes_i, highs_i, lows_i)
+                if isinstance(exp, Map):
+                    for key in exp.get_keys():
+                        np.testing.assert_allclose(result.get(key)[i], exp.get(key), equal_nan=True)
+                else:
+                    np.testing.assert_allclose(result[i], exp, equal_nan=True)
+        # Default params
+        np.testing.assert_allclose(MarketPrice.compute_many(Map.rsi, closes)[0], MarketPrice.rsis(MarketPrice._NB_PRD_RSIS, list(closes[0])))
+        # Wrong inputs
+        with self.assertRaises(ValueError):
+            MarketPrice.compute_many(Map.psar, closes)
+        with self.assertRaises(ValueError):
+            MarketPrice.compute_many(Map.supertrend, closes)
+        with self.assertRaises(ValueError):
+            MarketPrice.compute_many(Map.rsi, closes[0])
+
 
 if __name__ == '__main__':
     unittest.main
@@ -0,0 +1,72 @@
+import threading
+import time
+import unittest
+
+from model.tools.Map import Map
+from model.tools.MessageQueue import MessageQueue
+
+
+class TestMessageQueue(unittest.TestCase):
+    def test_put_get(self) -> None:
+        queue = MessageQueue(10)
+        [queue.put(key, key * 10) for key in range(3)]
+        self.assertEqual(3, len(queue))
+        self.assertTupleEqual((0, 0), queue.get())
+        self.assertTupleEqual((1, 10), queue.get())
+        self.assertTupleEqual((2, 20), queue.get())
+        self.assertIsNone(queue.get(timeout=0.01))
+        stats = queue.get_stats()
+        self.assertEqual(3, stats.get(Map.received))
+        self.assertEqual(3, stats.get(Map.delivered))
+        self.assertEqual(0, stats.get(Map.size))
+        with self.assertRaises(ValueError):
+            MessageQueue(0)
+
+    def test_coalesce(self) -> None:
+        queue = MessageQueue(10)
+        queue.put('a', 1)
+        queue.put('b', 1)
+        queue.put('a', 2)
+        # The newer message keeps the place of the one it replaces
+        self.assertTupleEqual(('a', 2), queue.get())
+        self.assertTupleEqual(('b', 1), queue.get())
+        self.assertEqual(1, queue.get_stats().get(Map.coalesce))
+
+    def test_drop(self) -> None:
+        queue = MessageQueue(2, timeout=0)
+        [queue.put(key, key) for key in range(3)]
+        self.assertEqual(2, len(queue))
+        self.assertTupleEqual((1, 1), queue.get())
+        self.assertEqual(1, queue.get_stats().get(Map.drop))
+
+    def test_backpressure(self) -> None:
+        queue = MessageQueue(1)
+        queue.put(0, 0)
+        puts = []
+        producer = threading.Thread(target=lambda: puts.append(queue.put(1, 1)))
+        producer.start()
+        time.sleep(0.05)
+        # Producer waits for a free place
+        self.assertListEqual([], puts)
+        self.assertTupleEqual((0, 0), queue.get())
+        producer.join(1)
+        self.assertListEqual([True], puts)
+        self.assertTupleEqual((1, 1), queue.get())
+        self.assertEqual(0, queue.get_stats().get(Map.drop))
+
+    def test_close(self) -> None:
+        queue = MessageQueue(1)
+        queue.put(0, 0)
+        gets = []
+        consumer = threading.Thread(target=lambda: [gets.append(queue.get()) for _ in range(2)])
+        consumer.start()
+        consumer.join(0.05)
+        queue.close()
+        consumer.join(1)
+        self.assertFalse(consumer.is_alive())
+        self.assertListEqual([(0, 0), None], gets)
+        self.assertFalse(queue.put(1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -1,4 +1,8 @@
 import unittest
+
+import numpy as np
+import pandas as pd
+
 from model.tools.Map import Map
 
 from model.tools.MyJson import MyJson
@@ -29,14 +33,40 @@ class TestMyJson(unittest.TestCase):
 
     def test_copy(self) -> None:
         def test(obj: MyJson) -> None:
-            obj_dict = obj.__dict__.copy()
+            obj_dict = obj._json_encode_to_dict().copy()
             obj_copy = obj.copy()
             self.assertNotEqual(id(obj), id(obj_copy))
             self.assertEqual(obj, obj_copy)
-            self.assertDictEqual(obj_dict, obj_copy.__dict__)
+            self.assertDictEqual(obj_dict, obj_copy._json_encode_to_dict())
         test(self.price)
         test(self.map1)
 
+    def test_json_decode_iterables(self) -> None:
+        values = {
+            'str': 'v1',
+            7: [1, 2.5, None],
+            2.5: (Price(1, 'BNB'), 'v2'),
+            True: np.array([[1.5, 2], [3, 4]]),
+            False: pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}),
+            'map': Map({'k1': Price(3, 'USDT')})
+            }
+        map1 = Map(values)
+        json_str = map1.json_encode()
+        result = MyJson.json_decode(json_str).get_map()
+        self.assertListEqual(list(values.keys()), list(result.keys()))
+        self.assertListEqual([type(key) for key in values.keys()], [type(key) for key in result.keys()])
+        self.assertListEqual(values[7], result[7])
+        self.assertTupleEqual(values[2.5], result[2.5])
+        self.assertTrue(np.array_equal(values[True], result[True]))
+        self.assertTrue(values[False].equals(result[False]))
+        self.assertEqual(values['map'], result['map'])
+        # Decoded object is encoded as the original
+        self.assertEqual(json_str, MyJson.json_decode(json_str).json_encode())
+        # Copy don't share mutable attributes
+        map1_copy = map1.copy()
+        map1_copy.get(7).append(3)
+        self.assertListEqual([1, 2.5, None], map1.get(7))
+
     def test_generate_instance(self) -> None:
         prc = self.price
         json_str = prc.json_encode()
@@ -48,15 +78,15 @@ class TestMyJson(unittest.TestCase):
 
     def test__eq__(self) -> None:
         def test(obj1: object, obj2: object, obj3: object) -> None:
-            obj1_copy = obj1.__dict__.copy()
-            obj2_copy = obj2.__dict__.copy()
-            obj3_copy = obj3.__dict__.copy()
+            obj1_copy = obj1._json_encode_to_dict().copy()
+            obj2_copy = obj2._json_encode_to_dict().copy()
+            obj3_copy = obj3._json_encode_to_dict().copy()
             # Object with an attribut 'id'
             self.assertEqual(obj1, obj2)
             self.assertNotEqual(obj1, obj3)
-            self.assertDictEqual(obj1.__dict__, obj1_copy)
-            self.assertDictEqual(obj2.__dict__, obj2_copy)
-            self.assertDictEqual(obj3.__dict__, obj3_copy)
+            self.assertDictEqual(obj1._json_encode_to_dict(), obj1_copy)
+            self.assertDictEqual(obj2._json_encode_to_dict(), obj2_copy)
+            self.assertDictEqual(obj3._json_encode_to_dict(), obj3_copy)
         # Object with an attribut 'id'
         map1 = Map({'k1': 'v1'})
         map2 = Map({'k1': 'v1'})
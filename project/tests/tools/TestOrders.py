@@ -93,13 +93,13 @@ class TestOrders(unittest.TestCase, Orders):
         elif amount_obj is not None:
             exec_amount = amount_obj
             exec_qty = Price(exec_amount / exec_price, order.get_pair().get_left().get_symbol())
-        order._set_status(self.STATUS_COMPLETED)
         order._set_broker_id(_MF.new_code())
         order._set_execution_time(_MF.get_timestamp(_MF.TIME_MILLISEC))
         order._set_execution_price(exec_price)
         order._set_executed_quantity(exec_qty)
         order._set_executed_amount(exec_amount)
         order._set_fee(fee)
+        order._set_status(self.STATUS_COMPLETED)
 
     def test_sum_orders(self):
         # simple test
@@ -181,5 +181,87 @@ class TestOrders(unittest.TestCase, Orders):
         exec(test_exec)
 
 
+class TestOrdersSum(unittest.TestCase, Orders):
+    def setUp(self) -> None:
+        """
+        Market Orders set by amount don't need the exchange's infos (unlike quantity's fixing)
+        """
+        Config.update(Config.STAGE_MODE, Config.STAGE_1)
+        self.rsbl = "USDT"
+        self.pr = Pair("SNX", self.rsbl)
+        self.exec_prc0 = Price(20, self.rsbl)
+        self.exec_prc1 = Price(25, self.rsbl)
+        self.r_fake_fee = Price(Order.FAKE_FEE, self.rsbl)
+        buy_prms = Map({
+            Map.pair: self.pr,
+            Map.move: self.MOVE_BUY,
+            Map.amount: Price(100, self.rsbl)
+        })
+        sell_prms = Map({
+            Map.pair: self.pr,
+            Map.move: self.MOVE_SELL,
+            Map.amount: Price(100, self.rsbl)
+        })
+        self.odr0 = BinanceOrder(self.TYPE_MARKET, buy_prms)
+        self.odr1 = BinanceOrder(self.TYPE_MARKET, sell_prms)
+        self.odr2 = BinanceOrder(self.TYPE_MARKET, sell_prms)
+        self.odrs_obj = Orders()
+
+    def execute_order(self, order: Order, exec_price: Price, fee: Price) -> None:
+        exec_amount = order.get_amount()
+        exec_qty = Price(exec_amount / exec_price, order.get_pair().get_left().get_symbol())
+        order._set_broker_id(_MF.new_code())
+        order._set_execution_time(_MF.get_timestamp(_MF.TIME_MILLISEC))
+        order._set_execution_price(exec_price)
+        order._set_executed_quantity(exec_qty)
+        order._set_executed_amount(exec_amount)
+        order._set_fee(fee)
+        order._set_status(self.STATUS_COMPLETED)
+
+    def test_get_sum_has_position(self):
+        odrs = self.odrs_obj
+        self.assertFalse(odrs.has_position())
+        odrs.add_order(self.odr0)
+        odrs.add_order(self.odr1)
+        # Nothing completed
+        self.assertFalse(odrs.has_position())
+        self.assertEqual(Price(0, self.rsbl), odrs.get_sum().get(Map.right))
+        # Order completed after the sum are added
+        self.execute_order(self.odr0, self.exec_prc0, self.r_fake_fee)
+        self.assertTrue(odrs.has_position())
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+        # Order added after the sum are added once completed
+        odrs.add_order(self.odr2)
+        self.execute_order(self.odr2, self.exec_prc1, self.r_fake_fee)
+        self.assertFalse(odrs.has_position())
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+        # Order completed before the last completed don't change position
+        self.execute_order(self.odr1, self.exec_prc1, self.r_fake_fee)
+        self.assertFalse(odrs.has_position())
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+        # Explicit reset
+        odrs._reset()
+        self.assertFalse(odrs.has_position())
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+
+    def test_get_sum_pending_orders(self):
+        odrs = self.odrs_obj
+        odrs.add_order(self.odr0)
+        odrs.add_order(self.odr1)
+        odrs.add_order(self.odr2)
+        odrs.get_sum()
+        # Orders completed in any order are summed once
+        self.execute_order(self.odr2, self.exec_prc1, self.r_fake_fee)
+        self.assertEqual(self._sum_orders(Map({2: self.odr2})).get_map(), odrs.get_sum().get_map())
+        self.execute_order(self.odr0, self.exec_prc0, self.r_fake_fee)
+        odrs.get_sum()
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+        # The last completed Order set the position
+        self.assertFalse(odrs.has_position())
+        self.execute_order(self.odr1, self.exec_prc1, self.r_fake_fee)
+        self.assertFalse(odrs.has_position())
+        self.assertEqual(self._sum_orders(odrs._get_orders()).get_map(), odrs.get_sum().get_map())
+
+
 if __name__ == '__main__':
     unittest.main
@@ -14,14 +14,17 @@ class TestPair(unittest.TestCase, Pair):
 
     def test_constructor_with_one_param(self) -> None:
         pr = Pair(self.prsbl)
-        self.assertDictEqual(self.exp_lasset.__dict__, pr.get_left().__dict__)
-        self.assertDictEqual(self.exp_rasset.__dict__, pr.get_right().__dict__)
+        self.assertIs(self.exp_lasset, pr.get_left())
+        self.assertIs(self.exp_rasset, pr.get_right())
 
     def test_constructor_with_two_params(self) -> None:
         # Params are string
         pr = Pair(self.lsbl, self.rsbl)
-        self.assertDictEqual(self.exp_lasset.__dict__, pr.get_left().__dict__)
-        self.assertDictEqual(self.exp_rasset.__dict__, pr.get_right().__dict__)
+        self.assertIs(self.exp_lasset, pr.get_left())
+        self.assertIs(self.exp_rasset, pr.get_right())
+        # Pair are interned
+        self.assertIs(Pair(self.prsbl), pr)
+        self.assertIs(Pair(self.prsbl.lower()), pr)
         # Params are Asset
         left = self.exp_lasset
         right = self.exp_rasset
@@ -41,8 +44,12 @@ class TestPair(unittest.TestCase, Pair):
 
     def test_json_encode_decode(self) -> None:
         original_obj = self.pr
-        test_exec = self.get_executable_test_json_encode_decode()
-        exec(test_exec)
+        json_str = original_obj.json_encode()
+        decoded_obj = self.json_decode(json_str)
+        self.assertEqual(original_obj, decoded_obj)
+        # Pair are interned
+        self.assertIs(original_obj, decoded_obj)
+        self.assertEqual(json_str, decoded_obj.json_encode())
 
     def test__str__(self):
         exp = (self.lsbl + self._get_separator() + self.rsbl).lower()
@@ -139,7 +139,9 @@ class TestPredictor(unittest.TestCase, Predictor):
     
     def test_learn(self) -> None:
         pair = Pair('coti/usdt')
-        self._learn(pair)
+        period = self.get_learn_periods()[0]
+        scores = self._learn(pair, period)
+        self.assertListEqual([self.HIGH, self.LOW, self.CLOSE], list(scores.keys()))
 
     def test_model(self) -> None:
         n_feature = self.get_n_feature()
@@ -171,6 +173,44 @@ class TestPredictor(unittest.TestCase, Predictor):
         self.assertTupleEqual((n_row-n_feature, n_feature), xs.shape)
         self.assertTupleEqual((n_row-n_feature, 1), ys.shape)
         self.assertListEqual(ys_exp1, ys[:,0].tolist())
+        # Not enough prices
+        xs, ys = self.generate_dataset(prices[:n_feature], n_feature)
+        self.assertEqual(0, xs.shape[0])
+        self.assertEqual(0, ys.shape[0])
+
+    def test_generate_datasets(self) -> None:
+        n_feature = 10
+        n_row = 300
+        values = np.arange(0, n_row*3, 1).reshape((n_row, 3))
+        xs, ys = self.generate_datasets(values, n_feature)
+        self.assertTupleEqual((n_row-n_feature, n_feature, 3), xs.shape)
+        self.assertTupleEqual((n_row-n_feature, 3), ys.shape)
+        # Same as one column at a time
+        for i in range(values.shape[1]):
+            xs_col, ys_col = self.generate_dataset(values[:, i:i+1], n_feature)
+            self.assertTrue(np.array_equal(xs_col, xs[:, :, i]))
+            self.assertTrue(np.array_equal(ys_col, ys[:, i:i+1]))
+        # Xs is a view
+        self.assertTrue(np.shares_memory(xs, values))
+        # Select features and targets
+        xs, ys = self.generate_datasets(values, n_feature, features=[0, 2], targets=[1])
+        self.assertTupleEqual((n_row-n_feature, n_feature, 2), xs.shape)
+        self.assertListEqual(values[n_feature:, 1].tolist(), ys[:, 0].tolist())
+        self.assertListEqual(values[:n_feature, 2].tolist(), xs[0, :, 1].tolist())
+        # Wrong shape
+        with self.assertRaises(ValueError):
+            self.generate_datasets(values[:, 0], n_feature)
+
+    def test_iter_datasets(self) -> None:
+        n_feature = 10
+        n_row = 300
+        values = np.arange(0, n_row*3, 1).reshape((n_row, 3))
+        xs, ys = self.generate_datasets(values, n_feature)
+        for chunk_size in [7, 64, n_row]:
+            chunks = [values[i:i+chunk_size] for i in range(0, n_row, chunk_size)]
+            datasets = list(self.iter_datasets(chunks, n_feature))
+            self.assertTrue(np.array_equal(xs, np.concatenate([chunk_xs for chunk_xs, _ in datasets])))
+            self.assertTrue(np.array_equal(ys, np.concatenate([chunk_ys for _, chunk_ys in datasets])))
 
     def test_learned_pairs(self) -> None:
         pairs = self.learned_pairs(stock_path)
@@ -376,11 +416,9 @@ class TestPredictor(unittest.TestCase, Predictor):
         hist_pairs_str = FileManager.get_dirs(hist_dir, make_dir=True)
         learn_pairs_str = FileManager.get_dirs(learn_dir, make_dir=True)
         pairs_to_learn = [Pair(pair_str.replace('_', '/')) for pair_str in hist_pairs_str if pair_str not in learn_pairs_str]
-        # pair = Pair('DOGE/USDT')
-        for pair in pairs_to_learn:
-            print(_MF.prefix() + _back_cyan + f"Start learning '{pair.__str__().upper()}'..." + _normal)
-            self._learn(pair)
-            print(_MF.prefix() + _back_cyan + f"End learning '{pair.__str__().upper()}'" + _normal)
+        print(_MF.prefix() + _back_cyan + f"Start learning '{len(pairs_to_learn)}' pairs..." + _normal)
+        self.update_learns(pairs=pairs_to_learn, resume=True)
+        print(_MF.prefix() + _back_cyan + f"End learning '{len(pairs_to_learn)}' pairs" + _normal)
 
     def print_occupation_rate(self) -> None:
         def print_row(f_path: str, f_rows: List[dict]) -> None:
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from model.tools.Asset import Asset
@@ -58,6 +59,24 @@ class TestPrice(unittest.TestCase, Price):
         self.assertEqual(exp1, result1)
         # No Price to sum
         self.assertIsNone(Price.sum([]))
+        # Sum is rounded once
+        exp2 = Price(0.3, symbol)
+        result2 = Price.sum([Price(0.1, symbol), Price(0.2, symbol)])
+        self.assertEqual(exp2, result2)
+        self.assertEqual(0.3, result2.get_value())
+        # Prices of different Asset
+        with self.assertRaises(ValueError):
+            Price.sum([Price(1, symbol), Price(1, 'BTC')])
+
+    def test_slots(self) -> None:
+        price = Price(1.5, self.symbol1)
+        self.assertFalse(hasattr(price, '__dict__'))
+        self.assertIs(Asset(self.symbol1), price.get_asset())
+        self.assertEqual(hash(Price(1.5, self.symbol1.lower())), hash(price))
+        # Pickled Price keep their interned Asset
+        price_copy = pickle.loads(pickle.dumps(price))
+        self.assertEqual(price, price_copy)
+        self.assertIs(price.get_asset(), price_copy.get_asset())
 
     def test_json_encode_decode(self) -> None:
         original_obj = self.price1
@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+
+from model.tools.Map import Map
+from model.tools.RateScheduler import RateScheduler
+from model.tools.TokenBucket import TokenBucket
+
+
+class TestRateScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = RateScheduler('test')
+        # 10 tokens at once then 100 tokens per second
+        self.scheduler.add_bucket(Map.weight, TokenBucket(20, 0.1))
+        self.scheduler.add_bucket(Map.second, TokenBucket(1000, 1))
+
+    def test_add_bucket(self) -> None:
+        self.assertListEqual([Map.weight, Map.second], self.scheduler.get_bucket_names())
+        with self.assertRaises(ValueError):
+            self.scheduler.add_bucket(Map.weight, TokenBucket(1, 1))
+        with self.assertRaises(ValueError):
+            self.scheduler.get_bucket(Map.day)
+
+    def test_acquire(self) -> None:
+        scheduler = self.scheduler
+        self.assertEqual(0, scheduler.wait_time({Map.weight: 10}))
+        scheduler.acquire({Map.weight: 10, Map.second: 10}, request_class='a')
+        self.assertGreater(scheduler.wait_time({Map.weight: 10}), 0.05)
+        waited = scheduler.acquire({Map.weight: 10}, request_class='a')
+        self.assertAlmostEqual(0.1, waited, delta=0.05)
+        with self.assertRaises(TimeoutError):
+            scheduler.acquire({Map.weight: 10}, request_class='b', timeout=0.01)
+        stats = scheduler.get_stats()
+        self.assertEqual(2, stats.get('a', Map.number))
+        self.assertEqual(0, stats.get('a', Map.size))
+        self.assertAlmostEqual(0.1, stats.get('a', Map.maximum), delta=0.05)
+        self.assertAlmostEqual(0.05, stats.get('a', Map.mean), delta=0.03)
+        self.assertEqual(0, stats.get('b', Map.number))
+        with self.assertRaises(ValueError):
+            scheduler.acquire({Map.day: 1})
+
+    def test_priority(self) -> None:
+        scheduler = self.scheduler
+        scheduler.consume({Map.weight: 10})
+        served = []
+        def request(name: str, priority: int) -> None:
+            scheduler.acquire({Map.weight: 10}, priority=priority, request_class=name)
+            served.append(name)
+        threads = [threading.Thread(target=request, args=(f"market_{i}", 2)) for i in range(3)]
+        [(thread.start(), time.sleep(0.005)) for thread in threads]
+        self.assertEqual(3, scheduler.get_stats().get('market_0', Map.size) + scheduler.get_stats().get('market_1', Map.size) + scheduler.get_stats().get('market_2', Map.size))
+        order = threading.Thread(target=request, args=('order', 0))
+        order.start()
+        [thread.join(2) for thread in [*threads, order]]
+        # The order passes before market requests that waited before it
+        self.assertEqual('order', served[0])
+        self.assertListEqual(['market_0', 'market_1', 'market_2'], served[1:])
+
+    def test_sync(self) -> None:
+        scheduler = self.scheduler
+        scheduler.sync(Map.weight, 20)
+        self.assertGreater(scheduler.wait_time({Map.weight: 1}), 0)
+
+
+if __name__ == '__main__':
+    unittest.main
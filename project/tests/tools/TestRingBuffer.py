@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from model.tools.RingBuffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = np.arange(12, dtype=np.float64).reshape((4, 3))
+
+    def test_append(self) -> None:
+        ring = RingBuffer(self.rows)
+        self.assertEqual(4, ring.get_capacity())
+        np.testing.assert_array_equal(self.rows, ring.view())
+        # Drop the older row when capacity is reached
+        rows = self.rows.tolist()
+        for i in range(10):
+            new_row = [100 + i, 200 + i, 300 + i]
+            ring.append(np.array(new_row))
+            rows = [*rows[1:], new_row]
+            np.testing.assert_array_equal(np.array(rows), ring.view())
+            self.assertEqual((4, 3), ring.shape)
+        # Fill a buffer bigger than its initial rows
+        ring = RingBuffer(self.rows[:2], capacity=3)
+        ring.append(self.rows[2])
+        np.testing.assert_array_equal(self.rows[:3], ring.view())
+        ring.append(self.rows[3])
+        np.testing.assert_array_equal(self.rows[1:], ring.view())
+        self.assertEqual(3, len(ring))
+
+    def test_replace_last(self) -> None:
+        ring = RingBuffer(self.rows)
+        ring.append(np.array([1, 1, 1]))
+        ring.replace_last(np.array([2, 2, 2]))
+        np.testing.assert_array_equal(np.array([*self.rows[1:].tolist(), [2, 2, 2]]), ring.view())
+        with self.assertRaises(IndexError):
+            RingBuffer(np.empty((0, 3)), capacity=2).replace_last(np.array([1, 1, 1]))
+
+    def test_view(self) -> None:
+        ring = RingBuffer(self.rows)
+        [ring.append(np.array([i, i, i])) for i in range(2)]
+        view = ring.view()
+        # No copy and read-only
+        self.assertFalse(view.flags.owndata)
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+        # Copy
+        np.testing.assert_array_equal(view[-2:], ring.copy(2))
+        np.testing.assert_array_equal(view, ring.copy())
+        self.assertTrue(ring.copy().flags.owndata)
+
+    def test_setitem(self) -> None:
+        ring = RingBuffer(self.rows)
+        [ring.append(np.array([i, i, i])) for i in range(2)]
+        ring[:, 1] = -1
+        self.assertListEqual([-1] * 4, ring[:, 1].tolist())
+        # Copies of rows stay synchronized
+        [ring.append(np.array([9, 9, 9])) for i in range(2)]
+        np.testing.assert_array_equal(np.array([[0, -1, 0], [1, -1, 1], [9, 9, 9], [9, 9, 9]]), ring.view())
+
+
+if __name__ == '__main__':
+    unittest.main
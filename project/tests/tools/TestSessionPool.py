@@ -0,0 +1,102 @@
+import unittest
+
+from requests import get as rq_get
+
+from model.tools.Map import Map
+from tests.tools.MockHTTPServer import MockHTTPServer
+from model.tools.SessionPool import SessionPool
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = MockHTTPServer(latency=0.001, content={Map.value: 1})
+        self.server.start()
+        self.url = self.server.url() + '/api/v3/klines'
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_get_session(self) -> None:
+        pool = SessionPool()
+        session = pool.get_session(self.url)
+        self.assertIs(session, pool.get_session(self.server.url() + '/api/v3/time'))
+        self.assertIsNot(session, pool.get_session(self.url, group='order'))
+        self.assertIsNot(session, pool.get_session('https://api.binance.com/api/v3/time'))
+        self.assertEqual(3, pool.get_stats().get(Map.session))
+        pool.close()
+        self.assertEqual(0, pool.get_stats().get(Map.session))
+        with self.assertRaises(ValueError):
+            SessionPool(pool_size=0)
+
+    def test_request(self) -> None:
+        n_request = 20
+        # Connections are kept alive between requests
+        pool = SessionPool()
+        for _ in range(n_request):
+            response = pool.request('GET', self.url, params={Map.symbol: 'BTCUSDT'})
+            self.assertEqual(200, response.status_code)
+            self.assertDictEqual({Map.value: 1}, response.json())
+        self.assertEqual(1, self.server.get_stats().get(Map.connection))
+        pool.close()
+        # Without session a connection is opened for each request
+        [rq_get(self.url) for _ in range(n_request)]
+        stats = self.server.get_stats()
+        self.assertEqual(n_request + 1, stats.get(Map.connection))
+        self.assertEqual(n_request * 2, stats.get(Map.request))
+
+    def test_retry(self) -> None:
+        pool = SessionPool(max_retry=3, backoff=0)
+        waits = []
+        def wait(response) -> float:
+            waits.append(response.status_code)
+            return 0
+        self.server.queue_statuses([429, 503])
+        response = pool.request('GET', self.url, wait=wait)
+        self.assertEqual(200, response.status_code)
+        self.assertListEqual([429, 503], waits)
+        self.assertEqual(2, pool.get_stats().get(Map.retry))
+        # Server errors are not retried for requests that aren't idempotent
+        self.server.queue_statuses([500])
+        response = pool.request('POST', self.url, wait=wait)
+        self.assertEqual(500, response.status_code)
+        self.assertEqual(2, pool.get_stats().get(Map.retry))
+        # Stop after the maximum of retry
+        self.server.queue_statuses([429] * 4)
+        response = pool.request('POST', self.url)
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(5, pool.get_stats().get(Map.retry))
+        # A ban is returned to the caller's rate limiter
+        self.server.queue_statuses([418])
+        response = pool.request('GET', self.url, wait=wait)
+        self.assertEqual(418, response.status_code)
+        self.assertEqual(5, pool.get_stats().get(Map.retry))
+        # A wait longer than the maximum sleep returns the response
+        self.server.queue_statuses([429])
+        response = pool.request('GET', self.url, wait=lambda rsp: 60)
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(5, pool.get_stats().get(Map.retry))
+        pool.close()
+        # Even when asked through the header Retry-After
+        server = MockHTTPServer(headers={'Retry-After': '120'})
+        server.start()
+        pool = SessionPool(max_retry=3, backoff=0, max_sleep=1)
+        server.queue_statuses([429])
+        response = pool.request('GET', server.url())
+        self.assertEqual(429, response.status_code)
+        self.assertEqual(0, pool.get_stats().get(Map.retry))
+        pool.close()
+        server.stop()
+
+    def test_get_retry_sleep_time(self) -> None:
+        pool = SessionPool(backoff=0.5)
+        self.server.queue_statuses([429])
+        response = rq_get(self.url)
+        self.assertEqual(0.5, pool.get_retry_sleep_time(response, 0))
+        self.assertEqual(2, pool.get_retry_sleep_time(response, 2))
+        self.assertEqual(10, pool.get_retry_sleep_time(response, 0, wait=lambda rsp: 10))
+        response.headers['Retry-After'] = '7'
+        self.assertEqual(7, pool.get_retry_sleep_time(response, 0))
+
+
+if __name__ == '__main__':
+    unittest.main
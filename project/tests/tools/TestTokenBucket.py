@@ -0,0 +1,46 @@
+import time
+import unittest
+
+from model.tools.TokenBucket import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_constructor(self) -> None:
+        bucket = TokenBucket(100, 10)
+        # burst + rate * interval = limit
+        self.assertEqual(50, bucket.get_capacity())
+        self.assertEqual(5, bucket.get_rate())
+        self.assertEqual(50, bucket.get_tokens())
+        with self.assertRaises(ValueError):
+            TokenBucket(0, 10)
+        with self.assertRaises(ValueError):
+            TokenBucket(100, 0)
+        with self.assertRaises(ValueError):
+            TokenBucket(100, 10, burst_rate=1)
+
+    def test_consume(self) -> None:
+        bucket = TokenBucket(1000, 1)
+        self.assertEqual(0, bucket.wait_time(500))
+        bucket.consume(500)
+        self.assertAlmostEqual(0.1, bucket.wait_time(50), delta=0.01)
+        time.sleep(0.05)
+        self.assertAlmostEqual(25, bucket.get_tokens(), delta=5)
+        self.assertAlmostEqual(475, bucket.get_used(), delta=5)
+        # Heavier than the burst: passes once the bucket is full
+        bucket = TokenBucket(1000, 1)
+        self.assertEqual(0, bucket.wait_time(800))
+        bucket.consume(800)
+        self.assertAlmostEqual(-300, bucket.get_tokens(), delta=5)
+        self.assertAlmostEqual(1.6, bucket.wait_time(800), delta=0.02)
+
+    def test_sync(self) -> None:
+        bucket = TokenBucket(100, 60)
+        # Never increased by the remote usage
+        bucket.sync(10)
+        self.assertEqual(50, bucket.get_tokens())
+        bucket.sync(80)
+        self.assertAlmostEqual(20, bucket.get_tokens(), delta=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main
@@ -163,6 +163,28 @@ class TestTransactions(unittest.TestCase, Transactions, Transaction):
         self.assertEqual(id(exp6), id(result6))
         self.assertEqual(exp6, result6)
 
+    def test_sum_incremental(self) -> None:
+        def full_sum(transacs: Transactions) -> dict:
+            transacs_copy = Transactions(transacs.get_pair())
+            [transacs_copy.add(transac) for transac in transacs._get_transactions().get_map().values()]
+            return transacs_copy.sum().get_map()
+        transacs = self.transacs1
+        transac_list = [self.transac1, self.transac2, self.transac3, self.transac4]
+        [transac._set_execution_time(exec_time) for transac, exec_time in zip(transac_list, [3, 1, 2, 4])]
+        transacs.sum()
+        # Sum updated on add
+        for transac in transac_list:
+            transacs.add(transac)
+            self.assertDictEqual(full_sum(transacs), transacs.sum().get_map())
+        self.assertListEqual([1, 2, 3, 4], [transac.get_execution_time() for transac in transacs._get_transactions().get_map().values()])
+        # Sum updated on remove
+        transacs.remove(self.transac3.get_id())
+        self.assertDictEqual(full_sum(transacs), transacs.sum().get_map())
+        # Sum computed again when a Transaction is replaced
+        transacs.add(self.transac1)
+        self.assertDictEqual(full_sum(transacs), transacs.sum().get_map())
+        self.assertEqual(3, len(transacs.ids()))
+
     def test_json_encode_decode(self) -> None:
         transacs = self.transacs1
         transac1 = self.transac1
@@ -3,6 +3,7 @@ import unittest
 
 from config.Config import Config
 from model.API.brokers.Binance.Binance import Binance
+from model.API.brokers.Binance.BinanceMarketPrice import BinanceMarketPrice
 from model.structure.Broker import Broker
 from model.structure.database.ModelFeature import ModelFeature as _MF
 from model.tools.Asset import Asset
@@ -178,6 +179,49 @@ class TestWallet(unittest.TestCase, Wallet):
         # End
         self.broker_switch(False)
 
+    def test_get_all_position_value_cached(self) -> None:
+        def new_marketprices(close1: float, close2: float) -> Map:
+            period = Wallet.get_period()
+            pair2 = Pair(self.asset2, self.r_asset)
+            return Map({
+                self.pair1: {period: BinanceMarketPrice([[0, '0', '0', '0', str(close1)]], '1m', self.pair1)},
+                pair2: {period: BinanceMarketPrice([[0, '0', '0', '0', str(close2)]], '1m', pair2)}
+            })
+        def buy(asset: Asset, right: float, close: float) -> None:
+            pair = Pair(asset, self.r_asset)
+            transac = Transaction(type=Transaction.TYPE_BUY, pair=pair, right=Price(right, self.r_asset), left=Price(right/close, asset), fee=Price(0, self.r_asset))
+            wallet.buy(transac)
+        wallet = self.w1
+        asset1 = self.asset1
+        asset2 = self.asset2
+        wallet.set_marketprices(new_marketprices(0.5, 20000))
+        self.assertEqual(Price(0, self.r_asset), wallet.get_all_position_value(None))
+        buy(asset1, 300, 0.5)
+        buy(asset2, 50, 20000)
+        # Value
+        value1 = wallet.get_all_position_value(None)
+        self.assertAlmostEqual(350, value1.get_value(), places=6)
+        self.assertIs(value1, wallet.get_all_position_value(None))
+        self.assertAlmostEqual(1000, wallet.get_total(None).get_value(), places=6)
+        # Reset on Transaction
+        buy(asset1, 100, 0.5)
+        value2 = wallet.get_all_position_value(None)
+        self.assertAlmostEqual(450, value2.get_value(), places=6)
+        self.assertAlmostEqual(1000, wallet.get_total(None).get_value(), places=6)
+        # Reset on MarketPrice
+        roi1 = wallet.get_roi(None)
+        wallet.set_marketprices(new_marketprices(1, 40000))
+        value3 = wallet.get_all_position_value(None)
+        self.assertAlmostEqual(900, value3.get_value(), places=6)
+        self.assertAlmostEqual(wallet.get_position_value(None, asset1).get_value() + wallet.get_position_value(None, asset2).get_value(), value3.get_value(), places=6)
+        self.assertAlmostEqual(1450, wallet.get_total(None).get_value(), places=6)
+        self.assertNotEqual(roi1, wallet.get_roi(None))
+        # Reset on deposit (a deposit isn't a return)
+        roi2 = wallet.get_roi(None)
+        wallet.deposit(self.amount1)
+        self.assertAlmostEqual(roi2, wallet.get_roi(None))
+        self.assertAlmostEqual(1550, wallet.get_total(None).get_value(), places=6)
+
     def test_set_reset_get_marketprice(self) -> None:
         broker = self.broker_switch(True)
         wallet = self.w1